@@ -0,0 +1,40 @@
+"""add_workflow_metrics_sketch_columns
+
+Revision ID: e4b7f2a91c03
+Revises: fcpm_20251120
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b7f2a91c03'
+down_revision: Union[str, Sequence[str], None] = 'fcpm_20251120'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("workflow_metrics", sa.Column("p99_latency_ms", sa.Float(), nullable=True))
+    op.add_column("workflow_metrics", sa.Column("workflow_name", sa.String(length=200), nullable=True))
+    op.add_column("workflow_metrics", sa.Column("window_start", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("workflow_metrics", sa.Column("window_end", sa.DateTime(timezone=True), nullable=True))
+    op.add_column("workflow_metrics", sa.Column("sketch", sa.JSON(), nullable=True))
+    op.create_index("ix_workflow_metrics_workflow_name", "workflow_metrics", ["workflow_name"])
+    op.create_index("ix_workflow_metrics_window_end", "workflow_metrics", ["window_end"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_workflow_metrics_window_end", table_name="workflow_metrics")
+    op.drop_index("ix_workflow_metrics_workflow_name", table_name="workflow_metrics")
+    op.drop_column("workflow_metrics", "sketch")
+    op.drop_column("workflow_metrics", "window_end")
+    op.drop_column("workflow_metrics", "window_start")
+    op.drop_column("workflow_metrics", "workflow_name")
+    op.drop_column("workflow_metrics", "p99_latency_ms")
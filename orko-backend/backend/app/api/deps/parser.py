@@ -0,0 +1,13 @@
+# backend/app/api/deps/parser.py
+
+from __future__ import annotations
+
+from backend.app.services.parsing.parser_engine import ParserEngine, get_parser_engine
+
+
+def get_parser() -> ParserEngine:
+    """
+    FastAPI dependency that provides the process-wide ParserEngine.
+    The engine is built once (warmed at startup) and shared across requests.
+    """
+    return get_parser_engine()
@@ -37,7 +37,7 @@ async def post_trigger(
 
     client_ip = request.client.host if request.client else None
 
-    return _trigger_service.trigger(
+    return await _trigger_service.trigger(
         db=db,
         user=user,
         req=req,
@@ -41,5 +41,7 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+    broker_pool_limit=settings.CELERY_BROKER_POOL_LIMIT,
+    redis_max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
 )
 
@@ -0,0 +1,296 @@
+# backend/app/core/clients.py
+# 🔌 Shared, pooled network clients (Redis, outbound HTTP, Twilio, DB engine)
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+import redis
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ClientRegistry:
+    """
+    One owner for every long-lived network client in a process.
+
+    - Redis: one bounded, keep-alive ConnectionPool per (url, decode_responses),
+      shared by every caller asking for that URL.
+    - HTTP: one httpx.AsyncClient per event loop (async clients must not
+      cross loops), HTTP/2 when enabled and `h2` is installed.
+    - Twilio: one REST Client per account (keeps its requests.Session).
+    - DB: the SQLAlchemy engine from db/session.py is registered for pool
+      metrics and disposed on shutdown.
+
+    Opened lazily on first use; close() / aclose() run on app and worker
+    shutdown. Fork-aware through get_client_registry(): a forked worker
+    builds its own registry instead of sharing the parent's sockets.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._redis: Dict[Tuple[str, bool], redis.Redis] = {}
+        self._http: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._twilio: Dict[Tuple[str, str], Any] = {}
+        self._engine: Any = None
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "redis_pools_created": 0,
+            "http_clients_created": 0,
+            "twilio_clients_created": 0,
+        }
+
+    # ---------------------------------------------------------
+    # Redis
+    # ---------------------------------------------------------
+    def redis(
+        self,
+        url: Optional[str] = None,
+        *,
+        decode_responses: bool = False,
+        max_connections: Optional[int] = None,
+        timeout_ms: Optional[int] = None,
+    ) -> redis.Redis:
+        """
+        Shared client for `url` (default: settings.redis_url). Pool size and
+        timeouts apply when the pool is first created.
+        """
+        url = url or settings.redis_url
+        if not url:
+            raise ValueError("No Redis URL configured (REDIS_URL)")
+        key = (url, decode_responses)
+
+        client = self._redis.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._redis.get(key)
+            if client is None:
+                timeout = (timeout_ms or settings.REDIS_POOL_TIMEOUT_MS) / 1000.0
+                pool = redis.ConnectionPool.from_url(
+                    url,
+                    max_connections=max_connections or settings.REDIS_POOL_MAX_CONNECTIONS,
+                    socket_timeout=timeout,
+                    socket_connect_timeout=timeout,
+                    socket_keepalive=True,
+                    health_check_interval=settings.REDIS_POOL_HEALTH_CHECK_SECONDS,
+                    decode_responses=decode_responses,
+                )
+                client = redis.Redis(connection_pool=pool)
+                self._redis[key] = client
+                self._bump("redis_pools_created")
+            return client
+
+    # ---------------------------------------------------------
+    # HTTP
+    # ---------------------------------------------------------
+    def http(self) -> httpx.AsyncClient:
+        """Shared async HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._http.get(loop)
+        if client is not None and not client.is_closed:
+            return client
+
+        with self._lock:
+            client = self._http.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    http2=_http2_available(),
+                    timeout=settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.HTTP_POOL_MAX_KEEPALIVE,
+                        keepalive_expiry=settings.HTTP_POOL_KEEPALIVE_SECONDS,
+                    ),
+                )
+                self._http[loop] = client
+                self._bump("http_clients_created")
+            return client
+
+    # ---------------------------------------------------------
+    # Twilio
+    # ---------------------------------------------------------
+    def twilio(self, account_sid: str, auth_token: str) -> Any:
+        """Shared Twilio REST client per account (thread-safe for sends)."""
+        key = (account_sid, auth_token)
+        client = self._twilio.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._twilio.get(key)
+            if client is None:
+                from twilio.rest import Client
+
+                client = Client(account_sid, auth_token)
+                self._twilio[key] = client
+                self._bump("twilio_clients_created")
+            return client
+
+    # ---------------------------------------------------------
+    # DB
+    # ---------------------------------------------------------
+    def register_engine(self, engine: Any) -> None:
+        self._engine = engine
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    async def aclose(self) -> None:
+        """Closes the HTTP client of the running loop, then everything else."""
+        loop = asyncio.get_running_loop()
+        client = self._http.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Disconnects Redis pools and disposes the DB pool (sync clients only)."""
+        with self._lock:
+            clients = list(self._redis.values())
+            self._redis.clear()
+            self._twilio.clear()
+        for client in clients:
+            try:
+                client.connection_pool.disconnect()
+            except Exception:
+                logger.exception("Redis pool disconnect failed")
+        if self._engine is not None:
+            try:
+                self._engine.dispose()
+            except Exception:
+                logger.exception("DB engine dispose failed")
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        with self._lock:
+            redis_items = list(self._redis.items())
+            http_clients = list(self._http.values())
+            out["twilio_clients"] = len(self._twilio)
+
+        out["redis"] = [
+            {"url": _redact(url), "decode_responses": decode, **_redis_pool_stats(client.connection_pool)}
+            for (url, decode), client in redis_items
+        ]
+        out["http"] = [_http_pool_stats(client) for client in http_clients]
+        out["db"] = _db_pool_stats(self._engine) if self._engine is not None else None
+        return out
+
+
+# ------------------------------------------------------------
+# Pool introspection (best effort; private attributes may move)
+# ------------------------------------------------------------
+
+def _redact(url: str) -> str:
+    head, sep, tail = url.rpartition("@")
+    if not sep:
+        return url
+    scheme, _, _ = head.partition("://")
+    return f"{scheme}://***@{tail}"
+
+
+def _redis_pool_stats(pool: Any) -> Dict[str, Any]:
+    in_use = len(getattr(pool, "_in_use_connections", ()) or ())
+    idle = len(getattr(pool, "_available_connections", ()) or ())
+    max_conn = getattr(pool, "max_connections", None)
+    return {
+        "max_connections": max_conn,
+        "in_use": in_use,
+        "idle": idle,
+        "utilization": round(in_use / max_conn, 4) if max_conn else None,
+    }
+
+
+def _http_pool_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", ()) or ())
+    idle = sum(1 for c in connections if getattr(c, "is_idle", lambda: False)())
+    max_conn = getattr(pool, "_max_connections", None)
+    return {
+        "http2": bool(getattr(pool, "_http2", False)),
+        "max_connections": max_conn,
+        "open": len(connections),
+        "idle": idle,
+        "utilization": round((len(connections) - idle) / max_conn, 4) if max_conn else None,
+        "closed": client.is_closed,
+    }
+
+
+def _db_pool_stats(engine: Any) -> Dict[str, Any]:
+    pool = engine.pool
+    size = getattr(pool, "size", lambda: None)()
+    checked_out = getattr(pool, "checkedout", lambda: None)()
+    return {
+        "pool": type(pool).__name__,
+        "size": size,
+        "checked_out": checked_out,
+        "overflow": getattr(pool, "overflow", lambda: None)(),
+        "utilization": round(checked_out / size, 4) if size and checked_out is not None else None,
+    }
+
+
+def _http2_available() -> bool:
+    if not settings.HTTP_CLIENT_HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP_CLIENT_HTTP2 is set but the 'h2' package is missing; using HTTP/1.1")
+        return False
+    return True
+
+
+# ------------------------------------------------------------
+# Process-wide registry
+# ------------------------------------------------------------
+_registry: Optional[ClientRegistry] = None
+_registry_pid: Optional[int] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> ClientRegistry:
+    """Thread-safe (double-checked locking) and fork-aware."""
+    global _registry, _registry_pid
+
+    registry = _registry
+    if registry is not None and _registry_pid == os.getpid():
+        return registry
+
+    with _registry_lock:
+        if _registry is None or _registry_pid != os.getpid():
+            _registry = ClientRegistry()
+            _registry_pid = os.getpid()
+            try:
+                from backend.app.db.session import engine
+
+                _registry.register_engine(engine)
+            except Exception:
+                logger.exception("DB engine not registered with client registry")
+        return _registry
+
+
+def reset_client_registry() -> None:
+    """Drops the registry without closing clients (tests / after fork)."""
+    global _registry, _registry_pid
+    with _registry_lock:
+        _registry = None
+        _registry_pid = None
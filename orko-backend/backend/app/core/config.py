@@ -53,6 +53,62 @@ class Settings(BaseSettings):
 
     TRIGGER_QUEUE_NAME: str = "orko_trigger_queue"
     TRIGGER_DLQ_NAME: str = "orko_trigger_dlq"
+    CELERY_BROKER_POOL_LIMIT: int = 10
+    CELERY_WORKER_POOL: str = "prefork"  # "threads" → tasks share the worker's workflow loop
+    CELERY_WORKER_CONCURRENCY: Optional[int] = None  # None = Celery default (CPU count)
+
+    # -------------------------------------------------------
+    # 🔁 Workflow — persistent per-worker asyncio loop
+    # -------------------------------------------------------
+    WORKFLOW_LOOP_CONCURRENCY: int = 32  # workflows awaiting I/O at once per worker process
+    WORKFLOW_LOOP_RUN_TIMEOUT_SECONDS: float = 230.0  # < task_soft_time_limit
+
+    # -------------------------------------------------------
+    # 🔁 Workflow — DAG flows (flows/*.json with depends_on)
+    # -------------------------------------------------------
+    WORKFLOW_DAG_FLOW_CONCURRENCY: int = 4  # parallel steps per flow run (flow "max_concurrency" overrides)
+    WORKFLOW_DAG_GLOBAL_CONCURRENCY: int = 64  # parallel steps per process, all flows
+    WORKFLOW_STEP_TIMEOUT_MS: int = 30000  # per step, unless the step sets timeout_ms
+    WORKFLOW_OUTPUT_DIR: str = "backend/data/workflow_output"  # write_file action target
+
+    # -------------------------------------------------------
+    # 🔁 Workflow — step checkpoints (Celery retries resume)
+    # -------------------------------------------------------
+    WORKFLOW_CHECKPOINTS_ENABLED: bool = True
+    WORKFLOW_CHECKPOINT_REDIS_URL: Optional[str] = None  # falls back to redis_url
+    WORKFLOW_CHECKPOINT_TTL_SECONDS: int = 86400
+
+    # -------------------------------------------------------
+    # 🧾 Trigger audit — staged lifecycle, one DB write per run
+    # -------------------------------------------------------
+    WORKFLOW_AUDIT_STAGING_ENABLED: bool = True
+    WORKFLOW_AUDIT_REDIS_URL: Optional[str] = None  # falls back to redis_url
+    WORKFLOW_AUDIT_FLUSH_INTERVAL_SECONDS: float = 15.0  # non-terminal states older than this reach the DB
+    # Longer than the broker visibility timeout (1 h), so a redelivered
+    # task is never declared lost before it gets the chance to resume
+    WORKFLOW_AUDIT_STALE_SECONDS: int = 3900
+    WORKFLOW_AUDIT_TERMINAL_TTL_SECONDS: int = 3600
+
+    # -------------------------------------------------------
+    # ⏱️ Workflow latency — streaming sketches → WorkflowMetrics
+    # -------------------------------------------------------
+    WORKFLOW_METRICS_FLUSH_INTERVAL_SECONDS: float = 60.0  # one row per scenario/workflow per window
+    WORKFLOW_METRICS_SKETCH_ALPHA: float = 0.01  # relative accuracy of p50/p95/p99
+
+    # -------------------------------------------------------
+    # 🔌 Shared client pools (core/clients.py)
+    # -------------------------------------------------------
+    REDIS_POOL_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_MS: int = 2000
+    REDIS_POOL_HEALTH_CHECK_SECONDS: int = 30
+    HTTP_POOL_MAX_CONNECTIONS: int = 100
+    HTTP_POOL_MAX_KEEPALIVE: int = 20
+    HTTP_POOL_KEEPALIVE_SECONDS: float = 30.0
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CLIENT_HTTP2: bool = False  # needs the `h2` package
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE_SECONDS: int = 1800
 
     # -------------------------------------------------------
     # ⚡ Step 6 Day 9 — Rate Limiting Configuration
@@ -60,6 +116,77 @@ class Settings(BaseSettings):
     RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/2"
     RATE_LIMIT_PER_MINUTE: int = 5
     RATE_LIMIT_WINDOW_SECONDS: int = 60
+    RATE_LIMIT_REDIS_MAX_CONNECTIONS: int = 50  # shared pool (limiter + abuse monitor)
+    RATE_LIMIT_REDIS_TIMEOUT_MS: int = 100
+    RATE_LIMIT_LOCAL_LEASE_SIZE: int = 0  # >1 → lease token blocks into the process; 0 = Redis per request
+    RATE_LIMIT_LOCAL_LEASE_TTL_MS: int = 1000  # unused leased tokens are dropped after this
+    RATE_LIMIT_LOCAL_MAX_KEYS: int = 10000
+
+    # -------------------------------------------------------
+    # 🧠 Parser — parse-result cache (LRU memory tier + Redis tier)
+    # -------------------------------------------------------
+    PARSE_CACHE_ENABLED: bool = True
+    PARSE_CACHE_MAX_ENTRIES: int = 2048
+    PARSE_CACHE_TTL_SECONDS: int = 3600
+    PARSE_CACHE_REDIS_URL: Optional[str] = None  # falls back to redis_url
+    PARSE_CACHE_REDIS_TIMEOUT_MS: int = 50
+    PARSE_CACHE_WARM_TOP_N: int = 0  # >0 → preload top-N parser_logs commands at startup
+
+    # -------------------------------------------------------
+    # 🧠 Parser — single-flight coalescing of identical parses
+    # -------------------------------------------------------
+    PARSE_SINGLEFLIGHT_ENABLED: bool = True
+    PARSE_SINGLEFLIGHT_REDIS_LOCK: bool = False  # also coalesce across processes (needs cache Redis tier)
+    PARSE_SINGLEFLIGHT_LOCK_TTL_MS: int = 15000  # > worst-case LLM latency
+    PARSE_SINGLEFLIGHT_POLL_MS: int = 50
+
+    # -------------------------------------------------------
+    # 🧠 Parser — per-request parse deadline (provisional heuristic result)
+    # -------------------------------------------------------
+    PARSER_DEADLINE_MS: int = 0  # async/API path; 0 = wait for the LLM. Sync path: explicit deadline_ms only
+    PARSER_DEADLINE_WORKERS: int = 8  # threads that finish timed-out LLM calls on the sync path
+
+    # -------------------------------------------------------
+    # 🧠 Parser — few-shot selection ("all" | "retrieval")
+    # -------------------------------------------------------
+    PARSER_FEWSHOT_MODE: str = "all"
+    PARSER_FEWSHOT_K: int = 8
+    PARSER_FEWSHOT_MAX_DOMAINS: int = 3
+    PARSER_FEWSHOT_TOKEN_BUDGET: int = 1500  # est. tokens for examples, 0 = unlimited
+
+    # -------------------------------------------------------
+    # 🧠 Parser — config snapshot hot reload (mtime watcher)
+    # -------------------------------------------------------
+    PARSER_CONFIG_WATCH_INTERVAL_SECONDS: float = 2.0  # 0 = never reload
+
+    # -------------------------------------------------------
+    # 🧠 Parser — write-behind ParserLog persistence
+    # -------------------------------------------------------
+    PARSER_LOG_WRITE_BEHIND: bool = True  # False → synchronous insert per parse
+    PARSER_LOG_BUFFER_MAX: int = 10000
+    PARSER_LOG_BATCH_SIZE: int = 200
+    PARSER_LOG_FLUSH_INTERVAL_MS: int = 250
+    PARSER_LOG_OVERFLOW: str = "drop"  # "drop" | "block"
+    PARSER_LOG_BLOCK_TIMEOUT_MS: int = 20
+    # Mask PII in stored parses (parser_logs.parsed_output + parser telemetry), not only
+    # reasoning traces. parser_logs.command stays raw: cache warm-up and fast-path training key on it.
+    PARSER_MASK_STORED_PARSES: bool = False
+
+    # -------------------------------------------------------
+    # 🧠 Parser — local fast-path classifier (skips the LLM)
+    # -------------------------------------------------------
+    PARSER_FASTPATH_MODE: str = "off"  # "off" | "shadow" | "on"
+    PARSER_FASTPATH_THRESHOLD: float = 0.9  # calibrated confidence needed to serve
+    PARSER_FASTPATH_MODEL_PATH: Optional[str] = None  # default: parsing/models/fastpath_model.npz
+
+    # -------------------------------------------------------
+    # 🧠 Parser — LLM transport (offline benchmarking / CI)
+    # -------------------------------------------------------
+    PARSER_LLM_BACKEND: str = "live"  # "live" | "record" | "replay" | "stub"
+    PARSER_LLM_CASSETTE_PATH: Optional[str] = None  # default: parsing/cassettes/llm_cassette.jsonl
+    PARSER_LLM_REPLAY_LATENCY: str = "recorded"  # none | recorded | empirical | fixed:MS | normal:MEAN,SD | ...
+    PARSER_LLM_REPLAY_SEED: int = 0
+    PARSER_LLM_REPLAY_ON_MISS: str = "error"  # "error" | "stub"
 
     class Config:
         env_file = ".env.local"
@@ -163,6 +163,15 @@ class WorkflowMetrics(Base):
 
     p50_latency_ms = Column(Float, nullable=False)
     p95_latency_ms = Column(Float, nullable=True)
+    p99_latency_ms = Column(Float, nullable=True)
+
+    # One row per (scenario, workflow) per flush window and worker;
+    # `sketch` (LatencySketch.to_dict) lets readers merge rows into exact
+    # percentiles over any set of windows / workers
+    workflow_name = Column(String(200), nullable=True, index=True)
+    window_start = Column(DateTime(timezone=True), nullable=True)
+    window_end = Column(DateTime(timezone=True), nullable=True, index=True)
+    sketch = Column(JSONType, nullable=True)
 
     notes = Column(Text, nullable=True)
 
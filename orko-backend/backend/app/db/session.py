@@ -29,7 +29,18 @@ if DATABASE_URL.startswith("postgres://"):
 # ------------------------------------------------------------
 # SQLAlchemy engine and session
 # ------------------------------------------------------------
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=False)
+# Pool sizing applies to server databases; SQLite keeps SQLAlchemy's defaults
+_pool_kwargs = {}
+if not DATABASE_URL.startswith("sqlite"):
+    from backend.app.core.config import settings
+
+    _pool_kwargs = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+    }
+
+engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=False, **_pool_kwargs)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # ------------------------------------------------------------
@@ -60,6 +60,14 @@ from backend.app.integrations.email.gmail_listener import start_gmail_listener
 from backend.app.integrations.files.drive_client import fetch_drive_changes
 from backend.app.integrations.files.sharepoint_client import fetch_sharepoint_delta
 
+# Shared ParserEngine (warmed once per process)
+from backend.app.services.parsing.parser_engine import get_parser_engine, warm_parser_engine
+from backend.app.services.parsing.config_snapshot import get_config_snapshot, start_config_watcher
+from backend.app.services.parsing.parser_log_writer import shutdown_parser_log_writer
+from backend.app.core.config import settings
+from backend.app.core.clients import get_client_registry
+from backend.app.services.workflow.actions_registry import warm_action_registry
+
 # DB helpers for ingestion
 from backend.app.db.helpers.file_ingest import ingest_files_bulk
 from backend.app.db.helpers.logs import log_ingest
@@ -190,6 +198,43 @@ async def startup_event():
     asyncio.create_task(safe_run(start_file_watcher, "File Watcher"))
     print("📁 File Watcher scheduled safely.")
 
+    try:
+        elapsed_ms = await asyncio.to_thread(warm_parser_engine)
+        print(f"🧠 ParserEngine warmed in {elapsed_ms:.1f} ms.")
+    except Exception as e:
+        print(f"⚠️ ParserEngine warm-up failed (will build lazily): {e}")
+
+    # Shared client registry: keep-alive HTTP client for this loop now,
+    # Redis pools on first use
+    get_client_registry().http()
+
+    try:
+        elapsed_ms = await asyncio.to_thread(warm_action_registry)
+        print(f"🧩 Workflow flows compiled in {elapsed_ms:.1f} ms.")
+    except Exception as e:
+        print(f"⚠️ Flow compilation failed (will retry lazily): {e}")
+
+    if start_config_watcher():
+        print(f"🗂 Parser config watcher started (version {get_config_snapshot().version_id}).")
+
+    if settings.PARSE_CACHE_WARM_TOP_N > 0:
+        try:
+            loaded = await asyncio.to_thread(
+                get_parser_engine().warm_cache, settings.PARSE_CACHE_WARM_TOP_N
+            )
+            print(f"🧠 Parse cache preloaded with {loaded} command(s).")
+        except Exception as e:
+            print(f"⚠️ Parse cache warm-up failed: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    flushed = await asyncio.to_thread(shutdown_parser_log_writer)
+    print(f"🧾 ParserLog buffer flushed on shutdown ({flushed} row(s)).")
+    await get_client_registry().aclose()
+    print("🔌 Shared Redis / HTTP / DB client pools closed.")
+
+
 # =====================================================
 # Root route (Render health check)
 # =====================================================
@@ -1,11 +1,17 @@
 # backend/app/queue/redis_client.py
 # 🧩 Handles connecting to Redis and publishing messages
 
+import json
+
 import redis
-from backend.app.core.config import settings  # ✅ fixed import path
 
-# Create a global Redis client
-redis_client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+from backend.app.core.clients import get_client_registry
+
+
+def get_queue_redis() -> redis.Redis:
+    """Shared pooled client for settings.redis_url (opened on first use)."""
+    return get_client_registry().redis(decode_responses=True)
+
 
 def push_message(queue_name: str, data: dict):
     """
@@ -14,7 +20,6 @@ def push_message(queue_name: str, data: dict):
         queue_name (str): The name of the queue (e.g. "messages").
         data (dict): The message payload.
     """
-    import json
     payload = json.dumps(data)
-    redis_client.rpush(queue_name, payload)
+    get_queue_redis().rpush(queue_name, payload)
     print(f"📨 Message pushed to queue '{queue_name}'")
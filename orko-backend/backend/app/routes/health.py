@@ -4,6 +4,7 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta, timezone
 from backend.app.db.session import SessionLocal
+from backend.app.core.clients import get_client_registry
 import traceback
 
 router = APIRouter()
@@ -50,6 +51,12 @@ def check_channel(source: str) -> dict:
         db.close()
 
 
+@router.get("/status/clients")
+def client_pool_status():
+    """Per-process pool utilization of the shared Redis / HTTP / DB clients."""
+    return get_client_registry().stats()
+
+
 @router.get("/status/ingestion")
 def ingestion_status():
     """Returns health summary for all ingestion channels."""
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 
 from backend.app.db.session import SessionLocal
 from backend.app.models.parser_metric import ParserMetric
+from backend.app.services.parsing.parser_engine import get_parser_engine
 
 router = APIRouter()
 
@@ -47,3 +48,12 @@ def get_latest_parser_metrics(
         "per_domain_accuracy": metric.per_domain_accuracy,
         "per_action": metric.per_action,
     }
+
+
+@router.get("/parser/metrics/runtime")
+def get_parser_runtime_metrics() -> Dict[str, Any]:
+    """
+    Return live in-process parser counters (parse cache hit/miss/eviction,
+    prompt prefix rebuilds, ...). Values are per worker process.
+    """
+    return get_parser_engine().runtime_stats()
@@ -1,7 +1,8 @@
 # backend/app/routers/telegram.py
 from fastapi import APIRouter, Request, Header, HTTPException, BackgroundTasks
 from fastapi.responses import JSONResponse
-import datetime, httpx
+import datetime
+from backend.app.core.clients import get_client_registry
 from backend.app.core.config import settings
 from backend.app.db.session import SessionLocal
 from backend.app.db.helpers.audit import audit_received, audit_processed, audit_failed
@@ -17,8 +18,8 @@ async def _send_autoreply(chat_id: int, text: str):
     if not token or not chat_id:
         return
     url = f"https://api.telegram.org/bot{token}/sendMessage"
-    async with httpx.AsyncClient(timeout=5) as client:
-        await client.post(url, json={"chat_id": chat_id, "text": text})
+    client = get_client_registry().http()
+    await client.post(url, json={"chat_id": chat_id, "text": text}, timeout=5)
 
 
 async def _save_message_background(payload: dict):
@@ -7,6 +7,7 @@ from fastapi import (
     Depends,
     Header,
     Request,
+    Response,
     HTTPException,
     status,
 )
@@ -17,6 +18,7 @@ from backend.app.schemas.trigger import TriggerRequest, TriggerResponse
 from backend.app.schemas.auth import CurrentUser
 from backend.app.api.deps.auth import require_trigger_role
 from backend.app.api.deps.db import get_db
+from backend.app.api.deps.parser import get_parser
 
 from backend.app.services.trigger_service import TriggerService
 from backend.app.services.workflow.confirmation_service import ConfirmationService
@@ -33,6 +35,7 @@ from backend.app.services.monitoring.abuse_monitor import AbuseMonitor
 
 # ⭐ Confidence gating
 from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.masking import mask_reasoning
 
 from backend.app.core.config import settings
 
@@ -47,8 +50,10 @@ _trigger_service = TriggerService()
 async def post_trigger(
     req: TriggerRequest,
     request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     user: CurrentUser = Depends(require_trigger_role),
+    parser: ParserEngine = Depends(get_parser),
     user_agent: Annotated[str | None, Header(alias="User-Agent")] = None,
 ) -> TriggerResponse:
 
@@ -62,31 +67,51 @@ async def post_trigger(
     org_id = getattr(req, "org_id", None)
 
     try:
-        limiter.check_and_increment(user_id=user_id, org_id=org_id)
-    except RateLimitExceeded:
+        decision = limiter.check_and_increment(user_id=user_id, org_id=org_id)
+    except RateLimitExceeded as exc:
         abuse_monitor.record_violation(user_id=user_id, org_id=org_id)
-        retry_after = settings.RATE_LIMIT_WINDOW_SECONDS
 
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded. Please retry later.",
-            headers={"Retry-After": str(retry_after)},
+            headers={
+                "Retry-After": str(exc.retry_after_seconds),
+                "X-RateLimit-Limit": str(settings.RATE_LIMIT_PER_MINUTE),
+                "X-RateLimit-Remaining": "0",
+            },
         )
 
+    if decision is not None:
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+
     # -----------------------------------------------------------
     # CLIENT IP
     # -----------------------------------------------------------
     client_ip = request.client.host if request.client else None
 
     # -----------------------------------------------------------
-    # ⭐ DAY 9 — Confidence Threshold Gate (<0.6 → human review)
+    # Manual trigger (intent_name + parameters) → no parsing
     # -----------------------------------------------------------
-    parser = ParserEngine()
+    if not req.raw_command:
+        return await _trigger_service.trigger(
+            db=db,
+            user=user,
+            req=req,
+            client_ip=client_ip,
+            user_agent=user_agent,
+        )
 
-    parsed = parser.parse_command(
-        text=req.command,
+    # -----------------------------------------------------------
+    # ⭐ DAY 9 — Confidence Threshold Gate (<0.6 → human review)
+    # The single parse of this request: TriggerService maps this
+    # result instead of parsing the command again.
+    # -----------------------------------------------------------
+    parsed = await parser.parse_command_async(
+        text=req.raw_command,
         context={
-            "org_id": req.org_id,
+            **req.context.data,
+            "org_id": org_id,
             "user_id": user_id,
             "source": getattr(req, "source", None),
             "channel": getattr(req, "channel", None),
@@ -105,15 +130,21 @@ async def post_trigger(
         parsed.setdefault("context", {})
         parsed["context"]["requires_human_review"] = True
 
+        message = "Command parsed with low confidence; human review required."
+        if parsed["context"].get("provisional"):
+            # Parse deadline hit: heuristic result, refined parse is logged later
+            message = "Parser deadline exceeded; provisional parse returned for human review."
+
         return TriggerResponse(
-            trigger_job_id=None,
+            trigger_id=None,
             status="requires_review",
-            message="Command parsed with low confidence; human review required.",
+            simulate=req.simulate,
+            message=message,
             parsed=parsed,
         )
 
     # -----------------------------------------------------------
-    # HIGH CONFIDENCE PATH → TriggerService pipeline
+    # HIGH CONFIDENCE PATH → TriggerService pipeline (map only)
     # -----------------------------------------------------------
     result = await _trigger_service.trigger(
         db=db,
@@ -121,21 +152,17 @@ async def post_trigger(
         req=req,
         client_ip=client_ip,
         user_agent=user_agent,
-        simulate=req.simulate,
+        parsed=parsed,
     )
 
     # -----------------------------------------------------------
     # DAY 7 — DEBUG REASONING MODE
     # -----------------------------------------------------------
     if getattr(req, "debug", False) and user.role == "admin":
-        reasoning = None
-        if hasattr(result, "context") and isinstance(result.context, dict):
-            reasoning = result.context.get("reasoning_trace")
-
-        return {
-            **result.dict(),
-            "debug_reasoning": reasoning,
-        }
+        reasoning = parsed.get("context", {}).get("reasoning_trace")
+        if reasoning:
+            reasoning = mask_reasoning(reasoning)
+        result.debug_reasoning = reasoning
 
     return result
 
@@ -3,9 +3,8 @@
 from fastapi import APIRouter, Request, Header, HTTPException
 from fastapi.responses import JSONResponse
 from twilio.request_validator import RequestValidator
-from twilio.rest import Client
-import os, json, asyncio, datetime, aiohttp
-from concurrent.futures import ThreadPoolExecutor
+import os, json, asyncio, datetime
+from backend.app.core.clients import get_client_registry
 from backend.app.db.session import SessionLocal
 from backend.app.db.helpers.audit import audit_received, audit_processed, audit_failed
 
@@ -124,23 +123,20 @@ async def whatsapp_webhook(
 async def handle_ingestion_and_reply(unified_msg, account_sid, auth_token, from_whatsapp, from_number, content):
     """Handle forwarding and Twilio reply asynchronously in background."""
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"Authorization": "Bearer supersecret123"}
-            async with session.post("http://127.0.0.1:8000/ingest/message", json=unified_msg, headers=headers) as resp:
-                print(f"📤 Background: forwarded to ingestion ({resp.status})")
+        client = get_client_registry().http()
+        headers = {"Authorization": "Bearer supersecret123"}
+        resp = await client.post("http://127.0.0.1:8000/ingest/message", json=unified_msg, headers=headers)
+        print(f"📤 Background: forwarded to ingestion ({resp.status_code})")
     except Exception as e:
         print(f"⚠️ Background ingestion failed: {e}")
 
     try:
-        loop = asyncio.get_event_loop()
-        executor = ThreadPoolExecutor(max_workers=1)
-
         def send_twilio():
-            client = Client(account_sid, auth_token)
+            client = get_client_registry().twilio(account_sid, auth_token)
             reply_text = f"Hi 👋 this is ORKO AI.\nYou said: '{content}'"
             client.messages.create(from_=from_whatsapp, to=from_number, body=reply_text)
             print(f"✅ Background auto-reply sent to {from_number}")
 
-        await loop.run_in_executor(executor, send_twilio)
+        await asyncio.to_thread(send_twilio)
     except Exception as e:
         print(f"❌ Background Twilio reply failed: {e}")
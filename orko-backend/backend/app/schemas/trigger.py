@@ -83,12 +83,27 @@ class TriggerResponse(BaseModel):
     missing_parameters is relevant to Step 6 slot filling.
     """
 
-    trigger_id: str
-    workflow_name: str
+    trigger_id: Optional[str] = None
+    workflow_name: str = ""
     status: str
-    simulate: bool
+    simulate: bool = False
 
     missing_parameters: List[str] = Field(
         default_factory=list,
         description="If slot filling is required, parser identifies missing parameters here.",
     )
+
+    message: Optional[str] = Field(
+        default=None,
+        description="Human-readable status detail (e.g. why review is required).",
+    )
+
+    parsed: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Parser output, returned when the command needs human review.",
+    )
+
+    debug_reasoning: Optional[Any] = Field(
+        default=None,
+        description="Masked reasoning_trace (debug=True, admin only).",
+    )
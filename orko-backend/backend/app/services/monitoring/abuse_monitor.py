@@ -5,7 +5,7 @@ from typing import Optional
 
 import redis
 
-from backend.app.core.config import settings
+from backend.app.services.rate_limit.redis_client import get_rate_limit_redis
 
 logger = logging.getLogger(__name__)
 
@@ -18,9 +18,9 @@ class AbuseMonitor:
     Only counts repeated exceeding of trigger limits (abuse detection).
     """
 
-    def __init__(self) -> None:
-        # Use same Redis as the rate limiter
-        self._redis = redis.from_url(settings.RATE_LIMIT_REDIS_URL)
+    def __init__(self, client: Optional[redis.Redis] = None) -> None:
+        # Same pooled Redis client as the rate limiter
+        self._redis = client or get_rate_limit_redis()
         self._window = 300  # 5 minutes
 
     def _key(self, user_id: Optional[str], org_id: Optional[str]) -> str:
@@ -54,13 +54,33 @@ class IntentMapper:
         """
         return self.map_v7(intent, context or {})
 
+    def map_parsed(self, parsed: Mapping[str, Any], context: Mapping[str, Any] = None) -> dict:
+        """
+        Map a ParserEngine result (no second parse): the parsed dict is
+        turned into an Intent and routed through map_v7.
+        """
+        return self.map_v7(Intent.from_parsed(dict(parsed)), context or {})
+
+    # -----------------------------------------------------
+    # Intent accessors
+    # -----------------------------------------------------
+    @staticmethod
+    def _intent_name(intent: Intent) -> str:
+        # Intent has no separate name: the (canonical) action is the intent name
+        return getattr(intent, "name", None) or intent.action
+
+    @staticmethod
+    def _intent_domain(intent: Intent) -> Optional[str]:
+        return getattr(intent, "domain", None) or (intent.context or {}).get("domain")
+
     # -----------------------------------------------------
     # v1 — Basic mapping
     # -----------------------------------------------------
     def map_v1(self, intent: Intent) -> dict:
-        cfg = self.mapping.get(intent.name)
+        name = self._intent_name(intent)
+        cfg = self.mapping.get(name)
         if not cfg:
-            raise IntentMappingError(f"No mapping for intent: {intent.name}")
+            raise IntentMappingError(f"No mapping for intent: {name}")
         return {"workflow_name": cfg["workflow_name"], "parameters": {}}
 
     # -----------------------------------------------------
@@ -138,18 +158,18 @@ class IntentMapper:
             "hr.create_employee"
             "general.summary"
         """
-        action = self._canonicalize_action(intent)
-        dom = intent.domain or "general"
+        name = self._intent_name(intent)
+        dom = self._intent_domain(intent) or "general"
 
-        composite_key = f"{dom}.{intent.name}"
-        fallback_key = intent.name
+        composite_key = f"{dom}.{name}"
+        fallback_key = name
 
         if composite_key in self.mapping:
             return composite_key
         if fallback_key in self.mapping:
             return fallback_key
 
-        raise IntentMappingError(f"No mapping entry for: {intent.name}")
+        raise IntentMappingError(f"No mapping entry for: {composite_key}")
 
     # -----------------------------------------------------
     # v6 – Telemetry hook
@@ -158,8 +178,8 @@ class IntentMapper:
         TelemetryCollector.record(
             "intent_mapping",
             {
-                "intent": intent.name,
-                "domain": intent.domain,
+                "intent": self._intent_name(intent),
+                "domain": self._intent_domain(intent),
                 "workflow_name": workflow_name,
                 "parameters": params,
                 "risk": intent.context.get("risk_level"),
@@ -37,3 +37,23 @@ class Intent(BaseModel):
         default=None,
         description="Original user text if provided by LLM response"
     )
+
+    @classmethod
+    def from_parsed(cls, parsed: Dict[str, Any]) -> "Intent":
+        """
+        Build an Intent from a ParserEngine result (domain, action,
+        parameters, context, risk_level). The domain travels in context.
+        """
+        ctx = dict(parsed.get("context") or {})
+        ctx["domain"] = parsed.get("domain")
+        risk_level = parsed.get("risk_level") or "medium"
+        ctx.setdefault("risk_level", risk_level)
+        return cls(
+            command=parsed.get("raw_text") or "",
+            action=parsed.get("action") or "",
+            parameters=dict(parsed.get("parameters") or {}),
+            context=ctx,
+            risk_level=risk_level,
+            requires_confirmation=bool(ctx.get("requires_confirmation", False)),
+            raw_text=parsed.get("raw_text"),
+        )
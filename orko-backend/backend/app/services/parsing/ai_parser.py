@@ -1,11 +1,37 @@
 from __future__ import annotations
 
 import json
+import threading
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, Set
 
-from openai import OpenAI
-
+from backend.app.core.config import settings
+from backend.app.services.parsing.config_snapshot import get_config_snapshot
 from backend.app.services.parsing.domain_registry import DomainRegistry
+from backend.app.services.parsing.example_retriever import ExampleRetriever
+from backend.app.services.parsing.llm_backend import LLMBackend
+
+
+@dataclass(frozen=True)
+class PromptPrefix:
+    """
+    Precompiled, immutable message prefix shared by every parse call:
+    the static system instructions + all cross-domain few-shot pairs.
+
+    `fingerprint` holds the config-snapshot digests of domain_examples.yml
+    and prompt_versions.json it was built from, so a hot reload of either
+    file is detected with a tuple compare instead of a rebuild.
+    """
+
+    messages: Tuple[Dict[str, Any], ...]
+    fingerprint: Tuple[str, ...]
+
+    # Retrieval mode: static system message (no global action list),
+    # pre-serialized (user, assistant) pair per example, and the BM25 index
+    # whose doc_ids line up with example_pairs.
+    retrieval_system: Dict[str, Any]
+    example_pairs: Tuple[Tuple[Dict[str, Any], Dict[str, Any]], ...]
+    retriever: ExampleRetriever
 
 
 class AIParser:
@@ -30,10 +56,33 @@ class AIParser:
          (used to fill missing keys and normalize values).
     """
 
-    def __init__(self, model: str = "gpt-4.1-mini") -> None:
+    def __init__(
+        self,
+        model: str = "gpt-4.1-mini",
+        fewshot_mode: Optional[str] = None,
+        fewshot_k: Optional[int] = None,
+        fewshot_max_domains: Optional[int] = None,
+        fewshot_token_budget: Optional[int] = None,
+        llm_backend: Optional[LLMBackend] = None,
+    ) -> None:
         self.model = model
-        self.client = OpenAI()
-        self.registry = DomainRegistry()
+        # Transport: live OpenAI, or record / replay / stub (PARSER_LLM_BACKEND)
+        self.llm_backend = llm_backend or LLMBackend()
+        self.client = self.llm_backend.sync_client()
+        # The async client is created lazily, on first parse_async() call, so
+        # that sync-only callers (scripts, Celery) never open an async HTTP pool.
+        self._async_client: Optional[Any] = None
+        self.registry = DomainRegistry(data=get_config_snapshot().domain_examples)
+
+        # Few-shot selection knobs (see class docstring)
+        self.fewshot_mode = fewshot_mode or settings.PARSER_FEWSHOT_MODE
+        self.fewshot_k = fewshot_k or settings.PARSER_FEWSHOT_K
+        self.fewshot_max_domains = fewshot_max_domains or settings.PARSER_FEWSHOT_MAX_DOMAINS
+        self.fewshot_token_budget = (
+            settings.PARSER_FEWSHOT_TOKEN_BUDGET
+            if fewshot_token_budget is None
+            else fewshot_token_budget
+        )
 
         # Semi-strict catalogs
         self.allowed_actions: Dict[str, Set[str]] = {}
@@ -42,6 +91,12 @@ class AIParser:
 
         self._build_action_catalog()
 
+        # Precompiled prompt prefix (built lazily, rebuilt on config change)
+        self._prompt_prefix: Optional[PromptPrefix] = None
+        self._prompt_lock = threading.Lock()
+        self.prompt_prefix_builds = 0
+        self.prompt_prefix_hits = 0
+
     # ============================================================
     # Catalog builder (from DomainRegistry examples)
     # ============================================================
@@ -56,6 +111,12 @@ class AIParser:
         """
         domains = getattr(self.registry, "domains", []) or []
 
+        # Build into fresh dicts and swap at the end, so concurrent readers
+        # never see a half-built catalog during a reload.
+        allowed_actions: Dict[str, Set[str]] = {}
+        allowed_params: Dict[Tuple[str, str], Set[str]] = {}
+        default_params: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
         for domain in domains:
             cfg = self.registry.get_examples(domain) or {}
             examples = cfg.get("examples", []) or []
@@ -74,17 +135,21 @@ class AIParser:
                 key = (domain, action)
 
                 # Allowed parameter names
-                if key not in self.allowed_params:
-                    self.allowed_params[key] = set()
-                self.allowed_params[key].update(params.keys())
+                if key not in allowed_params:
+                    allowed_params[key] = set()
+                allowed_params[key].update(params.keys())
 
                 # Canonical default parameter values (first example wins)
-                if key not in self.default_params:
+                if key not in default_params:
                     # shallow copy is enough (flat dict)
-                    self.default_params[key] = dict(params)
+                    default_params[key] = dict(params)
 
             if actions:
-                self.allowed_actions[domain] = actions
+                allowed_actions[domain] = actions
+
+        self.allowed_actions = allowed_actions
+        self.allowed_params = allowed_params
+        self.default_params = default_params
 
     def _allowed_actions_text_global(self) -> str:
         """
@@ -92,6 +157,13 @@ class AIParser:
 
         This replaces domain-specific guidance that over-biased the model.
         """
+        return self._allowed_actions_text()
+
+    def _allowed_actions_text(self, domains: Optional[List[str]] = None) -> str:
+        """
+        Human-readable list of allowed actions, for all domains (None) or
+        only the given candidate domains (retrieval mode).
+        """
         if not self.allowed_actions:
             return (
                 "There is currently no registered canonical action list.\n"
@@ -102,7 +174,7 @@ class AIParser:
 
         lines: List[str] = []
         for domain, actions in sorted(self.allowed_actions.items(), key=lambda kv: kv[0]):
-            if not actions:
+            if not actions or (domains is not None and domain not in domains):
                 continue
             actions_list = ", ".join(sorted(actions))
             lines.append(f"- {domain}: {actions_list}")
@@ -121,23 +193,17 @@ class AIParser:
         )
 
     # ============================================================
-    # Few-shot builder (CROSS-DOMAIN)
+    # Few-shot builder (CROSS-DOMAIN, precompiled prefix)
     # ============================================================
 
-    def _build_few_shot_messages(self, domain_hint: Optional[str]) -> List[Dict[str, Any]]:
-        """
-        Build few-shot messages using EXAMPLES FROM ALL DOMAINS.
+    @staticmethod
+    def _prompt_sources_fingerprint() -> Tuple[str, ...]:
+        digests = get_config_snapshot().digests
+        return (digests.get("domain_examples", ""), digests.get("prompt_versions", ""))
 
-        - domain_hint is a soft hint only, mentioned in system text.
-        """
-        allowed_actions_text = self._allowed_actions_text_global()
+    def _system_text(self, allowed_actions_text: str, scope: str = "ALL DOMAINS") -> str:
         valid_domains = ", ".join(getattr(self.registry, "domains", []) or [])
-
-        hint = (domain_hint or "").strip()
-        domains = getattr(self.registry, "domains", []) or []
-        hint_normalized = hint if hint in domains else "none"
-
-        system_text = (
+        return (
             "You are ORKO's deterministic command parser.\n"
             "You MUST output ONLY valid JSON. No explanations, no extra text.\n"
             "\n"
@@ -151,14 +217,15 @@ class AIParser:
             "\n"
             f"Valid domains: {valid_domains}\n"
             "If user context suggests a domain, it is a soft hint ONLY.\n"
-            f"Current soft domain hint (may be \"none\"): {hint_normalized}\n"
+            "The current soft domain hint (may be \"none\") is given right before\n"
+            "the user command.\n"
             "\n"
             "IMPORTANT:\n"
             "- Choose the domain based on the ACTUAL command text.\n"
             "- You MAY override the soft domain hint if the text clearly belongs\n"
             "  to another domain.\n"
             "\n"
-            "DOMAIN / ACTION GUIDANCE (ALL DOMAINS):\n"
+            f"DOMAIN / ACTION GUIDANCE ({scope}):\n"
             f"{allowed_actions_text}\n"
             "PARAMETER RULES:\n"
             "- \"parameters\" MUST ALWAYS be a JSON object (never null, never a list).\n"
@@ -183,46 +250,148 @@ class AIParser:
             "- Return ONLY ONE JSON object as the entire response.\n"
         )
 
-        messages: List[Dict[str, Any]] = [
-            {
-                "role": "system",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": system_text,
-                    }
-                ],
-            }
-        ]
+    def _compile_prompt_prefix(self, fingerprint: Tuple[str, ...]) -> PromptPrefix:
+        """
+        Build the static part of the prompt ONCE:
+        system instructions + examples from ALL domains.
 
-        # Cross-domain few-shots
-        for domain in domains:
-            cfg = self.registry.get_examples(domain) or {}
-            examples = cfg.get("examples", []) or []
+        The soft domain hint is NOT part of the prefix; it is appended per call
+        by _build_few_shot_messages(). Retrieval mode reuses the same
+        pre-serialized example pairs, indexed by ExampleRetriever doc_id.
+        """
+        system_text = self._system_text(self._allowed_actions_text_global())
+        retrieval_system_text = self._system_text(
+            "The canonical actions for the most likely domains are listed in the\n"
+            "next system message. Prefer those actions for the chosen domain.\n",
+            scope="CANDIDATE DOMAINS",
+        )
 
-            # If prompt size becomes a problem, slice here: examples = examples[:N]
-            for ex in examples:
-                cmd = ex.get("command") or ""
-                expected = ex.get("expected") or {}
+        retriever = ExampleRetriever(self.registry)
 
-                messages.append(
+        # Cross-domain few-shots (retriever order == registry order)
+        pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for ex in retriever.examples:
+            pairs.append(
+                (
                     {
                         "role": "user",
-                        "content": [{"type": "input_text", "text": cmd}],
-                    }
-                )
-                messages.append(
+                        "content": [{"type": "input_text", "text": ex.command}],
+                    },
                     {
                         "role": "assistant",
                         "content": [
                             {
                                 "type": "output_text",
-                                "text": json.dumps(expected, ensure_ascii=False),
+                                "text": json.dumps(ex.expected, ensure_ascii=False),
                             }
                         ],
-                    }
+                    },
                 )
+            )
+
+        messages: List[Dict[str, Any]] = [self._system_message(system_text)]
+        for user_msg, assistant_msg in pairs:
+            messages.append(user_msg)
+            messages.append(assistant_msg)
+
+        return PromptPrefix(
+            messages=tuple(messages),
+            fingerprint=fingerprint,
+            retrieval_system=self._system_message(retrieval_system_text),
+            example_pairs=tuple(pairs),
+            retriever=retriever,
+        )
+
+    @staticmethod
+    def _system_message(text: str) -> Dict[str, Any]:
+        return {
+            "role": "system",
+            "content": [
+                {
+                    "type": "input_text",
+                    "text": text,
+                }
+            ],
+        }
+
+    def _get_prompt_prefix(self) -> PromptPrefix:
+        """
+        Return the cached prefix, rebuilding it (and the registry/catalog) only
+        when domain_examples.yml or prompt_versions.json changed in the
+        config snapshot.
+        """
+        fingerprint = self._prompt_sources_fingerprint()
+        prefix = self._prompt_prefix
+        if prefix is not None and prefix.fingerprint == fingerprint:
+            self.prompt_prefix_hits += 1
+            return prefix
+
+        with self._prompt_lock:
+            prefix = self._prompt_prefix
+            if prefix is not None and prefix.fingerprint == fingerprint:
+                self.prompt_prefix_hits += 1
+                return prefix
+
+            # Examples changed since the last build → reload registry + catalog
+            if prefix is not None and prefix.fingerprint[0] != fingerprint[0]:
+                self.registry = DomainRegistry(data=get_config_snapshot().domain_examples)
+                self._build_action_catalog()
+
+            prefix = self._compile_prompt_prefix(fingerprint)
+            self._prompt_prefix = prefix
+            self.prompt_prefix_builds += 1
+            return prefix
+
+    def prompt_cache_stats(self) -> Dict[str, int]:
+        """Counters for the precompiled prompt prefix (builds vs reuses)."""
+        prefix = self._prompt_prefix
+        return {
+            "builds": self.prompt_prefix_builds,
+            "hits": self.prompt_prefix_hits,
+            "prefix_messages": len(prefix.messages) if prefix else 0,
+        }
+
+    def _build_few_shot_messages(
+        self,
+        domain_hint: Optional[str],
+        command: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build few-shot messages.
 
+        - "all" mode: the precompiled prefix with EXAMPLES FROM ALL DOMAINS.
+        - "retrieval" mode (needs `command`): static system text, the action
+          catalogs of the candidate domains, and only the k closest examples.
+        - domain_hint is a soft hint only, appended as a short system message.
+        """
+        prefix = self._get_prompt_prefix()
+
+        hint = (domain_hint or "").strip()
+        domains = getattr(self.registry, "domains", []) or []
+        hint_normalized = hint if hint in domains else "none"
+
+        if self.fewshot_mode == "retrieval" and command:
+            picked, candidates = prefix.retriever.select(
+                command,
+                k=self.fewshot_k,
+                max_domains=self.fewshot_max_domains,
+                token_budget=self.fewshot_token_budget,
+                domain_hint=hint_normalized,
+            )
+            messages: List[Dict[str, Any]] = [
+                prefix.retrieval_system,
+                self._system_message(self._allowed_actions_text(candidates)),
+            ]
+            for ex in picked:
+                user_msg, assistant_msg = prefix.example_pairs[ex.doc_id]
+                messages.append(user_msg)
+                messages.append(assistant_msg)
+        else:
+            messages = list(prefix.messages)
+
+        messages.append(
+            self._system_message(f"Current soft domain hint (may be \"none\"): {hint_normalized}")
+        )
         return messages
 
     # ============================================================
@@ -349,45 +518,48 @@ class AIParser:
     # MAIN PARSE FUNCTION
     # ============================================================
 
-    def parse(
+    @property
+    def async_client(self) -> Any:
+        if self._async_client is None:
+            self._async_client = self.llm_backend.async_client()
+        return self._async_client
+
+    def _prepare_request(
         self,
         command: str,
-        context: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        context: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], str, Optional[str]]:
         """
-        Main entrypoint used by ParserEngine.
-
-        FLOW:
-        - Read optional domain_hint from context (soft).
-        - Build CROSS-DOMAIN few-shot messages (all domains).
-        - Call Responses API.
-        - Apply semi-strict domain / action / parameter post-processing.
-        - ParserEngine will then call canonicalizer() on top of this.
+        Shared by parse() and parse_async().
+        Returns (messages, fallback_domain, domain_hint).
         """
-        context = context or {}
-
         # Soft domain hint
         domain_hint = context.get("domain")
         # Still compute a guessed domain for absolute fallback
         fallback_domain = self.registry.guess_domain(command)
 
         # Build cross-domain messages with soft hint
-        messages = self._build_few_shot_messages(domain_hint=domain_hint)
+        messages = self._build_few_shot_messages(domain_hint=domain_hint, command=command)
         messages.append(
             {
                 "role": "user",
                 "content": [{"type": "input_text", "text": command}],
             }
         )
+        return messages, fallback_domain, domain_hint
 
-        # -------------------------------
-        # Responses API call
-        # -------------------------------
-        resp = self.client.responses.create(
-            model=self.model,
-            input=messages,
-        )
-
+    def _finalize_response(
+        self,
+        resp: Any,
+        command: str,
+        context: Dict[str, Any],
+        fallback_domain: str,
+        domain_hint: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Shared by parse() and parse_async(): response text -> JSON ->
+        semi-strict post-processing.
+        """
         # -------------------------------
         # Extract text from response
         # -------------------------------
@@ -432,3 +604,50 @@ class AIParser:
         parsed = self._postprocess_parsed(parsed, command, domain_hint)
 
         return parsed
+
+    def parse(
+        self,
+        command: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Main entrypoint used by ParserEngine.
+
+        FLOW:
+        - Read optional domain_hint from context (soft).
+        - Build few-shot messages (all domains, or retrieved subset).
+        - Call Responses API.
+        - Apply semi-strict domain / action / parameter post-processing.
+        - ParserEngine will then call canonicalizer() on top of this.
+        """
+        context = context or {}
+        messages, fallback_domain, domain_hint = self._prepare_request(command, context)
+
+        # -------------------------------
+        # Responses API call
+        # -------------------------------
+        resp = self.client.responses.create(
+            model=self.model,
+            input=messages,
+        )
+
+        return self._finalize_response(resp, command, context, fallback_domain, domain_hint)
+
+    async def parse_async(
+        self,
+        command: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Same as parse(), but awaits the Responses API through AsyncOpenAI so
+        the event loop keeps serving other requests during the LLM call.
+        """
+        context = context or {}
+        messages, fallback_domain, domain_hint = self._prepare_request(command, context)
+
+        resp = await self.async_client.responses.create(
+            model=self.model,
+            input=messages,
+        )
+
+        return self._finalize_response(resp, command, context, fallback_domain, domain_hint)
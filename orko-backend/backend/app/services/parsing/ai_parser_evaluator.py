@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import argparse
 import json
 from pathlib import Path
 from typing import Dict, List, Any
 
 import yaml
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.llm_backend import (
+    add_llm_backend_arguments,
+    apply_llm_backend_arguments,
+)
+from backend.app.services.parsing.parser_engine import get_parser_engine
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -27,7 +32,7 @@ class AIParserEvaluator:
     """
 
     def __init__(self):
-        self.engine = ParserEngine()
+        self.engine = get_parser_engine()
 
     # ---------------------------------------------------------
     # Load test commands from YAML
@@ -105,6 +110,10 @@ class AIParserEvaluator:
 # Optional CLI execution
 # -------------------------------------------------------------
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="ORKO multi-domain AIParser evaluator")
+    add_llm_backend_arguments(ap)
+    apply_llm_backend_arguments(ap.parse_args())
+
     evaluator = AIParserEvaluator()
     out = evaluator.run()
     print(json.dumps(out, indent=2))
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from backend.app.services.parsing.config_snapshot import (
+    get_config_snapshot,
+    refresh_config_snapshot,
+)
+from backend.app.services.parsing.keyword_matcher import DOMAIN_MATCHER
 
 
 def _norm(s: str | None) -> str:
@@ -9,79 +18,132 @@ def _norm(s: str | None) -> str:
     return s.strip().lower()
 
 
-# Set of canonical domains used by ORKO / eval
-_CANONICAL_DOMAINS = {
-    "trading",
-    "logistics",
-    "finance",
-    "hr",
-    "it_ops",
-    "devops",
-    "customer_support",
-    "operations",
-    "analytics",
-    "sales",
-    "marketing",
-    "procurement",
-    "manufacturing",
-    "legal",
-    "retail",
-    "energy",
-    "healthcare_admin",
-    "general_admin",
-    "knowledge_work",
-}
+# ============================================================
+# Declarative canonicalization tables
+# ============================================================
+# config/canonicalization.json is compiled (as part of the parser config
+# snapshot) into O(1) lookups keyed by alias (domains) or (domain, alias)
+# (actions). The few text-conditioned
+# mappings are small predicate rules checked before the plain alias.
+
+CANONICALIZATION_PATH = Path(__file__).resolve().parent / "config" / "canonicalization.json"
+
+
+@dataclass(frozen=True)
+class CanonicalRule:
+    """
+    Conditional mapping. Every condition that is set must hold:
+    - text_any:        any of these substrings appears in the lowercased raw text
+    - action_in:       normalized action is one of these
+    - param_any:       any of these parameter keys is present
+    - action_contains: substring of the normalized action
+    """
+
+    then: str
+    text_any: Tuple[str, ...] = ()
+    action_in: FrozenSet[str] = frozenset()
+    param_any: Tuple[str, ...] = ()
+    action_contains: str = ""
+
+    def matches(self, text: str, action: str, parameters: Dict[str, Any]) -> bool:
+        if self.text_any and not any(k in text for k in self.text_any):
+            return False
+        if self.action_in and action not in self.action_in:
+            return False
+        if self.param_any and not any(k in parameters for k in self.param_any):
+            return False
+        if self.action_contains and self.action_contains not in action:
+            return False
+        return True
+
+    @classmethod
+    def from_config(cls, cfg: Dict[str, Any]) -> "CanonicalRule":
+        return cls(
+            then=cfg["then"],
+            text_any=tuple(k.lower() for k in cfg.get("if_text_any") or ()),
+            action_in=frozenset(cfg.get("if_action_in") or ()),
+            param_any=tuple(cfg.get("if_param_any") or ()),
+            action_contains=cfg.get("if_action_contains") or "",
+        )
+
+
+@dataclass(frozen=True)
+class CanonicalTable:
+    canonical_domains: FrozenSet[str]
+    generic_domains: FrozenSet[str]
+    domain_aliases: Dict[str, str]
+    domain_rules: Dict[str, Tuple[CanonicalRule, ...]]
+    action_aliases: Dict[Tuple[str, str], str]
+    action_rules: Dict[Tuple[str, str], Tuple[CanonicalRule, ...]]
+    action_patterns: Dict[str, Tuple[CanonicalRule, ...]]
+
+
+def compile_canonical_table(cfg: Dict[str, Any]) -> CanonicalTable:
+    """Compiles the declarative config into flat lookup dictionaries."""
+
+    def rules(items: Any) -> Tuple[CanonicalRule, ...]:
+        return tuple(CanonicalRule.from_config(r) for r in items or ())
+
+    action_aliases: Dict[Tuple[str, str], str] = {}
+    for domain, aliases in (cfg.get("action_aliases") or {}).items():
+        for alias, target in aliases.items():
+            action_aliases[(domain, alias)] = target
+
+    action_rules: Dict[Tuple[str, str], Tuple[CanonicalRule, ...]] = {}
+    for domain, by_alias in (cfg.get("action_rules") or {}).items():
+        for alias, items in by_alias.items():
+            action_rules[(domain, alias)] = rules(items)
+
+    return CanonicalTable(
+        canonical_domains=frozenset(cfg.get("canonical_domains") or ()),
+        generic_domains=frozenset(cfg.get("generic_domains") or ()),
+        domain_aliases=dict(cfg.get("domain_aliases") or {}),
+        domain_rules={d: rules(r) for d, r in (cfg.get("domain_rules") or {}).items()},
+        action_aliases=action_aliases,
+        action_rules=action_rules,
+        action_patterns={d: rules(r) for d, r in (cfg.get("action_patterns") or {}).items()},
+    )
+
+
+def load_canonical_table(path: Path = CANONICALIZATION_PATH) -> CanonicalTable:
+    if not path.exists():
+        return compile_canonical_table({})
+    with path.open("r", encoding="utf-8") as f:
+        return compile_canonical_table(json.load(f))
+
+
+def get_canonical_table() -> CanonicalTable:
+    """Compiled table from the current parser config snapshot."""
+    return get_config_snapshot().canonical_table
+
+
+def reload_canonical_table() -> CanonicalTable:
+    """Forces a config snapshot reload (no deploy needed for alias changes)."""
+    refresh_config_snapshot(force=True)
+    return get_canonical_table()
 
 
 def _heuristic_domain_from_text(text: str, default: str | None = None) -> str | None:
     """
     Lightweight heuristic domain guess based ONLY on the raw text.
 
-    Mirrors CommandParser._guess_domain, but side-effect free and safe to call
+    Same shared keyword matcher as CommandParser._guess_domain (one regex
+    scan, highest per-domain score wins); side-effect free and safe to call
     from canonicalization.
     """
-    t = text.lower()
-
-    if any(k in t for k in ["contract", "hedge", "pnl", "hedging", "mt", "shipment"]):
-        return "trading"
-    if any(k in t for k in ["ship", "vessel", "eta", "load", "port", "truck", "warehouse", "delivery"]):
-        return "logistics"
-    if any(k in t for k in ["invoice", "cashflow", "pnl", "tax", "budget", "expense"]):
-        return "finance"
-    if any(k in t for k in ["employee", "onboarding", "vacation", "leave", "hr"]):
-        return "hr"
-    if any(k in t for k in ["service", "incident", "cluster", "server", "restart", "patch"]):
-        return "it_ops"
-    if any(k in t for k in ["microservice", "load test", "deploy pipeline", "devops"]):
-        return "devops"
-    if any(k in t for k in ["ticket", "support case", "escalation"]):
-        return "customer_support"
-    if any(k in t for k in ["maintenance", "checklist", "operational risk", "incidents", "staffing"]):
-        return "operations"
-    if any(k in t for k in ["forecast", "demand", "retention", "churn", "analytics"]):
-        return "analytics"
-    if any(k in t for k in ["opportunity", "pipeline", "win-loss", "sales"]):
-        return "sales"
-    if any(k in t for k in ["campaign", "marketing", "engagement", "social media"]):
-        return "marketing"
-    if any(k in t for k in ["purchase order", "suppliers", "vendor", "sourcing"]):
-        return "procurement"
-    if any(k in t for k in ["machine", "work orders", "plant", "assembly"]):
-        return "manufacturing"
-    if any(k in t for k in ["nda", "contract", "compliance", "regulation", "legal"]):
-        return "legal"
-    if any(k in t for k in ["store", "inventory", "stockout", "retail"]):
-        return "retail"
-    if any(k in t for k in ["grid", "outage", "energy", "renewable"]):
-        return "energy"
-    if any(k in t for k in ["patient", "claims", "lab results"]):
-        return "healthcare_admin"
-    if any(k in t for k in ["meeting", "travel request", "okr", "office supplies"]):
-        return "general_admin"
-    if any(k in t for k in ["knowledge base", "documentation", "specification", "docs"]):
-        return "knowledge_work"
+    return DOMAIN_MATCHER.best(text, default=default)
 
-    return default
+
+def _first_match(
+    rules: Tuple[CanonicalRule, ...],
+    text: str,
+    action: str,
+    parameters: Dict[str, Any],
+) -> Optional[str]:
+    for rule in rules:
+        if rule.matches(text, action, parameters):
+            return rule.then
+    return None
 
 
 def canonicalize_domain(
@@ -89,6 +151,7 @@ def canonicalize_domain(
     action: str | None,
     parameters: Dict[str, Any],
     raw_text: str,
+    table: Optional[CanonicalTable] = None,
 ) -> str:
     """
     Map model-friendly / fuzzy domains into the strict canonical domains
@@ -99,69 +162,36 @@ def canonicalize_domain(
       the model already chose a canonical domain. This recovers mis-classified
       retail / energy / healthcare / operations, etc.
     """
+    t = table or get_canonical_table()
 
     d = _norm(domain)
     a = _norm(action)
     text = raw_text.lower()
 
     # -------------------------------
-    # 1. Straight synonyms / casing
+    # 1. Synonyms (predicate rules first, then plain aliases)
     # -------------------------------
+    rules = t.domain_rules.get(d)
+    if rules:
+        hit = _first_match(rules, text, a, parameters)
+        if hit:
+            return hit
 
-    if d in {"it-ops", "it_ops", "it"}:
-        return "it_ops"
-
-    if d in {"software_testing"}:
-        return "devops"
-
-    if d in {"inventory_management"}:
-        return "retail"
-
-    if d in {"energy_management", "energy_management_additional"}:
-        return "energy"
-
-    if d in {"customer_analysis", "customer_analytics"}:
-        if "ticket" in text or "sentiment" in text:
-            return "customer_support"
-        if "churn" in text or "retention" in text:
-            return "analytics"
-        return "analytics"
-
-    if d == "customer_feedback":
-        return "retail"
-
-    if d == "contract_management":
-        if a in ("approve_contract_renewal",) or "vendor_name" in parameters:
-            return "procurement"
-        return "legal"
-
-    if d == "compliance":
-        return "legal"
-
-    if d == "audit":
-        return "legal"
-
-    if d in {"travel", "calendar", "communication", "management"}:
-        return "general_admin"
-
-    if d == "lab_management":
-        return "healthcare_admin"
-
-    if d in {"knowledge_management", "document_management", "documentation"}:
-        return "knowledge_work"
+    alias = t.domain_aliases.get(d)
+    if alias:
+        return alias
 
     # ---------------------------------------------
     # 2. If domain is already canonical → still allow heuristics
     # ---------------------------------------------
-    if d in _CANONICAL_DOMAINS:
+    if d in t.canonical_domains:
         guessed = _heuristic_domain_from_text(text, default=d)
         return guessed or d
 
     # -------------------------------------------------
     # 3. Generic / missing / unknown domain → heuristics
     # -------------------------------------------------
-    generic_markers = {"", "general", "misc", "unassigned", "other"}
-    if d in generic_markers or domain is None:
+    if d in t.generic_domains or domain is None:
         guessed = _heuristic_domain_from_text(text, default="general_admin")
         if guessed:
             return guessed
@@ -181,363 +211,53 @@ def canonicalize_action(
     action: str | None,
     parameters: Dict[str, Any],
     raw_text: str,
+    table: Optional[CanonicalTable] = None,
 ) -> str:
     """
     Map fuzzy / generic actions into strict canonical actions from the eval.
+
+    Lookup order for (domain, action):
+      1) predicate rules  2) plain alias  3) domain-wide action patterns
+    Anything unmatched is returned normalized, as-is.
     """
+    t = table or get_canonical_table()
 
     d = domain  # already canonical
     a = _norm(action)
-    text = raw_text.lower()
-
-    # --- Logistics ---------------------------------------------------------
-    if d == "logistics":
-        if a in {"book_truck", "book_transport", "create_truck_booking"}:
-            return "book_truck"
-
-        if a in {"list_vessels", "list_ships"}:
-            return "list_vessels"
-
-        if a in {"allocate_warehouse_slot", "allocate_slot"}:
-            return "allocate_warehouse_slot"
-
-        if a in {"list_delayed_shipments", "list_delays"}:
-            return "list_delayed_shipments"
-
-        if a in {"create_delivery_schedule", "create_schedule"}:
-            return "create_delivery_schedule"
-
-    # --- Finance -----------------------------------------------------------
-    if d == "finance":
-        if a in {"generate_cashflow_report", "cashflow_report"}:
-            return "generate_cashflow_report"
-
-        if a in {"list_overdue_invoices", "overdue_invoices"}:
-            return "list_overdue_invoices"
-
-        if a in {"show_operating_expenses", "operating_expenses"}:
-            return "show_operating_expenses"
-
-        if a in {"generate_tax_summary", "tax_summary"}:
-            return "generate_tax_summary"
-
-        if a in {"invoice_aging", "invoice_aging_report"}:
-            return "invoice_aging"
-
-        if a in {"prepare_budget_forecast", "budget_forecast"}:
-            return "prepare_budget_forecast"
-
-    # --- HR ---------------------------------------------------------------
-    if d == "hr":
-        if a in {"create_employee", "add_employee"}:
-            return "create_employee"
-
-        if a in {"list_vacations", "list_leaves"}:
-            return "list_vacations"
-
-        if a in {"add_leave", "create_leave"}:
-            return "add_leave"
-
-        if a in {"promote_employee", "promotion"}:
-            return "promote_employee"
-
-        if a in {"schedule_onboarding", "onboarding"}:
-            return "schedule_onboarding"
-
-    # --- IT Ops ------------------------------------------------------------
-    if d == "it_ops":
-        if a in {"create_ticket", "open_ticket", "open_incident"}:
-            return "create_ticket"
-
-        if a in {"restart_service", "restart"}:
-            return "restart_service"
-
-        if a in {"run_diagnostics", "diagnostics"}:
-            return "run_diagnostics"
-
-        if a in {"rotate_logs", "log_rotation"}:
-            return "rotate_logs"
-
-        if a in {"schedule_patch", "patch_update"}:
-            return "schedule_patch"
-
-        if a in {"draft_dr_plan", "disaster_recovery_plan"}:
-            return "draft_dr_plan"
-
-        if a in {"deploy_service", "deploy"}:
-            return "deploy_service"
-
-        if a in {"list_unresolved_tickets"}:
-            return "list_unresolved_tickets"
-
-        if a in {"list_outages"} and "outage" in text:
-            return "list_outages"
-
-    # --- DevOps ------------------------------------------------------------
-    if d == "devops":
-        if a in {"deploy_microservice", "deploy_service", "deploy"}:
-            return "deploy_microservice"
-
-        if a in {"rollback_service", "rollback"}:
-            return "rollback_service"
-
-        if a in {"adjust_resources", "scale_resources"}:
-            return "adjust_resources"
-
-        if a in {"rebuild_dashboard", "rebuild"}:
-            return "rebuild_dashboard"
-
-        if a in {"run_load_test", "load_test"}:
-            return "run_load_test"
-
-    # --- Customer Support --------------------------------------------------
-    if d == "customer_support":
-        if a == "list_tickets":
-            return "list_tickets"
-
-        if a == "list_unresolved_tickets":
-            return "list_unresolved_tickets"
-
-        if a in {"sentiment_classification", "classify_tickets"}:
-            if "sentiment" in text or "emotion" in text:
-                return "sentiment_classification"
-
-        if a in {"list_escalations", "escalations"}:
-            return "list_escalations"
-
-        if a in {"create_case", "open_case"}:
-            return "create_case"
-
-        if a in {"escalate_ticket", "escalate"}:
-            return "escalate_ticket"
+    key = (d, a)
 
-    # --- Operations --------------------------------------------------------
-    if d == "operations":
-        if a == "create_checklist":
-            return "create_checklist"
+    rules = t.action_rules.get(key)
+    if rules:
+        hit = _first_match(rules, raw_text.lower(), a, parameters)
+        if hit:
+            return hit
 
-        if a in {"schedule_preventive_maintenance", "schedule_maintenance"}:
-            return "schedule_maintenance"
+    alias = t.action_aliases.get(key)
+    if alias:
+        return alias
 
-        if a == "list_risks":
-            return "list_risks"
-
-        if a == "summarize_incidents":
-            return "summarize_incidents"
-
-        if a == "forecast_staffing":
-            return "forecast_staffing"
-
-        if a == "create_safety_checklist":
-            return "create_safety_checklist"
-
-    # --- Manufacturing -----------------------------------------------------
-    if d == "manufacturing":
-        # NEW: utilization mapping for CMD-089 type commands
-        if a in {"machine_utilization", "show"} and "utilization" in text:
-            return "machine_utilization"
-
-        if a in {"machine_downtime_report", "downtime_report"}:
-            return "machine_downtime_report"
-
-        if a in {"optimize_process", "optimize_line_sequence"}:
-            return "optimize_line_sequence"
-
-        if a == "assign_technicians":
-            return "assign_technicians"
-
-        if a == "record_inspection_results":
-            return "record_inspection_results"
-
-        if a in {"schedule_calibration", "schedule_task"}:
-            return "schedule_calibration"
-
-        if a == "list_work_orders":
-            return "list_work_orders"
-
-    # --- Procurement -------------------------------------------------------
-    if d == "procurement":
-        if a == "list_overdue_suppliers":
-            return "list_overdue_suppliers"
-
-        if a == "approve_vendor_contract":
-            return "approve_vendor_contract"
-
-        if a == "create_sourcing_plan":
-            return "create_sourcing_plan"
-
-        if a == "procurement_savings_report":
-            return "procurement_savings_report"
-
-        if a == "create_procurement_tracker":
-            return "create_procurement_tracker"
-
-        if a == "create_purchase_order":
-            return "create_purchase_order"
-
-        if a == "initiate_procurement":
-            return "initiate_procurement"
-
-    # --- Legal -------------------------------------------------------------
-    if d == "legal":
-        if a == "draft_nda":
-            return "draft_nda"
-
-        if a == "list_compliance_actions":
-            return "list_compliance_actions"
-
-        if a == "review_contract":
-            return "review_contract"
-
-        if a == "draft_employment_contract":
-            return "draft_employment_contract"
-
-        if a == "review_compliance_docs":
-            return "review_compliance_docs"
-
-        if a == "prepare_briefing":
-            return "prepare_briefing"
-
-        if a == "summarize_audit_findings":
-            return "summarize_audit_findings"
-
-    # --- Retail ------------------------------------------------------------
-    if d == "retail":
-        if a == "check_inventory":
-            return "check_inventory"
-
-        if a == "generate_sales_report":
-            return "generate_sales_report"
-
-        if a == "list_stockout_risk":
-            return "list_stockout_risk"
-
-        if a == "summarize_feedback":
-            return "summarize_feedback"
-
-        if a == "plan_replenishment":
-            return "plan_replenishment"
-
-        if a == "top_products":
-            return "top_products"
-
-    # --- Energy ------------------------------------------------------------
-    if d == "energy":
-        if a in {"consumption_summary", "generate_summary", "create"} and (
-            "consumption" in text or "energy" in text
-        ):
-            return "consumption_summary"
-
-        if a in {"forecast_grid_demand", "forecast_demand"}:
-            return "forecast_grid_demand"
-
-        if a in {"list_outages", "list_events"}:
-            return "list_outages"
-
-        if a in {"renewable_output_analysis", "analyze"} and "renewable" in text:
-            return "renewable_output_analysis"
-
-        if a in {"inspect_outage_reports"} or "anomaly_detection" in a:
-            return "inspect_outage_reports"
-
-        if a == "optimize_energy_usage":
-            return "optimize_energy_usage"
-
-    # --- Analytics ---------------------------------------------------------
-    if d == "analytics":
-        if a == "revenue_breakdown":
-            return "revenue_breakdown"
-
-        if a == "retention_analysis":
-            return "retention_analysis"
-
-        if a == "forecast_demand":
-            return "forecast_demand"
-
-        if a == "churn_analysis":
-            return "churn_analysis"
-
-    # --- Sales -------------------------------------------------------------
-    if d == "sales":
-        if a == "create_opportunity":
-            return "create_opportunity"
-
-        if a == "show_pipeline":
-            return "show_pipeline"
-
-        if a == "win_loss_analysis":
-            return "win_loss_analysis"
-
-        if a == "list_opportunities":
-            return "list_opportunities"
-
-        if a == "top_products":
-            return "top_products"
-
-    # --- Marketing ---------------------------------------------------------
-    if d == "marketing":
-        if a == "create_campaign":
-            return "create_campaign"
-
-        if a == "analyze_spend":
-            return "analyze_spend"
-
-        if a == "engagement_report":
-            return "engagement_report"
-
-        if a == "competitive_report":
-            return "competitive_report"
-
-    # --- Healthcare Admin --------------------------------------------------
-    if d == "healthcare_admin":
-        if a == "schedule_followup":
-            return "schedule_followup"
-
-        if a == "claims_summary":
-            return "claims_summary"
-
-        if a == "list_pending_labs":
-            return "list_pending_labs"
-
-    # --- General Admin -----------------------------------------------------
-    if d == "general_admin":
-        if a == "create_travel_request":
-            return "create_travel_request"
-
-        if a == "list_meetings":
-            return "list_meetings"
-
-        if a == "draft_announcement":
-            return "draft_announcement"
-
-        if a == "summarize_okrs":
-            return "summarize_okrs"
-
-        if a == "create_procurement_tracker":
-            return "create_procurement_tracker"
-
-    # --- Knowledge Work ----------------------------------------------------
-    if d == "knowledge_work":
-        if a == "create_documentation":
-            return "create_documentation"
-
-        if a == "tag_documents":
-            return "tag_documents"
-
-        if a == "summarize_document":
-            return "summarize_document"
+    patterns = t.action_patterns.get(d)
+    if patterns:
+        hit = _first_match(patterns, raw_text.lower(), a, parameters)
+        if hit:
+            return hit
 
     # If nothing matched, return the normalized action string as-is.
     return a
 
 
-def canonicalize(parsed: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
+def canonicalize(
+    parsed: Dict[str, Any],
+    raw_text: str,
+    table: Optional[CanonicalTable] = None,
+) -> Dict[str, Any]:
     """
     Top-level entrypoint:
     - takes the raw parsed dict from the LLM
     - normalizes domain & action into your strict canonical space
     - returns updated dict.
     """
+    table = table or get_canonical_table()
     data = dict(parsed)  # shallow copy
     params = data.get("parameters") or {}
 
@@ -546,6 +266,7 @@ def canonicalize(parsed: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
         action=data.get("action"),
         parameters=params,
         raw_text=raw_text,
+        table=table,
     )
 
     act = canonicalize_action(
@@ -553,6 +274,7 @@ def canonicalize(parsed: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
         action=data.get("action"),
         parameters=params,
         raw_text=raw_text,
+        table=table,
     )
 
     data["domain"] = dom
@@ -560,3 +282,24 @@ def canonicalize(parsed: Dict[str, Any], raw_text: str) -> Dict[str, Any]:
     data.setdefault("raw_text", raw_text)
 
     return data
+
+
+def canonicalize_many(
+    parsed_items: Iterable[Dict[str, Any]],
+    raw_texts: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Batch canonicalize() for eval / replay workloads.
+
+    raw_texts defaults to each item's own "raw_text". The compiled table is
+    resolved once for the whole batch, so a reload mid-run cannot mix
+    results from two table versions.
+    """
+    table = get_canonical_table()
+    items = list(parsed_items)
+    texts = list(raw_texts) if raw_texts is not None else [
+        (p or {}).get("raw_text") or "" for p in items
+    ]
+    if len(texts) != len(items):
+        raise ValueError("canonicalize_many: parsed_items and raw_texts differ in length")
+    return [canonicalize(p or {}, text, table=table) for p, text in zip(items, texts)]
@@ -0,0 +1,317 @@
+# backend/app/services/parsing/config_snapshot.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+import yaml
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+BASE_DIR = Path(__file__).resolve().parent
+CONFIG_DIR = BASE_DIR / "config"
+
+# name → candidate paths (first existing one wins, same fallbacks as before)
+CONFIG_SOURCES: Dict[str, Tuple[Path, ...]] = {
+    "guardrails": (CONFIG_DIR / "guardrails.json", BASE_DIR / "guardrails.json"),
+    "intent_guardrails": (CONFIG_DIR / "intent_guardrails.json",),
+    "prompt_versions": (CONFIG_DIR / "prompt_versions.json",),
+    "intent_schema": (CONFIG_DIR / "intent_schema.json", BASE_DIR / "intent_schema.json"),
+    "domain_examples": (CONFIG_DIR / "domain_examples.yml",),
+    "canonicalization": (CONFIG_DIR / "canonicalization.json",),
+}
+
+
+def _resolve(candidates: Tuple[Path, ...]) -> Optional[Path]:
+    for path in candidates:
+        if path.exists():
+            return path
+    return None
+
+
+def _stat_fingerprint() -> Tuple[Tuple[str, Optional[int], Optional[int]], ...]:
+    """(name, mtime_ns, size) per source — cheap change detection for the watcher."""
+    out = []
+    for name, candidates in CONFIG_SOURCES.items():
+        path = _resolve(candidates)
+        try:
+            st = path.stat() if path else None
+        except OSError:
+            st = None
+        out.append((name, st.st_mtime_ns if st else None, st.st_size if st else None))
+    return tuple(out)
+
+
+# ============================================================
+# Snapshot
+# ============================================================
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable view of every parser config file, loaded in one pass.
+
+    Readers grab the current snapshot once per request and use it for the
+    whole parse, so a reload mid-request can never mix two config versions.
+    Top-level mappings are read-only proxies; treat nested values as
+    read-only too.
+
+    version_id is a content hash (identical across workers / pods that run
+    the same files) and is stamped into parse output as `config_version`.
+    """
+
+    version_id: str
+    loaded_at: float
+    fingerprint: Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+    digests: Mapping[str, str]
+
+    guardrails: Mapping[str, Any]
+    intent_guardrails: Mapping[str, Any]
+    prompt_versions: Mapping[str, Any]
+    intent_schema: Mapping[str, Any]
+    domain_examples: Mapping[str, Any]
+
+    # Precomputed lookups
+    allowed_verbs: FrozenSet[str]
+    risky_verbs: FrozenSet[str]
+    blocked_verbs: FrozenSet[str]
+    destructive_verbs: FrozenSet[str]
+    high_risk_actions: FrozenSet[str]
+    medium_risk_actions: FrozenSet[str]
+    canonical_table: Any = field(repr=False)  # canonicalizer.CanonicalTable
+    # Sources that failed to parse and were loaded as {} (lenient first load)
+    load_errors: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+
+    def prompt_version(self, domain: str) -> Tuple[int, str]:
+        """(version, updated_at) for a domain; version=1 if not listed."""
+        meta = self.prompt_versions.get(domain) or {}
+        return meta.get("version", 1), meta.get("updated_at", "")
+
+
+def load_snapshot(lenient: bool = False) -> ConfigSnapshot:
+    """
+    Reads + parses every config source and builds a new snapshot.
+
+    A malformed source raises, unless `lenient`: then it is logged and
+    loaded as {} (what the per-file loaders did), and listed in
+    snapshot.load_errors. Malformed covers both syntax errors and valid
+    files of the wrong shape (top level not a mapping, canonicalization
+    rule without "then", ...).
+    """
+    from backend.app.services.parsing.canonicalizer import compile_canonical_table
+
+    fingerprint = _stat_fingerprint()
+    raw: Dict[str, bytes] = {}
+    for name, candidates in CONFIG_SOURCES.items():
+        path = _resolve(candidates)
+        raw[name] = path.read_bytes() if path else b""
+
+    errors: Dict[str, str] = {}
+
+    def _reject(name: str, e: Exception) -> Dict[str, Any]:
+        if not lenient:
+            raise e
+        errors[name] = str(e)
+        logger.error("Parser config %s is malformed, loaded as empty: %s", name, e)
+        return {}
+
+    def _parse(name: str, loads: Any) -> Dict[str, Any]:
+        data = raw.get(name, b"")
+        if not data.strip():
+            return {}
+        try:
+            parsed = loads(data) or {}
+        except (ValueError, yaml.YAMLError) as e:
+            return _reject(name, e)
+        if not isinstance(parsed, dict):
+            return _reject(name, ValueError(f"expected a mapping at the top level, got {type(parsed).__name__}"))
+        return parsed
+
+    def _json(name: str) -> Dict[str, Any]:
+        return _parse(name, json.loads)
+
+    guardrails = _json("guardrails")
+    intent_guardrails = _json("intent_guardrails")
+    domain_examples = _parse("domain_examples", yaml.safe_load)
+
+    risk_tiers = intent_guardrails.get("risk_tiers", {}) or {}
+    destructive = (
+        intent_guardrails.get("destructive_verbs")
+        or intent_guardrails.get("unsafe_action_verbs")
+        or []
+    )
+
+    digests = {name: hashlib.sha256(data).hexdigest()[:12] for name, data in raw.items()}
+    version_id = hashlib.sha256(
+        "|".join(f"{k}:{digests[k]}" for k in sorted(digests)).encode("utf-8")
+    ).hexdigest()[:12]
+
+    prompt_versions = _json("prompt_versions")
+    intent_schema = _json("intent_schema")
+    canonicalization = _json("canonicalization")
+    try:
+        canonical_table = compile_canonical_table(canonicalization)
+    except (KeyError, TypeError, AttributeError, ValueError) as e:
+        _reject("canonicalization", ValueError(f"invalid canonicalization table: {type(e).__name__} {e}"))
+        canonical_table = compile_canonical_table({})
+
+    return ConfigSnapshot(
+        version_id=version_id,
+        loaded_at=time.time(),
+        fingerprint=fingerprint,
+        digests=MappingProxyType(digests),
+        guardrails=MappingProxyType(guardrails),
+        intent_guardrails=MappingProxyType(intent_guardrails),
+        prompt_versions=MappingProxyType(prompt_versions),
+        intent_schema=MappingProxyType(intent_schema),
+        domain_examples=MappingProxyType(domain_examples),
+        allowed_verbs=frozenset(guardrails.get("allowed_verbs", []) or []),
+        risky_verbs=frozenset(guardrails.get("risky_verbs", []) or []),
+        blocked_verbs=frozenset(guardrails.get("blocked_verbs", []) or []),
+        destructive_verbs=frozenset(destructive),
+        high_risk_actions=frozenset(risk_tiers.get("high_risk", []) or []),
+        medium_risk_actions=frozenset(risk_tiers.get("medium_risk", []) or []),
+        canonical_table=canonical_table,
+        load_errors=MappingProxyType(errors),
+    )
+
+
+# ============================================================
+# Store + mtime watcher
+# ============================================================
+
+class ConfigStore:
+    """
+    Holds the current ConfigSnapshot and swaps it atomically (single
+    reference assignment) when the files change.
+
+    A daemon thread polls the files' (mtime, size) every N seconds; if a
+    reload fails (e.g. a half-written JSON file) the previous snapshot
+    stays active and the next poll retries. The first load has no previous
+    snapshot, so it is lenient: a malformed file is logged and loaded as
+    empty instead of failing every parse.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._watcher_pid: Optional[int] = None
+        self._stop = threading.Event()
+        self.reloads = 0
+        self.reload_errors = 0
+
+    def current(self) -> ConfigSnapshot:
+        snap = self._snapshot
+        if snap is not None:
+            return snap
+        with self._lock:
+            if self._snapshot is None:
+                snap = load_snapshot(lenient=True)
+                if snap.load_errors:
+                    self.reload_errors += 1
+                self._snapshot = snap
+            return self._snapshot
+
+    def refresh(self, force: bool = False) -> bool:
+        """Reloads if any source changed on disk. Returns True on swap."""
+        current = self._snapshot
+        if not force and current is not None and current.fingerprint == _stat_fingerprint():
+            return False
+
+        with self._lock:
+            try:
+                # After a lenient first load, sources broken then may stay
+                # broken (so fixes elsewhere still apply); no new ones may break
+                broken = set(current.load_errors) if current is not None else set()
+                snap = load_snapshot(lenient=bool(broken))
+                newly_broken = set(snap.load_errors) - broken
+                if newly_broken:
+                    raise ValueError(f"malformed: {', '.join(sorted(newly_broken))}")
+            except Exception as e:
+                self.reload_errors += 1
+                logger.warning("Config reload failed, keeping previous snapshot: %s", e)
+                return False
+
+            previous = self._snapshot
+            self._snapshot = snap
+            if previous is not None:
+                self.reloads += 1
+                if previous.version_id != snap.version_id:
+                    logger.info(
+                        "Parser config reloaded: %s → %s", previous.version_id, snap.version_id
+                    )
+            return True
+
+    def _watch(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Config watcher poll failed")
+
+    def start_watcher(self, interval: Optional[float] = None) -> bool:
+        """
+        Starts the polling thread (idempotent, fork-aware).
+        interval <= 0 disables watching. Returns True if a thread was started.
+        """
+        interval = settings.PARSER_CONFIG_WATCH_INTERVAL_SECONDS if interval is None else interval
+        if interval <= 0:
+            return False
+        if self._watcher is not None and self._watcher.is_alive() and self._watcher_pid == os.getpid():
+            return False
+
+        self.current()
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name="orko-config-watcher", daemon=True
+        )
+        self._watcher_pid = os.getpid()
+        self._watcher.start()
+        return True
+
+    def stop_watcher(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        snap = self._snapshot
+        return {
+            "version_id": snap.version_id if snap else None,
+            "loaded_at": snap.loaded_at if snap else None,
+            "digests": dict(snap.digests) if snap else {},
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "load_errors": dict(snap.load_errors) if snap else {},
+            "watching": bool(self._watcher and self._watcher.is_alive()),
+        }
+
+
+_store = ConfigStore()
+
+
+def get_config_store() -> ConfigStore:
+    return _store
+
+
+def get_config_snapshot() -> ConfigSnapshot:
+    return _store.current()
+
+
+def refresh_config_snapshot(force: bool = False) -> bool:
+    return _store.refresh(force=force)
+
+
+def start_config_watcher(interval: Optional[float] = None) -> bool:
+    return _store.start_watcher(interval)
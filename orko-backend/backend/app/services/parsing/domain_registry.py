@@ -1,7 +1,9 @@
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import yaml
 
+from backend.app.services.parsing.keyword_matcher import DOMAIN_KEYWORDS, KeywordMatcher
+
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_DIR = BASE_DIR / "config"
 DOMAIN_EXAMPLES_PATH = CONFIG_DIR / "domain_examples.yml"
@@ -18,9 +20,11 @@ class DomainRegistry:
     - Provide keyword index for routing
     """
 
-    def __init__(self):
-        self._data = self._load()
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        # data: preloaded domain_examples (e.g. from the config snapshot)
+        self._data = dict(data) if data is not None else self._load()
         self._keywords = self._build_keyword_index()
+        self._matcher = KeywordMatcher(self._keywords)
 
     # ---------------------------------------------------------
     # Load YAML
@@ -36,18 +40,13 @@ class DomainRegistry:
     # Keyword index for lightweight classification
     # ---------------------------------------------------------
     def _build_keyword_index(self) -> Dict[str, List[str]]:
-        return {
-            "trading": ["contract", "pnl", "hedge", "position", "shipment", "mt", "fob"],
-            "logistics": ["truck", "vessel", "warehouse", "ship", "delivery", "eta", "silo"],
-            "finance": ["invoice", "cashflow", "budget", "payable", "receivable"],
-            "hr": ["employee", "payroll", "vacation", "leave", "recruit", "hire"],
-            "it_ops": ["incident", "ticket", "deployment", "service", "cluster", "restart"],
-            "legal": ["nda", "contract", "compliance", "legal", "terms"],
-            "sales_marketing": ["campaign", "lead", "opportunity", "sales", "crm", "outbound"],
-            "customer_support": ["support", "ticket", "sla", "csat", "customer"],
-            "analytics": ["report", "dashboard", "kpi", "metric", "analysis"],
-            "operations": ["checklist", "approval", "task", "maintenance", "operation"],
-        }
+        """
+        Shared DOMAIN_KEYWORDS table, restricted to the domains defined in
+        domain_examples.yml (so guess_domain never returns an unknown domain).
+        """
+        if not self._data:
+            return dict(DOMAIN_KEYWORDS)
+        return {d: kws for d, kws in DOMAIN_KEYWORDS.items() if d in self._data}
 
     # ---------------------------------------------------------
     # Public API
@@ -62,11 +61,14 @@ class DomainRegistry:
     # ---------------------------------------------------------
     # Heuristic Domain Classifier
     # ---------------------------------------------------------
+    def domain_scores(self, command: str) -> Dict[str, int]:
+        """Per-domain keyword hit counts from a single scan of the command."""
+        return self._matcher.scores(command)
+
     def guess_domain(self, command: str) -> str:
-        text = command.lower()
-        for domain, keywords in self._keywords.items():
-            if any(k in text for k in keywords):
-                return domain
+        guessed = self._matcher.best(command)
+        if guessed:
+            return guessed
 
         # fallback priority:
         if "operations" in self._data:
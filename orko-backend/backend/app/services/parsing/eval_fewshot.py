@@ -0,0 +1,126 @@
+# backend/app/services/parsing/eval_fewshot.py
+# ORKO Few-shot Selection Trade-off Evaluator (accuracy vs prompt tokens)
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import yaml
+
+from backend.app.services.parsing.ai_parser import AIParser
+from backend.app.services.parsing.canonicalizer import canonicalize
+from backend.app.services.parsing.example_retriever import estimate_tokens
+
+
+# =====================================================================
+# Paths
+# =====================================================================
+
+DATASET_PATH = Path("backend/tests/eval/parser_eval_set_v7.yml").resolve()
+
+REPORT_PATH = Path(
+    "backend/tests/eval/results/fewshot_tradeoff_v7.json"
+).resolve()
+
+
+def load_dataset(path: Path = DATASET_PATH) -> List[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return data.get("commands", []) or []
+
+
+def _prompt_tokens(messages: List[Dict[str, Any]]) -> int:
+    total = 0
+    for msg in messages:
+        for part in msg.get("content") or []:
+            total += estimate_tokens(part.get("text") or "")
+    return total
+
+
+def evaluate_config(
+    parser: AIParser,
+    items: List[Dict[str, Any]],
+    mode: str,
+    k: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Runs every eval item through AIParser + canonicalizer with the given
+    few-shot configuration and returns accuracy + token statistics.
+    """
+    parser.fewshot_mode = mode
+    if k is not None:
+        parser.fewshot_k = k
+
+    correct_domain = 0
+    correct_action = 0
+    correct_both = 0
+    tokens: List[int] = []
+    latencies: List[float] = []
+
+    for item in items:
+        cmd = item.get("command") or ""
+        expected = item.get("expected") or {}
+
+        messages = parser._build_few_shot_messages(domain_hint=None, command=cmd)
+        tokens.append(_prompt_tokens(messages) + estimate_tokens(cmd))
+
+        t0 = time.perf_counter()
+        try:
+            parsed = canonicalize(parser.parse(cmd, context={}) or {}, cmd)
+        except Exception:
+            parsed = {}
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+
+        d_ok = parsed.get("domain") == expected.get("domain")
+        a_ok = parsed.get("action") == expected.get("action")
+        correct_domain += int(d_ok)
+        correct_action += int(a_ok)
+        correct_both += int(d_ok and a_ok)
+
+    n = len(items) or 1
+    tokens_sorted = sorted(tokens) or [0]
+    return {
+        "mode": mode,
+        "k": parser.fewshot_k if mode == "retrieval" else None,
+        "total": len(items),
+        "domain_accuracy": round(correct_domain / n, 4),
+        "action_accuracy": round(correct_action / n, 4),
+        "accuracy": round(correct_both / n, 4),
+        "avg_prompt_tokens_est": round(sum(tokens) / n, 1),
+        "p95_prompt_tokens_est": tokens_sorted[int(0.95 * (len(tokens_sorted) - 1))],
+        "avg_latency_ms": round(sum(latencies) / n, 1),
+    }
+
+
+def run_fewshot_tradeoff(
+    ks: Sequence[int] = (4, 8, 16),
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Baseline ("all" examples) vs retrieval mode at several k values.
+    Writes fewshot_tradeoff_v7.json and returns the rows.
+    """
+    items = load_dataset()
+    if limit:
+        items = items[:limit]
+
+    parser = AIParser()
+    rows = [evaluate_config(parser, items, mode="all")]
+    for k in ks:
+        rows.append(evaluate_config(parser, items, mode="retrieval", k=k))
+
+    baseline = rows[0]
+    for row in rows:
+        row["token_ratio_vs_all"] = round(
+            row["avg_prompt_tokens_est"] / (baseline["avg_prompt_tokens_est"] or 1.0), 3
+        )
+        row["accuracy_delta_vs_all"] = round(row["accuracy"] - baseline["accuracy"], 4)
+
+    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with REPORT_PATH.open("w", encoding="utf-8") as f:
+        json.dump(rows, f, indent=2)
+
+    return rows
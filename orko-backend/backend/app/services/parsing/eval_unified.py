@@ -9,7 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.parser_engine import get_parser_engine
 
 
 # =====================================================================
@@ -73,7 +73,7 @@ class UnifiedParserEvaluator:
     """
 
     def __init__(self) -> None:
-        self.engine = ParserEngine()
+        self.engine = get_parser_engine()
 
     # ---------------------------------------------------------
     # Dataset loader
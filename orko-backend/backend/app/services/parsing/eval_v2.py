@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 from statistics import mean
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.parser_engine import get_parser_engine
 
 
 # =====================================================================
@@ -66,7 +66,7 @@ class UnifiedParserEvaluator:
     """
 
     def __init__(self) -> None:
-        self.engine = ParserEngine()
+        self.engine = get_parser_engine()
 
     # ---------------------------------------------------------
     # Load dataset
@@ -0,0 +1,166 @@
+# backend/app/services/parsing/example_retriever.py
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.app.services.parsing.domain_registry import DomainRegistry
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+_STOPWORDS = {
+    "a", "an", "the", "for", "of", "to", "in", "on", "at", "and", "or", "by",
+    "with", "from", "all", "this", "that", "is", "are", "be", "me", "my",
+    "our", "please", "pls", "new",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars per token) used for prompt budgeting."""
+    return max(1, len(text or "") // 4)
+
+
+@dataclass(frozen=True)
+class IndexedExample:
+    doc_id: int
+    domain: str
+    command: str
+    expected: Dict[str, Any]
+    token_cost: int
+
+
+class ExampleRetriever:
+    """
+    In-memory BM25 index over DomainRegistry examples.
+
+    Each document = example command + its expected action name (split on "_"),
+    so "list overdue invoices" also matches the `list_overdue_invoices` example.
+
+    select() returns the k most similar examples (within a token budget) and
+    the candidate domains whose action catalogs should be sent to the model.
+    """
+
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self, registry: DomainRegistry) -> None:
+        self.registry = registry
+        self.examples: List[IndexedExample] = []
+        self._postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._doc_len: List[int] = []
+        self._idf: Dict[str, float] = {}
+        self._avg_len = 0.0
+        self._build()
+
+    # ---------------------------------------------------------
+    # Index build
+    # ---------------------------------------------------------
+    def _build(self) -> None:
+        for domain in getattr(self.registry, "domains", []) or []:
+            cfg = self.registry.get_examples(domain) or {}
+            for ex in cfg.get("examples", []) or []:
+                cmd = ex.get("command") or ""
+                expected = ex.get("expected") or {}
+                action = expected.get("action") or ""
+
+                doc_id = len(self.examples)
+                cost = estimate_tokens(cmd) + estimate_tokens(
+                    json.dumps(expected, ensure_ascii=False)
+                )
+                self.examples.append(
+                    IndexedExample(
+                        doc_id=doc_id,
+                        domain=domain,
+                        command=cmd,
+                        expected=expected,
+                        token_cost=cost,
+                    )
+                )
+
+                terms = tokenize(cmd) + tokenize(action.replace("_", " "))
+                self._doc_len.append(len(terms))
+                for term, tf in Counter(terms).items():
+                    self._postings[term].append((doc_id, tf))
+
+        n = len(self.examples)
+        self._avg_len = (sum(self._doc_len) / n) if n else 0.0
+        for term, plist in self._postings.items():
+            df = len(plist)
+            self._idf[term] = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    # ---------------------------------------------------------
+    # Scoring
+    # ---------------------------------------------------------
+    def score(self, command: str) -> Dict[int, float]:
+        scores: Dict[int, float] = defaultdict(float)
+        avg = self._avg_len or 1.0
+        for term in set(tokenize(command)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, tf in self._postings[term]:
+                norm = self.K1 * (1.0 - self.B + self.B * self._doc_len[doc_id] / avg)
+                scores[doc_id] += idf * (tf * (self.K1 + 1.0)) / (tf + norm)
+        return scores
+
+    def select(
+        self,
+        command: str,
+        k: int = 8,
+        max_domains: int = 3,
+        token_budget: int = 0,
+        domain_hint: Optional[str] = None,
+    ) -> Tuple[List[IndexedExample], List[str]]:
+        """
+        Returns (examples, candidate_domains).
+
+        - examples: up to k best matches, stopping early once token_budget
+          (estimated tokens, 0 = unlimited) would be exceeded.
+        - candidate_domains: best-scoring domains (max example score),
+          plus the soft domain hint if it is a registered domain.
+        """
+        scores = self.score(command)
+
+        if not scores:
+            # No lexical overlap at all → fall back to the heuristic domain
+            guessed = self.registry.guess_domain(command)
+            ranked_ids = [ex.doc_id for ex in self.examples if ex.domain == guessed]
+        else:
+            ranked_ids = sorted(scores, key=lambda d: (-scores[d], d))
+
+        picked: List[IndexedExample] = []
+        spent = 0
+        for doc_id in ranked_ids:
+            ex = self.examples[doc_id]
+            if token_budget and picked and spent + ex.token_cost > token_budget:
+                break
+            picked.append(ex)
+            spent += ex.token_cost
+            if len(picked) >= k:
+                break
+
+        domain_best: Dict[str, float] = {}
+        for doc_id, sc in scores.items():
+            dom = self.examples[doc_id].domain
+            if sc > domain_best.get(dom, 0.0):
+                domain_best[dom] = sc
+        candidates = sorted(domain_best, key=lambda d: -domain_best[d])[:max_domains]
+
+        if not candidates:
+            candidates = list(dict.fromkeys(ex.domain for ex in picked))[:max_domains]
+
+        registered = set(getattr(self.registry, "domains", []) or [])
+        if domain_hint in registered and domain_hint not in candidates:
+            candidates.append(domain_hint)
+
+        return picked, candidates
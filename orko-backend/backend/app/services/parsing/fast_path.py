@@ -0,0 +1,727 @@
+# backend/app/services/parsing/fast_path.py
+# ORKO Local Fast-path Intent Classifier (TF-IDF + softmax regression, NumPy)
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import yaml
+
+from backend.app.core.config import settings
+from backend.app.services.parsing.example_retriever import tokenize
+
+logger = logging.getLogger(__name__)
+
+
+# =====================================================================
+# Paths
+# =====================================================================
+
+BASE_DIR = Path(__file__).resolve().parent
+DOMAIN_EXAMPLES_PATH = BASE_DIR / "config" / "domain_examples.yml"
+EVAL_SET_PATHS = (
+    Path("backend/tests/eval/parser_eval_set_v7.yml").resolve(),
+    Path("backend/tests/eval/parser_eval_set.yml").resolve(),
+)
+DEFAULT_MODEL_PATH = BASE_DIR / "models" / "fastpath_model.npz"
+REPORT_PATH = Path("backend/tests/eval/results/fastpath_eval_v7.json").resolve()
+
+MODEL_FORMAT_VERSION = 1
+
+
+@dataclass
+class TrainingItem:
+    command: str
+    domain: str
+    action: str
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    source: str = ""
+
+    @property
+    def label(self) -> str:
+        return f"{self.domain}.{self.action}"
+
+
+# =====================================================================
+# Training data
+# =====================================================================
+
+def _items_from_yaml_commands(path: Path, source: str) -> List[TrainingItem]:
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    out: List[TrainingItem] = []
+    for row in data.get("commands", []) or []:
+        exp = row.get("expected") or {}
+        if row.get("command") and exp.get("domain") and exp.get("action"):
+            out.append(
+                TrainingItem(row["command"], exp["domain"], exp["action"], exp.get("parameters") or {}, source)
+            )
+    return out
+
+
+def load_domain_examples(path: Path = DOMAIN_EXAMPLES_PATH) -> List[TrainingItem]:
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    out: List[TrainingItem] = []
+    for domain, cfg in data.items():
+        for ex in (cfg or {}).get("examples", []) or []:
+            exp = ex.get("expected") or {}
+            if ex.get("command") and exp.get("action"):
+                out.append(
+                    TrainingItem(
+                        ex["command"],
+                        exp.get("domain") or domain,
+                        exp["action"],
+                        exp.get("parameters") or {},
+                        "domain_examples",
+                    )
+                )
+    return out
+
+
+def load_eval_sets(paths: Sequence[Path] = EVAL_SET_PATHS) -> List[TrainingItem]:
+    out: List[TrainingItem] = []
+    for path in paths:
+        out.extend(_items_from_yaml_commands(path, path.stem))
+    return out
+
+
+def load_confirmed_parser_logs(limit: int = 5000) -> List[TrainingItem]:
+    """
+    parser_logs rows whose command later ran successfully (trigger_audit
+    status == "success"). Fallback-parser and fast-path rows are skipped so
+    the classifier never trains on its own output.
+    """
+    from backend.app.db.session import SessionLocal
+    from backend.app.models.parser_log import ParserLog
+    from backend.app.models.trigger_audit import TriggerAudit
+
+    db = SessionLocal()
+    try:
+        confirmed = (
+            db.query(TriggerAudit.raw_command)
+            .filter(TriggerAudit.status == "success", TriggerAudit.raw_command.isnot(None))
+            .distinct()
+            .subquery()
+        )
+        rows = (
+            db.query(ParserLog)
+            .filter(ParserLog.command.in_(confirmed))
+            .order_by(ParserLog.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+    finally:
+        db.close()
+
+    out: List[TrainingItem] = []
+    for row in rows:
+        parsed = row.parsed_output or {}
+        ctx = parsed.get("context") or {}
+        if ctx.get("used_fallback_parser") or ctx.get("parse_source") == "fastpath":
+            continue
+        if row.domain and row.action:
+            out.append(
+                TrainingItem(row.command, row.domain, row.action, parsed.get("parameters") or {}, "parser_logs")
+            )
+    return out
+
+
+def load_training_data(include_logs: bool = True) -> List[TrainingItem]:
+    items = load_domain_examples() + load_eval_sets()
+    if include_logs:
+        try:
+            items += load_confirmed_parser_logs()
+        except Exception as e:
+            logger.warning("Fast-path: parser_logs unavailable, training without them (%s)", e)
+    return items
+
+
+# =====================================================================
+# Features: TF-IDF over unigrams + bigrams
+# =====================================================================
+
+def _features(text: str) -> List[str]:
+    toks = tokenize(text)
+    return toks + [f"{a}_{b}" for a, b in zip(toks, toks[1:])]
+
+
+class TfidfVectorizer:
+    def __init__(self, vocab: Optional[Dict[str, int]] = None, idf: Optional[np.ndarray] = None) -> None:
+        self.vocab: Dict[str, int] = vocab or {}
+        self.idf: np.ndarray = idf if idf is not None else np.zeros(0, dtype=np.float32)
+
+    def fit(self, texts: Sequence[str], min_df: int = 1) -> "TfidfVectorizer":
+        df: Counter = Counter()
+        for text in texts:
+            df.update(set(_features(text)))
+        terms = sorted(t for t, c in df.items() if c >= min_df)
+        self.vocab = {t: i for i, t in enumerate(terms)}
+        n = len(texts)
+        self.idf = np.array(
+            [np.log((1.0 + n) / (1.0 + df[t])) + 1.0 for t in terms], dtype=np.float32
+        )
+        return self
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        X = np.zeros((len(texts), len(self.vocab)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for term, tf in Counter(_features(text)).items():
+                col = self.vocab.get(term)
+                if col is not None:
+                    X[row, col] = (1.0 + np.log(tf)) * self.idf[col]
+        norms = np.linalg.norm(X, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return X / norms
+
+
+# =====================================================================
+# Classifier: multinomial logistic regression (softmax) + isotonic calibration
+# =====================================================================
+
+def _softmax(z: np.ndarray) -> np.ndarray:
+    z = z - z.max(axis=1, keepdims=True)
+    e = np.exp(z)
+    return e / e.sum(axis=1, keepdims=True)
+
+
+class SoftmaxRegression:
+    def __init__(self, W: Optional[np.ndarray] = None, b: Optional[np.ndarray] = None) -> None:
+        self.W = W
+        self.b = b
+
+    def fit(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        n_classes: int,
+        l2: float = 1e-4,
+        lr: float = 0.5,
+        epochs: int = 150,
+    ) -> "SoftmaxRegression":
+        """Full-batch gradient descent with Adam (a few hundred ms for ~1k samples)."""
+        n, d = X.shape
+        Y = np.zeros((n, n_classes), dtype=np.float32)
+        Y[np.arange(n), y] = 1.0
+
+        W = np.zeros((d, n_classes), dtype=np.float32)
+        b = np.zeros(n_classes, dtype=np.float32)
+        mW, vW = np.zeros_like(W), np.zeros_like(W)
+        mb, vb = np.zeros_like(b), np.zeros_like(b)
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+
+        for t in range(1, epochs + 1):
+            P = _softmax(X @ W + b)
+            G = (P - Y) / n
+            gW = X.T @ G + l2 * W
+            gb = G.sum(axis=0)
+
+            mW = beta1 * mW + (1 - beta1) * gW
+            vW = beta2 * vW + (1 - beta2) * gW * gW
+            mb = beta1 * mb + (1 - beta1) * gb
+            vb = beta2 * vb + (1 - beta2) * gb * gb
+            corr1, corr2 = 1 - beta1**t, 1 - beta2**t
+            W -= lr * (mW / corr1) / (np.sqrt(vW / corr2) + eps)
+            b -= lr * (mb / corr1) / (np.sqrt(vb / corr2) + eps)
+
+        self.W, self.b = W, b
+        return self
+
+    def logits(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.W + self.b
+
+
+def fit_isotonic(scores: np.ndarray, correct: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pool-adjacent-violators fit of P(correct | top-1 softmax score).
+    Returns (x, y) knots for np.interp: a non-decreasing map from raw score
+    to the observed precision of held-out predictions at that score.
+    """
+    order = np.argsort(scores, kind="stable")
+    xs, ys = scores[order].astype(np.float64), correct[order].astype(np.float64)
+
+    # Blocks: [sum_y, count, x_lo, x_hi]
+    blocks: List[List[float]] = []
+    for x, y in zip(xs, ys):
+        blocks.append([y, 1.0, x, x])
+        while len(blocks) > 1 and blocks[-2][0] / blocks[-2][1] > blocks[-1][0] / blocks[-1][1]:
+            s, c, lo, hi = blocks.pop()
+            blocks[-1][0] += s
+            blocks[-1][1] += c
+            blocks[-1][3] = hi
+
+    knots_x: List[float] = []
+    knots_y: List[float] = []
+    for s, c, lo, hi in blocks:
+        knots_x += [lo, hi]
+        knots_y += [s / c, s / c]
+    return np.array(knots_x), np.array(knots_y)
+
+
+# =====================================================================
+# Slot extraction (gazetteer of values seen in training)
+# =====================================================================
+
+class SlotExtractor:
+    """
+    Fills parameters for the predicted (domain, action) from values seen in
+    training data: string values are matched as whole words (original
+    casing of the first training occurrence), numeric-only keys take the
+    first free number in the text.
+
+    `required[label]` = keys present in EVERY training example of that
+    class; a prediction is only "complete" when all of them are filled.
+    """
+
+    _NUM_RE = re.compile(r"\b\d+(?:[.,]\d+)?\b")
+
+    def __init__(
+        self,
+        values: Dict[str, Dict[str, str]],
+        numeric_keys: Iterable[str],
+        class_keys: Dict[str, List[str]],
+        required: Dict[str, List[str]],
+    ) -> None:
+        self.values = values
+        self.numeric_keys = set(numeric_keys)
+        self.class_keys = class_keys
+        self.required = required
+        self._patterns: Dict[str, re.Pattern[str]] = {}
+        for key, vals in values.items():
+            if vals:
+                alternation = "|".join(re.escape(v) for v in sorted(vals, key=len, reverse=True))
+                self._patterns[key] = re.compile(rf"\b({alternation})\b", re.IGNORECASE)
+
+    @classmethod
+    def fit(cls, items: Sequence[TrainingItem]) -> "SlotExtractor":
+        values: Dict[str, Dict[str, str]] = defaultdict(dict)
+        numeric: Dict[str, bool] = {}
+        class_keys: Dict[str, set] = defaultdict(set)
+        class_counts: Counter = Counter()
+        key_counts: Dict[str, Counter] = defaultdict(Counter)
+
+        for it in items:
+            class_counts[it.label] += 1
+            for key, val in (it.parameters or {}).items():
+                class_keys[it.label].add(key)
+                key_counts[it.label][key] += 1
+                is_num = isinstance(val, (int, float)) and not isinstance(val, bool)
+                numeric[key] = numeric.get(key, True) and is_num
+                if isinstance(val, str) and val.strip() and val.lower() in it.command.lower():
+                    values[key].setdefault(val.lower(), val)
+
+        required = {
+            label: sorted(k for k, c in key_counts[label].items() if c == class_counts[label])
+            for label in class_counts
+        }
+        return cls(
+            values=dict(values),
+            numeric_keys=[k for k, v in numeric.items() if v],
+            class_keys={k: sorted(v) for k, v in class_keys.items()},
+            required=required,
+        )
+
+    def extract(self, label: str, text: str) -> Tuple[Dict[str, Any], bool]:
+        params: Dict[str, Any] = {}
+        numbers = [m.group(0) for m in self._NUM_RE.finditer(text)]
+        for key in self.class_keys.get(label, []):
+            if key in self.numeric_keys:
+                if numbers:
+                    raw = numbers.pop(0).replace(",", ".")
+                    params[key] = float(raw) if "." in raw else int(raw)
+                continue
+            pattern = self._patterns.get(key)
+            m = pattern.search(text) if pattern else None
+            if m:
+                params[key] = self.values[key].get(m.group(1).lower(), m.group(1))
+        complete = all(k in params for k in self.required.get(label, []))
+        return params, complete
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "values": self.values,
+            "numeric_keys": sorted(self.numeric_keys),
+            "class_keys": self.class_keys,
+            "required": self.required,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "SlotExtractor":
+        return cls(data["values"], data["numeric_keys"], data["class_keys"], data["required"])
+
+
+# =====================================================================
+# Model
+# =====================================================================
+
+@dataclass
+class FastPathPrediction:
+    domain: str
+    action: str
+    parameters: Dict[str, Any]
+    confidence: float
+    complete: bool
+    latency_ms: float
+
+    def accepted(self, threshold: float) -> bool:
+        return self.complete and self.confidence >= threshold
+
+
+class FastPathModel:
+    def __init__(
+        self,
+        vectorizer: TfidfVectorizer,
+        classifier: SoftmaxRegression,
+        labels: List[str],
+        calibration: Tuple[np.ndarray, np.ndarray],
+        slots: SlotExtractor,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.vectorizer = vectorizer
+        self.classifier = classifier
+        self.labels = labels
+        self.calibration = calibration
+        self.slots = slots
+        self.meta = meta or {}
+
+    @property
+    def version(self) -> str:
+        return str(self.meta.get("trained_at", "untrained"))
+
+    # ---------------------------------------------------------
+    # Training
+    # ---------------------------------------------------------
+    @classmethod
+    def train(cls, items: Sequence[TrainingItem], calibration_folds: int = 3, seed: int = 7) -> "FastPathModel":
+        items = [it for it in items if it.command and it.domain and it.action]
+        labels = sorted({it.label for it in items})
+        index = {label: i for i, label in enumerate(labels)}
+        y = np.array([index[it.label] for it in items], dtype=np.int64)
+        texts = [it.command for it in items]
+
+        # Calibration from out-of-fold predictions (every sample is held out
+        # once, including classes its fitting folds never saw — the same
+        # open-world situation as production), final weights from all data.
+        rng = np.random.default_rng(seed)
+        fold_of = rng.permutation(len(items)) % calibration_folds
+        oof = np.zeros((len(items), len(labels)), dtype=np.float32)
+        for k in range(calibration_folds):
+            fit_idx, cal = np.flatnonzero(fold_of != k), np.flatnonzero(fold_of == k)
+            vec = TfidfVectorizer().fit([texts[i] for i in fit_idx])
+            clf = SoftmaxRegression().fit(vec.transform([texts[i] for i in fit_idx]), y[fit_idx], len(labels))
+            oof[cal] = clf.logits(vec.transform([texts[i] for i in cal]))
+        P = _softmax(oof)
+        calibration = fit_isotonic(P.max(axis=1), P.argmax(axis=1) == y)
+
+        vec = TfidfVectorizer().fit(texts)
+        clf = SoftmaxRegression().fit(vec.transform(texts), y, len(labels))
+
+        meta = {
+            "format": MODEL_FORMAT_VERSION,
+            "trained_at": time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()),
+            "samples": len(items),
+            "classes": len(labels),
+            "sources": dict(Counter(it.source for it in items)),
+        }
+        return cls(vec, clf, labels, calibration, SlotExtractor.fit(items), meta)
+
+    # ---------------------------------------------------------
+    # Inference
+    # ---------------------------------------------------------
+    def predict(self, text: str) -> FastPathPrediction:
+        t0 = time.perf_counter()
+        X = self.vectorizer.transform([text])
+        P = _softmax(self.classifier.logits(X))[0]
+        best = int(P.argmax())
+        label = self.labels[best]
+        domain, action = label.split(".", 1)
+        params, complete = self.slots.extract(label, text)
+        # No known feature at all → never trust the argmax
+        confidence = float(np.interp(P[best], *self.calibration)) if X.any() else 0.0
+        return FastPathPrediction(
+            domain=domain,
+            action=action,
+            parameters=params,
+            confidence=confidence,
+            complete=complete,
+            latency_ms=(time.perf_counter() - t0) * 1000.0,
+        )
+
+    # ---------------------------------------------------------
+    # Persistence (.npz: arrays + JSON sidecar string)
+    # ---------------------------------------------------------
+    def save(self, path: Path = DEFAULT_MODEL_PATH) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sidecar = {
+            "meta": self.meta,
+            "labels": self.labels,
+            "vocab": self.vectorizer.vocab,
+            "slots": self.slots.to_json(),
+        }
+        with path.open("wb") as f:
+            np.savez_compressed(
+                f,
+                W=self.classifier.W,
+                b=self.classifier.b,
+                idf=self.vectorizer.idf,
+                calib_x=self.calibration[0],
+                calib_y=self.calibration[1],
+                sidecar=np.array(json.dumps(sidecar, ensure_ascii=False)),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_MODEL_PATH) -> "FastPathModel":
+        with np.load(path, allow_pickle=False) as data:
+            sidecar = json.loads(str(data["sidecar"]))
+            return cls(
+                vectorizer=TfidfVectorizer(sidecar["vocab"], data["idf"]),
+                classifier=SoftmaxRegression(data["W"], data["b"]),
+                labels=sidecar["labels"],
+                calibration=(data["calib_x"], data["calib_y"]),
+                slots=SlotExtractor.from_json(sidecar["slots"]),
+                meta=sidecar["meta"],
+            )
+
+
+# =====================================================================
+# Runtime wrapper used by ParserEngine
+# =====================================================================
+
+class FastPath:
+    """
+    PARSER_FASTPATH_MODE:
+      - "off":    never consulted
+      - "shadow": predicted on every LLM miss, compared with the LLM result
+                  (telemetry: fastpath_shadow.jsonl), never served
+      - "on":     served instead of the LLM when confidence ≥ threshold and
+                  every required parameter was extracted
+    A missing / unreadable model file simply disables the fast path.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        threshold: Optional[float] = None,
+        model_path: Optional[Path] = None,
+    ) -> None:
+        self.mode = (mode or settings.PARSER_FASTPATH_MODE).lower()
+        self.threshold = settings.PARSER_FASTPATH_THRESHOLD if threshold is None else threshold
+        self.model_path = Path(model_path or settings.PARSER_FASTPATH_MODEL_PATH or DEFAULT_MODEL_PATH)
+        self.model: Optional[FastPathModel] = None
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "predictions": 0,
+            "served": 0,
+            "shadow_compared": 0,
+            "shadow_agree": 0,
+            "shadow_would_serve": 0,
+            "shadow_would_serve_agree": 0,
+            "latency_ms_total": 0.0,
+        }
+        if self.mode != "off":
+            self.reload()
+
+    def reload(self) -> bool:
+        try:
+            self.model = FastPathModel.load(self.model_path)
+            logger.info("Fast-path model %s loaded (%s)", self.model.version, self.model_path)
+            return True
+        except FileNotFoundError:
+            logger.info("Fast-path model not found at %s — fast path disabled", self.model_path)
+        except Exception as e:
+            logger.warning("Fast-path model failed to load (%s) — fast path disabled", e)
+        self.model = None
+        return False
+
+    @property
+    def active(self) -> bool:
+        return self.mode in ("shadow", "on") and self.model is not None
+
+    def _bump(self, name: str, n: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += n
+
+    def predict(self, text: str) -> Optional[FastPathPrediction]:
+        if not self.active:
+            return None
+        pred = self.model.predict(text)
+        self._bump("predictions")
+        self._bump("latency_ms_total", pred.latency_ms)
+        return pred
+
+    def serve(self, pred: Optional[FastPathPrediction]) -> Optional[Dict[str, Any]]:
+        """AIParser-shaped result if the prediction may replace the LLM call."""
+        if pred is None or self.mode != "on" or not pred.accepted(self.threshold):
+            return None
+        self._bump("served")
+        return {
+            "intent": "",
+            "domain": pred.domain,
+            "action": pred.action,
+            "parameters": dict(pred.parameters),
+            "context": {
+                "confidence": round(pred.confidence, 4),
+                "parse_source": "fastpath",
+                "fastpath_model": self.model.version if self.model else None,
+            },
+        }
+
+    def shadow_compare(self, pred: FastPathPrediction, parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Counts agreement with the (canonicalized) LLM parse; returns the telemetry row."""
+        agree = pred.domain == parsed.get("domain") and pred.action == parsed.get("action")
+        would_serve = pred.accepted(self.threshold)
+        self._bump("shadow_compared")
+        self._bump("shadow_agree", int(agree))
+        self._bump("shadow_would_serve", int(would_serve))
+        self._bump("shadow_would_serve_agree", int(would_serve and agree))
+        return {
+            "fast_domain": pred.domain,
+            "fast_action": pred.action,
+            "llm_domain": parsed.get("domain"),
+            "llm_action": parsed.get("action"),
+            "agree": agree,
+            "params_agree": pred.parameters == (parsed.get("parameters") or {}),
+            "confidence": round(pred.confidence, 4),
+            "would_serve": would_serve,
+            "fast_latency_ms": round(pred.latency_ms, 3),
+            "model": self.model.version if self.model else None,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        n = out["predictions"]
+        out["avg_latency_ms"] = round(out.pop("latency_ms_total") / n, 3) if n else 0.0
+        out["shadow_agreement"] = (
+            round(out["shadow_agree"] / out["shadow_compared"], 4) if out["shadow_compared"] else 0.0
+        )
+        out["shadow_precision_at_threshold"] = (
+            round(out["shadow_would_serve_agree"] / out["shadow_would_serve"], 4)
+            if out["shadow_would_serve"]
+            else 0.0
+        )
+        out.update(
+            {
+                "mode": self.mode,
+                "threshold": self.threshold,
+                "model": self.model.version if self.model else None,
+            }
+        )
+        return out
+
+
+# =====================================================================
+# Evaluation (cross-validated on the v7 eval set)
+# =====================================================================
+
+def score_predictions(
+    preds: Sequence[Tuple[TrainingItem, FastPathPrediction]],
+    thresholds: Sequence[float],
+) -> List[Dict[str, Any]]:
+    n = len(preds) or 1
+    latencies = sorted(p.latency_ms for _, p in preds) or [0.0]
+
+    rows = []
+    for th in thresholds:
+        served = [(it, p) for it, p in preds if p.accepted(th)]
+        correct = [(it, p) for it, p in served if p.domain == it.domain and p.action == it.action]
+        rows.append(
+            {
+                "threshold": th,
+                "top1_accuracy": round(
+                    sum(p.domain == it.domain and p.action == it.action for it, p in preds) / n, 4
+                ),
+                "coverage": round(len(served) / n, 4),
+                "precision_served": round(len(correct) / len(served), 4) if served else 0.0,
+                "params_exact_served": round(
+                    sum(p.parameters == it.parameters for it, p in correct) / len(served), 4
+                )
+                if served
+                else 0.0,
+                "p50_latency_ms": round(latencies[len(latencies) // 2], 3),
+                "p95_latency_ms": round(latencies[int(0.95 * (len(latencies) - 1))], 3),
+            }
+        )
+    return rows
+
+
+def run_fastpath_eval(
+    thresholds: Sequence[float] = (0.5, 0.7, 0.8, 0.9, 0.95),
+    folds: int = 5,
+    include_logs: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    k-fold over parser_eval_set_v7.yml: each fold is held out while the
+    model trains on domain_examples + the other eval data (+ parser_logs).
+    Writes fastpath_eval_v7.json and returns per-threshold rows.
+    """
+    v7 = _items_from_yaml_commands(EVAL_SET_PATHS[0], EVAL_SET_PATHS[0].stem)
+    base = load_domain_examples() + load_eval_sets(EVAL_SET_PATHS[1:])
+    if include_logs:
+        base += load_confirmed_parser_logs()
+    held_out = {it.command for it in v7}
+    base = [it for it in base if it.command not in held_out]
+
+    # Predictions are pooled over folds, then scored once
+    preds: List[Tuple[TrainingItem, FastPathPrediction]] = []
+    for k in range(folds):
+        train = base + [it for i, it in enumerate(v7) if i % folds != k]
+        model = FastPathModel.train(train)
+        preds.extend((it, model.predict(it.command)) for it in v7[k::folds])
+
+    rows = score_predictions(preds, thresholds)
+
+    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with REPORT_PATH.open("w", encoding="utf-8") as f:
+        json.dump({"folds": folds, "samples": len(v7), "rows": rows}, f, indent=2)
+    return rows
+
+
+def cli():
+    """
+    CLI interface for:
+        python -m backend.app.services.parsing.fast_path --retrain
+        python -m backend.app.services.parsing.fast_path --retrain --no-logs --out path/to/model.npz
+
+    Running workers pick up a new model on restart (or ParserEngine.reload_fastpath()).
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Train ORKO fast-path intent classifier")
+    parser.add_argument("--retrain", action="store_true", help="Train and save the model")
+    parser.add_argument("--no-logs", action="store_true", help="Skip confirmed parser_logs rows")
+    parser.add_argument("--out", type=str, default=None, help="Model output path")
+    args = parser.parse_args()
+
+    if not args.retrain:
+        parser.print_help()
+        return
+
+    items = load_training_data(include_logs=not args.no_logs)
+    t0 = time.perf_counter()
+    model = FastPathModel.train(items)
+    elapsed = time.perf_counter() - t0
+    path = model.save(Path(args.out or settings.PARSER_FASTPATH_MODEL_PATH or DEFAULT_MODEL_PATH))
+
+    print(f"Trained on {model.meta['samples']} samples / {model.meta['classes']} classes in {elapsed:.2f}s")
+    print(f"Sources:     {model.meta['sources']}")
+    print(f"Calibration: {len(model.calibration[0]) // 2} isotonic steps")
+    print(f"Saved to:    {path}")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,97 @@
+# backend/app/services/parsing/keyword_matcher.py
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+# =====================================================================
+# Shared domain keyword table
+# =====================================================================
+# Used by canonicalizer._heuristic_domain_from_text, CommandParser._guess_domain
+# and DomainRegistry.guess_domain. Order matters: on a score tie the domain
+# listed first wins (same precedence as the old if/any() chains).
+
+DOMAIN_KEYWORDS: Dict[str, List[str]] = {
+    "trading": ["contract", "hedge", "hedging", "pnl", "mt", "shipment", "fob"],
+    "logistics": ["ship", "vessel", "eta", "load", "port", "truck", "warehouse", "delivery", "silo"],
+    "finance": ["invoice", "cashflow", "pnl", "tax", "budget", "expense", "payable", "receivable"],
+    "hr": ["employee", "onboarding", "vacation", "leave", "hr", "payroll", "recruit"],
+    "it_ops": ["service", "incident", "cluster", "server", "restart", "patch", "deployment"],
+    "devops": ["microservice", "load test", "deploy pipeline", "devops"],
+    "customer_support": ["ticket", "support case", "escalation", "sla", "csat"],
+    "operations": ["maintenance", "checklist", "operational risk", "incidents", "staffing"],
+    "analytics": ["forecast", "demand", "retention", "churn", "analytics", "dashboard", "kpi"],
+    "sales": ["opportunity", "opportunities", "pipeline", "win-loss", "sales", "crm"],
+    "marketing": ["campaign", "marketing", "engagement", "social media", "competitive report"],
+    "procurement": ["purchase order", "suppliers", "vendor", "sourcing"],
+    "manufacturing": ["machine", "work orders", "plant", "assembly"],
+    "legal": ["nda", "contract", "compliance", "regulation", "legal"],
+    "retail": ["store", "inventory", "stockout", "retail"],
+    "energy": ["grid", "outage", "energy", "renewable"],
+    "healthcare_admin": ["patient", "claims", "lab results"],
+    "general_admin": ["meeting", "travel request", "okr", "office supplies"],
+    "knowledge_work": ["knowledge base", "documentation", "specification", "docs"],
+}
+
+# Inflections accepted after a keyword ("invoices", "restarted", "loading")
+_SUFFIX = r"(?:s|es|ed|ing)?"
+
+
+class KeywordMatcher:
+    """
+    Single-pass multi-keyword matcher.
+
+    All keywords are compiled into ONE alternation regex with word
+    boundaries (longest keyword first, so "load test" wins over "load"),
+    and the text is scanned once. Each hit adds 1 to every domain that owns
+    the keyword, so callers get per-domain scores instead of a first match.
+
+    Word boundaries keep short keywords honest: "mt" no longer matches
+    "amount", "port" no longer matches "report".
+    """
+
+    def __init__(self, table: Mapping[str, Sequence[str]]) -> None:
+        self.domains: Tuple[str, ...] = tuple(table)
+        self._rank = {domain: i for i, domain in enumerate(self.domains)}
+
+        owners: Dict[str, List[str]] = {}
+        for domain, keywords in table.items():
+            for kw in keywords:
+                owners.setdefault(kw.lower(), []).append(domain)
+        self._owners: Dict[str, Tuple[str, ...]] = {k: tuple(v) for k, v in owners.items()}
+
+        if self._owners:
+            alternation = "|".join(
+                re.escape(k) for k in sorted(self._owners, key=len, reverse=True)
+            )
+            self._pattern: Optional[re.Pattern[str]] = re.compile(
+                rf"\b({alternation}){_SUFFIX}\b"
+            )
+        else:
+            self._pattern = None
+
+    def scores(self, text: str) -> Dict[str, int]:
+        """Returns {domain: hit_count} for every domain with at least one hit."""
+        out: Dict[str, int] = {}
+        if not text or self._pattern is None:
+            return out
+        for m in self._pattern.finditer(text.lower()):
+            for domain in self._owners[m.group(1)]:
+                out[domain] = out.get(domain, 0) + 1
+        return out
+
+    def best(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """Highest-scoring domain (table order breaks ties), else default."""
+        scores = self.scores(text)
+        if not scores:
+            return default
+        return min(scores, key=lambda d: (-scores[d], self._rank[d]))
+
+
+DOMAIN_MATCHER = KeywordMatcher(DOMAIN_KEYWORDS)
+
+
+def guess_domain_scores(text: str) -> Dict[str, int]:
+    return DOMAIN_MATCHER.scores(text)
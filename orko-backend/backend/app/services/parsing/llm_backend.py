@@ -0,0 +1,493 @@
+# backend/app/services/parsing/llm_backend.py
+#
+# Pluggable LLM transport for AIParser.
+#
+#   live   : OpenAI Responses API (default)
+#   record : live calls, every (request hash → response, latency) appended
+#            to a JSONL cassette
+#   replay : responses served from the cassette, no network; latency is
+#            simulated from a configurable distribution
+#   stub   : schema-valid JSON built from the closest domain_examples entry,
+#            no network and no cassette needed
+#
+# All modes expose the same `client.responses.create(model=..., input=...)`
+# surface as the OpenAI SDK, so AIParser.parse()/parse_async() are unchanged.
+#
+# Benchmarks / evaluators select a mode with --llm-backend (see
+# add_llm_backend_arguments), services with PARSER_LLM_BACKEND.
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("live", "record", "replay", "stub")
+
+DEFAULT_CASSETTE_PATH = Path(__file__).resolve().parent / "cassettes" / "llm_cassette.jsonl"
+
+
+class CassetteMissError(LookupError):
+    """Replay mode: the request hash is not in the cassette."""
+
+
+# ------------------------------------------------------------
+# Request hashing
+# ------------------------------------------------------------
+
+# Per-message digests, memoized by object identity: the few-shot prefix
+# messages are the same (never mutated) dict objects on every call, so
+# only the hint + command messages are serialized per request. The memo
+# holds a reference to each message, so an id cannot be reused while cached.
+_DIGEST_MEMO_MAX = 4096
+_digest_memo: Dict[int, Tuple[Any, str]] = {}
+
+
+def _message_digest(message: Dict[str, Any]) -> str:
+    hit = _digest_memo.get(id(message))
+    if hit is not None and hit[0] is message:
+        return hit[1]
+    digest = hashlib.sha256(
+        json.dumps(message, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    if len(_digest_memo) >= _DIGEST_MEMO_MAX:
+        _digest_memo.clear()
+    _digest_memo[id(message)] = (message, digest)
+    return digest
+
+
+def request_hash(model: str, messages: Sequence[Dict[str, Any]]) -> str:
+    """
+    Stable key for one Responses API request: model + full input messages
+    (few-shot prefix, soft hint and command). Any prompt change therefore
+    misses the cassette instead of replaying a stale answer.
+    """
+    h = hashlib.sha256(model.encode("utf-8"))
+    for message in messages:
+        h.update(b"\n")
+        h.update(_message_digest(message).encode("ascii"))
+    return h.hexdigest()
+
+
+def _last_user_text(messages: Sequence[Dict[str, Any]]) -> str:
+    for msg in reversed(messages):
+        if msg.get("role") != "user":
+            continue
+        for part in msg.get("content") or []:
+            if isinstance(part, dict) and part.get("text"):
+                return part["text"]
+    return ""
+
+
+def _output_text(resp: Any) -> str:
+    try:
+        return resp.output_text
+    except Exception:
+        try:
+            return resp.output[0].content[0].text
+        except Exception:
+            return ""
+
+
+# ------------------------------------------------------------
+# Synthetic latency
+# ------------------------------------------------------------
+
+class LatencyModel:
+    """
+    Simulated model latency for replay / stub mode.
+
+    Spec strings:
+      none                   no delay
+      recorded               the latency stored with each cassette entry
+      empirical              sampled from all recorded latencies
+      fixed:MS
+      uniform:LO,HI
+      normal:MEAN,SD         (truncated at 0)
+      lognormal:MEDIAN,SIGMA
+
+    Samples are deterministic: the RNG is seeded from (seed, request key,
+    n-th occurrence of that key), so concurrent runs see the same latency
+    per request regardless of interleaving.
+    """
+
+    KINDS = ("none", "recorded", "empirical", "fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, spec: str = "recorded", seed: int = 0) -> None:
+        self.spec = (spec or "none").strip().lower()
+        kind, _, raw_args = self.spec.partition(":")
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency model {spec!r}; expected one of {self.KINDS}")
+        self.kind = kind
+        self.args: Tuple[float, ...] = tuple(float(a) for a in raw_args.split(",") if a.strip())
+        self.seed = seed
+
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2}.get(kind, 0)
+        if len(self.args) != expected:
+            raise ValueError(f"Latency model {kind!r} takes {expected} argument(s), got {spec!r}")
+
+        self._occurrences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def sample_ms(self, key: str, recorded_ms: Optional[float], population: Sequence[float]) -> float:
+        if self.kind == "none":
+            return 0.0
+        if self.kind == "recorded":
+            return float(recorded_ms or 0.0)
+        if self.kind == "fixed":
+            return self.args[0]
+
+        with self._lock:
+            n = self._occurrences.get(key, 0)
+            self._occurrences[key] = n + 1
+        rng = random.Random(f"{self.seed}:{key}:{n}")
+
+        if self.kind == "empirical":
+            return float(rng.choice(population)) if population else float(recorded_ms or 0.0)
+        if self.kind == "uniform":
+            return rng.uniform(self.args[0], self.args[1])
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(self.args[0], self.args[1]))
+        # lognormal: parameterised by its median
+        return rng.lognormvariate(math.log(max(self.args[0], 1e-9)), self.args[1])
+
+
+# ------------------------------------------------------------
+# Cassette
+# ------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CassetteEntry:
+    key: str
+    model: str
+    command: str
+    output_text: str
+    latency_ms: float
+
+
+class Cassette:
+    """
+    JSONL file of recorded responses, one entry per line, appended as they
+    are recorded (a crashed recording keeps everything written so far).
+    Later entries for the same key win on load.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._entries: Dict[str, CassetteEntry] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        entries: Dict[str, CassetteEntry] = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    row = json.loads(line)
+                    entries[row["key"]] = CassetteEntry(
+                        key=row["key"],
+                        model=row.get("model", ""),
+                        command=row.get("command", ""),
+                        output_text=row.get("output_text", ""),
+                        latency_ms=float(row.get("latency_ms") or 0.0),
+                    )
+        self._entries = entries
+
+    def get(self, key: str) -> Optional[CassetteEntry]:
+        return self._entries.get(key)
+
+    def latencies(self) -> List[float]:
+        return [e.latency_ms for e in self._entries.values()]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, entry: CassetteEntry) -> None:
+        row = {
+            "key": entry.key,
+            "model": entry.model,
+            "command": entry.command,
+            "output_text": entry.output_text,
+            "latency_ms": round(entry.latency_ms, 3),
+            "recorded_at": time.time(),
+        }
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self._entries[entry.key] = entry
+
+
+# ------------------------------------------------------------
+# Stub responses
+# ------------------------------------------------------------
+
+class StubResponder:
+    """
+    Answers with the expected block of the domain_examples entry closest to
+    the command (BM25 top-1), in the parser's output schema. Deterministic,
+    and always valid JSON, so post-processing runs its normal path.
+    """
+
+    STUB_CONFIDENCE = 0.9
+
+    def __init__(self) -> None:
+        self._retriever = None
+        self._lock = threading.Lock()
+
+    def _get_retriever(self):
+        if self._retriever is None:
+            with self._lock:
+                if self._retriever is None:
+                    from backend.app.services.parsing.config_snapshot import get_config_snapshot
+                    from backend.app.services.parsing.domain_registry import DomainRegistry
+                    from backend.app.services.parsing.example_retriever import ExampleRetriever
+
+                    registry = DomainRegistry(data=get_config_snapshot().domain_examples)
+                    self._retriever = ExampleRetriever(registry)
+        return self._retriever
+
+    def output_text(self, command: str) -> str:
+        picked, _ = self._get_retriever().select(command, k=1)
+        if not picked:
+            parsed: Dict[str, Any] = {
+                "domain": None,
+                "action": None,
+                "parameters": {},
+                "context": {"confidence": 0.0},
+            }
+        else:
+            ex = picked[0]
+            parsed = {
+                "domain": ex.domain,
+                "action": ex.expected.get("action"),
+                "parameters": dict(ex.expected.get("parameters") or {}),
+                "context": {"confidence": self.STUB_CONFIDENCE},
+            }
+        return json.dumps(parsed, ensure_ascii=False)
+
+
+# ------------------------------------------------------------
+# Backend
+# ------------------------------------------------------------
+
+class _SyncResponses:
+    def __init__(self, backend: "LLMBackend", live: Any = None) -> None:
+        self._backend = backend
+        self._live = live
+
+    def create(self, *, model: str, input: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        if self._backend.mode == "record":
+            t0 = time.perf_counter()
+            resp = self._live.create(model=model, input=input, **kwargs)
+            self._backend._record(model, input, resp, (time.perf_counter() - t0) * 1000.0)
+            return resp
+        text, delay_ms = self._backend._respond(model, input)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000.0)
+        return SimpleNamespace(output_text=text)
+
+
+class _AsyncResponses:
+    def __init__(self, backend: "LLMBackend", live: Any = None) -> None:
+        self._backend = backend
+        self._live = live
+
+    async def create(self, *, model: str, input: List[Dict[str, Any]], **kwargs: Any) -> Any:
+        if self._backend.mode == "record":
+            t0 = time.perf_counter()
+            resp = await self._live.create(model=model, input=input, **kwargs)
+            self._backend._record(model, input, resp, (time.perf_counter() - t0) * 1000.0)
+            return resp
+        text, delay_ms = self._backend._respond(model, input)
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+        return SimpleNamespace(output_text=text)
+
+
+class LLMBackend:
+    """
+    Builds the sync / async clients AIParser calls. In "live" mode these are
+    the plain OpenAI SDK clients; the other modes return thin wrappers with
+    the same responses.create() surface.
+
+    on_miss (replay only): "error" raises CassetteMissError (the parser then
+    takes its normal AI-failure fallback), "stub" answers from the stub.
+    """
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        cassette_path: Optional[str] = None,
+        latency: Optional[str] = None,
+        seed: Optional[int] = None,
+        on_miss: Optional[str] = None,
+    ) -> None:
+        self.mode = (mode or settings.PARSER_LLM_BACKEND).strip().lower()
+        if self.mode not in BACKENDS:
+            raise ValueError(f"Unknown LLM backend {self.mode!r}; expected one of {BACKENDS}")
+
+        self.on_miss = (on_miss or settings.PARSER_LLM_REPLAY_ON_MISS).strip().lower()
+        self.latency = LatencyModel(
+            latency if latency is not None else settings.PARSER_LLM_REPLAY_LATENCY,
+            settings.PARSER_LLM_REPLAY_SEED if seed is None else seed,
+        )
+
+        self.cassette: Optional[Cassette] = None
+        if self.mode in ("record", "replay"):
+            path = cassette_path or settings.PARSER_LLM_CASSETTE_PATH or DEFAULT_CASSETTE_PATH
+            self.cassette = Cassette(Path(path))
+            if self.mode == "replay" and not len(self.cassette):
+                logger.warning("LLM replay cassette %s is empty", self.cassette.path)
+
+        self._stub = StubResponder() if self.mode in ("stub", "replay") else None
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "calls": 0,
+            "recorded": 0,
+            "replayed": 0,
+            "misses": 0,
+            "stubbed": 0,
+            "simulated_latency_ms": 0.0,
+        }
+
+    def _bump(self, key: str, n: float = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out = dict(self._stats)
+        out["simulated_latency_ms"] = round(out["simulated_latency_ms"], 3)
+        out["mode"] = self.mode
+        out["latency_model"] = self.latency.spec
+        if self.cassette is not None:
+            out["cassette"] = str(self.cassette.path)
+            out["cassette_entries"] = len(self.cassette)
+        return out
+
+    # ---------------------------
+    # Clients
+    # ---------------------------
+    def sync_client(self) -> Any:
+        if self.mode == "live":
+            from openai import OpenAI
+
+            return OpenAI()
+        live = None
+        if self.mode == "record":
+            from openai import OpenAI
+
+            live = OpenAI().responses
+        return SimpleNamespace(responses=_SyncResponses(self, live))
+
+    def async_client(self) -> Any:
+        if self.mode == "live":
+            from openai import AsyncOpenAI
+
+            return AsyncOpenAI()
+        live = None
+        if self.mode == "record":
+            from openai import AsyncOpenAI
+
+            live = AsyncOpenAI().responses
+        return SimpleNamespace(responses=_AsyncResponses(self, live))
+
+    # ---------------------------
+    # Modes
+    # ---------------------------
+    def _record(self, model: str, messages: List[Dict[str, Any]], resp: Any, latency_ms: float) -> None:
+        self._bump("calls")
+        key = request_hash(model, messages)
+        self.cassette.append(
+            CassetteEntry(
+                key=key,
+                model=model,
+                command=_last_user_text(messages),
+                output_text=_output_text(resp),
+                latency_ms=latency_ms,
+            )
+        )
+        self._bump("recorded")
+
+    def _respond(self, model: str, messages: List[Dict[str, Any]]) -> Tuple[str, float]:
+        """Returns (output_text, simulated latency in ms) for replay / stub."""
+        self._bump("calls")
+        key = request_hash(model, messages)
+
+        entry = self.cassette.get(key) if self.cassette is not None else None
+        if entry is not None:
+            self._bump("replayed")
+            text, recorded_ms = entry.output_text, entry.latency_ms
+        else:
+            if self.mode == "replay":
+                self._bump("misses")
+                if self.on_miss != "stub":
+                    raise CassetteMissError(
+                        f"No cassette entry for request {key[:12]} "
+                        f"(command={_last_user_text(messages)[:60]!r})"
+                    )
+            self._bump("stubbed")
+            text, recorded_ms = self._stub.output_text(_last_user_text(messages)), None
+
+        population = self.cassette.latencies() if self.latency.kind == "empirical" and self.cassette else ()
+        delay_ms = self.latency.sample_ms(key, recorded_ms, population)
+        self._bump("simulated_latency_ms", delay_ms)
+        return text, delay_ms
+
+
+# ------------------------------------------------------------
+# CLI helpers for benchmarks / evaluators
+# ------------------------------------------------------------
+
+def add_llm_backend_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds --llm-backend / --cassette / --replay-latency / --replay-seed."""
+    parser.add_argument(
+        "--llm-backend",
+        choices=BACKENDS,
+        default=None,
+        help="LLM transport: live (OpenAI), record (live + write cassette), "
+        "replay (cassette, no network), stub (registry examples, no network)",
+    )
+    parser.add_argument("--cassette", default=None, help="Cassette JSONL path (record / replay)")
+    parser.add_argument(
+        "--replay-latency",
+        default=None,
+        help="Simulated latency for replay / stub: none | recorded | empirical | fixed:MS | "
+        "uniform:LO,HI | normal:MEAN,SD | lognormal:MEDIAN,SIGMA",
+    )
+    parser.add_argument("--replay-seed", type=int, default=None, help="Seed for sampled latencies")
+
+
+def apply_llm_backend_arguments(args: argparse.Namespace) -> None:
+    """
+    Applies the CLI flags to settings. Must run before the parser engine /
+    AIParser is built (the transport is chosen at construction).
+    """
+    if getattr(args, "llm_backend", None):
+        settings.PARSER_LLM_BACKEND = args.llm_backend
+    if getattr(args, "cassette", None):
+        settings.PARSER_LLM_CASSETTE_PATH = args.cassette
+    if getattr(args, "replay_latency", None) is not None:
+        LatencyModel(args.replay_latency)  # validate early
+        settings.PARSER_LLM_REPLAY_LATENCY = args.replay_latency
+    if getattr(args, "replay_seed", None) is not None:
+        settings.PARSER_LLM_REPLAY_SEED = args.replay_seed
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
 
 
 # ------------------------------------------------------------
@@ -32,6 +33,95 @@ NAME_RE = re.compile(
 )
 
 
+# ------------------------------------------------------------
+# Fused single-pass masker
+# ------------------------------------------------------------
+# The four patterns above used to run as four sequential substitutions.
+# Emails are cut out first (only when "@" is present; the local-part scan
+# is the most expensive pattern). Each piece between emails is then
+# scanned once by PII_RE, one alternation in the remaining priority order
+# (phone → id → name); the callback picks the placeholder from the named
+# group that matched. A piece starts and ends like a string does, which
+# gives the same word boundaries the email placeholder used to create.
+# See backend/tests/e2e/masking_benchmark.py for the before/after numbers.
+#
+# Adjustments that reproduce the sequential result in one scan:
+#   - a phone number glued to the end of a word ("AB5551234567") is
+#     matched with its prefix; the callback masks the prefix the way the
+#     later id / name passes would have seen it (followed by "[")
+#   - id, name and that word prefix may also start right after a digit,
+#     where the phone placeholder used to create a word boundary
+#     ("555-123-4567Ahmet", "555-123-4567ext555-987-6543"). The prefix
+#     branch comes first, so an id or name never takes the leading digits
+#     of the next phone number
+#   - a name's second word must be 3-5 letters: longer words were
+#     already ID-masked before the name pass ran
+#
+# The output can still differ from the sequential passes in placeholder
+# layout, but never leaves more text unmasked (tests/test_masking.py
+# checks this on random inputs built from PII fragments).
+
+_PHONE_BODY = r"\d[\d\- ]{7,}\d"
+_AFTER_PHONE = r"(?:\b|(?<=\d))"
+
+PII_RE = re.compile(
+    rf"{_AFTER_PHONE}(?P<prefix>[A-Za-z0-9]*?[A-Za-z][A-Za-z0-9]*?)(?P<wordphone>{_PHONE_BODY})"
+    rf"|(?P<phone>\+?{_PHONE_BODY})"
+    rf"|(?P<id>{_AFTER_PHONE}[A-Za-z0-9]{{6,}}\b)"
+    rf"|(?P<name>{_AFTER_PHONE}[A-Z][a-z]{{2,}}(?:\s+[A-Z][a-z]{{2,4}}\b)?\b)"
+)
+
+_PLACEHOLDERS = {
+    "wordphone": "[PHONE_MASKED]",
+    "phone": "[PHONE_MASKED]",
+    "id": "[ID_MASKED]",
+    "name": "[NAME_MASKED]",
+}
+
+_NAME_WORD_RE = re.compile(r"[A-Z][a-z]{2,}")
+
+# Longer strings (free-text traces) are masked without memoization
+_MEMO_MAX_LEN = 256
+
+
+def _replace(m: "re.Match[str]") -> str:
+    kind = m.lastgroup
+    if kind == "wordphone":
+        prefix = m.group("prefix")
+        if len(prefix) >= 6:
+            prefix = _PLACEHOLDERS["id"]
+        elif _NAME_WORD_RE.fullmatch(prefix):
+            prefix = _PLACEHOLDERS["name"]
+        return prefix + _PLACEHOLDERS["wordphone"]
+    return _PLACEHOLDERS[kind]
+
+
+def _scan(text: str) -> str:
+    if "@" not in text:
+        return PII_RE.sub(_replace, text)
+    return "[EMAIL_MASKED]".join(PII_RE.sub(_replace, part) for part in EMAIL_RE.split(text))
+
+
+def _may_contain_pii(text: str) -> bool:
+    """
+    Cheap pre-check before the regex scan. Every pattern needs at least
+    3 characters (names); below 6 characters only a capitalized name can
+    match, which needs both upper- and lowercase letters.
+    """
+    n = len(text)
+    if n < 3:
+        return False
+    if n < 6:
+        return not (text.islower() or text.isupper())
+    return True
+
+
+@lru_cache(maxsize=8192)
+def _mask_str(text: str) -> str:
+    """Masks one string; memoized, since parse fields repeat heavily."""
+    return _scan(text)
+
+
 # ------------------------------------------------------------
 # PII Masking Functions
 # ------------------------------------------------------------
@@ -47,21 +137,51 @@ def mask_pii(text: Any) -> Any:
     - IDs
     - person-like names (mildly)
     """
-    if not isinstance(text, str):
+    if not isinstance(text, str) or not _may_contain_pii(text):
         return text
+    if len(text) > _MEMO_MAX_LEN:
+        return _scan(text)
+    return _mask_str(text)
+
 
-    masked = text
-    masked = EMAIL_RE.sub("[EMAIL_MASKED]", masked)
-    masked = PHONE_RE.sub("[PHONE_MASKED]", masked)
-    masked = ID_RE.sub("[ID_MASKED]", masked)
-    masked = NAME_RE.sub("[NAME_MASKED]", masked)
+def _mask_value(value: Any) -> Any:
+    """
+    Deep copy of nested dicts / lists with every string masked, using an
+    explicit stack (no recursion, one allocation per container).
+    Dict keys and non-string leaves are kept as-is.
+    """
+    if isinstance(value, str):
+        return mask_pii(value)
+    if not isinstance(value, (dict, list)):
+        return value
+
+    root: List[Any] = [None]
+    # (source container, destination parent, slot in parent)
+    stack: List[Any] = [(value, root, 0)]
+    while stack:
+        src, parent, slot = stack.pop()
+        if isinstance(src, dict):
+            dst: Any = {}
+            items: Iterable[Any] = src.items()
+        else:
+            dst = [None] * len(src)
+            items = enumerate(src)
+        parent[slot] = dst
 
-    return masked
+        for key, item in items:
+            if isinstance(item, str):
+                dst[key] = mask_pii(item)
+            elif isinstance(item, (dict, list)):
+                dst[key] = None  # keeps key order; filled when popped
+                stack.append((item, dst, key))
+            else:
+                dst[key] = item
+    return root[0]
 
 
 def mask_reasoning(reasoning: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Recursively mask PII in nested reasoning traces.
+    Mask PII in nested reasoning traces.
     Supports:
     - dict
     - list
@@ -70,29 +190,13 @@ def mask_reasoning(reasoning: Dict[str, Any]) -> Dict[str, Any]:
     """
     if not isinstance(reasoning, dict):
         return reasoning
+    return _mask_value(reasoning)
 
-    masked: Dict[str, Any] = {}
-
-    for key, value in reasoning.items():
 
-        if isinstance(value, str):
-            masked[key] = mask_pii(value)
-
-        elif isinstance(value, dict):
-            masked[key] = mask_reasoning(value)
-
-        elif isinstance(value, list):
-            new_list = []
-            for item in value:
-                if isinstance(item, str):
-                    new_list.append(mask_pii(item))
-                elif isinstance(item, dict):
-                    new_list.append(mask_reasoning(item))
-                else:
-                    new_list.append(item)
-            masked[key] = new_list
-
-        else:
-            masked[key] = value
-
-    return masked
+def mask_many(values: Iterable[Any]) -> List[Any]:
+    """
+    Batch API: masks each value (string, dict, list or primitive) and
+    returns the results in order. Containers are copied; inputs are
+    never mutated.
+    """
+    return [_mask_value(v) for v in values]
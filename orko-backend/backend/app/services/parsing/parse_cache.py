@@ -0,0 +1,370 @@
+# backend/app/services/parsing/parse_cache.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached payload shape changes (orphans old Redis entries)
+CACHE_SCHEMA_VERSION = "v1"
+
+# After a Redis error, skip the Redis tier for this long
+REDIS_BACKOFF_SECONDS = 30.0
+
+
+def normalize_command(text: str) -> str:
+    """
+    Normalization used for cache keys.
+    Collapses whitespace only — casing is preserved because extracted
+    parameters (regions, names, codes) echo the original text.
+    """
+    return " ".join((text or "").split())
+
+
+def build_cache_key(text: str, domain_hint: Optional[str], prompt_version: Any, model: str) -> str:
+    raw = json.dumps(
+        [normalize_command(text), domain_hint or "", str(prompt_version), model],
+        ensure_ascii=False,
+    )
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return f"orko:parse:{CACHE_SCHEMA_VERSION}:{digest}"
+
+
+class _LRUTier:
+    """
+    In-process LRU with per-entry TTL. Values are stored as JSON strings so
+    every hit returns fresh objects (callers mutate parsed dicts freely).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max = max(1, int(max_entries))
+        self._ttl = float(ttl_seconds)
+        self._data: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= now:
+                del self._data[key]
+                self.expirations += 1
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        expires_at = time.monotonic() + self._ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ParseCache:
+    """
+    Two-tier cache for AIParser results, used by ParserEngine.parse_command.
+
+    Tier 1: in-process LRU (TTL)      — zero network cost
+    Tier 2: shared Redis (SETEX)      — shared across workers / pods
+
+    Key = normalized command + soft domain hint + prompt version + model.
+    Each entry also records the prompt version of the domain it resolved to;
+    a hit whose version no longer matches get_prompt_version() is dropped,
+    so bumping prompt_versions.json invalidates stale parses.
+
+    Redis errors never fail a parse: the tier is simply skipped.
+    """
+
+    def __init__(
+        self,
+        prompt_version_fn: Callable[[str], Tuple[int, str]],
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        redis_url: Optional[str] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        self._prompt_version_fn = prompt_version_fn
+        self.enabled = settings.PARSE_CACHE_ENABLED if enabled is None else enabled
+        self.ttl_seconds = int(ttl_seconds or settings.PARSE_CACHE_TTL_SECONDS)
+        self._memory = _LRUTier(
+            max_entries or settings.PARSE_CACHE_MAX_ENTRIES,
+            self.ttl_seconds,
+        )
+        self._redis = self._connect_redis(
+            redis_url or settings.PARSE_CACHE_REDIS_URL or settings.redis_url
+        )
+        self._redis_skip_until = 0.0
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "hits_memory": 0,
+            "hits_redis": 0,
+            "misses": 0,
+            "stores": 0,
+            "invalidations": 0,
+            "redis_errors": 0,
+        }
+
+    # ---------------------------------------------------------
+    # Setup
+    # ---------------------------------------------------------
+    @staticmethod
+    def _connect_redis(url: Optional[str]):
+        if not url:
+            return None
+        try:
+            import redis
+
+            timeout = settings.PARSE_CACHE_REDIS_TIMEOUT_MS / 1000.0
+            return redis.Redis.from_url(
+                url,
+                socket_timeout=timeout,
+                socket_connect_timeout=timeout,
+            )
+        except Exception as e:
+            logger.warning("ParseCache: Redis tier disabled (%s)", e)
+            return None
+
+    @property
+    def redis_client(self):
+        """Redis tier client (None if disabled); shared by the single-flight lock."""
+        return self._redis if self.enabled else None
+
+    def _bump(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += n
+
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_skip_until
+
+    def _redis_failed(self) -> None:
+        self._redis_skip_until = time.monotonic() + REDIS_BACKOFF_SECONDS
+        self._bump("redis_errors")
+
+    # ---------------------------------------------------------
+    # Keys
+    # ---------------------------------------------------------
+    def key_for(self, text: str, domain_hint: Optional[str], model: str) -> str:
+        version, _ = self._prompt_version_fn(domain_hint or "general")
+        return build_cache_key(text, domain_hint, version, model)
+
+    # ---------------------------------------------------------
+    # Read / write
+    # ---------------------------------------------------------
+    def _decode(self, key: str, raw: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(raw)
+        except Exception:
+            return None
+        domain = entry.get("domain") or "general"
+        if entry.get("domain_prompt_version") != self._prompt_version_fn(domain)[0]:
+            self.invalidate(key)
+            self._bump("invalidations")
+            return None
+        return entry.get("parsed")
+
+    def get(
+        self,
+        text: str,
+        domain_hint: Optional[str],
+        model: str,
+        count: bool = True,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Returns (parsed, tier) where tier is "memory", "redis" or None on miss.
+        count=False keeps polling lookups (single-flight waits) out of the stats.
+        """
+        if not self.enabled:
+            return None, None
+
+        key = self.key_for(text, domain_hint, model)
+
+        raw = self._memory.get(key)
+        if raw is not None:
+            parsed = self._decode(key, raw)
+            if parsed is not None:
+                if count:
+                    self._bump("hits_memory")
+                return parsed, "memory"
+
+        if self._redis_available():
+            try:
+                remote = self._redis.get(key)
+            except Exception:
+                remote = None
+                self._redis_failed()
+            if remote is not None:
+                raw = remote.decode("utf-8") if isinstance(remote, bytes) else remote
+                parsed = self._decode(key, raw)
+                if parsed is not None:
+                    self._memory.put(key, raw)
+                    if count:
+                        self._bump("hits_redis")
+                    return parsed, "redis"
+
+        if count:
+            self._bump("misses")
+        return None, None
+
+    def put(self, text: str, domain_hint: Optional[str], model: str, parsed: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        key = self.key_for(text, domain_hint, model)
+        domain = parsed.get("domain") or "general"
+        raw = json.dumps(
+            {
+                "parsed": parsed,
+                "domain": domain,
+                "domain_prompt_version": self._prompt_version_fn(domain)[0],
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+
+        self._memory.put(key, raw)
+        self._bump("stores")
+
+        if self._redis_available():
+            try:
+                self._redis.setex(key, self.ttl_seconds, raw)
+            except Exception:
+                self._redis_failed()
+
+    def invalidate(self, key: str) -> None:
+        self._memory.delete(key)
+        if self._redis_available():
+            try:
+                self._redis.delete(key)
+            except Exception:
+                self._redis_failed()
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+    # ---------------------------------------------------------
+    # Warm-up from parser_logs
+    # ---------------------------------------------------------
+    def warm_from_parser_logs(self, model: str, top_n: int = 100) -> int:
+        """
+        Preloads the N most frequent commands from parser_logs, using the
+        most recent stored parse for each. No LLM calls are made.
+        Returns the number of entries loaded.
+        """
+        from sqlalchemy import func
+
+        from backend.app.db.session import SessionLocal
+        from backend.app.models.parser_log import ParserLog
+
+        loaded = 0
+        db = SessionLocal()
+        try:
+            top = (
+                db.query(ParserLog.command, func.count(ParserLog.id).label("n"))
+                .group_by(ParserLog.command)
+                .order_by(func.count(ParserLog.id).desc())
+                .limit(top_n)
+                .all()
+            )
+
+            for command, _count in top:
+                if not command:
+                    continue
+                row = (
+                    db.query(ParserLog)
+                    .filter(ParserLog.command == command)
+                    .order_by(ParserLog.created_at.desc())
+                    .first()
+                )
+                out = (row.parsed_output if row else None) or {}
+                ctx = out.get("context") or {}
+                if ctx.get("used_fallback_parser") or not out.get("action"):
+                    continue
+
+                entry = {
+                    "intent": out.get("intent", ""),
+                    "domain": out.get("domain"),
+                    "action": out.get("action"),
+                    "parameters": out.get("parameters") or {},
+                    "context": {"confidence": ctx.get("confidence", 1.0)},
+                }
+                self.put(command, ctx.get("domain") or "general", model, entry)
+                loaded += 1
+        finally:
+            db.close()
+
+        logger.info("ParseCache warmed with %s command(s) from parser_logs", loaded)
+        return loaded
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        hits = out["hits_memory"] + out["hits_redis"]
+        lookups = hits + out["misses"]
+        out.update(
+            {
+                "enabled": self.enabled,
+                "redis_tier": self._redis is not None,
+                "memory_entries": len(self._memory),
+                "evictions": self._memory.evictions,
+                "expirations": self._memory.expirations,
+                "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            }
+        )
+        return out
+
+
+def cli():
+    """
+    CLI interface for:
+        python -m backend.app.services.parsing.parse_cache --warm 200
+
+    Fills the shared Redis tier from parser_logs (no LLM calls).
+    """
+    import argparse
+
+    from backend.app.services.parsing.parser_engine import get_parser_engine
+
+    parser = argparse.ArgumentParser(description="Warm ORKO parse cache from parser_logs")
+    parser.add_argument("--warm", type=int, default=100, help="Top-N commands to preload")
+    args = parser.parse_args()
+
+    engine = get_parser_engine()
+    loaded = engine.warm_cache(top_n=args.warm)
+    print(f"Loaded {loaded} command(s).")
+    print(json.dumps(engine.runtime_stats()["parse_cache"], indent=2))
+
+
+if __name__ == "__main__":
+    cli()
@@ -1,16 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
 from uuid import uuid4
 
+from backend.app.core.config import settings
 from backend.app.db.session import SessionLocal
 from backend.app.models.parser_log import ParserLog
 
 from backend.app.services.parsing.ai_parser import AIParser
-from backend.app.services.parsing.masking import mask_reasoning
+from backend.app.services.parsing.masking import mask_many, mask_pii, mask_reasoning
 from backend.app.services.parsing.canonicalizer import canonicalize
+from backend.app.services.parsing.config_snapshot import (
+    ConfigSnapshot,
+    get_config_snapshot,
+    get_config_store,
+)
+from backend.app.services.parsing.fast_path import FastPath, FastPathPrediction
+from backend.app.services.parsing.keyword_matcher import DOMAIN_MATCHER
+from backend.app.services.parsing.parse_cache import ParseCache
+from backend.app.services.parsing.parser_log_writer import get_parser_log_writer
+from backend.app.services.parsing.single_flight import SingleFlight
 
 from backend.app.services.parser.intent_mapper import IntentMapper
 from backend.app.services.parser.slot_filling import SlotFillingEngine  # kept for compatibility
@@ -19,6 +37,8 @@ from backend.app.services.parser.intent_schema import Intent
 # Step 7 – Telemetry
 from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================
 # Directory Setup
@@ -37,16 +57,10 @@ def _read_file(path: Path) -> str:
 
 def get_prompt_version(domain: str) -> Tuple[int, str]:
     """
-    Reads prompt_versions.json and returns (version, updated_at) for a given domain.
-    Falls back to version=1 if not found.
+    Returns (version, updated_at) for a given domain from the current
+    config snapshot (prompt_versions.json). Falls back to version=1 if not found.
     """
-    version_file = CONFIG_DIR / "prompt_versions.json"
-    if not version_file.exists():
-        return 1, ""
-    with version_file.open("r", encoding="utf-8") as f:
-        all_meta = json.load(f)
-    meta = all_meta.get(domain, {})
-    return meta.get("version", 1), meta.get("updated_at", "")
+    return get_config_snapshot().prompt_version(domain)
 
 
 # ============================================================
@@ -55,28 +69,26 @@ def get_prompt_version(domain: str) -> Tuple[int, str]:
 
 def load_guardrails() -> Dict[str, Any]:
     """
-    Loads guardrails configuration from config/guardrails.json or local fallback.
+    Guardrails configuration (config/guardrails.json or local fallback),
+    served from the in-memory config snapshot.
     """
-    primary = CONFIG_DIR / "guardrails.json"
-    fallback = BASE_DIR / "guardrails.json"
-    path = primary if primary.exists() else fallback
-    if not path.exists():
-        return {}
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return dict(get_config_snapshot().guardrails)
 
 
-def apply_guardrails(parsed: Dict[str, Any]) -> Dict[str, Any]:
+def apply_guardrails(
+    parsed: Dict[str, Any],
+    snapshot: Optional[ConfigSnapshot] = None,
+) -> Dict[str, Any]:
     """
     Applies simple risk-level tagging based on action verbs.
     - Does NOT mutate action/domain.
     - Only sets risk_level + appends guardrail_flags.
     """
-    cfg = load_guardrails()
+    snap = snapshot or get_config_snapshot()
 
-    allowed = set(cfg.get("allowed_verbs", []))
-    risky = set(cfg.get("risky_verbs", []))
-    blocked = set(cfg.get("blocked_verbs", []))
+    allowed = snap.allowed_verbs
+    risky = snap.risky_verbs
+    blocked = snap.blocked_verbs
 
     action = (parsed.get("action") or "").lower()
     flags: list[str] = []
@@ -118,17 +130,18 @@ class CommandParser:
     It must NOT override AIParser in normal operation.
     """
 
-    def __init__(self) -> None:
-        self.intent_schema: Dict[str, Any] = self._load_json(
-            CONFIG_DIR / "intent_schema.json"
-        )
-        self.guardrails: Dict[str, Any] = self._load_json(
-            CONFIG_DIR / "guardrails.json"
-        )
+    # Config comes from the shared snapshot (always the latest reload)
+    @property
+    def intent_schema(self) -> Mapping[str, Any]:
+        return get_config_snapshot().intent_schema
 
-        self.prompt_versions: Dict[str, Any] = self._load_json(
-            CONFIG_DIR / "prompt_versions.json"
-        )
+    @property
+    def guardrails(self) -> Mapping[str, Any]:
+        return get_config_snapshot().guardrails
+
+    @property
+    def prompt_versions(self) -> Mapping[str, Any]:
+        return get_config_snapshot().prompt_versions
 
     def _load_json(self, path: Path, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         if not path.exists():
@@ -142,49 +155,8 @@ class CommandParser:
         This is only used when AIParser fails completely.
         It MUST NOT be used to override a valid AIParser domain.
         """
-        t = text.lower()
-
-        # Match your 19 domains using simple keyword heuristics
-        if any(k in t for k in ["contract", "hedge", "pnl", "hedging", "mt", "shipment"]):
-            return "trading"
-        if any(k in t for k in ["ship", "vessel", "eta", "load", "port", "truck", "warehouse", "delivery"]):
-            return "logistics"
-        if any(k in t for k in ["invoice", "cashflow", "pnl", "tax", "budget", "expense"]):
-            return "finance"
-        if any(k in t for k in ["employee", "onboarding", "vacation", "leave", "hr"]):
-            return "hr"
-        if any(k in t for k in ["service", "incident", "cluster", "server", "restart", "patch"]):
-            return "it_ops"
-        if any(k in t for k in ["microservice", "load test", "deploy pipeline", "devops"]):
-            return "devops"
-        if any(k in t for k in ["ticket", "support case", "escalation"]):
-            return "customer_support"
-        if any(k in t for k in ["maintenance", "checklist", "operational risk", "incidents"]):
-            return "operations"
-        if any(k in t for k in ["forecast", "demand", "retention", "churn", "analytics"]):
-            return "analytics"
-        if any(k in t for k in ["opportunity", "pipeline", "win-loss", "sales"]):
-            return "sales"
-        if any(k in t for k in ["campaign", "marketing", "engagement", "competitive report"]):
-            return "marketing"
-        if any(k in t for k in ["purchase order", "suppliers", "vendor", "sourcing"]):
-            return "procurement"
-        if any(k in t for k in ["machine", "work orders", "plant", "assembly"]):
-            return "manufacturing"
-        if any(k in t for k in ["nda", "contract", "compliance", "regulation", "legal"]):
-            return "legal"
-        if any(k in t for k in ["store", "inventory", "stockout", "retail"]):
-            return "retail"
-        if any(k in t for k in ["grid", "outage", "energy", "renewable"]):
-            return "energy"
-        if any(k in t for k in ["patient", "claims", "lab results"]):
-            return "healthcare_admin"
-        if any(k in t for k in ["meeting", "travel request", "okr", "office supplies"]):
-            return "general_admin"
-        if any(k in t for k in ["knowledge base", "documentation", "specification", "docs"]):
-            return "knowledge_work"
-
-        return default
+        # Match your 19 domains with the shared single-pass keyword matcher
+        return DOMAIN_MATCHER.best(text, default=default) or default
 
     def _extract_action(self, text: str) -> str:
         """
@@ -224,24 +196,29 @@ class ParserEngine:
         self._ai_parser = AIParser()
         # Backup brain: CommandParser (heuristic) — only if AIParser dies
         self._fallback = CommandParser()
+        # Parse-result cache in front of the LLM call (memory + Redis)
+        self._cache = ParseCache(prompt_version_fn=get_prompt_version)
+        # Local classifier consulted before the LLM (PARSER_FASTPATH_MODE)
+        self._fastpath = FastPath()
+        # Identical concurrent misses share one LLM call
+        self._flight = SingleFlight(
+            redis_client=self._cache.redis_client if settings.PARSE_SINGLEFLIGHT_REDIS_LOCK else None
+        )
+        # Parse deadline: provisional results + background refinement
+        self._deadline_pool: Optional[ThreadPoolExecutor] = None
+        self._deadline_lock = threading.Lock()
+        self._refinements: set = set()  # strong refs to in-flight asyncio refinement tasks
+        self._deadline_stats: Dict[str, int] = {"hits": 0, "refined": 0, "refined_changed": 0, "refine_failed": 0}
+        self._deadline_hits_by_domain: Counter = Counter()
 
     # ---------------------------
     # Intent Guardrails
     # ---------------------------
     def _load_intent_guardrails(self) -> Dict[str, Any]:
-        path = CONFIG_DIR / "intent_guardrails.json"
-        if not path.exists():
-            return {}
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
+        return dict(get_config_snapshot().intent_guardrails)
 
-    def _load_destructive_verbs(self) -> set[str]:
-        cfg = self._load_intent_guardrails()
-        verbs = cfg.get("destructive_verbs") or cfg.get("unsafe_action_verbs") or []
-        return set(verbs)
+    def _load_destructive_verbs(self) -> FrozenSet[str]:
+        return get_config_snapshot().destructive_verbs
 
     # ---------------------------
     # Helper – Decide if we must fallback
@@ -268,32 +245,118 @@ class ParserEngine:
 
         return False
 
+    @staticmethod
+    def _cacheable(ai_parsed: Dict[str, Any], base_context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Strip request-specific context (user_id, org_id, channel, ...) so a
+        cached parse never leaks one caller's context into another's result.
+        """
+        ctx = ai_parsed.get("context") or {}
+        if not isinstance(ctx, dict):
+            ctx = {"value": ctx}
+        return {
+            "intent": ai_parsed.get("intent", ""),
+            "domain": ai_parsed.get("domain"),
+            "action": ai_parsed.get("action"),
+            "parameters": ai_parsed.get("parameters") or {},
+            "context": {k: v for k, v in ctx.items() if k not in base_context},
+        }
+
     # ---------------------------
-    # MAIN PARSE METHOD
+    # Runtime metrics
     # ---------------------------
-    def parse_command(
-        self,
-        text: str,
-        context: Optional[Dict[str, Any]] = None,
-        domain: str = "general",
-    ) -> Dict[str, Any]:
+    def runtime_stats(self) -> Dict[str, Any]:
+        return {
+            "parse_cache": self._cache.stats(),
+            "prompt_prefix": self._ai_parser.prompt_cache_stats(),
+            "config": get_config_store().stats(),
+            "parser_log_writer": get_parser_log_writer().stats(),
+            "fastpath": self._fastpath.stats(),
+            "single_flight": self._flight.stats(),
+            "parse_deadline": self.deadline_stats(),
+            "llm_backend": self._ai_parser.llm_backend.stats(),
+        }
 
+    def deadline_stats(self) -> Dict[str, Any]:
+        with self._deadline_lock:
+            out: Dict[str, Any] = dict(self._deadline_stats)
+            out["hits_by_domain"] = dict(self._deadline_hits_by_domain)
+        out["deadline_ms"] = settings.PARSER_DEADLINE_MS
+        out["refining"] = len(self._refinements)
+        return out
+
+    def reload_fastpath(self) -> bool:
+        """Re-reads the fast-path model file (after a --retrain)."""
+        return self._fastpath.reload()
+
+    def warm_cache(self, top_n: int = 100) -> int:
+        """Preload the parse cache with the top-N commands from parser_logs."""
+        return self._cache.warm_from_parser_logs(model=self._ai_parser.model, top_n=top_n)
+
+    # ---------------------------
+    # Parse stages (shared by sync + async paths)
+    # ---------------------------
+    @staticmethod
+    def _base_context(context: Optional[Dict[str, Any]], domain: str) -> Dict[str, Any]:
         # Make a copy of incoming context and inject domain as a soft hint
         base_context: Dict[str, Any] = dict(context or {})
         if domain and "domain" not in base_context:
             base_context["domain"] = domain
+        return base_context
+
+    @staticmethod
+    def _report_ai_failure(e: Exception, text: str) -> None:
+        print("\n🔥🔥🔥 AIParser FAILED — DEBUG INFO 🔥🔥🔥")
+        print("Error:", e)
+        print("Command:", text)
+        print("--------------------------------------------------\n")
 
-        # 1) Call AIParser (PRIMARY)
-        ai_parsed: Dict[str, Any] = {}
+    def _llm_parse(self, text: str, base_context: Dict[str, Any], domain_hint: Optional[str], model: str) -> Dict[str, Any]:
+        """
+        One AIParser call (+ cache store on success). Returns the
+        request-context-free form so single-flight waiters can share it;
+        _finalize merges each caller's own context back in.
+        """
         try:
             ai_parsed = self._ai_parser.parse(text, context=base_context) or {}
         except Exception as e:
-            print("\n🔥🔥🔥 AIParser FAILED — DEBUG INFO 🔥🔥🔥")
-            print("Error:", e)
-            print("Command:", text)
-            print("--------------------------------------------------\n")
+            self._report_ai_failure(e, text)
+            ai_parsed = {}
+
+        shared = self._cacheable(ai_parsed, base_context)
+        if not self._should_use_fallback(ai_parsed):
+            self._cache.put(text, domain_hint, model, shared)
+        return shared
+
+    async def _llm_parse_async(
+        self, text: str, base_context: Dict[str, Any], domain_hint: Optional[str], model: str
+    ) -> Dict[str, Any]:
+        try:
+            ai_parsed = await self._ai_parser.parse_async(text, context=base_context) or {}
+        except Exception as e:
+            self._report_ai_failure(e, text)
             ai_parsed = {}
 
+        shared = self._cacheable(ai_parsed, base_context)
+        if not self._should_use_fallback(ai_parsed):
+            await asyncio.to_thread(self._cache.put, text, domain_hint, model, shared)
+        return shared
+
+    def _flight_lookup(self, text: str, domain_hint: Optional[str], model: str):
+        """Shared-cache probe used while another process holds the parse lock."""
+        if not self._cache.enabled:
+            return None
+        return lambda: self._cache.get(text, domain_hint, model, count=False)[0]
+
+    def _merge(
+        self,
+        text: str,
+        domain: str,
+        base_context: Dict[str, Any],
+        ai_parsed: Dict[str, Any],
+        cache_tier: Optional[str],
+    ) -> Dict[str, Any]:
+        """Fallback decision + merge of AIParser output and inbound context."""
         # 2) Decide whether to fallback
         use_fallback = self._should_use_fallback(ai_parsed)
 
@@ -348,19 +411,18 @@ class ParserEngine:
             }
 
             parsed["context"]["used_fallback_parser"] = False
+            parsed["context"]["parse_cache"] = cache_tier or "miss"
 
-        # 2.5) Canonicalization step:
-        # Normalize fuzzy domain/action/params into strict canonical space.
-        parsed = canonicalize(parsed, text)
+        return parsed
 
-        # 3) Destructive verbs + risk tiers (do NOT change domain/action)
-        destructive_verbs = self._load_destructive_verbs()
+    @staticmethod
+    def _flag_risky_actions(parsed: Dict[str, Any], snap: ConfigSnapshot) -> None:
+        """Destructive verbs + risk tiers → confirmation / admin flags."""
+        destructive_verbs = snap.destructive_verbs
         action_lower = (parsed.get("action") or "").lower()
 
-        guardrails_cfg = self._load_intent_guardrails()
-        risk_tiers = guardrails_cfg.get("risk_tiers", {}) or {}
-        high_risk = set(risk_tiers.get("high_risk", []) or [])
-        medium_risk = set(risk_tiers.get("medium_risk", []) or [])
+        high_risk = snap.high_risk_actions
+        medium_risk = snap.medium_risk_actions
 
         parsed.setdefault("context", {})
 
@@ -375,46 +437,340 @@ class ParserEngine:
             parsed["context"]["requires_confirmation"] = True
             parsed["context"]["requires_admin"] = True
 
-        # 4) Non-destructive guardrails (sets risk_level + flags)
-        parsed = apply_guardrails(parsed)
-
-        # 5) Confidence normalization
+    @staticmethod
+    def _normalize_confidence(parsed: Dict[str, Any]) -> None:
         try:
             conf = float(parsed["context"].get("confidence", 1.0))
         except Exception:
             conf = 1.0
         parsed["context"]["confidence"] = max(0.0, min(1.0, conf))
 
+    def _finalize(
+        self,
+        text: str,
+        domain: str,
+        base_context: Dict[str, Any],
+        ai_parsed: Dict[str, Any],
+        cache_tier: Optional[str],
+    ) -> Dict[str, Any]:
+        """
+        Pure CPU post-processing of the AIParser output: fallback decision,
+        context merge, canonicalization, risk flags, guardrails, confidence
+        and prompt-version tagging. No network or DB I/O.
+
+        One config snapshot is used for the whole call; its version_id is
+        stamped into the output as `config_version`.
+        """
+        snap = get_config_snapshot()
+
+        # 2) Fallback decision + context merge
+        parsed = self._merge(text, domain, base_context, ai_parsed, cache_tier)
+
+        # 2.5) Canonicalization step:
+        # Normalize fuzzy domain/action/params into strict canonical space.
+        parsed = canonicalize(parsed, text, table=snap.canonical_table)
+
+        # 3) Destructive verbs + risk tiers (do NOT change domain/action)
+        self._flag_risky_actions(parsed, snap)
+
+        # 4) Non-destructive guardrails (sets risk_level + flags)
+        parsed = apply_guardrails(parsed, snapshot=snap)
+
+        # 5) Confidence normalization
+        self._normalize_confidence(parsed)
+
         # 6) Prompt version tagging
         domain_for_version = parsed.get("domain") or "general"
-        version, updated_at = get_prompt_version(domain_for_version)
+        version, updated_at = snap.prompt_version(domain_for_version)
         parsed["prompt_version"] = version
         parsed["prompt_version_updated_at"] = updated_at
+        parsed["config_version"] = snap.version_id
+
+        return parsed
+
+    def _record(
+        self,
+        parsed: Dict[str, Any],
+        text: str,
+        base_context: Dict[str, Any],
+        shadow: Optional[FastPathPrediction] = None,
+        row_id: Optional[str] = None,
+    ) -> None:
+        """
+        Side effects of a parse: ParserLog row + telemetry JSONL
+        (+ fast-path vs LLM agreement when running in shadow mode).
 
+        With PARSER_LOG_WRITE_BEHIND the row is only enqueued; the
+        ParserLogWriter thread bulk-inserts it. Otherwise it is committed
+        synchronously (one session per parse, legacy behaviour).
+        """
         # 7) Masked reasoning log (if any)
         reasoning = parsed.get("context", {}).get("reasoning_trace")
-        masked = mask_reasoning(reasoning) if reasoning else None
-
-        log = ParserLog(
-            id=str(uuid4()),
-            user_id=base_context.get("user_id"),
-            command=text,
-            parsed_output=parsed,
-            masked_reasoning=masked,
-            domain=parsed.get("domain"),
-            action=parsed.get("action"),
+        if settings.PARSER_MASK_STORED_PARSES:
+            # One batch over the whole stored parse (its context holds the trace)
+            stored, masked = mask_many([parsed, reasoning if reasoning else None])
+            raw = mask_pii(text)
+        else:
+            stored, raw = parsed, text
+            masked = mask_reasoning(reasoning) if reasoning else None
+
+        row = {
+            "id": row_id or str(uuid4()),
+            "user_id": base_context.get("user_id"),
+            "command": text,
+            "parsed_output": stored,
+            "masked_reasoning": masked,
+            "domain": parsed.get("domain"),
+            "action": parsed.get("action"),
+        }
+
+        if settings.PARSER_LOG_WRITE_BEHIND:
+            get_parser_log_writer().enqueue(row)
+        else:
+            db = SessionLocal()
+            try:
+                db.add(ParserLog(**row))
+                db.commit()
+            finally:
+                db.close()
+
+        # 8) Telemetry
+        TelemetryCollector.record_parser(stored, raw)
+        if shadow is not None and not parsed["context"].get("used_fallback_parser"):
+            TelemetryCollector.record_fastpath_shadow(
+                raw, self._fastpath.shadow_compare(shadow, parsed)
+            )
+
+    # ---------------------------
+    # Parse deadline
+    # ---------------------------
+    def _deadline_executor(self) -> ThreadPoolExecutor:
+        if self._deadline_pool is None:
+            with self._deadline_lock:
+                if self._deadline_pool is None:
+                    self._deadline_pool = ThreadPoolExecutor(
+                        max_workers=settings.PARSER_DEADLINE_WORKERS,
+                        thread_name_prefix="orko-parse-deadline",
+                    )
+        return self._deadline_pool
+
+    def _provisional(
+        self,
+        text: str,
+        domain: str,
+        base_context: Dict[str, Any],
+        deadline_ms: int,
+    ) -> Dict[str, Any]:
+        """
+        Heuristic (CommandParser) result returned when the LLM misses the
+        deadline. Its parse_id is the ParserLog row id; the refined row
+        written later carries it as `refines_parse_id`.
+        """
+        parsed = self._finalize(text, domain, base_context, {}, None)
+        parsed["context"]["provisional"] = True
+        parsed["context"]["parse_deadline_ms"] = deadline_ms
+        parsed["context"]["parse_id"] = str(uuid4())
+
+        with self._deadline_lock:
+            self._deadline_stats["hits"] += 1
+            self._deadline_hits_by_domain[parsed.get("domain") or "general"] += 1
+        return parsed
+
+    def _refine(
+        self,
+        provisional: Dict[str, Any],
+        text: str,
+        domain: str,
+        base_context: Dict[str, Any],
+        shadow: Optional[FastPathPrediction],
+        started: float,
+        outcome: Optional[Tuple[Dict[str, Any], Optional[str]]],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Records the late LLM parse for a provisional result (runs off the request path)."""
+        parse_id = provisional["context"]["parse_id"]
+        if outcome is None:
+            with self._deadline_lock:
+                self._deadline_stats["refine_failed"] += 1
+            logger.warning("Parse refinement %s failed: %s", parse_id, error)
+            return
+
+        ai_parsed, coalesced = outcome
+        parsed = self._finalize(
+            text, domain, base_context, ai_parsed, f"coalesced_{coalesced}" if coalesced else None
+        )
+        parsed["context"]["refines_parse_id"] = parse_id
+        changed = (parsed.get("domain"), parsed.get("action")) != (
+            provisional.get("domain"),
+            provisional.get("action"),
+        )
+        self._record(parsed, text, base_context, shadow)
+
+        with self._deadline_lock:
+            self._deadline_stats["refined"] += 1
+            self._deadline_stats["refined_changed"] += int(changed)
+
+        TelemetryCollector.record_parse_deadline(
+            mask_pii(text) if settings.PARSER_MASK_STORED_PARSES else text,
+            {
+                "parse_id": parse_id,
+                "deadline_ms": provisional["context"]["parse_deadline_ms"],
+                "llm_ms": round((time.perf_counter() - started) * 1000.0, 1),
+                "provisional_domain": provisional.get("domain"),
+                "refined_domain": parsed.get("domain"),
+                "refined_action": parsed.get("action"),
+                "changed": changed,
+            },
         )
 
-        db = SessionLocal()
+    def _refine_from_future(self, fut, *args) -> None:
         try:
-            db.add(log)
-            db.commit()
-        finally:
-            db.close()
+            outcome, error = fut.result(), None
+        except BaseException as e:
+            outcome, error = None, e
+        self._refine(*args, outcome, error)
 
-        # 8) Telemetry
-        TelemetryCollector.record_parser(parsed, text)
+    async def _refine_async(self, task: "asyncio.Task", *args) -> None:
+        try:
+            outcome, error = await task, None
+        except BaseException as e:
+            outcome, error = None, e
+        await asyncio.to_thread(self._refine, *args, outcome, error)
+
+    # ---------------------------
+    # MAIN PARSE METHOD
+    # ---------------------------
+    def parse_command(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]] = None,
+        domain: str = "general",
+        deadline_ms: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Synchronous parse (scripts, evaluators, Celery workers).
+        FastAPI routes should await parse_command_async() instead.
+
+        deadline_ms (off unless given): if the LLM stage takes longer, a
+        provisional heuristic result is returned and the LLM result is
+        recorded in the background when it arrives.
+        """
+        base_context = self._base_context(context, domain)
+
+        # 1) Parse-result cache, then AIParser (PRIMARY)
+        domain_hint = base_context.get("domain")
+        model = self._ai_parser.model
+        ai_parsed, cache_tier = self._cache.get(text, domain_hint, model)
+
+        # 1.5) Local fast path — serves confident predictions, else shadows the LLM
+        shadow = None
+        if ai_parsed is None:
+            shadow = self._fastpath.predict(text)
+            ai_parsed = self._fastpath.serve(shadow)
+            if ai_parsed is not None:
+                cache_tier, shadow = "fastpath", None
+
+        if ai_parsed is None:
+            started = time.perf_counter()
+
+            def call():
+                return self._flight.do(
+                    self._cache.key_for(text, domain_hint, model),
+                    lambda: self._llm_parse(text, base_context, domain_hint, model),
+                    self._flight_lookup(text, domain_hint, model),
+                )
+
+            if deadline_ms:
+                fut = self._deadline_executor().submit(call)
+                try:
+                    ai_parsed, coalesced = fut.result(timeout=deadline_ms / 1000.0)
+                except FuturesTimeout:
+                    provisional = self._provisional(text, domain, base_context, deadline_ms)
+                    self._record(provisional, text, base_context, None, provisional["context"]["parse_id"])
+                    fut.add_done_callback(
+                        lambda f: self._refine_from_future(
+                            f, provisional, text, domain, base_context, shadow, started
+                        )
+                    )
+                    return provisional
+            else:
+                ai_parsed, coalesced = call()
+            if coalesced:
+                cache_tier = f"coalesced_{coalesced}"
+
+        parsed = self._finalize(text, domain, base_context, ai_parsed, cache_tier)
+        self._record(parsed, text, base_context, shadow)
+        return parsed
+
+    async def parse_command_async(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]] = None,
+        domain: str = "general",
+        deadline_ms: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Event-loop friendly parse with the same output as parse_command().
+
+        - LLM call is awaited via AsyncOpenAI (no thread held per request)
+        - Redis cache lookups and the record step (ParserLog enqueue +
+          telemetry file write) run in worker threads, so the loop never
+          blocks on network / disk I/O
+        - LLM stage is bounded by deadline_ms (default PARSER_DEADLINE_MS):
+          past it a provisional heuristic result is returned and the LLM
+          call keeps running in the background to record the refined parse
+        """
+        if deadline_ms is None:
+            deadline_ms = settings.PARSER_DEADLINE_MS
+        base_context = self._base_context(context, domain)
+
+        # 1) Parse-result cache, then AIParser (PRIMARY)
+        domain_hint = base_context.get("domain")
+        model = self._ai_parser.model
+        ai_parsed, cache_tier = await asyncio.to_thread(
+            self._cache.get, text, domain_hint, model
+        )
+
+        # 1.5) Local fast path (sub-millisecond, runs inline on the loop)
+        shadow = None
+        if ai_parsed is None:
+            shadow = self._fastpath.predict(text)
+            ai_parsed = self._fastpath.serve(shadow)
+            if ai_parsed is not None:
+                cache_tier, shadow = "fastpath", None
+
+        if ai_parsed is None:
+            started = time.perf_counter()
+            call = self._flight.do_async(
+                self._cache.key_for(text, domain_hint, model),
+                lambda: self._llm_parse_async(text, base_context, domain_hint, model),
+                self._flight_lookup(text, domain_hint, model),
+            )
 
+            if deadline_ms:
+                task = asyncio.ensure_future(call)
+                try:
+                    ai_parsed, coalesced = await asyncio.wait_for(
+                        asyncio.shield(task), timeout=deadline_ms / 1000.0
+                    )
+                except asyncio.TimeoutError:
+                    provisional = self._provisional(text, domain, base_context, deadline_ms)
+                    await asyncio.to_thread(
+                        self._record, provisional, text, base_context, None, provisional["context"]["parse_id"]
+                    )
+                    refinement = asyncio.ensure_future(
+                        self._refine_async(task, provisional, text, domain, base_context, shadow, started)
+                    )
+                    self._refinements.add(refinement)
+                    refinement.add_done_callback(self._refinements.discard)
+                    return provisional
+            else:
+                ai_parsed, coalesced = await call
+            if coalesced:
+                cache_tier = f"coalesced_{coalesced}"
+
+        parsed = self._finalize(text, domain, base_context, ai_parsed, cache_tier)
+        await asyncio.to_thread(self._record, parsed, text, base_context, shadow)
         return parsed
 
     # ---------------------------
@@ -444,5 +800,64 @@ class ParserEngine:
         }
 
 
+# ============================================================
+# Process-wide ParserEngine (warm singleton)
+# ============================================================
+# Building a ParserEngine is expensive: it creates an OpenAI client (and its
+# HTTP pool), loads domain_examples.yml and builds the action catalog.
+# One instance is shared per process; it is rebuilt after a fork so that
+# worker processes never reuse the parent's connection pool.
+
+_engine: Optional[ParserEngine] = None
+_engine_pid: Optional[int] = None
+_engine_lock = threading.Lock()
+
+
+def get_parser_engine() -> ParserEngine:
+    """
+    Returns the process-wide ParserEngine, creating it on first use.
+    Thread-safe (double-checked locking) and fork-aware.
+    """
+    global _engine, _engine_pid
+
+    engine = _engine
+    if engine is not None and _engine_pid == os.getpid():
+        return engine
+
+    with _engine_lock:
+        if _engine is None or _engine_pid != os.getpid():
+            t0 = time.perf_counter()
+            _engine = ParserEngine()
+            _engine_pid = os.getpid()
+            elapsed_ms = (time.perf_counter() - t0) * 1000.0
+            logger.info(
+                "ParserEngine constructed in %.1f ms (pid=%s)", elapsed_ms, _engine_pid
+            )
+        return _engine
+
+
+def warm_parser_engine() -> float:
+    """
+    Eagerly constructs the shared ParserEngine (app startup / worker fork).
+    Returns the construction cost in milliseconds (0.0 if already warm).
+    """
+    if _engine is not None and _engine_pid == os.getpid():
+        return 0.0
+    t0 = time.perf_counter()
+    get_parser_engine()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def reset_parser_engine() -> None:
+    """
+    Drops the shared instance (tests, config reloads). The next call to
+    get_parser_engine() builds a fresh one.
+    """
+    global _engine, _engine_pid
+    with _engine_lock:
+        _engine = None
+        _engine_pid = None
+
+
 def get_default_parser_engine() -> ParserEngine:
-    return ParserEngine()
+    return get_parser_engine()
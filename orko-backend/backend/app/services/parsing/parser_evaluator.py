@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Tuple
 
 import yaml
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.parser_engine import get_parser_engine
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_DIR = BASE_DIR / "config"
@@ -53,7 +53,7 @@ class ParserEvaluator:
     """
 
     def __init__(self) -> None:
-        self.engine = ParserEngine()
+        self.engine = get_parser_engine()
 
     # -------------------------------------------------------------
     # Load items from YAML
@@ -0,0 +1,278 @@
+# backend/app/services/parsing/parser_log_writer.py
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.parser_log import ParserLog
+
+logger = logging.getLogger(__name__)
+
+# Put on the queue by shutdown() to wake the worker out of a blocking get()
+_WAKE: Dict[str, Any] = {}
+
+# JSON columns: snapshotted at enqueue time, the caller keeps mutating its dicts
+_JSON_FIELDS = ("parsed_output", "masked_reasoning")
+
+
+def _snapshot(row: Dict[str, Any]) -> Dict[str, Any]:
+    row = dict(row)
+    for name in _JSON_FIELDS:
+        if row.get(name) is not None:
+            row[name] = json.loads(json.dumps(row[name], default=str))
+    return row
+
+
+class ParserLogWriter:
+    """
+    Write-behind buffer for ParserLog rows.
+
+    The parse hot path only enqueues a plain row dict. A background thread
+    drains the bounded queue and bulk-inserts rows in one transaction
+    every `batch_size` rows or `flush_interval_ms`, whichever comes first.
+
+    Full buffer policy (PARSER_LOG_OVERFLOW):
+      - "drop":  the row is discarded immediately and counted in `dropped`
+      - "block": the caller waits up to `block_timeout_ms` for space
+                 (counted in `backpressure_waits`), then drops
+
+    flush() / shutdown() drain everything still buffered; shutdown is
+    registered with atexit and called from the app / worker shutdown hooks.
+    """
+
+    def __init__(
+        self,
+        max_buffer: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        overflow: Optional[str] = None,
+        block_timeout_ms: Optional[int] = None,
+        session_factory=SessionLocal,
+    ) -> None:
+        self.max_buffer = max_buffer or settings.PARSER_LOG_BUFFER_MAX
+        self.batch_size = batch_size or settings.PARSER_LOG_BATCH_SIZE
+        self.flush_interval_s = (flush_interval_ms or settings.PARSER_LOG_FLUSH_INTERVAL_MS) / 1000.0
+        self.overflow = (overflow or settings.PARSER_LOG_OVERFLOW).lower()
+        self.block_timeout_s = (
+            settings.PARSER_LOG_BLOCK_TIMEOUT_MS if block_timeout_ms is None else block_timeout_ms
+        ) / 1000.0
+        self._session_factory = session_factory
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=self.max_buffer)
+        self._start_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "backpressure_waits": 0,
+            "flush_errors": 0,
+            "rows_failed": 0,
+            "row_retries": 0,
+        }
+
+    # ---------------------------------------------------------
+    # Hot path
+    # ---------------------------------------------------------
+    def enqueue(self, row: Dict[str, Any]) -> bool:
+        """
+        Buffers one ParserLog row (column → value). Never touches the DB.
+        JSON columns are copied here, so later changes to the caller's
+        dicts (e.g. the route flagging human review) are not stored.
+        Returns False if the row was dropped because the buffer is full.
+        """
+        self._ensure_started()
+        row = _snapshot(row)
+        row.setdefault("created_at", datetime.utcnow())
+
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            if self.overflow != "block" or self.block_timeout_s <= 0:
+                self._bump("dropped")
+                return False
+            self._bump("backpressure_waits")
+            try:
+                self._queue.put(row, timeout=self.block_timeout_s)
+            except queue.Full:
+                self._bump("dropped")
+                return False
+
+        self._bump("enqueued")
+        return True
+
+    # ---------------------------------------------------------
+    # Background worker
+    # ---------------------------------------------------------
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                # Forked child: the parent's buffered rows are the parent's job
+                self._queue = queue.Queue(maxsize=self.max_buffer)
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="orko-parser-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._write(batch)
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Blocks for the first row, then gathers more until size or deadline."""
+        try:
+            first = self._queue.get(timeout=self.flush_interval_s)
+        except queue.Empty:
+            return []
+        if first is _WAKE:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_interval_s
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                row = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if row is _WAKE:
+                break
+            batch.append(row)
+        return batch
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if row is not _WAKE:
+                rows.append(row)
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        db = self._session_factory()
+        try:
+            db.bulk_insert_mappings(ParserLog, rows)
+            db.commit()
+            self._bump("written", len(rows))
+            self._bump("batches")
+            return
+        except Exception as e:
+            db.rollback()
+            self._bump("flush_errors")
+            logger.warning("ParserLog batch insert failed (%s rows), retrying row by row: %s", len(rows), e)
+        finally:
+            db.close()
+
+        # One bad row must not take the rest of the batch with it
+        for row in rows:
+            self._bump("row_retries")
+            db = self._session_factory()
+            try:
+                db.bulk_insert_mappings(ParserLog, [row])
+                db.commit()
+                self._bump("written")
+            except Exception as e:
+                db.rollback()
+                self._bump("rows_failed")
+                logger.warning("ParserLog row %s dropped: %s", row.get("id"), e)
+            finally:
+                db.close()
+
+    # ---------------------------------------------------------
+    # Flush / shutdown
+    # ---------------------------------------------------------
+    def flush(self) -> int:
+        """Synchronously writes everything currently buffered. Returns rows written."""
+        rows = self._drain()
+        for i in range(0, len(rows), self.batch_size):
+            self._write(rows[i : i + self.batch_size])
+        return len(rows)
+
+    def shutdown(self, timeout: float = 5.0) -> int:
+        """Stops the worker thread and flushes the remaining rows."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            try:
+                self._queue.put_nowait(_WAKE)
+            except queue.Full:
+                pass  # worker is busy draining, it will see the stop flag
+            thread.join(timeout)
+        self._thread = None
+        return self.flush()
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def _bump(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        out.update(
+            {
+                "buffered": self._queue.qsize(),
+                "max_buffer": self.max_buffer,
+                "batch_size": self.batch_size,
+                "flush_interval_ms": int(self.flush_interval_s * 1000),
+                "overflow": self.overflow,
+            }
+        )
+        return out
+
+
+# ============================================================
+# Process-wide writer
+# ============================================================
+
+_writer: Optional[ParserLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_parser_log_writer() -> ParserLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ParserLogWriter()
+    return _writer
+
+
+def shutdown_parser_log_writer(timeout: float = 5.0) -> int:
+    """Flushes buffered rows (app shutdown / worker exit). Returns rows flushed."""
+    writer = _writer
+    if writer is None:
+        return 0
+    return writer.shutdown(timeout)
+
+
+atexit.register(shutdown_parser_log_writer)
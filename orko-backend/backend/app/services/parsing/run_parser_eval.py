@@ -10,6 +10,11 @@ from backend.app.services.parsing.eval_unified import (
     export_errors,
 )
 from backend.app.services.parsing.parser_metrics_writer import ParserMetricsWriter
+from backend.app.services.parsing.llm_backend import (
+    add_llm_backend_arguments,
+    apply_llm_backend_arguments,
+)
+from backend.app.services.parsing.eval_fewshot import run_fewshot_tradeoff
 
 
 # Default accuracy threshold for commercial-grade operation
@@ -103,10 +108,61 @@ def run(version: str = "v7") -> None:
     print("--------------------------------------------------")
 
 
+def run_fewshot_tradeoff_report(ks=(4, 8, 16)) -> None:
+    """
+    Few-shot selection trade-off against parser_eval_set_v7.yml:
+    accuracy vs estimated prompt tokens for "all" vs "retrieval" (per k).
+    """
+    rows = run_fewshot_tradeoff(ks=ks)
+
+    print("--------------------------------------------------")
+    print("     ORKO Few-shot Selection Trade-off (v7 set)     ")
+    print("--------------------------------------------------")
+    print(f"{'mode':10s} {'k':>4s} {'acc':>8s} {'Δacc':>8s} {'tokens':>8s} {'ratio':>7s} {'lat_ms':>8s}")
+    for row in rows:
+        k = str(row["k"]) if row["k"] is not None else "-"
+        print(
+            f"{row['mode']:10s} {k:>4s} {row['accuracy']:8.4f} "
+            f"{row['accuracy_delta_vs_all']:+8.4f} {row['avg_prompt_tokens_est']:8.1f} "
+            f"{row['token_ratio_vs_all']:7.3f} {row['avg_latency_ms']:8.1f}"
+        )
+    print("--------------------------------------------------")
+    print("Report written to: backend/tests/eval/results/fewshot_tradeoff_v7.json")
+    print("--------------------------------------------------")
+
+
+def run_fastpath_report(thresholds=(0.5, 0.7, 0.8, 0.9, 0.95), folds: int = 5) -> None:
+    """
+    Local fast-path classifier, k-fold cross-validated on the v7 set:
+    coverage (share of commands that would skip the LLM), precision of the
+    served predictions, exact-parameter rate and per-prediction latency.
+    """
+    from backend.app.services.parsing.fast_path import run_fastpath_eval
+
+    rows = run_fastpath_eval(thresholds=thresholds, folds=folds)
+
+    print("--------------------------------------------------")
+    print(f"   ORKO Fast-path Classifier ({folds}-fold, v7 set)   ")
+    print("--------------------------------------------------")
+    print(f"{'thresh':>7s} {'top1':>7s} {'cover':>7s} {'prec':>7s} {'params':>7s} {'p50_ms':>7s} {'p95_ms':>7s}")
+    for row in rows:
+        print(
+            f"{row['threshold']:7.2f} {row['top1_accuracy']:7.4f} {row['coverage']:7.4f} "
+            f"{row['precision_served']:7.4f} {row['params_exact_served']:7.4f} "
+            f"{row['p50_latency_ms']:7.3f} {row['p95_latency_ms']:7.3f}"
+        )
+    print("--------------------------------------------------")
+    print("Report written to: backend/tests/eval/results/fastpath_eval_v7.json")
+    print("--------------------------------------------------")
+
+
 def cli():
     """
     CLI interface for:
         python -m backend.app.services.parsing.run_parser_eval --version v7
+        python -m backend.app.services.parsing.run_parser_eval --fewshot-tradeoff --k 4 8 16
+        python -m backend.app.services.parsing.run_parser_eval --fastpath --thresholds 0.8 0.9
+        python -m backend.app.services.parsing.run_parser_eval --version v7 --llm-backend replay --cassette eval.jsonl
 
     Versions allowed: v1, v2, v3, v4, v5, v6, v7
     """
@@ -119,7 +175,41 @@ def cli():
         help="Evaluation mode: v1, v2, v3, v4, v5, v6, v7",
     )
 
+    parser.add_argument(
+        "--fewshot-tradeoff",
+        action="store_true",
+        help="Report accuracy vs prompt tokens for all-examples vs retrieval few-shots (v7 set)",
+    )
+    parser.add_argument(
+        "--k",
+        type=int,
+        nargs="+",
+        default=[4, 8, 16],
+        help="Retrieval k values to compare (with --fewshot-tradeoff)",
+    )
+    parser.add_argument(
+        "--fastpath",
+        action="store_true",
+        help="Cross-validated accuracy / coverage / latency of the local fast-path classifier",
+    )
+    parser.add_argument(
+        "--thresholds",
+        type=float,
+        nargs="+",
+        default=[0.5, 0.7, 0.8, 0.9, 0.95],
+        help="Confidence thresholds to report (with --fastpath)",
+    )
+
+    add_llm_backend_arguments(parser)
+
     args = parser.parse_args()
+    apply_llm_backend_arguments(args)
+    if args.fastpath:
+        run_fastpath_report(thresholds=args.thresholds)
+        return
+    if args.fewshot_tradeoff:
+        run_fewshot_tradeoff_report(ks=args.k)
+        return
     run(version=args.version)
 
 
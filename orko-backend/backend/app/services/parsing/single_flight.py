@@ -0,0 +1,286 @@
+# backend/app/services/parsing/single_flight.py
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Compare-and-delete: only the holder's token may release the lock
+_RELEASE_LUA = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+LOCAL = "local"
+REMOTE = "remote"
+
+
+class _LeaderGone(Exception):
+    """Set on the shared future when the leader was cancelled / interrupted."""
+
+
+class SingleFlight:
+    """
+    In-flight call table for identical LLM parses.
+
+    The first caller for a key (leader) runs the LLM call; every caller that
+    arrives while it is still running waits on the same future and gets a
+    deep copy of the leader's result. Works for threads (sync parse path)
+    and coroutines (async path, via asyncio.wrap_future) in one table.
+
+    Optional cross-process mode (PARSE_SINGLEFLIGHT_REDIS_LOCK): the leader
+    also takes a short Redis lock (SET NX PX). A process that finds the lock
+    held polls the shared parse cache for the holder's result instead of
+    calling the LLM; on timeout, lock loss or Redis errors it calls the LLM
+    itself, so coalescing can only save calls, never fail a parse.
+
+    Failed LLM calls are shared too (waiters get the same failed result and
+    take the heuristic fallback), so a stalled upstream is hit once. A
+    leader that is cancelled (client disconnect) or interrupted is not a
+    failure: the async call keeps running for the waiters, and otherwise
+    one waiter takes over the lead.
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        redis_client: Any = None,
+        lock_ttl_ms: Optional[int] = None,
+        poll_ms: Optional[int] = None,
+    ) -> None:
+        self.enabled = settings.PARSE_SINGLEFLIGHT_ENABLED if enabled is None else enabled
+        self._redis = redis_client
+        self.lock_ttl_ms = lock_ttl_ms or settings.PARSE_SINGLEFLIGHT_LOCK_TTL_MS
+        self.poll_s = (poll_ms or settings.PARSE_SINGLEFLIGHT_POLL_MS) / 1000.0
+
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "leader_calls": 0,
+            "coalesced_local": 0,
+            "coalesced_remote": 0,
+            "remote_wait_timeouts": 0,
+            "lock_errors": 0,
+            "max_waiters": 0,
+        }
+        self._waiters: Dict[str, int] = {}
+
+    # ---------------------------------------------------------
+    # Table
+    # ---------------------------------------------------------
+    def _join(self, key: str) -> Tuple[Future, bool]:
+        """Returns (future, is_leader)."""
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                waiters = self._waiters[key] = self._waiters.get(key, 0) + 1
+                with self._stats_lock:
+                    self._stats["max_waiters"] = max(self._stats["max_waiters"], waiters)
+                return fut, False
+            fut = Future()
+            self._inflight[key] = fut
+            self._waiters[key] = 0
+            return fut, True
+
+    def _leave(self, key: str) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._waiters.pop(key, None)
+
+    def _bump(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[name] += n
+
+    # ---------------------------------------------------------
+    # Cross-process lock
+    # ---------------------------------------------------------
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"{key}:inflight"
+
+    def _try_lock(self, key: str) -> Optional[str]:
+        """Token if acquired, "" if held elsewhere, None if Redis is unusable."""
+        token = uuid.uuid4().hex
+        try:
+            ok = self._redis.set(self._lock_key(key), token, nx=True, px=self.lock_ttl_ms)
+        except Exception as e:
+            self._bump("lock_errors")
+            logger.debug("single-flight lock unavailable: %s", e)
+            return None
+        return token if ok else ""
+
+    def _unlock(self, key: str, token: str) -> None:
+        try:
+            self._redis.eval(_RELEASE_LUA, 1, self._lock_key(key), token)
+        except Exception:
+            self._bump("lock_errors")
+
+    def _lock_held(self, key: str) -> bool:
+        try:
+            return bool(self._redis.exists(self._lock_key(key)))
+        except Exception:
+            self._bump("lock_errors")
+            return False
+
+    # ---------------------------------------------------------
+    # Sync
+    # ---------------------------------------------------------
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], Dict[str, Any]],
+        lookup: Optional[Callable[[], Optional[Dict[str, Any]]]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Runs fn() once per in-flight key. Returns (result, coalesced) where
+        coalesced is None for the caller that ran fn, else "local"/"remote".
+        `lookup` reads the shared cache (used while another process holds
+        the Redis lock).
+        """
+        if not self.enabled:
+            return fn(), None
+
+        fut, leader = self._join(key)
+        if not leader:
+            try:
+                result = fut.result()
+            except _LeaderGone:
+                return self.do(key, fn, lookup)
+            self._bump("coalesced_local")
+            return copy.deepcopy(result), LOCAL
+
+        try:
+            result, how = self._lead(key, fn, lookup)
+        except Exception as e:
+            self._leave(key)
+            fut.set_exception(e)
+            raise
+        except BaseException:
+            self._leave(key)
+            fut.set_exception(_LeaderGone())
+            raise
+        self._leave(key)
+        fut.set_result(result)
+        return copy.deepcopy(result), how
+
+    def _lead(self, key, fn, lookup) -> Tuple[Dict[str, Any], Optional[str]]:
+        if self._redis is None or lookup is None:
+            self._bump("leader_calls")
+            return fn(), None
+
+        token = self._try_lock(key)
+        if token == "":
+            deadline = time.monotonic() + self.lock_ttl_ms / 1000.0
+            while time.monotonic() < deadline:
+                time.sleep(self.poll_s)
+                hit = lookup()
+                if hit is not None:
+                    self._bump("coalesced_remote")
+                    return hit, REMOTE
+                if not self._lock_held(key):
+                    break
+            else:
+                self._bump("remote_wait_timeouts")
+
+        self._bump("leader_calls")
+        try:
+            return fn(), None
+        finally:
+            if token:
+                self._unlock(key, token)
+
+    # ---------------------------------------------------------
+    # Async
+    # ---------------------------------------------------------
+    async def do_async(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[Dict[str, Any]]],
+        lookup: Optional[Callable[[], Optional[Dict[str, Any]]]] = None,
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Coroutine version of do(); Redis calls run in worker threads."""
+        if not self.enabled:
+            return await fn(), None
+
+        fut, leader = self._join(key)
+        if not leader:
+            try:
+                # shield: a cancelled waiter must not cancel the shared future
+                result = await asyncio.shield(asyncio.wrap_future(fut))
+            except _LeaderGone:
+                return await self.do_async(key, fn, lookup)
+            self._bump("coalesced_local")
+            return copy.deepcopy(result), LOCAL
+
+        # The call runs as its own task: if this caller is cancelled, the
+        # waiters still get the result
+        task = asyncio.ensure_future(self._lead_async(key, fn, lookup))
+        task.add_done_callback(lambda t: self._settle(key, fut, t))
+        result, how = await asyncio.shield(task)
+        return copy.deepcopy(result), how
+
+    def _settle(self, key: str, fut: Future, task: "asyncio.Future[Any]") -> None:
+        self._leave(key)
+        if task.cancelled():
+            fut.set_exception(_LeaderGone())
+            return
+        exc = task.exception()
+        if exc is None:
+            fut.set_result(task.result()[0])
+        elif isinstance(exc, Exception):
+            fut.set_exception(exc)
+        else:
+            fut.set_exception(_LeaderGone())
+
+    async def _lead_async(self, key, fn, lookup) -> Tuple[Dict[str, Any], Optional[str]]:
+        if self._redis is None or lookup is None:
+            self._bump("leader_calls")
+            return await fn(), None
+
+        token = await asyncio.to_thread(self._try_lock, key)
+        if token == "":
+            deadline = time.monotonic() + self.lock_ttl_ms / 1000.0
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_s)
+                hit = await asyncio.to_thread(lookup)
+                if hit is not None:
+                    self._bump("coalesced_remote")
+                    return hit, REMOTE
+                if not await asyncio.to_thread(self._lock_held, key):
+                    break
+            else:
+                self._bump("remote_wait_timeouts")
+
+        self._bump("leader_calls")
+        try:
+            return await fn(), None
+        finally:
+            if token:
+                await asyncio.to_thread(self._unlock, key, token)
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        with self._lock:
+            out["inflight"] = len(self._inflight)
+        out["llm_calls_saved"] = out["coalesced_local"] + out["coalesced_remote"]
+        out["enabled"] = self.enabled
+        out["redis_lock"] = self._redis is not None
+        return out
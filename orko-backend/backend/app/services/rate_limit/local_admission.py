@@ -0,0 +1,260 @@
+# backend/app/services/rate_limit/local_admission.py
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Optional, Tuple
+
+from backend.app.core.config import settings
+
+if TYPE_CHECKING:
+    from backend.app.services.rate_limit.trigger_rate_limiter import RateLimitDecision
+
+# fetch(user_id, org_id, want) -> authoritative Redis decision
+Fetch = Callable[[Optional[str], Optional[str], int], "RateLimitDecision"]
+
+_LATENCY_SAMPLES = 4096
+
+
+class _Lease:
+    __slots__ = ("tokens", "expires_at", "decision")
+
+    def __init__(self, tokens: int, expires_at: float, decision: "RateLimitDecision") -> None:
+        self.tokens = tokens
+        self.expires_at = expires_at
+        self.decision = decision
+
+
+class LocalAdmission:
+    """
+    In-process pre-admission in front of the Redis GCRA limiter.
+
+    Absorbs the clear cases without a Redis round trip:
+      - well under quota: the GCRA script hands out a block of up to
+        RATE_LIMIT_LOCAL_LEASE_SIZE tokens (already consumed in Redis),
+        spent locally per (user, org) until used up or
+        RATE_LIMIT_LOCAL_LEASE_TTL_MS passes;
+      - over quota: a Redis denial is remembered per user / org until its
+        retry-after elapses. Other processes can only consume more tokens,
+        so nothing is admitted earlier than Redis would.
+
+    Near the limit the script grants single tokens only, so the last tokens
+    of a window are always decided by Redis per request. Leased tokens are
+    consumed up front, so this can never admit more than the limit; unused
+    tokens expire with the lease (counted as lease_tokens_expired).
+
+    RATE_LIMIT_LOCAL_LEASE_SIZE <= 1 makes it a pass-through that only
+    measures the Redis call rate and latency.
+    """
+
+    def __init__(
+        self,
+        lease_size: Optional[int] = None,
+        lease_ttl_ms: Optional[int] = None,
+        max_keys: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.lease_size = settings.RATE_LIMIT_LOCAL_LEASE_SIZE if lease_size is None else lease_size
+        self.lease_ttl_s = (lease_ttl_ms or settings.RATE_LIMIT_LOCAL_LEASE_TTL_MS) / 1000.0
+        self.max_keys = max_keys or settings.RATE_LIMIT_LOCAL_MAX_KEYS
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._leases: Dict[Tuple[Optional[str], Optional[str]], _Lease] = {}
+        self._denied: Dict[str, Tuple[float, "RateLimitDecision"]] = {}
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "local_admits": 0,
+            "local_denies": 0,
+            "redis_calls": 0,
+            "leases": 0,
+            "leased_tokens": 0,
+            "lease_tokens_expired": 0,
+            "near_limit_checks": 0,
+        }
+        self._latency_ms: Deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    @property
+    def enabled(self) -> bool:
+        return self.lease_size > 1
+
+    # ---------------------------------------------------------
+    # Admission
+    # ---------------------------------------------------------
+    def admit(
+        self,
+        user_id: Optional[str],
+        org_id: Optional[str],
+        limit: int,
+        fetch: Fetch,
+    ) -> "RateLimitDecision":
+        """
+        Consumes one request for (user, org): locally when the answer is
+        clear, otherwise via fetch (one Redis script call). `limit` only
+        caps the lease size so small quotas are never leased.
+        """
+        started = time.perf_counter()
+        try:
+            if not self.enabled:
+                self._bump("redis_calls")
+                return fetch(user_id, org_id, 1)
+            return self._admit(user_id, org_id, limit, fetch)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000.0
+            with self._stats_lock:
+                self._stats["requests"] += 1
+                self._latency_ms.append(elapsed)
+
+    def _admit(
+        self,
+        user_id: Optional[str],
+        org_id: Optional[str],
+        limit: int,
+        fetch: Fetch,
+    ) -> "RateLimitDecision":
+        key = (user_id, org_id)
+        now = self._clock()
+
+        with self._lock:
+            denied = self._still_denied(user_id, org_id, now)
+            if denied is not None:
+                self._bump("local_denies")
+                return denied
+
+            lease = self._leases.get(key)
+            if lease is not None:
+                if lease.tokens > 0 and lease.expires_at > now:
+                    lease.tokens -= 1
+                    self._bump("local_admits")
+                    return dataclasses.replace(
+                        lease.decision,
+                        remaining=lease.decision.remaining + lease.tokens,
+                        granted=1,
+                    )
+                del self._leases[key]
+                if lease.tokens:
+                    self._bump("lease_tokens_expired", lease.tokens)
+
+        # A quota smaller than two blocks is never leased (script rule), so
+        # don't ask for more than that.
+        want = max(1, min(self.lease_size, limit // 2))
+        decision = fetch(user_id, org_id, want)
+        self._bump("redis_calls")
+
+        with self._lock:
+            if not decision.allowed:
+                scope_id = user_id if decision.limited_by == "user" else org_id
+                until = now + decision.retry_after_ms / 1000.0
+                self._denied[f"{decision.limited_by}:{scope_id}"] = (until, decision)
+            elif decision.granted > 1:
+                extra = decision.granted - 1
+                lease = self._leases.get(key)
+                if lease is not None and lease.expires_at > now:
+                    # A concurrent caller leased too: keep both blocks
+                    lease.tokens += extra
+                    lease.decision = decision
+                else:
+                    self._leases[key] = _Lease(extra, now + self.lease_ttl_s, decision)
+                self._bump("leases")
+                self._bump("leased_tokens", extra)
+            else:
+                self._bump("near_limit_checks")
+
+            if len(self._leases) + len(self._denied) > self.max_keys:
+                self._prune(now)
+
+        if decision.granted > 1:
+            return dataclasses.replace(decision, remaining=decision.remaining + decision.granted - 1, granted=1)
+        return decision
+
+    def _still_denied(
+        self, user_id: Optional[str], org_id: Optional[str], now: float
+    ) -> Optional["RateLimitDecision"]:
+        for scope_key in (f"user:{user_id}", f"org:{org_id}"):
+            entry = self._denied.get(scope_key)
+            if entry is None:
+                continue
+            until, decision = entry
+            if until <= now:
+                del self._denied[scope_key]
+                continue
+            return dataclasses.replace(decision, retry_after_ms=math.ceil((until - now) * 1000))
+        return None
+
+    def _prune(self, now: float) -> None:
+        for key in [k for k, lease in self._leases.items() if lease.expires_at <= now]:
+            self._bump("lease_tokens_expired", self._leases.pop(key).tokens)
+        for key in [k for k, (until, _) in self._denied.items() if until <= now]:
+            del self._denied[key]
+        # Still too many live keys: drop the oldest leases (their tokens are lost)
+        while self._leases and len(self._leases) + len(self._denied) > self.max_keys:
+            oldest = next(iter(self._leases))
+            self._bump("lease_tokens_expired", self._leases.pop(oldest).tokens)
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+            samples = sorted(self._latency_ms)
+        with self._lock:
+            out["active_leases"] = len(self._leases)
+            out["active_denials"] = len(self._denied)
+        out["redis_call_rate"] = round(out["redis_calls"] / out["requests"], 4) if out["requests"] else 0.0
+        out["added_latency_ms"] = {
+            "p50": round(_percentile(samples, 0.50), 4),
+            "p99": round(_percentile(samples, 0.99), 4),
+        }
+        out["enabled"] = self.enabled
+        out["lease_size"] = self.lease_size
+        return out
+
+
+def _percentile(samples: Any, q: float) -> float:
+    if not samples:
+        return 0.0
+    idx = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+    return float(samples[idx])
+
+
+# ------------------------------------------------------------
+# Process-wide instance (shared by every TriggerRateLimiter)
+# ------------------------------------------------------------
+_instance: Optional[LocalAdmission] = None
+_instance_pid: Optional[int] = None
+_instance_lock = threading.Lock()
+
+
+def get_local_admission() -> LocalAdmission:
+    """Thread-safe, fork-aware: a forked worker starts with no leases."""
+    global _instance, _instance_pid
+
+    inst = _instance
+    if inst is not None and _instance_pid == os.getpid():
+        return inst
+
+    with _instance_lock:
+        if _instance is None or _instance_pid != os.getpid():
+            _instance = LocalAdmission()
+            _instance_pid = os.getpid()
+        return _instance
+
+
+def reset_local_admission() -> None:
+    """Drops leases, denials and stats (tests / settings change)."""
+    global _instance, _instance_pid
+    with _instance_lock:
+        _instance = None
+        _instance_pid = None
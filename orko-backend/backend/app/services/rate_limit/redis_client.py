@@ -0,0 +1,20 @@
+# backend/app/services/rate_limit/redis_client.py
+
+import redis
+
+from backend.app.core.clients import get_client_registry
+from backend.app.core.config import settings
+
+
+def get_rate_limit_redis() -> redis.Redis:
+    """
+    Redis client for rate limiting / abuse monitoring: the shared registry
+    pool for RATE_LIMIT_REDIS_URL, sized by RATE_LIMIT_REDIS_MAX_CONNECTIONS
+    with a short RATE_LIMIT_REDIS_TIMEOUT_MS (the limiter sits on the
+    request path).
+    """
+    return get_client_registry().redis(
+        settings.RATE_LIMIT_REDIS_URL,
+        max_connections=settings.RATE_LIMIT_REDIS_MAX_CONNECTIONS,
+        timeout_ms=settings.RATE_LIMIT_REDIS_TIMEOUT_MS,
+    )
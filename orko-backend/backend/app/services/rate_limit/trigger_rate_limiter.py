@@ -1,31 +1,135 @@
 # backend/app/services/rate_limit/trigger_rate_limiter.py
 
-import time
+import math
+from dataclasses import dataclass
 from typing import Optional
+
 import redis
 
 from backend.app.core.config import settings
+from backend.app.services.rate_limit.local_admission import LocalAdmission, get_local_admission
+from backend.app.services.rate_limit.redis_client import get_rate_limit_redis
 
 
 class RateLimitExceeded(Exception):
     """Raised when a rate limit has been exceeded."""
 
+    def __init__(self, message: str, decision: Optional["RateLimitDecision"] = None) -> None:
+        super().__init__(message)
+        self.decision = decision
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Whole seconds for the Retry-After header (rounded up)."""
+        if self.decision is None:
+            return settings.RATE_LIMIT_WINDOW_SECONDS
+        return self.decision.retry_after_header
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int  # requests still allowed right now (min over user / org)
+    retry_after_ms: int  # 0 when allowed
+    limited_by: Optional[str] = None  # "user" | "org" when denied
+    granted: int = 0  # tokens consumed (> 1 when a local lease was taken)
+
+    @property
+    def retry_after_header(self) -> int:
+        return max(1, math.ceil(self.retry_after_ms / 1000.0))
+
+
+# ------------------------------------------------------------
+# GCRA over N keys, checked and updated atomically in one EVALSHA.
+#
+# Each key stores its theoretical arrival time (TAT, ms). A request is
+# allowed when, after adding one emission interval T = window / limit,
+# the TAT is at most one window ahead of now — i.e. up to `limit`
+# requests per window, spread smoothly (no burst at window edges).
+#
+# Denied requests update nothing; allowed requests advance every key.
+# Time comes from the Redis server, so all app servers share one clock.
+#
+# Leasing: ARGV[1] asks for up to `want` tokens at once (local
+# pre-admission). The full block is granted only while every key has at
+# least 2 * want tokens available; closer to the limit exactly one token
+# is granted, so the last tokens are always checked here, per request.
+#
+# ARGV: want, then T_ms, window_ms per key (pairs, same order as KEYS)
+# Returns: {granted (0 = denied), remaining, retry_after_ms,
+#           limiting key index (1-based, 0 = none)}
+# ------------------------------------------------------------
+GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local want = tonumber(ARGV[1])
+
+local retry_after = 0
+local limited_by = 0
+local available = -1
+local tats = {}
+
+for i = 1, #KEYS do
+  local interval = tonumber(ARGV[2 * i])
+  local window = tonumber(ARGV[2 * i + 1])
+  local tat = tonumber(redis.call('GET', KEYS[i]) or now)
+  if tat < now then tat = now end
+  tats[i] = tat
+  local free = math.floor((window - (tat - now)) / interval)
+  if free < 1 then
+    local wait = tat + interval - now - window
+    if wait > retry_after or limited_by == 0 then
+      retry_after = wait
+      limited_by = i
+    end
+  end
+  if available < 0 or free < available then available = free end
+end
+
+if available < 1 then
+  return {0, 0, retry_after, limited_by}
+end
+
+local granted = 1
+if want > 1 and available >= 2 * want then granted = want end
+
+for i = 1, #KEYS do
+  local new_tat = tats[i] + granted * tonumber(ARGV[2 * i])
+  redis.call('SET', KEYS[i], new_tat, 'PX', math.max(1, new_tat - now))
+end
+
+return {granted, available - granted, 0, 0}
+"""
+
+_SCOPES = ("user", "org")
+
 
 class TriggerRateLimiter:
     """
     Redis-backed per-user and per-org rate limiter for trigger requests.
 
     Multi-industry: no assumptions about domain. Only identity-based throttling.
+
+    GCRA (generic cell rate algorithm): RATE_LIMIT_PER_MINUTE requests per
+    RATE_LIMIT_WINDOW_SECONDS, for the user and the org, checked and
+    consumed together in one Lua script call (one round trip) on the
+    shared pooled client. Clear cases (leased tokens left, or a known
+    denial still in effect) are answered in-process by LocalAdmission.
     """
 
-    def __init__(self) -> None:
-        # Dedicated Redis instance/pool for rate limiting
-        self._redis = redis.from_url(settings.RATE_LIMIT_REDIS_URL)
+    def __init__(self, client: Optional[redis.Redis] = None, local: Optional[LocalAdmission] = None) -> None:
+        self._redis = client or get_rate_limit_redis()
+        self._script = self._redis.register_script(GCRA_LUA)
 
         # Config knobs (from .env or defaults)
         self._limit = settings.RATE_LIMIT_PER_MINUTE
         self._window = settings.RATE_LIMIT_WINDOW_SECONDS
 
+        # In-process leases / denials in front of Redis (pass-through when
+        # RATE_LIMIT_LOCAL_LEASE_SIZE is 0)
+        self._local = local or get_local_admission()
+
     # ---------------------------------------------------------
     # Key helpers
     # ---------------------------------------------------------
@@ -37,46 +141,41 @@ class TriggerRateLimiter:
         oid = org_id or "no-org"
         return f"trigger:rl:org:{oid}"
 
-    def _now_bucket(self) -> int:
-        """
-        Fixed window:
-        Each time window (e.g., 60s) is represented as epoch//window.
-        """
-        return int(time.time() // self._window)
-
-    def _build_key(self, prefix: str, bucket: int) -> str:
-        return f"{prefix}:b{bucket}"
-
     # ---------------------------------------------------------
     # Main rate limiter logic
     # ---------------------------------------------------------
-    def _hit(self, key_prefix: str) -> int:
+    def check(self, user_id: Optional[str], org_id: Optional[str], want: int = 1) -> RateLimitDecision:
         """
-        Increments the counter for the current bucket and returns total hits.
+        Checks and (if allowed) consumes tokens for user and org in Redis:
+        `want` of them while far from the limit, otherwise one.
+        Never raises for a denial; see check_and_increment().
         """
-        bucket = self._now_bucket()
-        key = self._build_key(key_prefix, bucket)
-        pipe = self._redis.pipeline()
-
-        pipe.incr(key, 1)                # increment request count
-        pipe.expire(key, self._window)   # auto-cleanup after window
-
-        count, _ = pipe.execute()
-        return int(count)
-
-    def check_and_increment(self, user_id: Optional[str], org_id: Optional[str]) -> None:
+        window_ms = int(self._window * 1000)
+        interval_ms = math.ceil(window_ms / max(self._limit, 1))
+
+        granted, remaining, retry_after_ms, limited_idx = self._script(
+            keys=[self._key_user(user_id), self._key_org(org_id)],
+            args=[max(1, want), interval_ms, window_ms, interval_ms, window_ms],
+        )
+        return RateLimitDecision(
+            allowed=int(granted) > 0,
+            limit=self._limit,
+            remaining=max(0, int(remaining)),
+            retry_after_ms=int(retry_after_ms),
+            limited_by=_SCOPES[int(limited_idx) - 1] if int(limited_idx) else None,
+            granted=int(granted),
+        )
+
+    def check_and_increment(self, user_id: Optional[str], org_id: Optional[str]) -> RateLimitDecision:
         """
-        Increments counters for user and org.
-        Raises RateLimitExceeded if either exceeds limit.
+        Consumes one request for user and org.
+        Raises RateLimitExceeded (carrying the decision) if either is over limit.
         """
-        user_prefix = self._key_user(user_id)
-        org_prefix = self._key_org(org_id)
-
-        user_count = self._hit(user_prefix)
-        org_count = self._hit(org_prefix)
-
-        if user_count > self._limit or org_count > self._limit:
+        decision = self._local.admit(user_id, org_id, self._limit, self.check)
+        if not decision.allowed:
             raise RateLimitExceeded(
-                f"Rate limit exceeded "
-                f"(user={user_count}/{self._limit}, org={org_count}/{self._limit})"
+                f"Rate limit exceeded ({decision.limited_by}, limit={self._limit}/{self._window}s, "
+                f"retry in {decision.retry_after_ms} ms)",
+                decision,
             )
+        return decision
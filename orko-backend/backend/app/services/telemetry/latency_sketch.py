@@ -0,0 +1,134 @@
+# backend/app/services/telemetry/latency_sketch.py
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, Optional
+
+
+class LatencySketch:
+    """
+    Mergeable quantile sketch (DDSketch, relative-error variant).
+
+    Values land in logarithmic buckets: bucket i covers
+    (gamma^(i-1), gamma^i] with gamma = (1 + alpha) / (1 - alpha), so every
+    quantile is returned within `alpha` relative error of the true value,
+    whatever the distribution. Size depends on the value range, not the
+    number of samples (1 ms .. 10 min at 1% is ~660 buckets).
+
+    Two sketches with the same alpha merge by adding bucket counts — the
+    result is exactly the sketch of the combined samples, so windows from
+    several workers (or several flush intervals) combine without loss.
+    When more than `max_buckets` are in use the lowest ones are collapsed,
+    which only degrades the accuracy of the smallest values.
+    """
+
+    MIN_VALUE = 1e-3  # ms; values at or below count as zero
+
+    def __init__(self, alpha: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0.0 < alpha < 1.0:
+            raise ValueError("alpha must be in (0, 1)")
+        self.alpha = alpha
+        self.max_buckets = max_buckets
+        self._gamma = (1.0 + alpha) / (1.0 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ---------------------------------------------------------
+    # Ingest / merge
+    # ---------------------------------------------------------
+    def add(self, value: float, n: int = 1) -> None:
+        if n <= 0:
+            return
+        value = float(value)
+        if value <= self.MIN_VALUE:
+            self.zero_count += n
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + n
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        self.count += n
+        self.sum += value * n
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: "LatencySketch") -> "LatencySketch":
+        if other.alpha != self.alpha:
+            raise ValueError(f"Cannot merge sketches with alpha {self.alpha} and {other.alpha}")
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _collapse(self) -> None:
+        ordered = sorted(self.buckets)
+        excess = ordered[: len(ordered) - self.max_buckets]
+        target = ordered[len(excess)]
+        self.buckets[target] += sum(self.buckets.pop(i) for i in excess)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count == 0:
+            return None
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        value = self.max
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms
+                value = 2.0 * self._gamma ** index / (self._gamma + 1.0)
+                break
+        return min(max(value, self.min), self.max)
+
+    def quantiles(self, qs: Iterable[float] = (0.5, 0.95, 0.99)) -> Dict[str, Optional[float]]:
+        return {f"p{round(q * 100):g}": self.quantile(q) for q in qs}
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    # ---------------------------------------------------------
+    # Serialization (stored with each WorkflowMetrics row)
+    # ---------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "alpha": self.alpha,
+            "buckets": {str(i): n for i, n in self.buckets.items()},
+            "zero": self.zero_count,
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencySketch":
+        sketch = cls(alpha=float(data["alpha"]))
+        sketch.buckets = {int(i): int(n) for i, n in (data.get("buckets") or {}).items()}
+        sketch.zero_count = int(data.get("zero", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
@@ -34,6 +34,14 @@ class TelemetryCollector:
             "context": parsed.get("context", {}),
         })
 
+    @staticmethod
+    def record_fastpath_shadow(raw: str, comparison: Dict[str, Any]) -> None:
+        TelemetryCollector.record("fastpath_shadow", {"raw_command": raw, **comparison})
+
+    @staticmethod
+    def record_parse_deadline(raw: str, payload: Dict[str, Any]) -> None:
+        TelemetryCollector.record("parse_deadline", {"raw_command": raw, **payload})
+
     @staticmethod
     def record_trigger(job_id: str, parsed: Dict[str, Any]) -> None:
         TelemetryCollector.record("trigger", {
@@ -42,6 +50,10 @@ class TelemetryCollector:
             "action": parsed.get("action"),
         })
 
+    @staticmethod
+    def record_workflow_steps(workflow_name: str, report: Dict[str, Any]) -> None:
+        TelemetryCollector.record("workflow_steps", {"workflow": workflow_name, **report})
+
     @staticmethod
     def record_workflow(workflow_name: str, result: Any, error: str | None) -> None:
         TelemetryCollector.record("workflow", {
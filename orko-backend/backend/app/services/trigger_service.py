@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -8,7 +8,8 @@ from backend.app.schemas.trigger import TriggerRequest, TriggerResponse
 from backend.app.schemas.auth import CurrentUser
 from backend.app.models.trigger_audit import TriggerAudit
 
-from backend.app.services.parser.command_parser import CommandParser
+from backend.app.services.parser.intent_mapper import IntentMapper, IntentMappingError
+from backend.app.services.parsing.parser_engine import get_parser_engine
 from backend.app.services.workflow.trigger_queue import TriggerQueue
 
 
@@ -18,7 +19,8 @@ class TriggerService:
     --------------------------------------------------
     New responsibility:
 
-    - Parse raw_command → intent + workflow mapping
+    - Map the ParserEngine result of raw_command → intent + workflow
+      (parse-then-map: the route's parse is reused, never parsed twice)
     - Create TriggerAudit row with status="queued"
     - Enqueue job to Celery TriggerQueue
     - Return TriggerResponse(status="queued")
@@ -28,8 +30,28 @@ class TriggerService:
     """
 
     def __init__(self) -> None:
-        # Existing parser (you already use this in your project)
-        self._parser = CommandParser()
+        self._mapper = IntentMapper()
+
+    def _map_parsed(
+        self,
+        parsed: Dict[str, Any],
+        context: Dict[str, Any],
+    ) -> Optional[Tuple[str, str, Dict[str, Any], List[str]]]:
+        """
+        ParserEngine result → (intent_name, workflow_name, parameters, missing).
+
+        Actions with an intent_to_workflow.json entry get its workflow,
+        slot filling and guardrail routing. Anything else (including an
+        empty action) returns None: there is no workflow to run.
+        """
+        intent_name = parsed.get("action") or ""
+        if not intent_name:
+            return None
+        try:
+            mapped = self._mapper.map_parsed(parsed, context)
+        except IntentMappingError:
+            return None
+        return intent_name, mapped["workflow_name"], mapped["parameters"], mapped["missing"]
 
     async def trigger(
         self,
@@ -38,28 +60,45 @@ class TriggerService:
         req: TriggerRequest,
         client_ip: Optional[str] = None,
         user_agent: Optional[str] = None,
+        parsed: Optional[Dict[str, Any]] = None,
     ) -> TriggerResponse:
         """
         Main entry point for /api/trigger.
 
         IMPORTANT (Option A):
         - Does NOT execute the workflow directly.
-        - Only parses + audits + enqueues job to Celery.
+        - Only maps + audits + enqueues job to Celery.
+
+        `parsed` is the ParserEngine result the route already computed for
+        confidence gating; it is only parsed here when not given.
         """
 
         # ------------------------------------------------------------
-        # 1) Parse + map intent (only if raw_command exists)
+        # 1) Map intent (only if raw_command exists)
         # ------------------------------------------------------------
+        missing: List[str] = []
         if req.raw_command:
-            # Your existing parser path
-            parsed_intent, mapped = self._parser.parse_and_map(
-                req.raw_command,
-                context=req.context.data,
-            )
-
-            intent_name = parsed_intent.name
-            workflow_name = mapped["workflow_name"]
-            parameters: Dict[str, Any] = mapped["parameters"]
+            if parsed is None:
+                parsed = await get_parser_engine().parse_command_async(
+                    req.raw_command,
+                    context=dict(req.context.data),
+                )
+            mapped = self._map_parsed(parsed, req.context.data)
+            if mapped is None:
+                # Nothing to run: hand back for review, no audit row, no job
+                action = parsed.get("action")
+                return TriggerResponse(
+                    trigger_id=None,
+                    status="requires_review",
+                    simulate=req.simulate,
+                    message=(
+                        f"No workflow is mapped to action '{action}'; human review required."
+                        if action
+                        else "Command did not resolve to an action; human review required."
+                    ),
+                    parsed=parsed,
+                )
+            intent_name, workflow_name, parameters, missing = mapped
 
         else:
             # Manual trigger without NLP parsing
@@ -112,5 +151,5 @@ class TriggerService:
             workflow_name=workflow_name or "",
             status="queued",           # 🔥 now queued, not success/error
             simulate=req.simulate,
-            missing_parameters=[],     # slot-filling step will populate later
+            missing_parameters=missing,
         )
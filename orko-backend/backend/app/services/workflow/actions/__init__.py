@@ -0,0 +1,2 @@
+# backend/app/services/workflow/actions/__init__.py
+# Built-in workflow actions, imported lazily by actions_registry.
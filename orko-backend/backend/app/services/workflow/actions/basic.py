@@ -0,0 +1,54 @@
+# backend/app/services/workflow/actions/basic.py
+#
+# Built-in, domain-agnostic actions. Signature: fn(context, **params);
+# the return value is stored in context["step_results"][step_id].
+# Actions read the context but never write to it: a retried run restores
+# finished steps from their checkpointed return value only, so anything
+# else a step put into the context would be missing on the next attempt.
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def log_message(context: Dict[str, Any], message: Optional[str] = None, level: str = "info") -> str:
+    """Writes `message` (or context["message"]) to the workflow log."""
+    text = message or str(context.get("message", ""))
+    logger.log(getattr(logging, level.upper(), logging.INFO), "workflow message: %s", text)
+    return text
+
+
+def write_file(context: Dict[str, Any], filename: Optional[str] = None, content: Optional[str] = None) -> str:
+    """
+    Writes `content` (or context["content"]) to WORKFLOW_OUTPUT_DIR/<filename>.
+    Only the base name is used, so a flow cannot write outside that directory.
+    """
+    name = Path(filename or context.get("filename") or "workflow_output.txt").name
+    out_dir = Path(settings.WORKFLOW_OUTPUT_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / name
+    path.write_text(str(content if content is not None else context.get("content", "")), encoding="utf-8")
+    return str(path)
+
+
+def notify_user(
+    context: Dict[str, Any],
+    message: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Returns a user notification (stored as this step's result); channel
+    delivery (Telegram / WhatsApp) happens outside the workflow engine and
+    deduplicates retried sends on `idempotency_key`.
+    """
+    return {
+        "user_id": context.get("user_id"),
+        "message": message or context.get("notify_message") or "Workflow step completed",
+        "idempotency_key": idempotency_key,
+    }
@@ -1,40 +1,225 @@
+# backend/app/services/workflow/actions_registry.py
+
+from __future__ import annotations
+
+import importlib
 import json
-# Load schema file later to validate actions
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from backend.app.services.workflow.dag import FLOWS_DIR, FlowPlan, FlowValidationError, compile_flow
+
+logger = logging.getLogger(__name__)
+
+ActionFn = Callable[..., Any]
+
+# Action name → "module:attribute". Nothing is imported until an action is
+# first resolved (or preload() is called).
+BUILTIN_ACTIONS: Dict[str, str] = {
+    "log_message": "backend.app.services.workflow.actions.basic:log_message",
+    "write_file": "backend.app.services.workflow.actions.basic:write_file",
+    "notify_user": "backend.app.services.workflow.actions.basic:notify_user",
+}
+
+
+@dataclass(frozen=True)
+class CompiledFlow:
+    plan: FlowPlan
+    missing_actions: Tuple[str, ...]  # used by the flow but not registered
+    source: str
+
+
+class ActionRegistry(Mapping[str, ActionFn]):
+    """
+    Action name → callable, plus the compiled plans of flows/*.json.
+
+    - resolve(name) is one dict lookup once the action has been loaded;
+      the first call imports its module (declared as "module:attr").
+    - compile_flows() validates every flow file once (normally at startup)
+      and caches its FlowPlan, so plan(workflow_name) never touches disk.
+
+    Acts as a read-only Mapping, so it can be passed straight to
+    Orchestrator.run(actions=...).
+    """
+
+    def __init__(self, targets: Optional[Mapping[str, str]] = None) -> None:
+        self._targets: Dict[str, str] = dict(BUILTIN_ACTIONS if targets is None else targets)
+        self._resolved: Dict[str, ActionFn] = {}
+        self._flows: Dict[str, CompiledFlow] = {}
+        self._lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "lazy_imports": 0,
+            "unknown_actions": 0,
+            "flows_compiled": 0,
+            "flow_errors": 0,
+        }
+
+    # ---------------------------------------------------------
+    # Registration
+    # ---------------------------------------------------------
+    def declare(self, name: str, target: str) -> None:
+        """Registers a lazily imported action ("package.module:function")."""
+        if ":" not in target:
+            raise ValueError(f"Action target must look like 'module:attr', got {target!r}")
+        with self._lock:
+            self._targets[name] = target
+            self._resolved.pop(name, None)
+
+    def register(self, name: str, fn: Optional[ActionFn] = None) -> Any:
+        """Registers an already imported callable; usable as a decorator."""
+
+        def _add(func: ActionFn) -> ActionFn:
+            if not callable(func):
+                raise TypeError(f"Action '{name}' is not callable")
+            with self._lock:
+                self._resolved[name] = func
+            return func
+
+        return _add(fn) if fn is not None else _add
+
+    # ---------------------------------------------------------
+    # Resolution
+    # ---------------------------------------------------------
+    def resolve(self, name: str) -> ActionFn:
+        fn = self._resolved.get(name)
+        if fn is not None:
+            return fn
+        return self._load(name)
+
+    def _load(self, name: str) -> ActionFn:
+        with self._lock:
+            fn = self._resolved.get(name)
+            if fn is not None:
+                return fn
+            target = self._targets.get(name)
+            if target is None:
+                self._bump("unknown_actions")
+                raise KeyError(name)
+
+            module_name, _, attr = target.partition(":")
+            fn = getattr(importlib.import_module(module_name), attr)
+            if not callable(fn):
+                raise TypeError(f"Action '{name}' ({target}) is not callable")
+            self._resolved[name] = fn
+            self._bump("lazy_imports")
+            return fn
+
+    def preload(self) -> int:
+        """Imports every declared action now; returns how many were loaded."""
+        for name in list(self._targets):
+            self.resolve(name)
+        return len(self._resolved)
+
+    def __getitem__(self, name: str) -> ActionFn:
+        return self.resolve(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._resolved or name in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(set(self._targets) | set(self._resolved)))
+
+    def __len__(self) -> int:
+        return len(set(self._targets) | set(self._resolved))
+
+    # ---------------------------------------------------------
+    # Flow plans
+    # ---------------------------------------------------------
+    def compile_flows(self, flows_dir: Path = FLOWS_DIR) -> Dict[str, Any]:
+        """
+        Compiles every flows_dir/*.json into a cached plan (replacing the
+        previous set). Invalid flows are logged and skipped; flows using
+        unregistered actions are kept and listed under "missing".
+        """
+        started = time.perf_counter()
+        compiled: Dict[str, CompiledFlow] = {}
+        errors: Dict[str, str] = {}
+
+        for path in sorted(Path(flows_dir).glob("*.json")):
+            try:
+                with path.open("r", encoding="utf-8") as f:
+                    plan = compile_flow(json.load(f))
+            except (OSError, ValueError, FlowValidationError) as exc:
+                errors[path.name] = str(exc)
+                logger.error("Flow %s not loaded: %s", path.name, exc)
+                continue
+            missing = tuple(sorted({s.action for s in plan.steps if s.action not in self}))
+            if missing:
+                logger.warning("Flow %s uses unregistered actions: %s", plan.name, ", ".join(missing))
+            compiled[plan.name] = CompiledFlow(plan=plan, missing_actions=missing, source=str(path))
+
+        with self._lock:
+            self._flows = compiled
+        self._bump("flows_compiled", len(compiled))
+        self._bump("flow_errors", len(errors))
+
+        return {
+            "flows": sorted(compiled),
+            "missing": {name: list(c.missing_actions) for name, c in compiled.items() if c.missing_actions},
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 3),
+        }
+
+    def plan(self, workflow_name: str) -> Optional[FlowPlan]:
+        compiled = self._flows.get(workflow_name)
+        return compiled.plan if compiled is not None else None
+
+    def flow(self, workflow_name: str) -> Optional[CompiledFlow]:
+        return self._flows.get(workflow_name)
 
-# Stores all workflow actions
-print("Actions registry ready...")
-print("Preparing to load workflow schema...")
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
 
-# Later: validate each action with workflow_schema.json
-# Future: open workflow_schema.json and check each action
-print("Schema validation step will be added soon...")
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        out["declared"] = len(self._targets)
+        out["loaded"] = len(self._resolved)
+        out["flows"] = len(self._flows)
+        return out
 
-# Later: scan workflow folder for all action files
-print("Preparing to scan workflow folder...")
 
-# Future: match each action file to workflow_schema.json
-print("Planning schema-to-action matching...")
+# ------------------------------------------------------------
+# Process-wide registry (flows compiled on first use / startup)
+# ------------------------------------------------------------
+_registry: Optional[ActionRegistry] = None
+_registry_lock = threading.Lock()
 
-# Future: auto-detect and import all action files from this folder
-print("Dynamic action loading will be implemented soon...")
 
-# Future: load default templates before scanning for user actions
-print("Template loading will be implemented soon...")
+def get_action_registry() -> ActionRegistry:
+    global _registry
 
-# Future: categorize actions for easier Composer navigation
-print("Action categories will be added soon...")
+    registry = _registry
+    if registry is not None:
+        return registry
 
-# Future: validate errors when loading or connecting actions
-print("Error handling will be added soon...")
+    with _registry_lock:
+        if _registry is None:
+            registry = ActionRegistry()
+            registry.compile_flows()
+            _registry = registry
+        return _registry
 
-# Future: track version metadata for each action
-print("Versioning support will be added soon...")
 
-# Future: run evaluation set against registered actions and parsers to compute accuracy metrics
-print("Evaluation metrics planning for actions and parser will be implemented soon...")
+def warm_action_registry() -> float:
+    """Builds the registry and compiles all flows; returns elapsed ms."""
+    started = time.perf_counter()
+    get_action_registry()
+    return (time.perf_counter() - started) * 1000.0
 
-# Future: enforce permission rules when registering or triggering actions
-print("Permission rule planning added...")
 
-# Future: hook logging into action registration and execution
-print("Logging planning added...")
+def reset_action_registry() -> None:
+    """Drops the registry so the next call recompiles flows (tests / flow edits)."""
+    global _registry
+    with _registry_lock:
+        _registry = None
@@ -1,10 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict
-from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
 
-from backend.app.db.session import SessionLocal
-from backend.app.models.trigger_audit import TriggerAudit
+from backend.app.services.workflow.audit_state import AuditStateStore, get_audit_state
 
 
 class AuditLogger:
@@ -14,44 +12,23 @@ class AuditLogger:
     This logger appends details to the TriggerAudit entry that was
     created by the API/TriggerService before enqueueing the Celery task.
 
-    The logger DOES NOT create new audit rows.
-    It updates the existing row with result details.
+    The logger DOES NOT create new audit rows, and it does not change
+    their status: details are staged next to the run's lifecycle state
+    (see audit_state.py) and reach the DB with the worker's terminal
+    transition, in the same single UPDATE.
     """
 
+    def __init__(self, state: Optional[AuditStateStore] = None) -> None:
+        self._state = state
+
     def log(
         self,
-        workflow_name: str,
+        audit_id: Any,
         parameters: Dict[str, Any],
         result: Dict[str, Any],
-        user_id: str,
     ) -> None:
         """
-        Update the existing TriggerAudit record for this workflow.
+        Stage result details for the TriggerAudit row `audit_id`.
         """
-        db: Session = SessionLocal()
-        try:
-            # Look up most recent audit record for this user + workflow
-            # (API + TriggerQueue created this row earlier)
-            audit_row = (
-                db.query(TriggerAudit)
-                  .filter(TriggerAudit.workflow_name == workflow_name)
-                  .filter(TriggerAudit.user_id == user_id)
-                  .order_by(TriggerAudit.id.desc())
-                  .first()
-            )
-
-            if not audit_row:
-                # If no audit row exists, skip logging silently
-                return
-
-            # Update fields
-            audit_row.parameters = parameters
-            audit_row.error_message = result.get("error")
-            audit_row.status = "success" if result.get("success") else "error"
-
-            # Commit
-            db.add(audit_row)
-            db.commit()
-
-        finally:
-            db.close()
+        state = self._state or get_audit_state()
+        state.stage(audit_id, parameters=parameters, error=result.get("error"))
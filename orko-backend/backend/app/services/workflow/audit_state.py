@@ -0,0 +1,396 @@
+# backend/app/services/workflow/audit_state.py
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import update
+
+from backend.app.core.config import settings
+from backend.app.db.session import SessionLocal
+from backend.app.models.trigger_audit import TriggerAudit
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCESS = "success"
+ERROR = "error"
+
+STATUSES = frozenset({QUEUED, RUNNING, SUCCESS, ERROR})
+TERMINAL = frozenset({SUCCESS, ERROR})
+
+_KEY_PREFIX = "wf:audit:"
+_ACTIVE_KEY = "wf:audit:active"  # zset: audit id → when the flusher should look at it (epoch ms)
+
+_UNSET: Any = object()
+
+
+class AuditTransitionError(ValueError):
+    pass
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _text(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def _row_values(state: Dict[str, str]) -> Dict[str, Any]:
+    """Staged hash → TriggerAudit column values."""
+    values: Dict[str, Any] = {"status": state.get("s") or QUEUED}
+    if "e" in state:
+        values["error_message"] = state["e"] or None
+    if "p" in state:
+        values["parameters"] = json.loads(state["p"])
+    return values
+
+
+# ------------------------------------------------------------
+# Metrics (process-wide, like checkpoint_stats)
+# ------------------------------------------------------------
+_stats_lock = threading.Lock()
+_stats: Dict[str, int] = {
+    "transitions": 0,
+    "invalid_transitions": 0,  # attempted after the run was already terminal
+    "db_writes": 0,
+    "terminal_writes": 0,
+    "flushed_open": 0,  # long-running jobs made visible by the flusher
+    "recovered_terminal": 0,  # terminal state staged but the worker died before the DB write
+    "abandoned": 0,  # no progress for WORKFLOW_AUDIT_STALE_SECONDS → marked error
+    "write_through": 0,  # staging unavailable → written straight to the DB
+    "store_errors": 0,
+    "db_errors": 0,
+}
+
+
+def _bump(key: str, n: int = 1) -> None:
+    with _stats_lock:
+        _stats[key] += n
+
+
+def audit_state_stats() -> Dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+class AuditStateStore:
+    """
+    Lifecycle of TriggerAudit rows (queued → running → success | error),
+    staged in Redis and written to the DB once per run.
+
+    The API inserts the row as "queued"; from then on every change is an
+    HSET on wf:audit:<id> (s=status, e=error, p=parameters JSON, t=last
+    change ms, v=version, fv=version last written). Only the terminal
+    transition issues an UPDATE … WHERE id = :id. Runs still open after
+    WORKFLOW_AUDIT_FLUSH_INTERVAL_SECONDS are written by flush(), which
+    also finishes terminal writes a crashed worker never made and marks
+    runs without progress for WORKFLOW_AUDIT_STALE_SECONDS as errors.
+
+    client=None (staging disabled or Redis down) writes every transition
+    straight to the DB by primary key. Audit failures are logged and never
+    fail the workflow. One task owns an audit id at a time, so the
+    read-then-write of a transition is not made atomic.
+    """
+
+    def __init__(self, client: Any = None, session_factory: Any = None) -> None:
+        self._redis = client
+        self._session_factory = session_factory or SessionLocal
+        self.flush_interval_ms = int(settings.WORKFLOW_AUDIT_FLUSH_INTERVAL_SECONDS * 1000)
+        self.stale_ms = settings.WORKFLOW_AUDIT_STALE_SECONDS * 1000
+        self.terminal_ttl = settings.WORKFLOW_AUDIT_TERMINAL_TTL_SECONDS
+
+    @property
+    def staging(self) -> bool:
+        return self._redis is not None
+
+    # ---------------------------------------------------------
+    # Transitions
+    # ---------------------------------------------------------
+    def transition(
+        self,
+        audit_id: Any,
+        status: str,
+        *,
+        error: Any = _UNSET,
+        parameters: Any = _UNSET,
+    ) -> bool:
+        """
+        Moves the run to `status`; False if it was already terminal.
+        error=None clears a staged error; omitted fields keep their value.
+        """
+        if status not in STATUSES:
+            raise AuditTransitionError(f"Unknown trigger audit status {status!r}")
+
+        now = _now_ms()
+        fields = self._fields(error, parameters)
+        fields["s"] = status
+        fields["t"] = str(now)
+
+        if self._redis is None:
+            return self._write_through(audit_id, fields)
+
+        key = _KEY_PREFIX + str(audit_id)
+        try:
+            current = _text(self._redis.hget(key, "s"))
+            if current in TERMINAL:
+                _bump("invalid_transitions")
+                logger.warning("Audit %s is already %s; ignoring transition to %s", audit_id, current, status)
+                return False
+
+            due = now if status in TERMINAL else now + self.flush_interval_ms
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.hset(key, mapping=fields)
+            pipe.hincrby(key, "v", 1)
+            pipe.expire(key, self.stale_ms // 1000 + self.terminal_ttl)
+            pipe.zadd(_ACTIVE_KEY, {str(audit_id): due})
+            pipe.execute()
+        except Exception:
+            _bump("store_errors")
+            logger.exception("Audit staging failed for %s; writing to the DB directly", audit_id)
+            return self._write_through(audit_id, fields)
+
+        _bump("transitions")
+        if status in TERMINAL:
+            self._finish(audit_id)
+        return True
+
+    def stage(self, audit_id: Any, *, error: Any = _UNSET, parameters: Any = _UNSET) -> None:
+        """Attaches result details to the run without changing its status."""
+        fields = self._fields(error, parameters)
+        if not fields:
+            return
+        if self._redis is None:
+            self._write_through(audit_id, fields)
+            return
+        try:
+            self._redis.hset(_KEY_PREFIX + str(audit_id), mapping=fields)
+        except Exception:
+            _bump("store_errors")
+            logger.exception("Audit staging failed for %s; writing to the DB directly", audit_id)
+            self._write_through(audit_id, fields)
+
+    @staticmethod
+    def _fields(error: Any, parameters: Any) -> Dict[str, str]:
+        fields: Dict[str, str] = {}
+        if error is not _UNSET:
+            fields["e"] = "" if error is None else str(error)
+        if parameters is not _UNSET:
+            fields["p"] = json.dumps(parameters, default=str)
+        return fields
+
+    # ---------------------------------------------------------
+    # DB writes (primary key only)
+    # ---------------------------------------------------------
+    def _write_row(self, audit_id: Any, values: Dict[str, Any], *, only_if_open: bool = False) -> bool:
+        stmt = update(TriggerAudit).where(TriggerAudit.id == int(audit_id)).values(**values)
+        if only_if_open:
+            # A late flush must never overwrite the final state
+            stmt = stmt.where(TriggerAudit.status.notin_(sorted(TERMINAL)))
+        db = self._session_factory()
+        try:
+            rowcount = db.execute(stmt).rowcount
+            db.commit()
+        finally:
+            db.close()
+        _bump("db_writes")
+        return rowcount > 0
+
+    def _write_through(self, audit_id: Any, fields: Dict[str, str]) -> bool:
+        values = _row_values(fields)
+        if "s" not in fields:
+            values.pop("status")
+        _bump("write_through")
+        try:
+            return self._write_row(audit_id, values)
+        except Exception:
+            _bump("db_errors")
+            logger.exception("Audit write failed for %s", audit_id)
+            return False
+
+    def _load(self, audit_id: Any) -> Dict[str, str]:
+        raw = self._redis.hgetall(_KEY_PREFIX + str(audit_id)) or {}
+        return {_text(k): _text(v) for k, v in raw.items()}
+
+    def _finish(self, audit_id: Any, state: Optional[Dict[str, str]] = None) -> bool:
+        """Terminal write; on failure the run stays due so flush() retries it."""
+        try:
+            state = state if state is not None else self._load(audit_id)
+            self._write_row(audit_id, _row_values(state))
+        except Exception:
+            _bump("db_errors")
+            logger.exception("Terminal audit write failed for %s (flusher will retry)", audit_id)
+            return False
+        _bump("terminal_writes")
+        self._retire(audit_id, state)
+        return True
+
+    def _retire(self, audit_id: Any, state: Dict[str, str]) -> None:
+        key = _KEY_PREFIX + str(audit_id)
+        try:
+            pipe = self._redis.pipeline(transaction=True)
+            pipe.zrem(_ACTIVE_KEY, str(audit_id))
+            pipe.hset(key, "fv", state.get("v", "0"))
+            # Kept briefly so duplicate deliveries see the terminal state
+            pipe.expire(key, self.terminal_ttl)
+            pipe.execute()
+        except Exception:
+            _bump("store_errors")
+            logger.exception("Could not retire audit %s (expires by TTL)", audit_id)
+
+    # ---------------------------------------------------------
+    # Flusher pass
+    # ---------------------------------------------------------
+    def flush(self, now_ms: Optional[int] = None, limit: int = 500) -> Dict[str, int]:
+        """
+        Handles runs whose due time has passed: terminal → write (crash
+        recovery), stale → error, open with unwritten changes → conditional
+        write. Safe to run from several workers; every write is idempotent.
+        """
+        done = {"terminal": 0, "abandoned": 0, "open": 0}
+        if self._redis is None:
+            return done
+
+        now = _now_ms() if now_ms is None else now_ms
+        for member in self._redis.zrangebyscore(_ACTIVE_KEY, "-inf", now, start=0, num=limit):
+            audit_id = _text(member)
+            try:
+                state = self._load(audit_id)
+                if not state:
+                    self._redis.zrem(_ACTIVE_KEY, audit_id)
+                    continue
+
+                if state.get("s") in TERMINAL:
+                    if self._finish(audit_id, state):
+                        done["terminal"] += 1
+                        _bump("recovered_terminal")
+                    continue
+
+                changed_at = int(state.get("t") or 0)
+                if now - changed_at >= self.stale_ms:
+                    # Worker died and the task never came back
+                    stale_for = self.stale_ms // 1000
+                    if self.transition(audit_id, ERROR, error=f"Worker lost: no progress for {stale_for}s"):
+                        done["abandoned"] += 1
+                        _bump("abandoned")
+                    continue
+
+                if state.get("v") != state.get("fv"):
+                    values = _row_values(state)
+                    self._write_row(audit_id, values, only_if_open=True)
+                    self._redis.hset(_KEY_PREFIX + audit_id, "fv", state.get("v", "0"))
+                    done["open"] += 1
+                    _bump("flushed_open")
+                # Next look: when the run would count as stale
+                self._redis.zadd(_ACTIVE_KEY, {audit_id: changed_at + self.stale_ms})
+            except Exception:
+                _bump("store_errors")
+                logger.exception("Audit flush failed for %s", audit_id)
+        return done
+
+
+class AuditFlusher:
+    """Daemon thread running AuditStateStore.flush() every `interval` seconds."""
+
+    def __init__(self, store: AuditStateStore, interval: float) -> None:
+        self._store = store
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="orko-audit-flusher", daemon=True)
+        self.pid = os.getpid()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self._store.flush()
+            except Exception:
+                logger.exception("Audit flusher pass failed")
+
+    def stop(self, flush: bool = True, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+        if flush:
+            try:
+                self._store.flush()
+            except Exception:
+                logger.exception("Final audit flush failed")
+
+
+# ------------------------------------------------------------
+# Process-wide store + flusher (fork-aware)
+# ------------------------------------------------------------
+_store: Optional[AuditStateStore] = None
+_store_pid: Optional[int] = None
+_flusher: Optional[AuditFlusher] = None
+_lock = threading.Lock()
+
+
+def get_audit_state() -> AuditStateStore:
+    global _store, _store_pid
+
+    store = _store
+    if store is not None and _store_pid == os.getpid():
+        return store
+
+    with _lock:
+        if _store is None or _store_pid != os.getpid():
+            client = None
+            if settings.WORKFLOW_AUDIT_STAGING_ENABLED:
+                try:
+                    from backend.app.core.clients import get_client_registry
+
+                    client = get_client_registry().redis(settings.WORKFLOW_AUDIT_REDIS_URL or None)
+                except Exception:
+                    logger.exception("Audit staging unavailable; audit rows are written directly")
+            _store = AuditStateStore(client)
+            _store_pid = os.getpid()
+        return _store
+
+
+def start_audit_flusher(interval: Optional[float] = None) -> bool:
+    """Starts this process's flusher (idempotent); interval <= 0 disables it."""
+    global _flusher
+
+    interval = settings.WORKFLOW_AUDIT_FLUSH_INTERVAL_SECONDS if interval is None else interval
+    store = get_audit_state()
+    if interval <= 0 or not store.staging:
+        return False
+    with _lock:
+        if _flusher is not None and _flusher.is_alive() and _flusher.pid == os.getpid():
+            return False
+        _flusher = AuditFlusher(store, interval)
+        _flusher.start()
+    return True
+
+
+def stop_audit_flusher(flush: bool = True) -> None:
+    global _flusher
+
+    with _lock:
+        flusher, _flusher = _flusher, None
+    if flusher is not None and flusher.pid == os.getpid():
+        flusher.stop(flush=flush)
+
+
+def reset_audit_state() -> None:
+    """Stops the flusher and drops the store (tests / settings changes)."""
+    global _store, _store_pid
+
+    stop_audit_flusher(flush=False)
+    with _lock:
+        _store = None
+        _store_pid = None
@@ -0,0 +1,172 @@
+# backend/app/services/workflow/checkpoints.py
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "wf:ckpt:"
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    index: int  # position in FlowPlan.steps
+    step_id: str
+    result: Any
+    duration_ms: float
+
+
+# ------------------------------------------------------------
+# Stores: one hash per run, field = step index
+# ------------------------------------------------------------
+
+class RedisCheckpointStore:
+    """wf:ckpt:<run_key> → {step index: {"step_id", "result", "duration_ms"}}, TTL'd."""
+
+    def __init__(self, client: Any = None, ttl_seconds: Optional[int] = None) -> None:
+        if client is None:
+            from backend.app.core.clients import get_client_registry
+
+            client = get_client_registry().redis(settings.WORKFLOW_CHECKPOINT_REDIS_URL or None)
+        self._redis = client
+        self.ttl_seconds = ttl_seconds or settings.WORKFLOW_CHECKPOINT_TTL_SECONDS
+
+    def load(self, run_key: str) -> Dict[int, Checkpoint]:
+        raw = self._redis.hgetall(_KEY_PREFIX + run_key) or {}
+        out: Dict[int, Checkpoint] = {}
+        for field, value in raw.items():
+            data = json.loads(value)
+            index = int(field)
+            out[index] = Checkpoint(index, data["step_id"], data["result"], float(data.get("duration_ms", 0.0)))
+        return out
+
+    def save(self, run_key: str, checkpoint: Checkpoint) -> None:
+        key = _KEY_PREFIX + run_key
+        value = json.dumps(
+            {"step_id": checkpoint.step_id, "result": checkpoint.result, "duration_ms": checkpoint.duration_ms}
+        )
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, str(checkpoint.index), value)
+        pipe.expire(key, self.ttl_seconds)
+        pipe.execute()
+
+    def clear(self, run_key: str) -> None:
+        self._redis.delete(_KEY_PREFIX + run_key)
+
+
+class MemoryCheckpointStore:
+    """In-process store with the same interface (tests, benchmarks, single worker)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._runs: Dict[str, Dict[int, str]] = {}
+
+    def load(self, run_key: str) -> Dict[int, Checkpoint]:
+        with self._lock:
+            raw = dict(self._runs.get(run_key, {}))
+        out: Dict[int, Checkpoint] = {}
+        for index, value in raw.items():
+            data = json.loads(value)
+            out[index] = Checkpoint(index, data["step_id"], data["result"], data["duration_ms"])
+        return out
+
+    def save(self, run_key: str, checkpoint: Checkpoint) -> None:
+        # Same JSON round trip as Redis, so non-serializable results fail alike
+        value = json.dumps(
+            {"step_id": checkpoint.step_id, "result": checkpoint.result, "duration_ms": checkpoint.duration_ms}
+        )
+        with self._lock:
+            self._runs.setdefault(run_key, {})[checkpoint.index] = value
+
+    def clear(self, run_key: str) -> None:
+        with self._lock:
+            self._runs.pop(run_key, None)
+
+
+# ------------------------------------------------------------
+# Per-run facade used by dag.run_plan
+# ------------------------------------------------------------
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {
+    "runs_resumed": 0,
+    "steps_saved": 0,
+    "steps_restored": 0,  # step executions avoided on retries
+    "rerun_ms_avoided": 0.0,  # original duration of the restored steps
+    "save_skipped_unserializable": 0,
+    "store_errors": 0,
+}
+
+
+def _bump(key: str, n: float = 1) -> None:
+    with _stats_lock:
+        _stats[key] += n
+
+
+def checkpoint_stats() -> Dict[str, float]:
+    with _stats_lock:
+        out = dict(_stats)
+    out["rerun_ms_avoided"] = round(out["rerun_ms_avoided"], 3)
+    return out
+
+
+class StepCheckpointer:
+    """
+    Checkpoints of one workflow run (run_key = audit id, stable across
+    Celery retries). Store calls run in a thread; store errors are logged
+    and never fail the workflow — the step simply reruns next time.
+    """
+
+    def __init__(self, run_key: str, store: Any = None) -> None:
+        self.run_key = run_key
+        self._store = store if store is not None else RedisCheckpointStore()
+
+    def idempotency_key(self, index: int, step_id: str) -> str:
+        """Same value on every retry of this run, so side effects can be deduplicated."""
+        return hashlib.sha256(f"{self.run_key}:{index}:{step_id}".encode("utf-8")).hexdigest()[:32]
+
+    async def restore(self) -> Dict[int, Checkpoint]:
+        try:
+            found = await asyncio.to_thread(self._store.load, self.run_key)
+        except Exception:
+            _bump("store_errors")
+            logger.exception("Checkpoint load failed for run %s (running all steps)", self.run_key)
+            return {}
+        if found:
+            _bump("runs_resumed")
+        return found
+
+    def mark_restored(self, checkpoint: Checkpoint) -> None:
+        _bump("steps_restored")
+        _bump("rerun_ms_avoided", checkpoint.duration_ms)
+
+    async def save(self, index: int, step_id: str, result: Any, duration_ms: float) -> bool:
+        checkpoint = Checkpoint(index, step_id, result, round(duration_ms, 3))
+        try:
+            await asyncio.to_thread(self._store.save, self.run_key, checkpoint)
+        except (TypeError, ValueError):
+            _bump("save_skipped_unserializable")
+            logger.warning("Step %s result is not JSON-serializable; not checkpointed", step_id)
+            return False
+        except Exception:
+            _bump("store_errors")
+            logger.exception("Checkpoint save failed for run %s step %s", self.run_key, step_id)
+            return False
+        _bump("steps_saved")
+        return True
+
+    async def clear(self) -> None:
+        try:
+            await asyncio.to_thread(self._store.clear, self.run_key)
+        except Exception:
+            _bump("store_errors")
+            logger.exception("Checkpoint cleanup failed for run %s (expires by TTL)", self.run_key)
@@ -0,0 +1,419 @@
+# backend/app/services/workflow/dag.py
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from backend.app.core.config import settings
+
+if TYPE_CHECKING:
+    from backend.app.services.workflow.checkpoints import StepCheckpointer
+
+# resolve(action name) → step callable: fn(context, **params), sync or async
+Resolver = Callable[[str], Callable[..., Any]]
+
+FLOWS_DIR = Path(__file__).resolve().parent / "flows"
+
+
+class FlowValidationError(ValueError):
+    """A flow definition is not a valid DAG (unknown/duplicate ids, cycles, bad fields)."""
+
+
+class WorkflowStepError(RuntimeError):
+    """A DAG step failed or timed out; the remaining steps were cancelled."""
+
+    def __init__(self, step_id: str, message: str, retryable: bool = True) -> None:
+        super().__init__(f"step '{step_id}' failed: {message}")
+        self.step_id = step_id
+        self.retryable = retryable
+
+
+class UnresolvedActionError(LookupError):
+    """A step's action is not registered; retrying cannot fix it."""
+
+
+# ------------------------------------------------------------
+# Flow format
+# ------------------------------------------------------------
+
+@dataclass(frozen=True)
+class FlowStep:
+    id: str
+    action: str
+    depends_on: Tuple[str, ...] = ()
+    timeout_ms: Optional[int] = None
+    params: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+
+@dataclass(frozen=True)
+class FlowPlan:
+    """
+    Compiled, validated flow. `steps` is in topological order and
+    `dependents` maps each step id to the steps waiting on it.
+    """
+
+    name: str
+    steps: Tuple[FlowStep, ...]
+    dependents: Mapping[str, Tuple[str, ...]]
+    max_concurrency: Optional[int] = None
+
+    def step(self, step_id: str) -> FlowStep:
+        for step in self.steps:
+            if step.id == step_id:
+                return step
+        raise KeyError(step_id)
+
+
+def compile_flow(spec: Mapping[str, Any]) -> FlowPlan:
+    """
+    Validates a flow definition and compiles it into a FlowPlan.
+
+    Steps: {"id"?, "action", "depends_on"?: [ids], "timeout_ms"?, "params"?}.
+    `id` defaults to the action name. If no step declares `depends_on`
+    the flow is a legacy list and runs in file order (each step depends
+    on the previous one); otherwise steps without `depends_on` are roots.
+    """
+    name = spec.get("name")
+    raw_steps = spec.get("steps")
+    if not name or not isinstance(name, str):
+        raise FlowValidationError("flow needs a string 'name'")
+    if not isinstance(raw_steps, list) or not raw_steps:
+        raise FlowValidationError(f"flow '{name}': 'steps' must be a non-empty list")
+
+    explicit = any(isinstance(s, Mapping) and "depends_on" in s for s in raw_steps)
+    steps: List[FlowStep] = []
+    seen: Dict[str, FlowStep] = {}
+
+    for idx, raw in enumerate(raw_steps):
+        if not isinstance(raw, Mapping) or not isinstance(raw.get("action"), str) or not raw["action"]:
+            raise FlowValidationError(f"flow '{name}': step #{idx} needs an 'action'")
+        step_id = raw.get("id") or raw["action"]
+        if step_id in seen:
+            raise FlowValidationError(f"flow '{name}': duplicate step id '{step_id}' (set explicit 'id's)")
+
+        if explicit:
+            deps = raw.get("depends_on") or []
+            if not isinstance(deps, list) or not all(isinstance(d, str) for d in deps):
+                raise FlowValidationError(f"flow '{name}': '{step_id}'.depends_on must be a list of step ids")
+        else:
+            deps = [steps[-1].id] if steps else []
+
+        timeout_ms = raw.get("timeout_ms")
+        if timeout_ms is not None and (not isinstance(timeout_ms, int) or timeout_ms <= 0):
+            raise FlowValidationError(f"flow '{name}': '{step_id}'.timeout_ms must be a positive integer")
+
+        params = raw.get("params") or {}
+        if not isinstance(params, Mapping):
+            raise FlowValidationError(f"flow '{name}': '{step_id}'.params must be an object")
+
+        step = FlowStep(
+            id=step_id,
+            action=raw["action"],
+            depends_on=tuple(dict.fromkeys(deps)),
+            timeout_ms=timeout_ms,
+            params=MappingProxyType(dict(params)),
+        )
+        seen[step_id] = step
+        steps.append(step)
+
+    dependents: Dict[str, List[str]] = {s.id: [] for s in steps}
+    for step in steps:
+        for dep in step.depends_on:
+            if dep not in seen:
+                raise FlowValidationError(f"flow '{name}': '{step.id}' depends on unknown step '{dep}'")
+            if dep == step.id:
+                raise FlowValidationError(f"flow '{name}': '{step.id}' depends on itself")
+            dependents[dep].append(step.id)
+
+    # Kahn: topological order, stable w.r.t. file order
+    indegree = {s.id: len(s.depends_on) for s in steps}
+    ready = [s.id for s in steps if indegree[s.id] == 0]
+    order: List[str] = []
+    while ready:
+        current = ready.pop(0)
+        order.append(current)
+        for child in dependents[current]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+    if len(order) != len(steps):
+        cyclic = sorted(sid for sid, deg in indegree.items() if deg > 0)
+        raise FlowValidationError(f"flow '{name}': dependency cycle among {cyclic}")
+
+    max_concurrency = spec.get("max_concurrency")
+    if max_concurrency is not None and (not isinstance(max_concurrency, int) or max_concurrency <= 0):
+        raise FlowValidationError(f"flow '{name}': max_concurrency must be a positive integer")
+
+    return FlowPlan(
+        name=name,
+        steps=tuple(seen[sid] for sid in order),
+        dependents=MappingProxyType({sid: tuple(children) for sid, children in dependents.items()}),
+        max_concurrency=max_concurrency,
+    )
+
+
+def load_flow(name_or_path: str | Path) -> FlowPlan:
+    """Reads and compiles flows/<name>.json (or an explicit path)."""
+    path = Path(name_or_path)
+    if path.suffix != ".json":
+        path = FLOWS_DIR / f"{name_or_path}.json"
+    with path.open("r", encoding="utf-8") as f:
+        return compile_flow(json.load(f))
+
+
+# ------------------------------------------------------------
+# Execution
+# ------------------------------------------------------------
+
+@dataclass
+class StepRecord:
+    step_id: str
+    action: str
+    depends_on: Tuple[str, ...]
+    status: str = "skipped"  # ok | restored | error | unresolved | timeout | cancelled | skipped
+    wait_ms: float = 0.0  # ready → admitted by the concurrency limits
+    start_ms: Optional[float] = None  # offsets from the start of the run
+    end_ms: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.start_ms is None or self.end_ms is None:
+            return None
+        return self.end_ms - self.start_ms
+
+
+@dataclass
+class DagRunReport:
+    flow: str
+    steps: Dict[str, StepRecord]
+    total_ms: float = 0.0
+    failed_step: Optional[str] = None
+    error: Optional[str] = None
+
+    def critical_path(self) -> List[str]:
+        """
+        Chain of steps that determined the finish time: from the last step
+        to end, repeatedly follow the dependency that finished last.
+        """
+        finished = [r for r in self.steps.values() if r.end_ms is not None]
+        if not finished:
+            return []
+        current = max(finished, key=lambda r: r.end_ms)
+        path = [current.step_id]
+        while current.depends_on:
+            deps = [self.steps[d] for d in current.depends_on if self.steps[d].end_ms is not None]
+            if not deps:
+                break
+            current = max(deps, key=lambda r: r.end_ms)
+            path.append(current.step_id)
+        return list(reversed(path))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "flow": self.flow,
+            "total_ms": round(self.total_ms, 3),
+            "failed_step": self.failed_step,
+            "error": self.error,
+            "critical_path": self.critical_path(),
+            "restored_steps": [r.step_id for r in self.steps.values() if r.status == "restored"],
+            "steps": [
+                {
+                    "id": r.step_id,
+                    "action": r.action,
+                    "status": r.status,
+                    "wait_ms": round(r.wait_ms, 3),
+                    "start_ms": None if r.start_ms is None else round(r.start_ms, 3),
+                    "duration_ms": None if r.duration_ms is None else round(r.duration_ms, 3),
+                    "error": r.error,
+                }
+                for r in self.steps.values()
+            ],
+        }
+
+
+_global_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+_global_limits_lock = threading.Lock()
+
+
+def _global_semaphore() -> asyncio.Semaphore:
+    """WORKFLOW_DAG_GLOBAL_CONCURRENCY, shared by every flow on this loop."""
+    loop = asyncio.get_running_loop()
+    with _global_limits_lock:
+        sem = _global_limits.get(loop)
+        if sem is None:
+            sem = asyncio.Semaphore(settings.WORKFLOW_DAG_GLOBAL_CONCURRENCY)
+            _global_limits[loop] = sem
+        return sem
+
+
+_IDEMPOTENCY_PARAM = "idempotency_key"
+_accepts_key_cache: Dict[Any, bool] = {}
+
+
+def _accepts_idempotency_key(fn: Callable[..., Any]) -> bool:
+    """Side-effecting steps opt in by accepting an `idempotency_key` kwarg."""
+    cached = _accepts_key_cache.get(fn)
+    if cached is None:
+        try:
+            params = inspect.signature(fn).parameters
+        except (TypeError, ValueError):
+            params = {}
+        cached = _IDEMPOTENCY_PARAM in params or any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+        )
+        _accepts_key_cache[fn] = cached
+    return cached
+
+
+async def _invoke(fn: Callable[..., Any], context: Dict[str, Any], params: Mapping[str, Any]) -> Any:
+    if inspect.iscoroutinefunction(fn):
+        return await fn(context, **params)
+    # Sync steps run in a thread so independent steps overlap. On timeout
+    # the thread is abandoned (it cannot be interrupted), not killed.
+    result = await asyncio.to_thread(fn, context, **params)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def run_plan(
+    plan: FlowPlan,
+    context: Dict[str, Any],
+    resolve: Resolver,
+    *,
+    flow_concurrency: Optional[int] = None,
+    default_timeout_ms: Optional[int] = None,
+    checkpoints: Optional["StepCheckpointer"] = None,
+) -> DagRunReport:
+    """
+    Runs a compiled plan: every step starts as soon as all of its
+    dependencies succeeded, bounded by the per-flow limit
+    (flow_concurrency → plan.max_concurrency → WORKFLOW_DAG_FLOW_CONCURRENCY)
+    and the process-wide WORKFLOW_DAG_GLOBAL_CONCURRENCY.
+
+    Each step has its own timeout (timeout_ms → default_timeout_ms →
+    WORKFLOW_STEP_TIMEOUT_MS). The first failure or timeout cancels the
+    running steps and skips the rest; it is reported, not raised. Step
+    return values land in context["step_results"][step_id].
+
+    With `checkpoints`, steps already completed by an earlier attempt of
+    the same run are restored from their checkpoint instead of rerun,
+    each success is checkpointed, and steps accepting `idempotency_key`
+    get a key that is stable across retries. Only the return value is
+    checkpointed, so steps must pass data to later steps (and to the
+    caller) through return values alone and treat `context` as read-only.
+    """
+    flow_sem = asyncio.Semaphore(flow_concurrency or plan.max_concurrency or settings.WORKFLOW_DAG_FLOW_CONCURRENCY)
+    global_sem = _global_semaphore()
+    default_timeout_s = (default_timeout_ms or settings.WORKFLOW_STEP_TIMEOUT_MS) / 1000.0
+    results = context.setdefault("step_results", {})
+
+    report = DagRunReport(
+        flow=plan.name,
+        steps={s.id: StepRecord(s.id, s.action, s.depends_on) for s in plan.steps},
+    )
+    started = time.monotonic()
+
+    def offset_ms() -> float:
+        return (time.monotonic() - started) * 1000.0
+
+    index_of = {s.id: i for i, s in enumerate(plan.steps)}
+
+    async def run_step(step: FlowStep) -> None:
+        record = report.steps[step.id]
+        ready_at = offset_ms()
+        async with flow_sem, global_sem:
+            record.start_ms = offset_ms()
+            record.wait_ms = record.start_ms - ready_at
+            timeout_s = step.timeout_ms / 1000.0 if step.timeout_ms else default_timeout_s
+            try:
+                fn = resolve(step.action)
+                params = step.params
+                if checkpoints is not None and _accepts_idempotency_key(fn):
+                    params = {**params, _IDEMPOTENCY_PARAM: checkpoints.idempotency_key(index_of[step.id], step.id)}
+                results[step.id] = await asyncio.wait_for(_invoke(fn, context, params), timeout_s)
+                record.status = "ok"
+            except asyncio.TimeoutError:
+                record.status = "timeout"
+                record.error = f"timed out after {timeout_s * 1000:.0f} ms"
+                raise
+            except asyncio.CancelledError:
+                record.status = "cancelled"
+                raise
+            except UnresolvedActionError as exc:
+                record.status = "unresolved"
+                record.error = str(exc)
+                raise
+            except Exception as exc:
+                record.status = "error"
+                record.error = str(exc) or type(exc).__name__
+                raise
+            finally:
+                record.end_ms = offset_ms()
+
+        if checkpoints is not None:
+            await checkpoints.save(index_of[step.id], step.id, results[step.id], record.duration_ms or 0.0)
+
+    # Steps finished by an earlier attempt of this run count as done
+    done_ids = set()
+    if checkpoints is not None:
+        for index, checkpoint in (await checkpoints.restore()).items():
+            if index < len(plan.steps) and plan.steps[index].id == checkpoint.step_id:
+                results[checkpoint.step_id] = checkpoint.result
+                report.steps[checkpoint.step_id].status = "restored"
+                checkpoints.mark_restored(checkpoint)
+                done_ids.add(checkpoint.step_id)
+
+    by_id = {s.id: s for s in plan.steps}
+    pending_deps = {s.id: sum(1 for d in s.depends_on if d not in done_ids) for s in plan.steps}
+    running: Dict["asyncio.Task[None]", str] = {}
+
+    def launch(step_id: str) -> None:
+        running[asyncio.ensure_future(run_step(by_id[step_id]))] = step_id
+
+    async def cancel_running() -> None:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        running.clear()
+
+    try:
+        for step in plan.steps:
+            if step.id not in done_ids and pending_deps[step.id] == 0:
+                launch(step.id)
+
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step_id = running.pop(task)
+                if task.cancelled() or task.exception() is not None:
+                    if report.failed_step is None:
+                        report.failed_step = step_id
+                        report.error = report.steps[step_id].error or "cancelled"
+                    continue
+                for child in plan.dependents[step_id]:
+                    pending_deps[child] -= 1
+                    if pending_deps[child] == 0 and child not in done_ids and report.failed_step is None:
+                        launch(child)
+            if report.failed_step is not None:
+                await cancel_running()
+    except asyncio.CancelledError:
+        # The whole run was cancelled (worker loop timeout / shutdown)
+        await cancel_running()
+        raise
+    finally:
+        report.total_ms = offset_ms()
+
+    return report
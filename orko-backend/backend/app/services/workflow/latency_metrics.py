@@ -0,0 +1,291 @@
+# backend/app/services/workflow/latency_metrics.py
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.app.core.config import settings
+from backend.app.db import models
+from backend.app.db.session import SessionLocal
+from backend.app.services.telemetry.latency_sketch import LatencySketch
+
+logger = logging.getLogger(__name__)
+
+WindowKey = Tuple[str, str]  # (scenario, workflow_name or "")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@dataclass
+class _Window:
+    sketch: LatencySketch
+    started_at: datetime = field(default_factory=_utcnow)
+    success_count: int = 0
+    failure_count: int = 0
+
+    def absorb(self, other: "_Window") -> None:
+        self.sketch.merge(other.sketch)
+        self.started_at = min(self.started_at, other.started_at)
+        self.success_count += other.success_count
+        self.failure_count += other.failure_count
+
+
+class WorkflowLatencyRecorder:
+    """
+    Per-process latency windows for workflow runs.
+
+    observe() adds one duration to the LatencySketch of its (scenario,
+    workflow) window — memory only, no DB. Every `flush_interval_s` a
+    background thread swaps the windows out and writes one WorkflowMetrics
+    row per window: run counts, p50/p95/p99 and the serialized sketch.
+    If the write fails the windows are merged back and retried next time.
+
+    Rows from several workers and intervals merge on read without further
+    loss (see read_workflow_latency). Started lazily and fork-aware, like the
+    ParserLog writer; shutdown() flushes what is left.
+    """
+
+    def __init__(
+        self,
+        flush_interval_s: Optional[float] = None,
+        alpha: Optional[float] = None,
+        session_factory=SessionLocal,
+    ) -> None:
+        self.flush_interval_s = (
+            settings.WORKFLOW_METRICS_FLUSH_INTERVAL_SECONDS if flush_interval_s is None else flush_interval_s
+        )
+        self.alpha = alpha or settings.WORKFLOW_METRICS_SKETCH_ALPHA
+        self._session_factory = session_factory
+
+        self._lock = threading.Lock()
+        self._windows: Dict[WindowKey, _Window] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+
+        self._stats: Dict[str, int] = {
+            "observed": 0,
+            "rows_written": 0,
+            "flushes": 0,
+            "flush_errors": 0,
+        }
+
+    # ---------------------------------------------------------
+    # Hot path
+    # ---------------------------------------------------------
+    def observe(
+        self,
+        duration_ms: float,
+        success: bool,
+        scenario: str = "engine_run",
+        workflow_name: Optional[str] = None,
+    ) -> None:
+        self._ensure_started()
+        key = (scenario, workflow_name or "")
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = _Window(LatencySketch(self.alpha))
+            window.sketch.add(duration_ms)
+            if success:
+                window.success_count += 1
+            else:
+                window.failure_count += 1
+            self._stats["observed"] += 1
+
+    # ---------------------------------------------------------
+    # Background flusher
+    # ---------------------------------------------------------
+    def _ensure_started(self) -> None:
+        if self.flush_interval_s <= 0:
+            return  # flushed explicitly (tests, benchmarks)
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                # Forked child: the parent's windows are the parent's to flush
+                self._windows = {}
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="orko-workflow-metrics", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval_s):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("WorkflowMetrics flush failed")
+
+    def flush(self) -> int:
+        """Writes the current windows (one row each); returns rows written."""
+        with self._lock:
+            windows, self._windows = self._windows, {}
+        if not windows:
+            return 0
+
+        ended_at = _utcnow()
+        rows = [self._row(key, window, ended_at) for key, window in windows.items()]
+        db = self._session_factory()
+        try:
+            db.add_all(rows)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            with self._lock:
+                for key, window in windows.items():
+                    current = self._windows.get(key)
+                    if current is not None:
+                        window.absorb(current)
+                    self._windows[key] = window
+                self._stats["flush_errors"] += 1
+            logger.warning("WorkflowMetrics write failed (%s windows kept): %s", len(rows), e)
+            return 0
+        finally:
+            db.close()
+
+        with self._lock:
+            self._stats["rows_written"] += len(rows)
+            self._stats["flushes"] += 1
+        return len(rows)
+
+    def _row(self, key: WindowKey, window: _Window, ended_at: datetime) -> models.WorkflowMetrics:
+        scenario, workflow_name = key
+        q = window.sketch.quantiles()
+        return models.WorkflowMetrics(
+            scenario=scenario,
+            workflow_name=workflow_name or None,
+            total_runs=window.sketch.count,
+            success_count=window.success_count,
+            failure_count=window.failure_count,
+            p50_latency_ms=q["p50"],
+            p95_latency_ms=q["p95"],
+            p99_latency_ms=q["p99"],
+            window_start=window.started_at,
+            window_end=ended_at,
+            sketch=window.sketch.to_dict(),
+            notes=f"latency sketch window (orchestrator v7, pid {os.getpid()})",
+        )
+
+    def shutdown(self, timeout: float = 5.0) -> int:
+        """Stops the flusher thread and writes the remaining windows."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive() and self._pid == os.getpid():
+            thread.join(timeout)
+        self._thread = None
+        return self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = dict(self._stats)
+            out["open_windows"] = len(self._windows)
+        out["flush_interval_s"] = self.flush_interval_s
+        out["alpha"] = self.alpha
+        return out
+
+
+# ============================================================
+# Read side: merge stored windows
+# ============================================================
+
+def read_workflow_latency(
+    scenario: Optional[str] = None,
+    workflow_name: Optional[str] = None,
+    since: Optional[datetime] = None,
+    session_factory=SessionLocal,
+) -> List[Dict[str, Any]]:
+    """
+    Latency per (scenario, workflow) over every stored window matching
+    the filters — all workers, all intervals — by merging their sketches.
+    Merging loses nothing, so the percentiles are those of one sketch over
+    all the samples: within the sketch's alpha relative error.
+    Rows written before sketches existed (single-run rows) are skipped.
+    """
+    M = models.WorkflowMetrics
+    db = session_factory()
+    try:
+        query = db.query(
+            M.scenario, M.workflow_name, M.success_count, M.failure_count, M.sketch
+        ).filter(M.sketch.isnot(None))
+        if scenario is not None:
+            query = query.filter(M.scenario == scenario)
+        if workflow_name is not None:
+            query = query.filter(M.workflow_name == workflow_name)
+        if since is not None:
+            query = query.filter(M.window_end >= since)
+        rows = query.all()
+    finally:
+        db.close()
+
+    merged: Dict[WindowKey, Dict[str, Any]] = {}
+    for row in rows:
+        key = (row.scenario, row.workflow_name or "")
+        entry = merged.get(key)
+        sketch = LatencySketch.from_dict(row.sketch)
+        if entry is None:
+            merged[key] = {"sketch": sketch, "success": row.success_count, "failure": row.failure_count, "windows": 1}
+            continue
+        entry["sketch"].merge(sketch)
+        entry["success"] += row.success_count
+        entry["failure"] += row.failure_count
+        entry["windows"] += 1
+
+    out: List[Dict[str, Any]] = []
+    for (scen, wf), entry in sorted(merged.items()):
+        sketch: LatencySketch = entry["sketch"]
+        q = sketch.quantiles()
+        out.append(
+            {
+                "scenario": scen,
+                "workflow_name": wf or None,
+                "total_runs": sketch.count,
+                "success_count": entry["success"],
+                "failure_count": entry["failure"],
+                "windows": entry["windows"],
+                "p50_latency_ms": q["p50"],
+                "p95_latency_ms": q["p95"],
+                "p99_latency_ms": q["p99"],
+                "mean_latency_ms": sketch.mean,
+                "max_latency_ms": sketch.max,
+            }
+        )
+    return out
+
+
+# ============================================================
+# Process-wide recorder
+# ============================================================
+
+_recorder: Optional[WorkflowLatencyRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def get_latency_recorder() -> WorkflowLatencyRecorder:
+    global _recorder
+    if _recorder is None:
+        with _recorder_lock:
+            if _recorder is None:
+                _recorder = WorkflowLatencyRecorder()
+    return _recorder
+
+
+def shutdown_latency_recorder(timeout: float = 5.0) -> int:
+    """Flushes open windows (worker exit). Returns rows written."""
+    recorder = _recorder
+    if recorder is None:
+        return 0
+    return recorder.shutdown(timeout)
+
+
+atexit.register(shutdown_latency_recorder)
@@ -4,13 +4,20 @@ from __future__ import annotations
 
 import time
 import asyncio
-from typing import Any, Dict, Optional, List, Callable
-
-from backend.app.db.session import SessionLocal
-from backend.app.db import models
+from typing import Any, Dict, Optional, List, Callable, Mapping, Union
 
 from backend.app.services.workflow.dlq_helpers import record_dlq_failure
 from backend.app.services.workflow.audit_logger import AuditLogger
+from backend.app.services.workflow.actions_registry import get_action_registry
+from backend.app.services.workflow.checkpoints import StepCheckpointer
+from backend.app.services.workflow.dag import (
+    DagRunReport,
+    FlowPlan,
+    UnresolvedActionError,
+    WorkflowStepError,
+    run_plan,
+)
+from backend.app.services.workflow.latency_metrics import get_latency_recorder
 
 # Step 7 — Telemetry
 from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
@@ -33,10 +40,12 @@ class Orchestrator:
     - DLQ failure pipeline
     - telemetry hooks (parser → trigger → workflow)
     - audit logging
-    - latency metrics (WorkflowMetrics table)
+    - latency metrics (streaming sketches → WorkflowMetrics windows)
     - structured return payload
     - safe context merging
     - workflow engine version tag
+    - DAG flows (FlowPlan): independent steps run concurrently, per-step
+      timeouts, per-step latency + critical path telemetry
 
     All changes are backward-compatible.
     """
@@ -49,16 +58,29 @@ class Orchestrator:
     # ------------------------------------------------------------------
     async def run(
         self,
-        workflow_steps: List[WorkflowStep],
+        workflow_steps: Union[List[WorkflowStep], FlowPlan],
         context: Optional[Dict[str, Any]] = None,
         scenario: str = "engine_run",
         workflow_name: Optional[str] = None,
         user_id: Optional[str] = None,
         simulate: bool = False,
+        actions: Optional[Mapping[str, Callable[..., Any]]] = None,
+        checkpoints: Optional[StepCheckpointer] = None,
+        audit_id: Optional[Any] = None,
+        record_dlq: bool = True,
     ) -> Dict[str, Any]:
         """
         Executes a workflow end-to-end.
 
+        workflow_steps is either a list of callables (run in order) or a
+        compiled FlowPlan, whose step actions are looked up in `actions`
+        (default: the process-wide ActionRegistry). With `checkpoints`,
+        a retried run resumes after its last completed plan step; the
+        checkpoints are dropped once the run succeeds. With `audit_id`, the
+        final context is staged on that TriggerAudit row (its status is
+        owned by the caller). record_dlq=False leaves a failure out of the
+        WorkflowDLQ (a caller that retries records only the last attempt).
+
         simulate=True → no steps, no DB writes, no DLQ, no audit logs.
 
         Returns a structured dict used by TriggerQueue and Telemetry.
@@ -93,11 +115,22 @@ class Orchestrator:
         start_time = time.monotonic()
         success = False
         error_message: Optional[str] = None
+        dag_report: Optional[DagRunReport] = None
 
         try:
             # ----------------------------------------------------------
             # Execute workflow steps
             # ----------------------------------------------------------
+            if isinstance(workflow_steps, FlowPlan):
+                dag_report = await run_plan(
+                    workflow_steps, context, self._resolver(actions), checkpoints=checkpoints
+                )
+                if dag_report.failed_step is not None:
+                    raise WorkflowStepError(dag_report.failed_step, dag_report.error or "failed")
+                if checkpoints is not None:
+                    await checkpoints.clear()
+                workflow_steps = []
+
             for step in workflow_steps:
                 if not callable(step):
                     raise ValueError("Workflow step is not callable")
@@ -117,11 +150,15 @@ class Orchestrator:
             # ----------------------------------------------------------
             # DLQ handling (real mode only)
             # ----------------------------------------------------------
-            record_dlq_failure(
-                scenario=scenario,
-                error_message=error_message,
-                context=context,
-            )
+            # DB writes run off the loop so other workflows sharing it
+            # (Celery worker loop) keep making progress
+            if record_dlq:
+                await asyncio.to_thread(
+                    record_dlq_failure,
+                    scenario=scenario,
+                    error_message=error_message,
+                    context=context,
+                )
 
         finally:
             # ----------------------------------------------------------
@@ -130,25 +167,26 @@ class Orchestrator:
             end_time = time.monotonic()
             duration_ms = (end_time - start_time) * 1000.0
 
-            self._record_single_run_metric(
+            self._record_latency(
                 duration_ms=duration_ms,
                 success=success,
                 scenario=scenario,
+                workflow_name=workflow_name,
             )
 
             # ----------------------------------------------------------
             # Audit logging (real mode)
             # ----------------------------------------------------------
-            if workflow_name and user_id:
-                self.audit.log(
-                    workflow_name=workflow_name,
+            if audit_id is not None:
+                await asyncio.to_thread(
+                    self.audit.log,
+                    audit_id=audit_id,
                     parameters=context,
                     result={
                         "success": success,
                         "duration_ms": duration_ms,
-                        "context": context,
+                        "error": error_message,
                     },
-                    user_id=user_id,
                 )
 
         # ===============================================================
@@ -167,6 +205,14 @@ class Orchestrator:
         # ---------------------------------------------------------------
         # Telemetry (records success/error)
         # ---------------------------------------------------------------
+        if dag_report is not None:
+            steps_report = dag_report.as_dict()
+            result_payload["steps"] = steps_report
+            TelemetryCollector.record_workflow_steps(
+                workflow_name=workflow_name or dag_report.flow,
+                report=steps_report,
+            )
+
         TelemetryCollector.record_workflow(
             workflow_name=workflow_name or "",
             result=result_payload,
@@ -176,33 +222,38 @@ class Orchestrator:
         return result_payload
 
     # ------------------------------------------------------------------
-    # INTERNAL — Write WorkflowMetrics row
+    # INTERNAL — DAG action lookup
     # ------------------------------------------------------------------
-    def _record_single_run_metric(
+    @staticmethod
+    def _resolver(actions: Optional[Mapping[str, Callable[..., Any]]]) -> Callable[[str], Callable[..., Any]]:
+        table = actions if actions is not None else get_action_registry()
+
+        def resolve(action: str) -> Callable[..., Any]:
+            try:
+                return table[action]
+            except KeyError:
+                raise UnresolvedActionError(f"No action registered for '{action}'") from None
+
+        return resolve
+
+    # ------------------------------------------------------------------
+    # INTERNAL — Latency metrics
+    # ------------------------------------------------------------------
+    def _record_latency(
         self,
         duration_ms: float,
         success: bool,
         scenario: str = "engine_run",
+        workflow_name: Optional[str] = None,
     ) -> None:
         """
-        Writes a single WorkflowMetrics row for latency analytics.
-
-        Non-breaking:
-        - does not overwrite batches
-        - does not aggregate here (dashboard does aggregation)
+        Adds the run to its (scenario, workflow) latency sketch. In memory
+        only; WorkflowMetrics rows with p50/p95/p99 are written per flush
+        window (see latency_metrics.py).
         """
-        db = SessionLocal()
-        try:
-            row = models.WorkflowMetrics(
-                scenario=scenario,
-                total_runs=1,
-                success_count=1 if success else 0,
-                failure_count=0 if success else 1,
-                p50_latency_ms=duration_ms,   # single-run latency
-                p95_latency_ms=None,          # aggregated later
-                notes="single run metric from orchestrator v7",
-            )
-            db.add(row)
-            db.commit()
-        finally:
-            db.close()
+        get_latency_recorder().observe(
+            duration_ms,
+            success,
+            scenario=scenario,
+            workflow_name=workflow_name,
+        )
@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
 from celery.utils.log import get_task_logger
 
+from backend.app.core.clients import get_client_registry
 from backend.app.core.config import settings
-from backend.app.db.session import SessionLocal
-from backend.app.models.trigger_audit import TriggerAudit
 from backend.app.services.workflow.orchestrator import Orchestrator
 from backend.app.services.workflow.dlq_helpers import record_trigger_dlq
+from backend.app.services.workflow.worker_loop import get_worker_loop, shutdown_worker_loop
+from backend.app.services.workflow.latency_metrics import shutdown_latency_recorder
+from backend.app.services.workflow.actions_registry import get_action_registry, warm_action_registry
+from backend.app.services.workflow.checkpoints import StepCheckpointer
+from backend.app.services.workflow.audit_state import (
+    ERROR,
+    QUEUED,
+    RUNNING,
+    SUCCESS,
+    get_audit_state,
+    start_audit_flusher,
+    stop_audit_flusher,
+)
+from backend.app.services.workflow.dag import UnresolvedActionError, WorkflowStepError
+from backend.app.services.parsing.parser_engine import warm_parser_engine
+from backend.app.services.parsing.config_snapshot import start_config_watcher
+from backend.app.services.parsing.parser_log_writer import shutdown_parser_log_writer
 
 # Step 7 — Telemetry
 from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
@@ -37,7 +54,52 @@ celery_app.conf.update(
     worker_prefetch_multiplier=4,
     task_time_limit=300,        # 5 minutes hard limit
     task_soft_time_limit=240,   # 4 minutes soft limit
+    broker_pool_limit=settings.CELERY_BROKER_POOL_LIMIT,
+    redis_max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+    worker_pool=settings.CELERY_WORKER_POOL,
 )
+if settings.CELERY_WORKER_CONCURRENCY:
+    celery_app.conf.worker_concurrency = settings.CELERY_WORKER_CONCURRENCY
+
+
+# ------------------------------------------------------------
+# Warm the shared ParserEngine once per forked worker process
+# ------------------------------------------------------------
+@worker_process_init.connect
+def _warm_parser_on_fork(**_kwargs: Any) -> None:
+    try:
+        elapsed_ms = warm_parser_engine()
+        logger.info("ParserEngine warmed in worker in %.1f ms", elapsed_ms)
+    except Exception:
+        logger.exception("ParserEngine warm-up failed in worker (will build lazily)")
+    try:
+        elapsed_ms = warm_action_registry()
+        logger.info("Action registry and flow plans ready in %.1f ms", elapsed_ms)
+    except Exception:
+        logger.exception("Flow compilation failed in worker (will retry lazily)")
+    # Threads do not survive fork → start the config watcher and the
+    # workflow loop per worker
+    start_config_watcher()
+    get_worker_loop()
+    start_audit_flusher()
+
+
+@worker_process_shutdown.connect
+def _flush_parser_logs_on_exit(**_kwargs: Any) -> None:
+    _stop_workflow_loop()
+    stop_audit_flusher()
+    flushed = shutdown_parser_log_writer()
+    logger.info("ParserLog buffer flushed on worker exit (%s rows)", flushed)
+    flushed = shutdown_latency_recorder()
+    logger.info("Workflow latency windows flushed on worker exit (%s rows)", flushed)
+    get_client_registry().close()
+
+
+@worker_shutdown.connect
+def _stop_workflow_loop(**_kwargs: Any) -> None:
+    # Prefork children stop theirs above; this covers thread / solo pools
+    if not shutdown_worker_loop():
+        logger.warning("Workflow loop stopped with cancelled in-flight runs")
 
 
 # ------------------------------------------------------------
@@ -62,8 +124,6 @@ def run_workflow_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
     - simulate        (bool)
     - metadata        (dict, optional)
     """
-    db = SessionLocal()
-
     audit_id = payload.get("audit_id")
     workflow_name = payload.get("workflow_name")
     parameters = payload.get("parameters") or {}
@@ -81,40 +141,72 @@ def run_workflow_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         simulate,
     )
 
+    # Lifecycle changes are staged (Redis); the row is written once, by
+    # primary key, when the run reaches success / error
+    audit_state = get_audit_state()
+    last_attempt = self.request.retries >= self.max_retries
+
     try:
         # --------------------------------------------------------
         # 1) Mark audit row as running
         # --------------------------------------------------------
-        audit = None
         if audit_id is not None:
-            audit = db.get(TriggerAudit, audit_id)
-            if audit:
-                audit.status = "running"
-                audit.error_message = None
-                db.add(audit)
-                db.commit()
+            audit_state.transition(audit_id, RUNNING, error=None)
 
         # --------------------------------------------------------
         # 2) Execute workflow via Orchestrator
         # --------------------------------------------------------
         orchestrator = Orchestrator()
-
-        result = orchestrator.run(
-            workflow_steps=[],        # workflow steps can be attached later
-            context=parameters,
-            workflow_name=workflow_name,
-            user_id=payload.get("user_id"),
-            simulate=simulate,
+        registry = get_action_registry()
+
+        # Compiled flow plan for this workflow (dict lookup); workflows
+        # without a flow file run no steps, as before
+        plan = registry.plan(workflow_name) if workflow_name else None
+        compiled = registry.flow(workflow_name) if plan is not None else None
+        if compiled is not None and compiled.missing_actions and not simulate:
+            # Would fail at the first unregistered step on every attempt
+            raise UnresolvedActionError(
+                f"Workflow '{workflow_name}' uses unregistered actions: {', '.join(compiled.missing_actions)}"
+            )
+        checkpoints = _checkpointer(audit_id, self.request.id) if plan is not None else None
+
+        # Runs on this worker's persistent loop; other tasks' workflows
+        # keep running there while this one awaits I/O
+        result = get_worker_loop().run(
+            orchestrator.run(
+                workflow_steps=plan or [],
+                actions=registry,
+                checkpoints=checkpoints,
+                audit_id=audit_id,
+                context=parameters,
+                workflow_name=workflow_name,
+                user_id=payload.get("user_id"),
+                simulate=simulate,
+                record_dlq=last_attempt,
+            ),
+            timeout=settings.WORKFLOW_LOOP_RUN_TIMEOUT_SECONDS,
         )
 
         # --------------------------------------------------------
-        # 3) Mark audit as successful
+        # 3) Mark audit as successful (or failed inside a step)
         # --------------------------------------------------------
-        if audit:
-            audit.status = "success"
-            audit.error_message = None
-            db.add(audit)
-            db.commit()
+        succeeded = result.get("success", True)
+        failed_step = (result.get("steps") or {}).get("failed_step")
+        if not succeeded and failed_step:
+            # Plan step failed → retry; completed steps resume from checkpoints
+            statuses = {s["id"]: s["status"] for s in result["steps"].get("steps", [])}
+            raise WorkflowStepError(
+                failed_step,
+                result["steps"].get("error") or "failed",
+                retryable=statuses.get(failed_step) != "unresolved",
+            )
+
+        if audit_id is not None:
+            audit_state.transition(
+                audit_id,
+                SUCCESS if succeeded else ERROR,
+                error=None if succeeded else result.get("context", {}).get("error"),
+            )
 
         logger.info("ORKO Trigger Worker SUCCESS: audit_id=%s", audit_id)
 
@@ -130,30 +222,28 @@ def run_workflow_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as exc:
         logger.exception("ORKO Trigger Worker ERROR: audit_id=%s", audit_id)
 
-        # --------------------------------------------------------
-        # DLQ (Trigger-level)
-        # --------------------------------------------------------
-        record_trigger_dlq(payload, str(exc), job_id=self.request.id)
+        retryable = _retryable(exc)
+        final = not retryable or last_attempt
 
         # --------------------------------------------------------
-        # Update audit log
+        # DLQ (Trigger-level): one entry per failed run, written once
+        # no retry is left. A failed plan step on the last attempt is
+        # already in the WorkflowDLQ (Orchestrator).
         # --------------------------------------------------------
-        if audit_id is not None:
-            audit = db.get(TriggerAudit, audit_id)
-            if audit:
-                audit.status = "error"
-                audit.error_message = str(exc)
-                db.add(audit)
-                db.commit()
+        if final and not (isinstance(exc, WorkflowStepError) and last_attempt):
+            record_trigger_dlq(payload, str(exc), job_id=self.request.id)
 
         # --------------------------------------------------------
-        # Retry
+        # Update audit log: back to queued while a retry is pending,
+        # error (terminal → DB write) once retries are exhausted or
+        # cannot help (unregistered actions)
         # --------------------------------------------------------
-        try:
-            raise self.retry(exc=exc)
-        except self.MaxRetriesExceededError:
-            logger.error("Max retries exceeded for audit_id=%s", audit_id)
+        if audit_id is not None:
+            audit_state.transition(audit_id, ERROR if final else QUEUED, error=str(exc))
 
+        if final:
+            if retryable:
+                logger.error("Max retries exceeded for audit_id=%s", audit_id)
             return {
                 "status": "failed",
                 "audit_id": audit_id,
@@ -161,8 +251,29 @@ def run_workflow_task(self, payload: Dict[str, Any]) -> Dict[str, Any]:
                 "error": str(exc),
             }
 
-    finally:
-        db.close()
+        # --------------------------------------------------------
+        # Retry
+        # --------------------------------------------------------
+        raise self.retry(exc=exc)
+
+
+def _retryable(exc: Exception) -> bool:
+    """Unregistered actions fail the same way on every attempt."""
+    if isinstance(exc, UnresolvedActionError):
+        return False
+    return not (isinstance(exc, WorkflowStepError) and not exc.retryable)
+
+
+def _checkpointer(audit_id: Any, task_id: Optional[str]) -> Optional[StepCheckpointer]:
+    """Checkpoints keyed by audit id (else Celery task id; both survive retries)."""
+    run_key = str(audit_id) if audit_id is not None else task_id
+    if not settings.WORKFLOW_CHECKPOINTS_ENABLED or not run_key:
+        return None
+    try:
+        return StepCheckpointer(run_key)
+    except Exception:
+        logger.exception("Checkpoint store unavailable; running without checkpoints")
+        return None
 
 
 # ------------------------------------------------------------
@@ -0,0 +1,179 @@
+# backend/app/services/workflow/worker_loop.py
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from backend.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerLoop:
+    """
+    One long-lived asyncio loop per worker process, on a daemon thread.
+
+    Celery tasks are synchronous: they submit the Orchestrator coroutine
+    here and block on the returned future. With a thread (or gevent) task
+    pool, many tasks of one worker are in flight together and their async
+    steps interleave on this loop; WORKFLOW_LOOP_CONCURRENCY caps how many
+    workflows run at once (the rest wait on the semaphore, in order).
+
+    With the prefork pool each child runs one task at a time, so this only
+    saves the per-task loop setup; concurrency needs
+    CELERY_WORKER_POOL="threads" and CELERY_WORKER_CONCURRENCY >= the loop
+    concurrency.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None) -> None:
+        self.concurrency = max(1, concurrency or settings.WORKFLOW_LOOP_CONCURRENCY)
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._thread = threading.Thread(target=self._serve, name="orko-workflow-loop", daemon=True)
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+
+        self._thread.start()
+        self._ready.wait()
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._loop.call_soon(self._ready.set)
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    # ---------------------------------------------------------
+    # Submission
+    # ---------------------------------------------------------
+    @property
+    def running(self) -> bool:
+        return self._loop.is_running()
+
+    def submit(self, coro: Awaitable[T]) -> "Future[T]":
+        """Schedules coro on the loop (thread-safe); returns a concurrent future."""
+        if not self.running:
+            raise RuntimeError("Worker loop is not running")
+        self._bump("submitted")
+        return asyncio.run_coroutine_threadsafe(self._guarded(coro), self._loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """submit() and wait. On timeout the run is cancelled on the loop."""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    async def _guarded(self, coro: Awaitable[T]) -> T:
+        assert self._semaphore is not None
+        async with self._semaphore:
+            with self._stats_lock:
+                self._stats["in_flight"] += 1
+                self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+            try:
+                result = await coro
+            except BaseException:
+                self._bump("failed")
+                raise
+            else:
+                self._bump("completed")
+                return result
+            finally:
+                self._bump("in_flight", -1)
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    def stop(self, timeout: float = 10.0) -> bool:
+        """
+        Waits up to `timeout` for in-flight runs, cancels the rest and stops
+        the loop. Returns True when nothing had to be cancelled.
+        """
+        if not self.running:
+            return True
+
+        async def _drain() -> bool:
+            current = asyncio.current_task()
+            pending = [t for t in asyncio.all_tasks() if t is not current]
+            if not pending:
+                return True
+            _done, still = await asyncio.wait(pending, timeout=timeout)
+            for task in still:
+                task.cancel()
+            if still:
+                await asyncio.gather(*still, return_exceptions=True)
+            return not still
+
+        try:
+            clean = asyncio.run_coroutine_threadsafe(_drain(), self._loop).result(timeout + 5)
+        except Exception:
+            logger.exception("Workflow loop drain failed")
+            clean = False
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        return clean
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def _bump(self, key: str, n: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            out: Dict[str, Any] = dict(self._stats)
+        out["concurrency"] = self.concurrency
+        out["running"] = self.running
+        return out
+
+
+# ------------------------------------------------------------
+# Process-wide loop (one per Celery worker process)
+# ------------------------------------------------------------
+_loop: Optional[WorkerLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+
+
+def get_worker_loop() -> WorkerLoop:
+    """Thread-safe and fork-aware: threads do not survive fork, so a forked
+    child starts its own loop."""
+    global _loop, _loop_pid
+
+    loop = _loop
+    if loop is not None and _loop_pid == os.getpid() and loop.running:
+        return loop
+
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid() or not _loop.running:
+            _loop = WorkerLoop()
+            _loop_pid = os.getpid()
+        return _loop
+
+
+def shutdown_worker_loop(timeout: float = 10.0) -> bool:
+    """Drains and stops this process's loop (worker shutdown)."""
+    global _loop, _loop_pid
+    with _loop_lock:
+        loop, _loop, _loop_pid = (_loop if _loop_pid == os.getpid() else None), None, None
+    return loop.stop(timeout) if loop is not None else True
@@ -1,7 +1,7 @@
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.parser_engine import get_parser_engine
 from backend.app.services.workflow.trigger_queue import TriggerQueue
 
-p = ParserEngine()
+p = get_parser_engine()
 
 commands = [
     "Generate a cashflow report for last quarter",
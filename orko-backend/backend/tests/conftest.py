@@ -2,6 +2,8 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from types import SimpleNamespace
+
 import pytest
 from fastapi.testclient import TestClient
 from faker import Faker
@@ -12,6 +14,9 @@ from backend.app.main import app
 # --- NEW IMPORTS FOR DB SETUP ---
 from backend.app.db.session import engine, SessionLocal
 from backend.app.db.models import Base, Org
+from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
+from backend.app.services.workflow import orchestrator as orchestrator_module
+from backend.app.services.workflow.orchestrator import Orchestrator
 
 
 # ============================================================
@@ -71,3 +76,21 @@ def fake_org_payload():
         "name": fake.company(),
         "status": "active"
     }
+
+
+# ============================================================
+# WORKFLOW FIXTURES
+# ============================================================
+
+@pytest.fixture
+def orchestrator_sinks(monkeypatch):
+    """
+    Replaces the Orchestrator's side effects (latency metrics, WorkflowDLQ,
+    workflow + step telemetry) with lists recording what they were given.
+    """
+    sinks = SimpleNamespace(latency=[], dlq=[], workflows=[], steps=[])
+    monkeypatch.setattr(Orchestrator, "_record_latency", lambda self, **kw: sinks.latency.append(kw))
+    monkeypatch.setattr(orchestrator_module, "record_dlq_failure", lambda **kw: sinks.dlq.append(kw))
+    monkeypatch.setattr(TelemetryCollector, "record_workflow", staticmethod(lambda **kw: sinks.workflows.append(kw)))
+    monkeypatch.setattr(TelemetryCollector, "record_workflow_steps", staticmethod(lambda **kw: sinks.steps.append(kw)))
+    return sinks
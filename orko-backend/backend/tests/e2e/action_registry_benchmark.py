@@ -0,0 +1,102 @@
+# backend/tests/e2e/action_registry_benchmark.py
+#
+# Cost of resolving a workflow name to a runnable plan + action callables:
+#   scan : what resolution costs without the registry — read + parse +
+#          compile flows/<name>.json and import_module/getattr per action
+#   cold : fresh ActionRegistry — compile_flows() for all flows, then the
+#          first resolution (action modules evicted from sys.modules, so
+#          the lazy import is really paid)
+#   warm : registry.plan(name) + resolve() per step — dict lookups only
+#
+#   python -m backend.tests.e2e.action_registry_benchmark --repeat 2000
+
+import argparse
+import importlib
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.app.services.workflow.actions_registry import BUILTIN_ACTIONS, ActionRegistry
+from backend.app.services.workflow.dag import FLOWS_DIR, load_flow
+
+FLOW = "log_file_notify"  # every action of this flow is registered
+
+
+def _scan_resolve(name: str) -> int:
+    plan = load_flow(FLOWS_DIR / f"{name}.json")
+    for step in plan.steps:
+        module_name, _, attr = BUILTIN_ACTIONS[step.action].partition(":")
+        getattr(importlib.import_module(module_name), attr)
+    return len(plan.steps)
+
+
+def _warm_resolve(registry: ActionRegistry, name: str) -> int:
+    plan = registry.plan(name)
+    for step in plan.steps:
+        registry.resolve(step.action)
+    return len(plan.steps)
+
+
+def _evict_action_modules() -> None:
+    for target in BUILTIN_ACTIONS.values():
+        sys.modules.pop(target.partition(":")[0], None)
+
+
+def _per_op_us(fn: Any, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def run_benchmark(repeat: int = 2000, cold_rounds: int = 20, flow: str = FLOW) -> Dict[str, Any]:
+    cold_compile: List[float] = []
+    cold_first: List[float] = []
+    for _ in range(cold_rounds):
+        _evict_action_modules()
+        t0 = time.perf_counter()
+        registry = ActionRegistry()
+        summary = registry.compile_flows()
+        t1 = time.perf_counter()
+        _warm_resolve(registry, flow)
+        t2 = time.perf_counter()
+        cold_compile.append((t1 - t0) * 1e6)
+        cold_first.append((t2 - t1) * 1e6)
+
+    scan_us = _per_op_us(lambda: _scan_resolve(flow), max(1, repeat // 10))
+    warm_us = _per_op_us(lambda: _warm_resolve(registry, flow), repeat)
+
+    return {
+        "meta": {"flow": flow, "flows_compiled": len(summary["flows"]), "repeat": repeat, "cold_rounds": cold_rounds},
+        "scan_us_per_resolve": round(scan_us, 2),
+        "cold": {
+            "compile_all_flows_us": round(sorted(cold_compile)[len(cold_compile) // 2], 2),
+            "first_resolve_with_imports_us": round(sorted(cold_first)[len(cold_first) // 2], 2),
+        },
+        "warm_us_per_resolve": round(warm_us, 3),
+        "warm_speedup_vs_scan": round(scan_us / warm_us, 1) if warm_us else None,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Workflow action/flow resolution: scan vs cold vs warm registry")
+    ap.add_argument("--repeat", type=int, default=2000)
+    ap.add_argument("--cold-rounds", type=int, default=20)
+    ap.add_argument("--out", type=Path, default=None)
+    args = ap.parse_args(argv)
+
+    # Cold rounds recompile the shipped flows; their missing-action warnings are known
+    logging.getLogger("backend.app.services.workflow.actions_registry").setLevel(logging.ERROR)
+    result = run_benchmark(repeat=args.repeat, cold_rounds=args.cold_rounds)
+    text = json.dumps(result, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+# backend/tests/e2e/async_parse_benchmark.py
+#
+# Requests/sec for ONE worker (one event loop) under concurrent load:
+#   before: async route calling the blocking ParserEngine.parse_command()
+#   after : async route awaiting ParserEngine.parse_command_async()
+#
+# The LLM is replaced by a fixed-latency fake so the numbers isolate the
+# event-loop effect (no OpenAI key / network needed). The parse cache is
+# disabled so every request pays the simulated model latency.
+#
+#   python -m backend.tests.e2e.async_parse_benchmark --requests 50 --llm-latency-ms 400
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from backend.app.services.parsing.parser_engine import get_parser_engine
+from backend.tests.e2e.performance_concurrency_test import TEST_COMMANDS
+
+
+_FAKE_OUTPUT = json.dumps(
+    {
+        "domain": "finance",
+        "action": "generate_cashflow_report",
+        "parameters": {"period": "quarterly", "region": "EMEA"},
+        "context": {"confidence": 0.95},
+    }
+)
+
+
+class _FakeSyncResponses:
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+
+    def create(self, **_kwargs: Any) -> Any:
+        time.sleep(self.latency_s)
+        return SimpleNamespace(output_text=_FAKE_OUTPUT)
+
+
+class _FakeAsyncResponses:
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+
+    async def create(self, **_kwargs: Any) -> Any:
+        await asyncio.sleep(self.latency_s)
+        return SimpleNamespace(output_text=_FAKE_OUTPUT)
+
+
+def _install_fake_llm(engine, latency_ms: float) -> None:
+    latency_s = latency_ms / 1000.0
+    engine._ai_parser.client = SimpleNamespace(responses=_FakeSyncResponses(latency_s))
+    engine._ai_parser._async_client = SimpleNamespace(responses=_FakeAsyncResponses(latency_s))
+    engine._cache.enabled = False
+
+
+async def _run(mode: str, requests: int) -> Dict[str, Any]:
+    engine = get_parser_engine()
+
+    async def handler(cmd: str) -> float:
+        t0 = time.perf_counter()
+        ctx = {"org_id": "perf-org", "source": "perf-test", "channel": "cli"}
+        if mode == "sync":
+            engine.parse_command(cmd, context=ctx)
+        else:
+            await engine.parse_command_async(cmd, context=ctx)
+        return (time.perf_counter() - t0) * 1000.0
+
+    t0 = time.perf_counter()
+    latencies: List[float] = await asyncio.gather(
+        *(handler(TEST_COMMANDS[i % len(TEST_COMMANDS)]) for i in range(requests))
+    )
+    wall_s = time.perf_counter() - t0
+
+    latencies_sorted = sorted(latencies)
+    return {
+        "mode": mode,
+        "requests": requests,
+        "wall_s": round(wall_s, 3),
+        "rps_per_worker": round(requests / wall_s, 2) if wall_s else 0.0,
+        "p50_ms": round(latencies_sorted[len(latencies_sorted) // 2], 1),
+        "p95_ms": round(latencies_sorted[int(0.95 * (len(latencies_sorted) - 1))], 1),
+    }
+
+
+def run_async_parse_benchmark(requests: int = 50, llm_latency_ms: float = 400.0) -> Dict[str, Any]:
+    _install_fake_llm(get_parser_engine(), llm_latency_ms)
+
+    before = asyncio.run(_run("sync", requests))
+    after = asyncio.run(_run("async", requests))
+
+    return {
+        "llm_latency_ms": llm_latency_ms,
+        "before": before,
+        "after": after,
+        "speedup": round(after["rps_per_worker"] / (before["rps_per_worker"] or 1.0), 2),
+    }
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="ORKO sync vs async parse throughput")
+    ap.add_argument("--requests", type=int, default=50)
+    ap.add_argument("--llm-latency-ms", type=float, default=400.0)
+    args = ap.parse_args()
+
+    print(json.dumps(run_async_parse_benchmark(args.requests, args.llm_latency_ms), indent=2))
@@ -0,0 +1,117 @@
+# backend/tests/e2e/masking_benchmark.py
+#
+# PII masking cost on recorded parser telemetry (logs/telemetry/parser.jsonl):
+#   before: four sequential re.sub passes per string + recursive
+#           mask_reasoning (the pre-fusion implementation, copied below)
+#   after : fused single-pass masking.mask_many over the same records,
+#           cold (string memo cleared before each run) and warm
+#
+# Also checks that both produce the same output for every record.
+#
+#   python -m backend.tests.e2e.masking_benchmark --repeat 5
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from backend.app.services.parsing import masking
+from backend.app.services.parsing.masking import EMAIL_RE, ID_RE, NAME_RE, PHONE_RE, mask_many
+
+TELEMETRY_PATH = Path("backend/logs/telemetry/parser.jsonl")
+
+
+# ------------------------------------------------------------
+# Pre-fusion implementation (reference)
+# ------------------------------------------------------------
+
+def legacy_mask_pii(text: Any) -> Any:
+    if not isinstance(text, str):
+        return text
+    masked = EMAIL_RE.sub("[EMAIL_MASKED]", text)
+    masked = PHONE_RE.sub("[PHONE_MASKED]", masked)
+    masked = ID_RE.sub("[ID_MASKED]", masked)
+    return NAME_RE.sub("[NAME_MASKED]", masked)
+
+
+def legacy_mask_reasoning(reasoning: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(reasoning, dict):
+        return reasoning
+    masked: Dict[str, Any] = {}
+    for key, value in reasoning.items():
+        if isinstance(value, str):
+            masked[key] = legacy_mask_pii(value)
+        elif isinstance(value, dict):
+            masked[key] = legacy_mask_reasoning(value)
+        elif isinstance(value, list):
+            masked[key] = [
+                legacy_mask_pii(i) if isinstance(i, str)
+                else legacy_mask_reasoning(i) if isinstance(i, dict)
+                else i
+                for i in value
+            ]
+        else:
+            masked[key] = value
+    return masked
+
+
+# ------------------------------------------------------------
+# Benchmark
+# ------------------------------------------------------------
+
+def load_records(path: Path = TELEMETRY_PATH) -> List[Dict[str, Any]]:
+    records = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run_masking_benchmark(repeat: int = 5) -> Dict[str, Any]:
+    records = load_records()
+    n = len(records)
+
+    legacy_s = _best_of(lambda: [legacy_mask_reasoning(r) for r in records], repeat)
+
+    # Cold: empty string memo (first pass over new data)
+    masking._mask_str.cache_clear()
+    cold_s = _best_of(lambda: (masking._mask_str.cache_clear(), mask_many(records)), repeat)
+    # Warm: memo populated by the previous pass (steady state)
+    fused_s = _best_of(lambda: mask_many(records), repeat)
+
+    mismatches = sum(
+        1 for a, b in zip((legacy_mask_reasoning(r) for r in records), mask_many(records)) if a != b
+    )
+
+    return {
+        "records": n,
+        "legacy_us_per_record": round(legacy_s / n * 1e6, 2),
+        "fused_cold_us_per_record": round(cold_s / n * 1e6, 2),
+        "fused_us_per_record": round(fused_s / n * 1e6, 2),
+        "speedup_cold": round(legacy_s / cold_s, 2) if cold_s else None,
+        "speedup": round(legacy_s / fused_s, 2) if fused_s else None,
+        "mismatched_records": mismatches,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sequential vs fused PII masking on recorded telemetry")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N timing runs")
+    args = parser.parse_args()
+    print(json.dumps(run_masking_benchmark(args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+# backend/tests/e2e/parser_stage_benchmark.py
+#
+# Per-stage microbenchmarks for the non-LLM part of parsing, replayed from
+# recorded parser telemetry (logs/telemetry/parser.jsonl):
+#
+#   context_merge        ParserEngine._merge (fallback decision + context merge)
+#   canonicalize         canonicalizer.canonicalize
+#   risk_flags           ParserEngine._flag_risky_actions (destructive verbs / risk tiers)
+#   apply_guardrails     parser_engine.apply_guardrails
+#   confidence           ParserEngine._normalize_confidence
+#   finalize_total       ParserEngine._finalize (all of the above + prompt version)
+#   mask_reasoning       masking.mask_reasoning over the finalized parse
+#   telemetry_emit       TelemetryCollector.record_parser (into a temp dir)
+#   intent_mapper_map_v7 IntentMapper.map_v7 (telemetry into a temp dir)
+#   slot_filling_fill    SlotFillingEngine.fill (telemetry into a temp dir)
+#
+# Each stage is timed on its own: the inputs of every stage are the outputs
+# of the previous one, computed up front, and deep-copied before each round
+# (stages mutate their input). Reported per stage:
+#   ns_per_op              best round, total time / records
+#   alloc_bytes_per_op     mean tracemalloc peak above the start of the op
+#   retained_bytes_per_op  mean tracemalloc growth after the op
+#
+#   python -m backend.tests.e2e.parser_stage_benchmark run --rounds 5 [--out current.json]
+#   python -m backend.tests.e2e.parser_stage_benchmark run --save-baseline
+#   python -m backend.tests.e2e.parser_stage_benchmark compare --threshold 0.2 [--current current.json]
+#
+# compare exits with status 1 when any stage regressed by more than the
+# threshold against the baseline.
+
+import argparse
+import contextlib
+import copy
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from backend.app.services.parser.intent_mapper import IntentMapper
+from backend.app.services.parser.slot_filling import SlotFillingEngine
+from backend.app.services.parsing.canonicalizer import canonicalize
+from backend.app.services.parsing.config_snapshot import get_config_snapshot
+from backend.app.services.parsing.masking import mask_reasoning
+from backend.app.services.parsing.parser_engine import ParserEngine, apply_guardrails
+from backend.app.services.telemetry import telemetry_collector
+from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
+
+TELEMETRY_PATH = Path("backend/logs/telemetry/parser.jsonl")
+BASELINE_PATH = Path("backend/tests/e2e/baselines/parser_stages.json")
+
+STAGES = (
+    "context_merge",
+    "canonicalize",
+    "risk_flags",
+    "apply_guardrails",
+    "confidence",
+    "finalize_total",
+    "mask_reasoning",
+    "telemetry_emit",
+    "intent_mapper_map_v7",
+    "slot_filling_fill",
+)
+
+GATED_METRICS = ("ns_per_op", "alloc_bytes_per_op")
+
+# Sub-microsecond stages jitter by more than 20% run to run; ignore
+# regressions smaller than these absolute deltas.
+MIN_DELTA = {"ns_per_op": 100, "alloc_bytes_per_op": 64}
+
+
+# ------------------------------------------------------------
+# Inputs
+# ------------------------------------------------------------
+
+def load_records(path: Path = TELEMETRY_PATH, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    records = []
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            rec = json.loads(line)
+            if isinstance(rec.get("parsed"), dict) and rec.get("raw_command"):
+                records.append(rec)
+            if limit and len(records) >= limit:
+                break
+    return records
+
+
+def _ai_output(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """AIParser-shaped output reconstructed from a recorded final parse."""
+    ctx = parsed.get("context") or {}
+    ai_ctx: Dict[str, Any] = {"confidence": ctx.get("confidence", 1.0)}
+    if "guardrail_flags" in ctx:
+        ai_ctx["guardrail_flags"] = list(ctx.get("guardrail_flags") or [])
+    if "reasoning_trace" in ctx:
+        ai_ctx["reasoning_trace"] = ctx["reasoning_trace"]
+    return {
+        "domain": parsed.get("domain"),
+        "action": parsed.get("action"),
+        "parameters": parsed.get("parameters") or {},
+        "context": ai_ctx,
+    }
+
+
+@contextlib.contextmanager
+def _telemetry_to_tempdir() -> Iterator[Path]:
+    """Redirects TelemetryCollector writes so benchmarks never touch logs/."""
+    original = telemetry_collector.LOG_PATH
+    with tempfile.TemporaryDirectory(prefix="orko-stage-bench-") as tmp:
+        telemetry_collector.LOG_PATH = Path(tmp)
+        try:
+            yield Path(tmp)
+        finally:
+            telemetry_collector.LOG_PATH = original
+
+
+def build_stage_inputs(
+    records: Sequence[Dict[str, Any]],
+) -> Dict[str, Tuple[Callable[..., Any], List[Tuple[Any, ...]]]]:
+    """
+    Runs the pipeline once per record and returns, per stage, the callable
+    and its argument tuples (each stage fed by the previous stage's output).
+    """
+    engine = ParserEngine()
+    snap = get_config_snapshot()
+    table = snap.canonical_table
+    mapper = IntentMapper()
+    slots = SlotFillingEngine()
+    intent_keys = sorted(mapper.mapping)
+
+    stages: Dict[str, List[Tuple[Any, ...]]] = {name: [] for name in STAGES}
+
+    for i, rec in enumerate(records):
+        text = rec["raw_command"]
+        user_ctx = {"user_id": (rec["parsed"].get("context") or {}).get("user_id", "bench")}
+        base_context = ParserEngine._base_context(user_ctx, "general")
+        ai_parsed = _ai_output(rec["parsed"])
+
+        stages["context_merge"].append((text, "general", base_context, ai_parsed, None))
+        stages["finalize_total"].append((text, "general", base_context, ai_parsed, None))
+
+        parsed = engine._merge(text, "general", copy.deepcopy(base_context), copy.deepcopy(ai_parsed), None)
+        stages["canonicalize"].append((copy.deepcopy(parsed), text, table))
+
+        parsed = canonicalize(parsed, text, table=table)
+        stages["risk_flags"].append((copy.deepcopy(parsed), snap))
+
+        ParserEngine._flag_risky_actions(parsed, snap)
+        stages["apply_guardrails"].append((copy.deepcopy(parsed),))
+
+        parsed = apply_guardrails(parsed, snapshot=snap)
+        stages["confidence"].append((copy.deepcopy(parsed),))
+
+        final = engine._finalize(text, "general", copy.deepcopy(base_context), copy.deepcopy(ai_parsed), None)
+        stages["mask_reasoning"].append((final,))
+        stages["telemetry_emit"].append((final, text))
+
+        # IntentMapper reads .name / .domain / .action / .parameters / .context;
+        # route every record to a configured mapping entry so the full
+        # slot-fill + routing path runs.
+        key = intent_keys[i % len(intent_keys)]
+        cfg = mapper.mapping[key]
+        intent = SimpleNamespace(
+            name=key,
+            domain=final.get("domain"),
+            action=final.get("action"),
+            parameters=final.get("parameters") or {},
+            context={**final.get("context", {}), "risk_level": final.get("risk_level")},
+        )
+        stages["intent_mapper_map_v7"].append((intent, base_context))
+        template = {"required_parameters": cfg.get("required_params", []), "defaults": cfg.get("defaults", {})}
+        stages["slot_filling_fill"].append((template, final, base_context))
+
+    fns: Dict[str, Callable[..., Any]] = {
+        "context_merge": engine._merge,
+        "canonicalize": lambda parsed, text, tbl: canonicalize(parsed, text, table=tbl),
+        "risk_flags": ParserEngine._flag_risky_actions,
+        "apply_guardrails": lambda parsed: apply_guardrails(parsed, snapshot=snap),
+        "confidence": ParserEngine._normalize_confidence,
+        "finalize_total": engine._finalize,
+        "mask_reasoning": mask_reasoning,
+        "telemetry_emit": TelemetryCollector.record_parser,
+        "intent_mapper_map_v7": mapper.map_v7,
+        "slot_filling_fill": slots.fill,
+    }
+    return {name: (fns[name], stages[name]) for name in STAGES}
+
+
+# ------------------------------------------------------------
+# Measurement
+# ------------------------------------------------------------
+
+def _fresh(args_list: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    """Copies the mutable (dict / list) arguments; snapshots / tables are shared."""
+    return [
+        tuple(copy.deepcopy(a) if isinstance(a, (dict, list)) else a for a in args)
+        for args in args_list
+    ]
+
+def _time_stage(fn: Callable[..., Any], args_list: List[Tuple[Any, ...]], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        batch = _fresh(args_list)
+        gc.collect()
+        gc.disable()
+        try:
+            t0 = time.perf_counter_ns()
+            for args in batch:
+                fn(*args)
+            best = min(best, time.perf_counter_ns() - t0)
+        finally:
+            gc.enable()
+    return best / max(len(args_list), 1)
+
+
+def _alloc_stage(fn: Callable[..., Any], args_list: List[Tuple[Any, ...]]) -> Tuple[float, float]:
+    batch = _fresh(args_list)
+    peak_total = 0
+    retained_total = 0
+    results = []
+    tracemalloc.start()
+    try:
+        for args in batch:
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            results.append(fn(*args))  # keep outputs alive → retained bytes
+            end, peak = tracemalloc.get_traced_memory()
+            peak_total += peak - start
+            retained_total += max(0, end - start)
+    finally:
+        tracemalloc.stop()
+    n = max(len(batch), 1)
+    return peak_total / n, retained_total / n
+
+
+def run_stage_benchmark(
+    telemetry_path: Path = TELEMETRY_PATH,
+    rounds: int = 5,
+    limit: Optional[int] = None,
+    stages: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    records = load_records(telemetry_path, limit)
+    selected = list(stages or STAGES)
+
+    with _telemetry_to_tempdir():
+        inputs = build_stage_inputs(records)
+        results: Dict[str, Dict[str, Any]] = {}
+        for name in selected:
+            fn, args_list = inputs[name]
+            # Warm-up pass: memo caches, lazy config loads
+            for args in _fresh(args_list[:50]):
+                fn(*args)
+            ns = _time_stage(fn, args_list, rounds)
+            alloc, retained = _alloc_stage(fn, args_list)
+            results[name] = {
+                "ns_per_op": round(ns),
+                "alloc_bytes_per_op": round(alloc),
+                "retained_bytes_per_op": round(retained),
+            }
+
+    return {
+        "meta": {
+            "records": len(records),
+            "rounds": rounds,
+            "telemetry": str(telemetry_path),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "stages": results,
+    }
+
+
+# ------------------------------------------------------------
+# Baselines
+# ------------------------------------------------------------
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = 0.2,
+) -> List[Dict[str, Any]]:
+    """
+    Returns one row per stage/metric that regressed by more than
+    `threshold` (relative) and MIN_DELTA (absolute) against the baseline.
+    Stages missing from either side are skipped.
+    """
+    regressions: List[Dict[str, Any]] = []
+    for stage, cur in current.get("stages", {}).items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base:
+            continue
+        for metric in GATED_METRICS:
+            b, c = base.get(metric), cur.get(metric)
+            if not b or c is None:
+                continue
+            if c - b > MIN_DELTA[metric] and c > b * (1.0 + threshold):
+                regressions.append(
+                    {
+                        "stage": stage,
+                        "metric": metric,
+                        "baseline": b,
+                        "current": c,
+                        "change": round(c / b - 1.0, 3),
+                    }
+                )
+    return regressions
+
+
+def _print_table(baseline: Optional[Dict[str, Any]], current: Dict[str, Any]) -> None:
+    print(f"{'stage':22s} {'ns/op':>10s} {'base':>10s} {'Δ':>8s} {'alloc B/op':>11s} {'base':>10s}")
+    for stage, cur in current["stages"].items():
+        base = (baseline or {}).get("stages", {}).get(stage, {})
+        b_ns = base.get("ns_per_op")
+        delta = f"{cur['ns_per_op'] / b_ns - 1.0:+.1%}" if b_ns else "-"
+        print(
+            f"{stage:22s} {cur['ns_per_op']:>10d} {b_ns if b_ns is not None else '-':>10} {delta:>8s} "
+            f"{cur['alloc_bytes_per_op']:>11d} {base.get('alloc_bytes_per_op', '-'):>10}"
+        )
+
+
+def _write(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-stage parser microbenchmarks with regression gate")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_args(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--telemetry", type=Path, default=TELEMETRY_PATH)
+        p.add_argument("--rounds", type=int, default=5, help="Best-of-N timing rounds")
+        p.add_argument("--limit", type=int, default=None, help="Use only the first N records")
+        p.add_argument("--stages", nargs="+", choices=STAGES, default=None)
+
+    run_p = sub.add_parser("run", help="Run the suite and print / save results")
+    add_run_args(run_p)
+    run_p.add_argument("--out", type=Path, default=None, help="Write results JSON here")
+    run_p.add_argument("--save-baseline", action="store_true", help=f"Write results to {BASELINE_PATH}")
+
+    cmp_p = sub.add_parser("compare", help="Compare against the baseline; exit 1 on regression")
+    add_run_args(cmp_p)
+    cmp_p.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    cmp_p.add_argument("--current", type=Path, default=None, help="Results JSON (default: run the suite now)")
+    cmp_p.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown (0.2 = 20%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run_stage_benchmark(args.telemetry, args.rounds, args.limit, args.stages)
+        if args.out:
+            _write(args.out, result)
+        if args.save_baseline:
+            _write(BASELINE_PATH, result)
+        baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else None
+        _print_table(baseline, result)
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    if args.current:
+        current = json.loads(args.current.read_text())
+    else:
+        current = run_stage_benchmark(args.telemetry, args.rounds, args.limit, args.stages)
+
+    _print_table(baseline, current)
+    regressions = compare_results(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}:")
+        for r in regressions:
+            print(f"  {r['stage']}.{r['metric']}: {r['baseline']} → {r['current']} ({r['change']:+.1%})")
+        return 1
+    print(f"\nNo regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
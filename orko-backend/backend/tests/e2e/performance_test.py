@@ -7,6 +7,12 @@ Run:
   python -m backend.tests.e2e.performance_test -v v2
   python -m backend.tests.e2e.performance_test -v v7
   python -m backend.tests.e2e.performance_test -v all
+
+Offline (no OpenAI access), see parsing/llm_backend.py:
+  python -m backend.tests.e2e.performance_test -v v7 --llm-backend stub
+  python -m backend.tests.e2e.performance_test -v v7 --llm-backend record --cassette perf.jsonl
+  python -m backend.tests.e2e.performance_test -v v7 --llm-backend replay --cassette perf.jsonl \
+      --replay-latency lognormal:600,0.4
 """
 
 import argparse
@@ -14,7 +20,11 @@ import statistics
 import time
 from typing import Dict, List, Tuple
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.llm_backend import (
+    add_llm_backend_arguments,
+    apply_llm_backend_arguments,
+)
+from backend.app.services.parsing.parser_engine import get_parser_engine
 from backend.app.services.workflow.trigger_queue import TriggerQueue
 from backend.app.services.workflow.orchestrator import Orchestrator
 
@@ -84,7 +94,7 @@ def percentile(values: List[float], p: float) -> float:
 # v1 — Parser-only latency
 # ------------------------------------------------------------
 def run_v1() -> Dict[str, float]:
-    parser = ParserEngine()
+    parser = get_parser_engine()
     samples = []
 
     for cmd in COMMANDS:
@@ -108,7 +118,7 @@ def run_v1() -> Dict[str, float]:
 # v2 — Parser + Trigger Queue latency
 # ------------------------------------------------------------
 def run_v2() -> Dict[str, float]:
-    parser = ParserEngine()
+    parser = get_parser_engine()
     samples = []
 
     for cmd in COMMANDS:
@@ -134,7 +144,7 @@ def run_v2() -> Dict[str, float]:
 # v3 — Parser + Orchestrator simulation
 # ------------------------------------------------------------
 def run_v3() -> Dict[str, float]:
-    parser = ParserEngine()
+    parser = get_parser_engine()
     orch = Orchestrator()
     samples = []
 
@@ -160,7 +170,7 @@ def run_v3() -> Dict[str, float]:
 # v4 — Domain traffic simulation (just counts)
 # ------------------------------------------------------------
 def run_v4():
-    parser = ParserEngine()
+    parser = get_parser_engine()
     domain_counts = {}
 
     for cmd in COMMANDS:
@@ -175,7 +185,7 @@ def run_v4():
 # v5 — Stress test (10 rapid cycles)
 # ------------------------------------------------------------
 def run_v5():
-    parser = ParserEngine()
+    parser = get_parser_engine()
     samples = []
 
     for _ in range(10):
@@ -196,7 +206,7 @@ def run_v5():
 # v6 — Extended statistics
 # ------------------------------------------------------------
 def run_v6():
-    parser = ParserEngine()
+    parser = get_parser_engine()
     samples = []
 
     for cmd in COMMANDS:
@@ -221,7 +231,7 @@ def run_v6():
 # v7 — Full commercial-grade performance suite
 # ------------------------------------------------------------
 def run_v7():
-    parser = ParserEngine()
+    parser = get_parser_engine()
     samples = []
 
     for cmd in COMMANDS:
@@ -250,7 +260,9 @@ def run_v7():
 def cli():
     parser = argparse.ArgumentParser()
     parser.add_argument("-v", "--version", required=True, choices=["v1","v2","v3","v4","v5","v6","v7","all"])
+    add_llm_backend_arguments(parser)
     args = parser.parse_args()
+    apply_llm_backend_arguments(args)
 
     if args.version == "v1":
         print(run_v1())
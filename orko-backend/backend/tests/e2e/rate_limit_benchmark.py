@@ -0,0 +1,195 @@
+# backend/tests/e2e/rate_limit_benchmark.py
+#
+# Trigger rate limiter: Redis call rate and added latency with and without
+# local pre-admission (leased token blocks + cached denials).
+#
+# Redis is simulated: SimulatedGcraScript is a line-by-line Python port of
+# trigger_rate_limiter.GCRA_LUA with a configurable round-trip time, so the
+# benchmark runs without a Redis server. The workload is open-loop over
+# wall-clock time: a heavy tenant well over quota, a steady one under it,
+# and many light users.
+#
+#   python -m backend.tests.e2e.rate_limit_benchmark --lease-sizes 0,8,32 --rtt-ms 0.5
+
+import argparse
+import json
+import math
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.app.core.config import settings
+from backend.app.services.rate_limit.local_admission import LocalAdmission
+from backend.app.services.rate_limit.trigger_rate_limiter import RateLimitExceeded, TriggerRateLimiter
+
+
+# ------------------------------------------------------------
+# Simulated Redis (GCRA_LUA semantics)
+# ------------------------------------------------------------
+
+class SimulatedGcraScript:
+    def __init__(self, clock_ms: Callable[[], int], rtt_ms: float = 0.0) -> None:
+        self._clock_ms = clock_ms
+        self._rtt_s = rtt_ms / 1000.0
+        self.store: Dict[str, int] = {}
+        self.calls = 0
+
+    def __call__(self, keys: List[str], args: List[int]) -> List[int]:
+        self.calls += 1
+        if self._rtt_s:
+            time.sleep(self._rtt_s)
+
+        now = self._clock_ms()
+        want = int(args[0])
+        retry_after, limited_by, available = 0, 0, -1
+        tats: List[int] = []
+
+        for i, key in enumerate(keys, start=1):
+            interval, window = int(args[2 * i - 1]), int(args[2 * i])
+            tat = max(self.store.get(key, now), now)
+            tats.append(tat)
+            free = math.floor((window - (tat - now)) / interval)
+            if free < 1:
+                wait = tat + interval - now - window
+                if wait > retry_after or limited_by == 0:
+                    retry_after, limited_by = wait, i
+            if available < 0 or free < available:
+                available = free
+
+        if available < 1:
+            return [0, 0, retry_after, limited_by]
+
+        granted = want if want > 1 and available >= 2 * want else 1
+        for i, key in enumerate(keys, start=1):
+            self.store[key] = tats[i - 1] + granted * int(args[2 * i - 1])
+        return [granted, available - granted, 0, 0]
+
+
+class SimulatedRedis:
+    def __init__(self, script: SimulatedGcraScript) -> None:
+        self.script = script
+
+    def register_script(self, _source: str) -> SimulatedGcraScript:
+        return self.script
+
+
+def wall_clock_ms() -> int:
+    return int(time.time() * 1000)
+
+
+# ------------------------------------------------------------
+# Workload
+# ------------------------------------------------------------
+
+def build_schedule(duration_s: float, limit_per_s: float, seed: int = 0) -> List[Tuple[float, str, str, str]]:
+    """(offset_s, tenant class, user_id, org_id), Poisson arrivals per tenant."""
+    rng = random.Random(seed)
+    tenants = [("heavy", "heavy-user", "org-heavy", 3.0 * limit_per_s)]
+    tenants.append(("steady", "steady-user", "org-steady", 0.5 * limit_per_s))
+    tenants += [("light", f"light-{i}", "org-light", 0.02 * limit_per_s) for i in range(20)]
+
+    events: List[Tuple[float, str, str, str]] = []
+    for cls, user_id, org_id, rate in tenants:
+        t = rng.expovariate(rate)
+        while t < duration_s:
+            events.append((t, cls, user_id, org_id))
+            t += rng.expovariate(rate)
+    events.sort()
+    return events
+
+
+def run_workload(
+    lease_size: int,
+    schedule: List[Tuple[float, str, str, str]],
+    rtt_ms: float,
+) -> Dict[str, Any]:
+    script = SimulatedGcraScript(wall_clock_ms, rtt_ms=rtt_ms)
+    local = LocalAdmission(lease_size=lease_size)
+    limiter = TriggerRateLimiter(client=SimulatedRedis(script), local=local)
+
+    admitted: Dict[str, int] = {}
+    denied: Dict[str, int] = {}
+    start = time.perf_counter()
+    for offset, cls, user_id, org_id in schedule:
+        delay = start + offset - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            limiter.check_and_increment(user_id=user_id, org_id=org_id)
+            admitted[cls] = admitted.get(cls, 0) + 1
+        except RateLimitExceeded:
+            denied[cls] = denied.get(cls, 0) + 1
+
+    stats = local.stats()
+    return {
+        "lease_size": lease_size,
+        "requests": stats["requests"],
+        "redis_calls": script.calls,
+        "redis_call_rate": stats["redis_call_rate"],
+        "added_latency_ms": stats["added_latency_ms"],
+        "local_admits": stats["local_admits"],
+        "local_denies": stats["local_denies"],
+        "lease_tokens_expired": stats["lease_tokens_expired"],
+        "admitted": dict(sorted(admitted.items())),
+        "denied": dict(sorted(denied.items())),
+    }
+
+
+def run_benchmark(
+    lease_sizes: List[int],
+    duration_s: float = 3.0,
+    limit: int = 100,
+    window_seconds: int = 1,
+    rtt_ms: float = 0.5,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    saved = (settings.RATE_LIMIT_PER_MINUTE, settings.RATE_LIMIT_WINDOW_SECONDS)
+    settings.RATE_LIMIT_PER_MINUTE, settings.RATE_LIMIT_WINDOW_SECONDS = limit, window_seconds
+    try:
+        schedule = build_schedule(duration_s, limit / window_seconds, seed=seed)
+        runs = [run_workload(size, schedule, rtt_ms) for size in lease_sizes]
+    finally:
+        settings.RATE_LIMIT_PER_MINUTE, settings.RATE_LIMIT_WINDOW_SECONDS = saved
+
+    return {
+        "meta": {
+            "duration_s": duration_s,
+            "limit": limit,
+            "window_seconds": window_seconds,
+            "rtt_ms": rtt_ms,
+            "events": len(schedule),
+            "seed": seed,
+        },
+        "runs": runs,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Trigger rate limiter local pre-admission benchmark")
+    ap.add_argument("--lease-sizes", default="0,8,32", help="comma-separated; 0 = Redis per request")
+    ap.add_argument("--duration", type=float, default=3.0, help="seconds of open-loop traffic per run")
+    ap.add_argument("--limit", type=int, default=100, help="requests per window")
+    ap.add_argument("--window-seconds", type=int, default=1)
+    ap.add_argument("--rtt-ms", type=float, default=0.5, help="simulated Redis round trip")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", type=Path, default=None)
+    args = ap.parse_args(argv)
+
+    result = run_benchmark(
+        [int(s) for s in args.lease_sizes.split(",") if s.strip()],
+        duration_s=args.duration,
+        limit=args.limit,
+        window_seconds=args.window_seconds,
+        rtt_ms=args.rtt_ms,
+        seed=args.seed,
+    )
+    text = json.dumps(result, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,15 @@
 # backend/tests/e2e/robustness_test.py
+#
+#   python -m backend.tests.e2e.robustness_test [--llm-backend stub|replay|record|live]
 
+import argparse
 from typing import Dict, List
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.llm_backend import (
+    add_llm_backend_arguments,
+    apply_llm_backend_arguments,
+)
+from backend.app.services.parsing.parser_engine import get_parser_engine
 
 
 ROBUST_COMMANDS: List[str] = [
@@ -24,7 +31,7 @@ ROBUST_COMMANDS: List[str] = [
 
 
 def run_robustness_smoke() -> Dict[str, bool]:
-    parser = ParserEngine()
+    parser = get_parser_engine()
     results: Dict[str, bool] = {}
 
     for cmd in ROBUST_COMMANDS:
@@ -40,6 +47,10 @@ def run_robustness_smoke() -> Dict[str, bool]:
 
 
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="ORKO parser robustness smoke test")
+    add_llm_backend_arguments(ap)
+    apply_llm_backend_arguments(ap.parse_args())
+
     res = run_robustness_smoke()
     for cmd, ok in res.items():
         status = "OK" if ok else "FAIL"
@@ -1,12 +1,12 @@
 # backend/tests/e2e/test_failure_cases.py
 
 from backend.app.services.workflow.trigger_queue import TriggerQueue
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.parser_engine import get_parser_engine
 from backend.app.services.workflow.orchestrator import Orchestrator
 
 
 def test_failure_scenarios():
-    parser = ParserEngine()
+    parser = get_parser_engine()
     orchestrator = Orchestrator()
 
     failure_jobs = []
@@ -4,7 +4,7 @@ from pathlib import Path
 import yaml
 import time
 
-from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.parser_engine import get_parser_engine
 from backend.app.services.workflow.orchestrator import Orchestrator
 from backend.app.services.workflow.trigger_queue import TriggerQueue
 
@@ -16,7 +16,7 @@ def run_e2e_tests():
     with open(E2E_PATH, "r", encoding="utf-8") as f:
         data = yaml.safe_load(f)
 
-    parser = ParserEngine()
+    parser = get_parser_engine()
     orchestrator = Orchestrator()
 
     results = []
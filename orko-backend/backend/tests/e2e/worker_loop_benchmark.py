@@ -0,0 +1,126 @@
+# backend/tests/e2e/worker_loop_benchmark.py
+#
+# Workflow throughput of ONE Celery worker process:
+#   per_task : prefork model — one task at a time, each Orchestrator.run
+#              driven by its own asyncio.run() (fresh loop per task)
+#   loop_cN  : persistent WorkerLoop with concurrency N, fed by N task
+#              threads (CELERY_WORKER_POOL="threads")
+#
+# Workflows are I/O bound: --steps async steps of --io-ms each
+# (asyncio.sleep stands in for HTTP / DB awaits). WorkflowMetrics writes
+# are skipped and telemetry goes to a temp dir, so only scheduling is
+# measured.
+#
+#   python -m backend.tests.e2e.worker_loop_benchmark --tasks 200 --concurrency 1,8,32
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from backend.app.services.workflow.orchestrator import Orchestrator
+from backend.app.services.workflow.worker_loop import WorkerLoop
+from backend.tests.e2e.parser_stage_benchmark import _telemetry_to_tempdir
+
+
+class _BenchOrchestrator(Orchestrator):
+    def _record_latency(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+
+def _io_steps(steps: int, io_ms: float) -> List[Any]:
+    async def io_step(context: Dict[str, Any]) -> None:
+        await asyncio.sleep(io_ms / 1000.0)
+        context["steps_done"] = context.get("steps_done", 0) + 1
+
+    return [io_step] * steps
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))]
+
+
+def _summary(name: str, latencies: List[float], elapsed: float, **extra: Any) -> Dict[str, Any]:
+    return {
+        "model": name,
+        "tasks": len(latencies),
+        "elapsed_s": round(elapsed, 4),
+        "throughput_per_s": round(len(latencies) / elapsed, 2),
+        "latency_ms": {
+            "p50": round(_percentile(latencies, 0.50), 2),
+            "p99": round(_percentile(latencies, 0.99), 2),
+        },
+        **extra,
+    }
+
+
+def run_per_task(tasks: int, steps: int, io_ms: float) -> Dict[str, Any]:
+    orchestrator = _BenchOrchestrator()
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for _ in range(tasks):
+        t0 = time.perf_counter()
+        result = asyncio.run(orchestrator.run(_io_steps(steps, io_ms), context={}))
+        assert result["success"], result
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+    return _summary("per_task", latencies, time.perf_counter() - start)
+
+
+def run_loop(tasks: int, steps: int, io_ms: float, concurrency: int) -> Dict[str, Any]:
+    orchestrator = _BenchOrchestrator()
+    loop = WorkerLoop(concurrency=concurrency)
+
+    def task() -> float:
+        t0 = time.perf_counter()
+        result = loop.run(orchestrator.run(_io_steps(steps, io_ms), context={}))
+        assert result["success"], result
+        return (time.perf_counter() - t0) * 1000.0
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = list(pool.map(lambda _i: task(), range(tasks)))
+        elapsed = time.perf_counter() - start
+    finally:
+        loop.stop()
+    return _summary(f"loop_c{concurrency}", latencies, elapsed, max_in_flight=loop.stats()["max_in_flight"])
+
+
+def run_benchmark(tasks: int, steps: int, io_ms: float, concurrency: List[int]) -> Dict[str, Any]:
+    with _telemetry_to_tempdir():
+        runs = [run_per_task(tasks, steps, io_ms)]
+        runs += [run_loop(tasks, steps, io_ms, c) for c in concurrency]
+    base = runs[0]["throughput_per_s"]
+    for row in runs:
+        row["speedup"] = round(row["throughput_per_s"] / base, 2)
+    return {"meta": {"tasks": tasks, "steps": steps, "io_ms": io_ms}, "runs": runs}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Per-worker workflow throughput: fresh loop per task vs persistent loop")
+    ap.add_argument("--tasks", type=int, default=200)
+    ap.add_argument("--steps", type=int, default=3)
+    ap.add_argument("--io-ms", type=float, default=20.0)
+    ap.add_argument("--concurrency", default="1,8,32", help="comma-separated loop concurrency levels")
+    ap.add_argument("--out", type=Path, default=None)
+    args = ap.parse_args(argv)
+
+    result = run_benchmark(
+        args.tasks,
+        args.steps,
+        args.io_ms,
+        [int(c) for c in args.concurrency.split(",") if c.strip()],
+    )
+    text = json.dumps(result, indent=2)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+import fakeredis
+import pytest
+
+from backend.app.db.session import SessionLocal, engine
+from backend.app.models.trigger_audit import TriggerAudit
+from backend.app.services.workflow.audit_logger import AuditLogger
+from backend.app.services.workflow.audit_state import (
+    ERROR,
+    QUEUED,
+    RUNNING,
+    SUCCESS,
+    AuditStateStore,
+    AuditTransitionError,
+    audit_state_stats,
+)
+
+TriggerAudit.__table__.create(bind=engine, checkfirst=True)
+
+
+class _CountingSessions:
+    """SessionLocal that counts the statements each session executes."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self):
+        session = SessionLocal()
+        execute = session.execute
+
+        def counted(stmt, *args, **kwargs):
+            self.statements.append(str(stmt).split()[0])
+            return execute(stmt, *args, **kwargs)
+
+        session.execute = counted
+        return session
+
+
+def _insert_queued(**overrides):
+    db = SessionLocal()
+    try:
+        row = TriggerAudit(user_id="u1", user_role="admin", workflow_name="report", status="queued", **overrides)
+        db.add(row)
+        db.commit()
+        return row.id
+    finally:
+        db.close()
+
+
+def _row(audit_id):
+    db = SessionLocal()
+    try:
+        return db.get(TriggerAudit, audit_id)
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def store_and_sessions():
+    sessions = _CountingSessions()
+    return AuditStateStore(fakeredis.FakeRedis(), session_factory=sessions), sessions
+
+
+def test_lifecycle_is_one_update_by_primary_key(store_and_sessions):
+    store, sessions = store_and_sessions
+    audit_id = _insert_queued()
+
+    store.transition(audit_id, RUNNING, error=None)
+    AuditLogger(store).log(audit_id, parameters={"to": "ops"}, result={"success": True, "error": None})
+    assert _row(audit_id).status == "queued"
+    assert sessions.statements == []
+
+    store.transition(audit_id, SUCCESS, error=None)
+
+    assert sessions.statements == ["UPDATE"]
+    row = _row(audit_id)
+    assert (row.status, row.error_message, row.parameters) == ("success", None, {"to": "ops"})
+
+
+def test_terminal_state_rejects_later_transitions(store_and_sessions):
+    store, _ = store_and_sessions
+    audit_id = _insert_queued()
+    before = audit_state_stats()["invalid_transitions"]
+
+    assert store.transition(audit_id, ERROR, error="boom")
+    assert not store.transition(audit_id, RUNNING)
+    assert audit_state_stats()["invalid_transitions"] == before + 1
+    assert _row(audit_id).status == "error"
+    with pytest.raises(AuditTransitionError):
+        store.transition(audit_id, "paused")
+
+
+def test_flusher_writes_long_running_jobs_once_per_change(store_and_sessions):
+    store, sessions = store_and_sessions
+    audit_id = _insert_queued()
+    store.transition(audit_id, RUNNING)
+
+    # Not due yet: short runs never reach the DB before their terminal write
+    assert store.flush()["open"] == 0
+    due = _due_after(store)
+    assert store.flush(now_ms=due)["open"] == 1
+    assert _row(audit_id).status == "running"
+    # Next look is the stale check; nothing changed → nothing rewritten
+    assert _due_after(store) == due - store.flush_interval_ms + store.stale_ms
+    assert store.flush(now_ms=due)["open"] == 0
+
+    store.transition(audit_id, QUEUED, error="smtp down")  # retry pending
+    store.transition(audit_id, RUNNING, error=None)
+    store.transition(audit_id, SUCCESS)
+    assert _row(audit_id).status == "success"
+    assert sessions.statements == ["UPDATE", "UPDATE"]
+
+
+def test_crashed_worker_terminal_write_is_recovered(store_and_sessions, monkeypatch):
+    store, _ = store_and_sessions
+    audit_id = _insert_queued()
+    store.transition(audit_id, RUNNING)
+
+    # Worker staged the result, then the DB write failed (crash / DB down)
+    def db_down(*_args, **_kwargs):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(store, "_write_row", db_down)
+    store.transition(audit_id, ERROR, error="boom")
+    assert _row(audit_id).status == "queued"
+    monkeypatch.undo()
+
+    assert store.flush()["terminal"] == 1
+    row = _row(audit_id)
+    assert (row.status, row.error_message) == ("error", "boom")
+
+
+def test_run_without_progress_is_marked_lost(store_and_sessions):
+    store, _ = store_and_sessions
+    audit_id = _insert_queued()
+    store.transition(audit_id, RUNNING)
+
+    now = int(store._redis.hget(f"wf:audit:{audit_id}", "t"))
+    assert store.flush(now_ms=now + store.stale_ms)["abandoned"] == 1
+    row = _row(audit_id)
+    assert row.status == "error"
+    assert row.error_message.startswith("Worker lost")
+
+
+def test_without_redis_transitions_write_through():
+    audit_id = _insert_queued()
+    store = AuditStateStore(client=None)
+
+    store.transition(audit_id, RUNNING)
+    assert _row(audit_id).status == "running"
+    store.stage(audit_id, parameters={"a": 1})
+    store.transition(audit_id, SUCCESS)
+    row = _row(audit_id)
+    assert (row.status, row.parameters) == ("success", {"a": 1})
+
+
+def _due_after(store):
+    return max(int(score) for _, score in store._redis.zrange("wf:audit:active", 0, -1, withscores=True))
@@ -0,0 +1,46 @@
+from backend.app.services.parsing.canonicalizer import (
+    canonicalize,
+    canonicalize_many,
+    compile_canonical_table,
+)
+
+
+def test_action_aliases_and_text_conditioned_rules():
+    out = canonicalize({"domain": "devops", "action": "Deploy"}, "Deploy auth microservice")
+    assert out["action"] == "deploy_microservice"
+
+    energy = {"domain": "energy", "action": "analyze"}
+    assert canonicalize(energy, "Analyze renewable output")["action"] == "renewable_output_analysis"
+    assert canonicalize(energy, "Analyze grid outage")["action"] == "analyze"
+
+
+def test_domain_rules_run_before_aliases():
+    parsed = {"domain": "contract_management", "action": "review", "parameters": {"vendor_name": "ACME"}}
+    assert canonicalize(parsed, "Review ACME agreement")["domain"] == "procurement"
+
+    parsed["parameters"] = {}
+    assert canonicalize(parsed, "Review ACME agreement")["domain"] == "legal"
+
+
+def test_compiled_table_is_keyed_by_domain_and_alias():
+    table = compile_canonical_table(
+        {
+            "action_aliases": {"hr": {"hire": "create_employee"}},
+            "action_patterns": {"hr": [{"if_action_contains": "leave", "then": "add_leave"}]},
+        }
+    )
+    assert table.action_aliases == {("hr", "hire"): "create_employee"}
+    out = canonicalize({"domain": "hr", "action": "request_leave"}, "Request leave", table=table)
+    assert out["action"] == "add_leave"
+
+
+def test_canonicalize_many_uses_each_items_raw_text():
+    items = [
+        {"domain": "it", "action": "restart", "raw_text": "Restart payments service"},
+        {"domain": "finance", "action": "cashflow_report", "raw_text": "Cashflow report for EMEA"},
+    ]
+    out = canonicalize_many(items)
+    assert [(o["domain"], o["action"]) for o in out] == [
+        ("it_ops", "restart_service"),
+        ("finance", "generate_cashflow_report"),
+    ]
@@ -0,0 +1,67 @@
+import asyncio
+
+from backend.app.core.clients import ClientRegistry, get_client_registry
+from backend.app.core.config import settings
+from backend.app.services.monitoring.abuse_monitor import AbuseMonitor
+from backend.app.services.rate_limit.redis_client import get_rate_limit_redis
+
+
+def test_redis_pools_are_shared_per_url_and_sized_from_settings():
+    registry = ClientRegistry()
+    a = registry.redis("redis://localhost:6379/3")
+    b = registry.redis("redis://localhost:6379/3")
+    decoded = registry.redis("redis://localhost:6379/3", decode_responses=True)
+    small = registry.redis("redis://localhost:6379/4", max_connections=7)
+
+    assert a is b
+    assert decoded is not a
+    assert a.connection_pool.max_connections == settings.REDIS_POOL_MAX_CONNECTIONS
+    assert small.connection_pool.max_connections == 7
+
+    stats = registry.stats()
+    assert stats["redis_pools_created"] == 3
+    assert {row["max_connections"] for row in stats["redis"]} == {settings.REDIS_POOL_MAX_CONNECTIONS, 7}
+    assert all(row["in_use"] == 0 and row["utilization"] == 0 for row in stats["redis"])
+    registry.close()
+    assert registry.stats()["redis"] == []
+
+
+def test_rate_limiter_and_abuse_monitor_share_one_client():
+    client = get_rate_limit_redis()
+    assert AbuseMonitor()._redis is client
+    assert get_client_registry().redis(settings.RATE_LIMIT_REDIS_URL) is client
+    assert client.connection_pool.max_connections == settings.RATE_LIMIT_REDIS_MAX_CONNECTIONS
+
+
+def test_http_client_is_reused_within_a_loop_and_closed_on_shutdown():
+    registry = ClientRegistry()
+
+    async def scenario():
+        first = registry.http()
+        assert registry.http() is first
+        stats = registry.stats()["http"]
+        assert stats[0]["max_connections"] == settings.HTTP_POOL_MAX_CONNECTIONS
+        assert stats[0]["open"] == 0
+        await registry.aclose()
+        return first
+
+    client = asyncio.run(scenario())
+    assert client.is_closed
+    # A new loop gets its own client
+    assert asyncio.run(_http_of(registry)) is not client
+
+
+async def _http_of(registry):
+    client = registry.http()
+    await client.aclose()
+    return client
+
+
+def test_db_engine_pool_is_reported():
+    from backend.app.db.session import engine
+
+    registry = ClientRegistry()
+    registry.register_engine(engine)
+    db = registry.stats()["db"]
+    assert db["pool"] == type(engine.pool).__name__
+    assert "checked_out" in db
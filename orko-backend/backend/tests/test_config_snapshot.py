@@ -0,0 +1,119 @@
+import json
+import os
+
+from backend.app.services.parsing import config_snapshot
+from backend.app.services.parsing.config_snapshot import ConfigStore
+
+
+def _write(path, data, bump_ns=0):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if bump_ns:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+
+def test_snapshot_precomputes_sets_and_swaps_on_change(tmp_path, monkeypatch):
+    guardrails = tmp_path / "guardrails.json"
+    prompts = tmp_path / "prompt_versions.json"
+    _write(guardrails, {"allowed_verbs": ["list"], "blocked_verbs": ["delete"]})
+    _write(prompts, {"finance": {"version": 3, "updated_at": "2025-01-01"}})
+    monkeypatch.setattr(
+        config_snapshot,
+        "CONFIG_SOURCES",
+        {"guardrails": (guardrails,), "prompt_versions": (prompts,)},
+    )
+
+    store = ConfigStore()
+    first = store.current()
+    assert first.blocked_verbs == frozenset({"delete"})
+    assert first.prompt_version("finance") == (3, "2025-01-01")
+    assert first.prompt_version("hr") == (1, "")
+    assert store.refresh() is False
+
+    _write(prompts, {"finance": {"version": 4, "updated_at": "2025-02-01"}}, bump_ns=10**9)
+    assert store.refresh() is True
+
+    second = store.current()
+    assert second.version_id != first.version_id
+    assert second.prompt_version("finance")[0] == 4
+    assert first.prompt_version("finance")[0] == 3  # old snapshot untouched
+
+
+def test_bad_reload_keeps_previous_snapshot(tmp_path, monkeypatch):
+    guardrails = tmp_path / "guardrails.json"
+    _write(guardrails, {"risky_verbs": ["send"]})
+    monkeypatch.setattr(config_snapshot, "CONFIG_SOURCES", {"guardrails": (guardrails,)})
+
+    store = ConfigStore()
+    before = store.current()
+    guardrails.write_text("{ not json", encoding="utf-8")
+
+    assert store.refresh(force=True) is False
+    assert store.current() is before
+    assert store.stats()["reload_errors"] == 1
+
+
+def test_malformed_file_on_first_load_is_loaded_as_empty(tmp_path, monkeypatch):
+    guardrails = tmp_path / "guardrails.json"
+    examples = tmp_path / "domain_examples.yml"
+    prompts = tmp_path / "prompt_versions.json"
+    guardrails.write_text("{ not json", encoding="utf-8")
+    examples.write_text("finance: [unclosed", encoding="utf-8")
+    _write(prompts, {"finance": {"version": 2}})
+    monkeypatch.setattr(
+        config_snapshot,
+        "CONFIG_SOURCES",
+        {"guardrails": (guardrails,), "domain_examples": (examples,), "prompt_versions": (prompts,)},
+    )
+
+    store = ConfigStore()
+    snap = store.current()
+
+    assert snap.blocked_verbs == frozenset()
+    assert dict(snap.domain_examples) == {}
+    assert snap.prompt_version("finance")[0] == 2  # healthy sources still load
+    assert set(snap.load_errors) == {"guardrails", "domain_examples"}
+    assert store.stats()["reload_errors"] == 1
+
+    _write(guardrails, {"blocked_verbs": ["delete"]}, bump_ns=10**9)
+    assert store.refresh() is True
+    assert store.current().blocked_verbs == frozenset({"delete"})
+
+
+def test_reload_after_lenient_load_never_empties_a_healthy_source(tmp_path, monkeypatch):
+    guardrails = tmp_path / "guardrails.json"
+    prompts = tmp_path / "prompt_versions.json"
+    _write(guardrails, {"blocked_verbs": ["delete"]})
+    prompts.write_text("{ not json", encoding="utf-8")
+    monkeypatch.setattr(
+        config_snapshot, "CONFIG_SOURCES", {"guardrails": (guardrails,), "prompt_versions": (prompts,)}
+    )
+
+    store = ConfigStore()
+    assert set(store.current().load_errors) == {"prompt_versions"}
+
+    guardrails.write_text("{ half written", encoding="utf-8")
+    assert store.refresh(force=True) is False
+    assert store.current().blocked_verbs == frozenset({"delete"})
+
+
+def test_valid_json_of_the_wrong_shape_is_malformed_too(tmp_path, monkeypatch):
+    canonical = tmp_path / "canonicalization.json"
+    guardrails = tmp_path / "guardrails.json"
+    _write(canonical, {"domain_aliases": {"fin": "finance"}, "domain_rules": {"finance": [{"if_text_any": ["pay"]}]}})
+    _write(guardrails, ["delete"])
+    monkeypatch.setattr(
+        config_snapshot, "CONFIG_SOURCES", {"canonicalization": (canonical,), "guardrails": (guardrails,)}
+    )
+
+    store = ConfigStore()
+    snap = store.current()  # a rule without "then", a list instead of a mapping
+
+    assert set(snap.load_errors) == {"canonicalization", "guardrails"}
+    assert snap.canonical_table.domain_aliases == {}
+    assert snap.blocked_verbs == frozenset()
+
+    _write(canonical, {"domain_aliases": {"fin": "finance"}}, bump_ns=10**9)
+    assert store.refresh() is True
+    assert store.current().canonical_table.domain_aliases == {"fin": "finance"}
+    assert set(store.current().load_errors) == {"guardrails"}
@@ -0,0 +1,100 @@
+from backend.app.services.parsing.example_retriever import ExampleRetriever, tokenize
+
+
+class _Registry:
+    domains = ["finance", "hr"]
+
+    _EXAMPLES = {
+        "finance": [
+            {"command": "List overdue invoices", "expected": {"action": "list_overdue_invoices"}},
+            {"command": "Create daily PnL report", "expected": {"action": "create_daily_pnl_report"}},
+            {"command": "Approve vendor invoice", "expected": {"action": "approve_invoice"}},
+        ],
+        "hr": [
+            {"command": "Onboard new employee", "expected": {"action": "onboard_employee"}},
+            {"command": "Approve leave request", "expected": {"action": "approve_leave"}},
+        ],
+    }
+
+    def __init__(self, guess="hr"):
+        self.guess = guess
+        self.guessed = []
+
+    def get_examples(self, domain):
+        return {"examples": self._EXAMPLES[domain]}
+
+    def guess_domain(self, command):
+        self.guessed.append(command)
+        return self.guess
+
+
+def _commands(examples):
+    return [ex.command for ex in examples]
+
+
+def test_best_lexical_match_ranks_first():
+    retriever = ExampleRetriever(_Registry())
+
+    picked, domains = retriever.select("show overdue invoices from vendor", k=2)
+
+    assert _commands(picked) == ["List overdue invoices", "Approve vendor invoice"]
+    assert domains[0] == "finance"
+
+
+def test_equal_scores_keep_index_order():
+    retriever = ExampleRetriever(_Registry())
+
+    # "approve" appears once in two documents of the same length
+    picked, domains = retriever.select("approve", k=5)
+
+    assert _commands(picked) == ["Approve vendor invoice", "Approve leave request"]
+    scores = retriever.score("approve")
+    assert scores[picked[0].doc_id] == scores[picked[1].doc_id]
+    assert set(domains) == {"finance", "hr"}
+
+
+def test_k_larger_than_corpus_returns_each_match_once():
+    retriever = ExampleRetriever(_Registry())
+
+    picked, _ = retriever.select("approve invoice report employee", k=50)
+
+    ids = [ex.doc_id for ex in picked]
+    assert len(ids) == len(set(ids)) == len(retriever.score("approve invoice report employee"))
+    assert len(ids) <= len(retriever.examples)
+
+
+def test_token_budget_stops_after_first_pick():
+    retriever = ExampleRetriever(_Registry())
+
+    picked, _ = retriever.select("approve", k=5, token_budget=1)
+
+    assert len(picked) == 1  # the first pick is always kept
+
+
+def test_empty_or_unknown_query_falls_back_to_guessed_domain():
+    registry = _Registry(guess="hr")
+    retriever = ExampleRetriever(registry)
+
+    for command in ("", "zzz qqq", "the and of"):
+        assert retriever.score(command) == {}
+        picked, domains = retriever.select(command, k=5)
+        assert _commands(picked) == ["Onboard new employee", "Approve leave request"]
+        assert domains == ["hr"]
+    assert registry.guessed == ["", "zzz qqq", "the and of"]
+
+
+def test_domain_hint_is_added_only_when_registered():
+    retriever = ExampleRetriever(_Registry())
+
+    _, domains = retriever.select("overdue invoices", domain_hint="hr")
+    assert domains == ["finance", "hr"]
+    _, domains = retriever.select("overdue invoices", domain_hint="legal")
+    assert domains == ["finance"]
+
+
+def test_action_names_are_indexed():
+    retriever = ExampleRetriever(_Registry())
+    assert tokenize("PnL") == ["pnl"]
+
+    picked, _ = retriever.select("pnl", k=1)
+    assert picked[0].expected["action"] == "create_daily_pnl_report"
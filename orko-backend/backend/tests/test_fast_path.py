@@ -0,0 +1,74 @@
+from backend.app.services.parsing.fast_path import FastPath, FastPathModel, TrainingItem
+
+
+def _items():
+    rows = [
+        ("Show PnL for wheat in Europe.", "trading", "show_pnl", {"commodity": "wheat", "region": "Europe"}),
+        ("Show PnL for corn in Asia.", "trading", "show_pnl", {"commodity": "corn", "region": "Asia"}),
+        ("Display the PnL for barley in Europe.", "trading", "show_pnl", {"commodity": "barley", "region": "Europe"}),
+        ("Restart the billing service.", "it_ops", "restart_service", {"service": "billing"}),
+        ("Restart the auth service now.", "it_ops", "restart_service", {"service": "auth"}),
+        ("Please restart the search service.", "it_ops", "restart_service", {"service": "search"}),
+        ("List overdue invoices for 30 days.", "finance", "list_overdue_invoices", {"days": 30}),
+        ("List overdue invoices older than 60 days.", "finance", "list_overdue_invoices", {"days": 60}),
+        ("Show overdue invoices past 90 days.", "finance", "list_overdue_invoices", {"days": 90}),
+    ]
+    return [TrainingItem(c, d, a, p, "test") for c, d, a, p in rows] * 3
+
+
+def test_predicts_label_and_fills_required_slots():
+    model = FastPathModel.train(_items())
+
+    pred = model.predict("Show PnL for corn in Europe")
+    assert (pred.domain, pred.action) == ("trading", "show_pnl")
+    assert pred.parameters == {"commodity": "corn", "region": "Europe"}
+    assert pred.complete
+
+    pred = model.predict("List overdue invoices for 45 days")
+    assert pred.action == "list_overdue_invoices"
+    assert pred.parameters == {"days": 45}
+
+    # Known class, but the required slot value was never seen
+    pred = model.predict("Show PnL for soybeans")
+    assert pred.action == "show_pnl" and not pred.complete
+
+    # Nothing the vectorizer knows → zero confidence
+    assert model.predict("xyzzy plugh").confidence == 0.0
+
+
+def test_serve_respects_mode_threshold_and_completeness(tmp_path):
+    path = FastPathModel.train(_items()).save(tmp_path / "model.npz")
+
+    fp = FastPath(mode="on", threshold=0.5, model_path=path)
+    pred = fp.predict("Restart the billing service")
+    served = fp.serve(pred)
+    assert served["action"] == "restart_service"
+    assert served["parameters"] == {"service": "billing"}
+    assert served["context"]["parse_source"] == "fastpath"
+
+    assert fp.serve(fp.predict("Show PnL for soybeans")) is None  # incomplete
+    assert FastPath(mode="on", threshold=1.01, model_path=path).serve(pred) is None
+
+    shadow = FastPath(mode="shadow", threshold=0.5, model_path=path)
+    pred = shadow.predict("Restart the billing service")
+    assert shadow.serve(pred) is None
+    row = shadow.shadow_compare(pred, {"domain": "it_ops", "action": "restart_service"})
+    assert row["agree"] and row["would_serve"]
+    assert shadow.stats()["shadow_agreement"] == 1.0
+
+
+def test_missing_model_disables_fast_path(tmp_path):
+    fp = FastPath(mode="on", model_path=tmp_path / "nope.npz")
+    assert not fp.active
+    assert fp.predict("Restart the billing service") is None
+
+
+def test_save_load_round_trip(tmp_path):
+    model = FastPathModel.train(_items())
+    loaded = FastPathModel.load(model.save(tmp_path / "model.npz"))
+
+    for text in ("Show PnL for wheat in Asia", "Restart the auth service", "List overdue invoices for 10 days"):
+        a, b = model.predict(text), loaded.predict(text)
+        assert (a.domain, a.action, a.parameters, a.complete) == (b.domain, b.action, b.parameters, b.complete)
+        assert abs(a.confidence - b.confidence) < 1e-6
+    assert loaded.version == model.version
@@ -0,0 +1,26 @@
+from backend.app.services.parsing.canonicalizer import _heuristic_domain_from_text
+from backend.app.services.parsing.keyword_matcher import DOMAIN_MATCHER, KeywordMatcher
+
+
+def test_keywords_respect_word_boundaries():
+    # "mt" in "amount" / "port" in "report" used to route to trading / logistics
+    assert DOMAIN_MATCHER.scores("Show the total amount in the report") == {}
+    assert DOMAIN_MATCHER.best("Book a truck for 500 MT barley to Ankara silo") == "logistics"
+
+
+def test_scores_count_every_domain_and_inflections():
+    scores = DOMAIN_MATCHER.scores("Restart servers and review open invoices")
+    assert scores == {"it_ops": 2, "finance": 1}
+
+
+def test_longest_keyword_wins_and_ties_follow_table_order():
+    assert DOMAIN_MATCHER.best("Run load test on checkout API") == "devops"
+
+    matcher = KeywordMatcher({"a": ["alpha"], "b": ["beta"]})
+    assert matcher.best("beta alpha") == "a"
+    assert matcher.best("nothing here", default="b") == "b"
+
+
+def test_canonicalizer_uses_shared_matcher():
+    assert _heuristic_domain_from_text("Create a new support case", default=None) == "customer_support"
+    assert _heuristic_domain_from_text("hello there", default="general_admin") == "general_admin"
@@ -0,0 +1,119 @@
+import random
+
+import pytest
+
+from backend.app.db import models
+from backend.app.db.session import SessionLocal, engine
+from backend.app.services.telemetry.latency_sketch import LatencySketch
+from backend.app.services.workflow.latency_metrics import WorkflowLatencyRecorder, read_workflow_latency
+
+models.WorkflowMetrics.__table__.create(bind=engine, checkfirst=True)
+
+
+def _exact(samples, q):
+    ordered = sorted(samples)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def _samples(n, seed):
+    rng = random.Random(seed)
+    return [rng.lognormvariate(4.0, 1.0) for _ in range(n)]  # ~55 ms median, long tail
+
+
+def test_sketch_quantiles_within_relative_error():
+    samples = _samples(20000, seed=1)
+    sketch = LatencySketch(alpha=0.01)
+    for value in samples:
+        sketch.add(value)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = _exact(samples, q)
+        assert abs(sketch.quantile(q) - exact) / exact <= 0.011
+    assert sketch.count == len(samples)
+    assert len(sketch.buckets) < 1000
+
+
+def test_merged_sketches_equal_sketch_of_all_samples():
+    a, b = _samples(5000, seed=2), _samples(3000, seed=3)
+    left, right, both = LatencySketch(), LatencySketch(), LatencySketch()
+    for v in a:
+        left.add(v)
+        both.add(v)
+    for v in b:
+        right.add(v)
+        both.add(v)
+
+    merged = LatencySketch.from_dict(left.to_dict()).merge(LatencySketch.from_dict(right.to_dict()))
+    assert merged.buckets == both.buckets
+    assert merged.quantiles() == both.quantiles()
+    with pytest.raises(ValueError):
+        merged.merge(LatencySketch(alpha=0.05))
+
+
+def test_bucket_limit_keeps_high_quantiles_accurate():
+    sketch = LatencySketch(alpha=0.01, max_buckets=64)
+    samples = [1.0 * 1.05 ** i for i in range(400)]
+    for value in samples:
+        sketch.add(value)
+    assert len(sketch.buckets) == 64
+    assert sketch.count == len(samples)
+    assert abs(sketch.quantile(0.99) - _exact(samples, 0.99)) / _exact(samples, 0.99) <= 0.011
+
+
+def _clear_metrics():
+    db = SessionLocal()
+    try:
+        db.query(models.WorkflowMetrics).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_windows_from_several_workers_merge_on_read():
+    _clear_metrics()
+    worker_a = WorkflowLatencyRecorder(flush_interval_s=0)
+    worker_b = WorkflowLatencyRecorder(flush_interval_s=0)
+    a, b = _samples(2000, seed=4), [v * 3 for v in _samples(1000, seed=5)]
+    for v in a:
+        worker_a.observe(v, True, workflow_name="daily_update")
+    for v in b:
+        worker_b.observe(v, False, workflow_name="daily_update")
+    worker_a.observe(12.0, True, workflow_name="contract_draft")
+
+    assert worker_a.flush() == 2
+    assert worker_b.flush() == 1
+    assert worker_a.flush() == 0
+
+    (contract, daily) = read_workflow_latency()
+    assert (contract["workflow_name"], contract["total_runs"]) == ("contract_draft", 1)
+    assert (daily["total_runs"], daily["success_count"], daily["failure_count"], daily["windows"]) == (3000, 2000, 1000, 2)
+    for q, key in ((0.5, "p50_latency_ms"), (0.95, "p95_latency_ms"), (0.99, "p99_latency_ms")):
+        exact = _exact(a + b, q)
+        assert abs(daily[key] - exact) / exact <= 0.011
+
+
+def test_failed_flush_keeps_windows():
+    _clear_metrics()
+
+    class _BrokenSession:
+        def add_all(self, rows):
+            raise RuntimeError("db down")
+
+        def rollback(self):
+            pass
+
+        def close(self):
+            pass
+
+    recorder = WorkflowLatencyRecorder(flush_interval_s=0, session_factory=_BrokenSession)
+    recorder.observe(10.0, True, workflow_name="report")
+    assert recorder.flush() == 0
+    recorder.observe(30.0, True, workflow_name="report")
+    assert recorder.stats()["open_windows"] == 1
+
+    recorder._session_factory = SessionLocal
+    assert recorder.flush() == 1
+    (row,) = read_workflow_latency(workflow_name="report")
+    assert row["total_runs"] == 2
+    assert row["p50_latency_ms"] == pytest.approx(10.0, rel=0.01)
+    assert row["max_latency_ms"] == 30.0
@@ -0,0 +1,81 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.services.parsing.ai_parser import AIParser
+from backend.app.services.parsing.llm_backend import CassetteMissError, LatencyModel, LLMBackend
+
+
+CMD = "Create a purchase order for 300 laptops."
+
+_OUTPUT = json.dumps(
+    {
+        "domain": "procurement",
+        "action": "create_purchase_order",
+        "parameters": {"quantity": 300, "item": "laptops"},
+        "context": {"confidence": 0.93},
+    }
+)
+
+
+class _LiveResponses:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **_kwargs):
+        self.calls += 1
+        return SimpleNamespace(output_text=_OUTPUT)
+
+
+def test_stub_backend_returns_schema_valid_registry_parse():
+    parser = AIParser(llm_backend=LLMBackend(mode="stub", latency="none"))
+
+    parsed = parser.parse(CMD)
+
+    assert parsed["domain"] in parser.registry.domains
+    assert parsed["action"] in parser.allowed_actions[parsed["domain"]]
+    assert isinstance(parsed["parameters"], dict)
+    assert "parse_error" not in parsed["context"]
+    assert parser.llm_backend.stats()["stubbed"] == 1
+
+
+def test_record_then_replay_serves_identical_response(tmp_path):
+    cassette = tmp_path / "cassette.jsonl"
+
+    recorder = AIParser(llm_backend=LLMBackend(mode="record", cassette_path=str(cassette)))
+    live = _LiveResponses()
+    recorder.client.responses._live = live
+    recorded = recorder.parse(CMD)
+    assert live.calls == 1 and recorder.llm_backend.stats()["recorded"] == 1
+
+    backend = LLMBackend(mode="replay", cassette_path=str(cassette), latency="fixed:1")
+    replayer = AIParser(llm_backend=backend)
+    assert replayer.parse(CMD) == recorded
+    assert asyncio.run(replayer.parse_async(CMD)) == recorded
+
+    stats = backend.stats()
+    assert stats["replayed"] == 2 and stats["misses"] == 0
+    assert stats["simulated_latency_ms"] == 2.0
+
+    # Different prompt → different request hash → miss
+    with pytest.raises(CassetteMissError):
+        replayer.parse(CMD, context={"domain": "finance"})
+    assert backend.stats()["misses"] == 1
+
+
+def test_sampled_latency_is_deterministic_per_request():
+    a = LatencyModel("lognormal:600,0.4", seed=7)
+    b = LatencyModel("lognormal:600,0.4", seed=7)
+
+    first = [a.sample_ms("k1", None, ()), a.sample_ms("k2", None, ()), a.sample_ms("k1", None, ())]
+    # Interleaving does not change the per-request samples
+    second = [b.sample_ms("k2", None, ()), b.sample_ms("k1", None, ()), b.sample_ms("k1", None, ())]
+
+    assert first[0] == second[1] and first[1] == second[0] and first[2] == second[2]
+    assert first[0] != first[2]
+    assert LatencyModel("recorded").sample_ms("k", 812.5, ()) == 812.5
+
+    with pytest.raises(ValueError):
+        LatencyModel("normal:400")
@@ -0,0 +1,97 @@
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.services.rate_limit.local_admission import LocalAdmission
+from backend.app.services.rate_limit.trigger_rate_limiter import RateLimitExceeded, TriggerRateLimiter
+from backend.tests.e2e.rate_limit_benchmark import SimulatedGcraScript, SimulatedRedis, run_benchmark
+
+
+class _Clock:
+    def __init__(self):
+        self.now_ms = 1_000_000
+
+    def ms(self):
+        return self.now_ms
+
+    def seconds(self):
+        return self.now_ms / 1000.0
+
+
+@pytest.fixture
+def rig(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 20)
+    monkeypatch.setattr(settings, "RATE_LIMIT_WINDOW_SECONDS", 60)
+    clock = _Clock()
+    script = SimulatedGcraScript(clock.ms)
+    local = LocalAdmission(lease_size=4, lease_ttl_ms=60_000, clock=clock.seconds)
+    return TriggerRateLimiter(client=SimulatedRedis(script), local=local), script, local, clock
+
+
+def _admitted(limiter, n, user="u1", org="o1"):
+    ok = 0
+    for _ in range(n):
+        try:
+            limiter.check_and_increment(user_id=user, org_id=org)
+            ok += 1
+        except RateLimitExceeded:
+            pass
+    return ok
+
+
+def test_leases_absorb_requests_and_never_exceed_the_limit(rig):
+    limiter, script, local, _clock = rig
+
+    assert _admitted(limiter, 50) == 20
+    stats = local.stats()
+    # Blocks of 4 are leased while >= 8 tokens are free, the last 4 are
+    # checked one by one, and every denial after the first is local.
+    assert script.calls == 4 + 4 + 1
+    assert stats["local_admits"] == 12
+    assert stats["local_denies"] == 29
+    assert stats["redis_call_rate"] == round(9 / 50, 4)
+
+
+def test_cached_denial_expires_with_retry_after(rig):
+    limiter, script, _local, clock = rig
+    _admitted(limiter, 21)
+
+    with pytest.raises(RateLimitExceeded) as exc:
+        limiter.check_and_increment(user_id="u1", org_id="o1")
+    # One emission interval (60s / 20) from the start of the burst
+    assert exc.value.decision.retry_after_ms == 3000
+    calls = script.calls
+
+    clock.now_ms += 3000
+    limiter.check_and_increment(user_id="u1", org_id="o1")
+    assert script.calls == calls + 1
+
+
+def test_expired_lease_tokens_are_dropped_not_reused(rig):
+    limiter, script, local, clock = rig
+    limiter.check_and_increment(user_id="u1", org_id="o1")  # leases 4, uses 1
+
+    clock.now_ms += 61_000
+    limiter.check_and_increment(user_id="u1", org_id="o1")
+    assert script.calls == 2
+    assert local.stats()["lease_tokens_expired"] == 3
+
+
+def test_pass_through_when_leasing_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 20)
+    clock = _Clock()
+    script = SimulatedGcraScript(clock.ms)
+    local = LocalAdmission(lease_size=0, clock=clock.seconds)
+    limiter = TriggerRateLimiter(client=SimulatedRedis(script), local=local)
+
+    assert _admitted(limiter, 25) == 20
+    assert script.calls == 25
+    assert local.stats()["redis_call_rate"] == 1.0
+
+
+def test_benchmark_admits_the_same_with_fewer_redis_calls():
+    result = run_benchmark([0, 8], duration_s=0.3, rtt_ms=0.0)
+    plain, leased = result["runs"]
+
+    assert plain["redis_call_rate"] == 1.0
+    assert leased["redis_call_rate"] < plain["redis_call_rate"]
+    assert sum(leased["admitted"].values()) <= sum(plain["admitted"].values())
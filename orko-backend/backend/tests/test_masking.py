@@ -0,0 +1,75 @@
+import random
+import re
+
+from backend.app.services.parsing.masking import mask_many, mask_pii, mask_reasoning
+from backend.tests.e2e.masking_benchmark import legacy_mask_pii
+
+
+SAMPLES = [
+    "Mail john.doe@acme.com today",
+    "Call +90 555 123 4567 now",
+    "Ahmet Yilmaz approved the invoice",
+    "Ali Veli approved",
+    "ref AB1234567890",
+    "2025-12-26T00:00:00Z",
+    "555-123-4567Ahmet",
+    "Ahmet Ali.veli@x.com",
+    "Generate a quarterly cashflow report for EMEA.",
+    "Book a truck from Istanbul to Izmir for 12 pallets",
+]
+
+
+def test_mask_pii_matches_sequential_passes():
+    for text in SAMPLES:
+        assert mask_pii(text) == legacy_mask_pii(text), text
+    assert mask_pii("Call +90 555 123 4567 now") == "[NAME_MASKED] [PHONE_MASKED] now"
+
+
+def test_id_and_name_never_take_digits_of_the_next_phone():
+    assert mask_pii("555-123-4567ext555-987-6543") == "[PHONE_MASKED]ext[PHONE_MASKED]"
+    assert mask_pii("call 555-123-4567Veli555-123-4567") == "call [PHONE_MASKED][NAME_MASKED][PHONE_MASKED]"
+
+
+_PLACEHOLDER_RE = re.compile(r"\[(?:EMAIL|PHONE|ID|NAME)_MASKED\]")
+_FRAGMENTS = [
+    "555-123-4567", "+90 555 123 4567", "ali@x.io", "Ahmet", "Veli", "Yilmaz",
+    "ABCDEF", "AB12", "ext", "abc", "Q", "9", "123", " ", "-", ".", "_",
+]
+
+
+def _unmasked(text):
+    return sum(c.isalnum() for c in _PLACEHOLDER_RE.sub("", text))
+
+
+def test_never_leaves_more_unmasked_than_sequential_passes():
+    rng = random.Random(13)
+    for _ in range(20000):
+        text = "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 6)))
+        assert _unmasked(mask_pii(text)) <= _unmasked(legacy_mask_pii(text)), text
+
+
+def test_pre_check_skips_strings_without_pii():
+    assert mask_pii("ok") == "ok"
+    assert mask_pii("miss") == "miss"
+    assert mask_pii("EMEA") == "EMEA"
+    assert mask_pii("Bob") == "[NAME_MASKED]"
+    assert mask_pii(0.9) == 0.9
+
+
+def test_mask_many_walks_nested_values_without_mutating():
+    trace = {
+        "steps": ["Contact ali@x.io", {"note": "Ahmet rang", "n": 3}, ["Bob", None]],
+        "score": 0.5,
+        "user": "Veli",
+    }
+    masked_trace, masked_text, number = mask_many([trace, "Bob", 7])
+
+    assert masked_trace == {
+        "steps": ["[ID_MASKED] [EMAIL_MASKED]", {"note": "[NAME_MASKED] rang", "n": 3}, ["[NAME_MASKED]", None]],
+        "score": 0.5,
+        "user": "[NAME_MASKED]",
+    }
+    assert list(masked_trace) == ["steps", "score", "user"]
+    assert trace["steps"][1]["note"] == "Ahmet rang"
+    assert (masked_text, number) == ("[NAME_MASKED]", 7)
+    assert mask_reasoning(trace) == masked_trace
@@ -0,0 +1,41 @@
+from backend.app.services.parsing.parse_cache import ParseCache
+
+
+def _memory_only_cache(versions, **kwargs):
+    cache = ParseCache(prompt_version_fn=lambda d: (versions.get(d, 1), ""), **kwargs)
+    cache._redis = None
+    return cache
+
+
+def test_hit_after_put_and_whitespace_normalization():
+    cache = _memory_only_cache({})
+    parsed = {"domain": "finance", "action": "list_overdue_invoices", "parameters": {}, "context": {}}
+
+    cache.put("list overdue invoices", "general", "m", parsed)
+    hit, tier = cache.get("  list   overdue invoices ", "general", "m")
+
+    assert tier == "memory"
+    assert hit == parsed
+    assert hit is not parsed
+    assert cache.stats()["hits_memory"] == 1
+
+
+def test_prompt_version_bump_invalidates_entry():
+    versions = {"finance": 1}
+    cache = _memory_only_cache(versions)
+    cache.put("show cashflow", "general", "m", {"domain": "finance", "action": "x"})
+
+    versions["finance"] = 2
+    hit, tier = cache.get("show cashflow", "general", "m")
+
+    assert hit is None and tier is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_lru_eviction_is_counted():
+    cache = _memory_only_cache({}, max_entries=2)
+    for cmd in ("a", "b", "c"):
+        cache.put(cmd, None, "m", {"domain": "hr", "action": cmd})
+
+    assert cache.get("a", None, "m") == (None, None)
+    assert cache.stats()["evictions"] == 1
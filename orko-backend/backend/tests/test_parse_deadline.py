@@ -0,0 +1,90 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
+
+
+_OUTPUT = json.dumps(
+    {
+        "domain": "finance",
+        "action": "list_overdue_invoices",
+        "parameters": {"days": 30},
+        "context": {"confidence": 0.9},
+    }
+)
+
+CMD = "List overdue invoices for 30 days"
+
+
+class _SlowAsyncResponses:
+    async def create(self, **_kwargs):
+        await asyncio.sleep(0.2)
+        return SimpleNamespace(output_text=_OUTPUT)
+
+
+class _SlowSyncResponses:
+    def create(self, **_kwargs):
+        time.sleep(0.2)
+        return SimpleNamespace(output_text=_OUTPUT)
+
+
+def _engine(monkeypatch):
+    engine = ParserEngine()
+    engine._cache.enabled = False
+    engine._fastpath.mode = "off"
+    recorded = []
+    monkeypatch.setattr(engine, "_record", lambda parsed, *args: recorded.append(parsed))
+    monkeypatch.setattr(TelemetryCollector, "record_parse_deadline", lambda *args: None)
+    return engine, recorded
+
+
+def test_async_deadline_returns_provisional_then_records_refined(monkeypatch):
+    engine, recorded = _engine(monkeypatch)
+    engine._ai_parser._async_client = SimpleNamespace(responses=_SlowAsyncResponses())
+
+    async def run():
+        t0 = time.perf_counter()
+        parsed = await engine.parse_command_async(CMD, context={"user_id": "u-1"}, deadline_ms=20)
+        elapsed = time.perf_counter() - t0
+        await asyncio.gather(*engine._refinements)
+        return parsed, elapsed
+
+    parsed, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.15
+    assert parsed["context"]["provisional"] is True
+    assert parsed["context"]["used_fallback_parser"] is True
+    assert parsed["domain"] == "finance"  # keyword heuristic
+
+    provisional, refined = recorded
+    assert provisional is parsed
+    assert refined["action"] == "list_overdue_invoices"
+    assert refined["context"]["refines_parse_id"] == parsed["context"]["parse_id"]
+    assert refined["context"]["user_id"] == "u-1"
+
+    stats = engine.deadline_stats()
+    assert stats["hits"] == 1 and stats["hits_by_domain"] == {"finance": 1}
+    assert stats["refined"] == 1 and stats["refined_changed"] == 1
+
+
+def test_sync_deadline_only_applies_when_requested(monkeypatch):
+    engine, recorded = _engine(monkeypatch)
+    engine._ai_parser.client = SimpleNamespace(responses=_SlowSyncResponses())
+
+    parsed = engine.parse_command(CMD)
+    assert "provisional" not in parsed["context"]
+    assert parsed["action"] == "list_overdue_invoices"
+
+    done = threading.Event()
+    original = engine._refine
+    monkeypatch.setattr(engine, "_refine", lambda *a: (original(*a), done.set()))
+
+    parsed = engine.parse_command(CMD, deadline_ms=20)
+    assert parsed["context"]["provisional"] is True
+    assert done.wait(2)
+    assert recorded[-1]["context"]["refines_parse_id"] == parsed["context"]["parse_id"]
+    assert engine.deadline_stats()["refined"] == 1
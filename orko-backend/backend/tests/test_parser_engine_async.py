@@ -0,0 +1,52 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from backend.app.services.parsing.parser_engine import ParserEngine
+
+
+_OUTPUT = json.dumps(
+    {
+        "domain": "finance",
+        "action": "generate_cashflow_report",
+        "parameters": {"period": "quarterly", "region": "EMEA"},
+        "context": {"confidence": 0.9},
+    }
+)
+
+
+class _SyncResponses:
+    calls = 0
+
+    def create(self, **_kwargs):
+        type(self).calls += 1
+        return SimpleNamespace(output_text=_OUTPUT)
+
+
+class _AsyncResponses:
+    calls = 0
+
+    async def create(self, **_kwargs):
+        type(self).calls += 1
+        return SimpleNamespace(output_text=_OUTPUT)
+
+
+def test_async_parse_matches_sync_parse(monkeypatch):
+    engine = ParserEngine()
+    engine._cache.enabled = False
+    engine._ai_parser.client = SimpleNamespace(responses=_SyncResponses())
+    engine._ai_parser._async_client = SimpleNamespace(responses=_AsyncResponses())
+    recorded = []
+    monkeypatch.setattr(engine, "_record", lambda parsed, text, ctx, shadow=None: recorded.append(text))
+
+    cmd = "Generate a quarterly cashflow report for EMEA."
+    ctx = {"org_id": "org-1", "user_id": "u-1"}
+
+    sync_out = engine.parse_command(cmd, context=ctx)
+    async_out = asyncio.run(engine.parse_command_async(cmd, context=ctx))
+
+    assert async_out == sync_out
+    assert async_out["context"]["used_fallback_parser"] is False
+    assert async_out["config_version"]
+    assert _SyncResponses.calls == 1 and _AsyncResponses.calls == 1
+    assert recorded == [cmd, cmd]
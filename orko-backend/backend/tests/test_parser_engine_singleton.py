@@ -0,0 +1,32 @@
+import threading
+
+from backend.app.services.parsing import parser_engine
+
+
+class _CountingEngine:
+    instances = 0
+
+    def __init__(self):
+        type(self).instances += 1
+
+
+def test_parser_engine_is_built_once_per_process(monkeypatch):
+    monkeypatch.setattr(parser_engine, "ParserEngine", _CountingEngine)
+    parser_engine.reset_parser_engine()
+    _CountingEngine.instances = 0
+
+    seen = []
+    threads = [
+        threading.Thread(target=lambda: seen.append(parser_engine.get_parser_engine()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert _CountingEngine.instances == 1
+    assert all(e is seen[0] for e in seen)
+    assert parser_engine.warm_parser_engine() == 0.0
+
+    parser_engine.reset_parser_engine()
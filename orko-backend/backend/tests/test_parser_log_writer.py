@@ -0,0 +1,69 @@
+from uuid import uuid4
+
+from backend.app.db.session import SessionLocal
+from backend.app.models.parser_log import ParserLog
+from backend.app.services.parsing.parser_log_writer import ParserLogWriter
+
+
+def _row(command):
+    return {"id": str(uuid4()), "command": command, "parsed_output": {}, "domain": "hr", "action": "x"}
+
+
+def test_rows_are_bulk_inserted_and_flushed_on_shutdown():
+    writer = ParserLogWriter(batch_size=50, flush_interval_ms=10_000)
+    tag = f"writer-test-{uuid4()}"
+    for _ in range(5):
+        assert writer.enqueue(_row(tag)) is True
+
+    writer.shutdown()
+
+    db = SessionLocal()
+    try:
+        assert db.query(ParserLog).filter(ParserLog.command == tag).count() == 5
+    finally:
+        db.close()
+    stats = writer.stats()
+    assert stats["written"] == 5 and stats["buffered"] == 0
+
+
+def test_full_buffer_drops_and_counts(monkeypatch):
+    writer = ParserLogWriter(max_buffer=2, overflow="block", block_timeout_ms=1)
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)
+
+    results = [writer.enqueue(_row("drop-test")) for _ in range(3)]
+
+    assert results == [True, True, False]
+    stats = writer.stats()
+    assert stats["dropped"] == 1
+    assert stats["backpressure_waits"] == 1
+
+
+def test_row_is_snapshotted_at_enqueue(monkeypatch):
+    writer = ParserLogWriter()
+    monkeypatch.setattr(writer, "_ensure_started", lambda: None)
+    parsed = {"context": {"confidence": 0.4}}
+
+    writer.enqueue({**_row("snapshot-test"), "parsed_output": parsed})
+    # The route flags the returned parse after it was logged
+    parsed["context"]["requires_human_review"] = True
+
+    (queued,) = writer._drain()
+    assert queued["parsed_output"] == {"context": {"confidence": 0.4}}
+
+
+def test_failed_batch_is_retried_row_by_row():
+    writer = ParserLogWriter(batch_size=50, flush_interval_ms=10_000)
+    tag = f"retry-test-{uuid4()}"
+    good = [_row(tag) for _ in range(3)]
+    duplicate = dict(good[0])  # primary key clash fails the bulk insert
+
+    writer._write(good[:1])
+    writer._write(good[1:] + [duplicate])
+
+    db = SessionLocal()
+    try:
+        assert db.query(ParserLog).filter(ParserLog.command == tag).count() == 3
+    finally:
+        db.close()
+    stats = writer.stats()
+    assert stats["rows_failed"] == 1 and stats["row_retries"] == 3
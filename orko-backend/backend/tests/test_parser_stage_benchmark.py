@@ -0,0 +1,42 @@
+import json
+
+from backend.app.services.telemetry import telemetry_collector
+from backend.tests.e2e.parser_stage_benchmark import STAGES, compare_results, main, run_stage_benchmark
+
+
+def test_suite_covers_every_stage_without_touching_logs():
+    log_path = telemetry_collector.LOG_PATH
+    result = run_stage_benchmark(rounds=1, limit=20)
+
+    assert result["meta"]["records"] == 20
+    assert set(result["stages"]) == set(STAGES)
+    for row in result["stages"].values():
+        assert row["ns_per_op"] > 0
+        assert row["alloc_bytes_per_op"] >= 0
+    assert telemetry_collector.LOG_PATH == log_path
+
+
+def test_compare_flags_only_regressions_above_threshold(tmp_path):
+    baseline = {
+        "stages": {
+            "canonicalize": {"ns_per_op": 5000, "alloc_bytes_per_op": 2000},
+            "confidence": {"ns_per_op": 300, "alloc_bytes_per_op": 50},
+        }
+    }
+    current = {
+        "stages": {
+            "canonicalize": {"ns_per_op": 6500, "alloc_bytes_per_op": 2100},
+            # +33%, but below the absolute noise floor
+            "confidence": {"ns_per_op": 400, "alloc_bytes_per_op": 50},
+        }
+    }
+
+    regressions = compare_results(baseline, current, threshold=0.2)
+    assert [(r["stage"], r["metric"]) for r in regressions] == [("canonicalize", "ns_per_op")]
+    assert regressions[0]["change"] == 0.3
+
+    (tmp_path / "base.json").write_text(json.dumps(baseline))
+    (tmp_path / "cur.json").write_text(json.dumps(current))
+    argv = ["compare", "--baseline", str(tmp_path / "base.json"), "--current", str(tmp_path / "cur.json")]
+    assert main(argv) == 1
+    assert main(argv + ["--threshold", "0.5"]) == 0
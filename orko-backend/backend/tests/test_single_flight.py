@@ -0,0 +1,184 @@
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.parsing.single_flight import SingleFlight
+
+
+_OUTPUT = json.dumps(
+    {
+        "domain": "finance",
+        "action": "list_overdue_invoices",
+        "parameters": {"days": 30},
+        "context": {"confidence": 0.9},
+    }
+)
+
+
+class _SlowAsyncResponses:
+    def __init__(self):
+        self.calls = 0
+
+    async def create(self, **_kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(output_text=_OUTPUT)
+
+
+def test_concurrent_identical_async_parses_share_one_llm_call(monkeypatch):
+    engine = ParserEngine()
+    engine._cache.enabled = False
+    engine._fastpath.mode = "off"
+    responses = _SlowAsyncResponses()
+    engine._ai_parser._async_client = SimpleNamespace(responses=responses)
+    monkeypatch.setattr(engine, "_record", lambda *args: None)
+
+    async def burst():
+        return await asyncio.gather(
+            *[
+                engine.parse_command_async("List overdue invoices for 30 days", context={"user_id": f"u-{i}"})
+                for i in range(10)
+            ]
+        )
+
+    results = asyncio.run(burst())
+
+    assert responses.calls == 1
+    assert {r["action"] for r in results} == {"list_overdue_invoices"}
+    # Each waiter keeps its own request context
+    assert [r["context"]["user_id"] for r in results] == [f"u-{i}" for i in range(10)]
+    assert sum(r["context"]["parse_cache"] == "coalesced_local" for r in results) == 9
+
+    stats = engine.runtime_stats()["single_flight"]
+    assert stats["leader_calls"] == 1
+    assert stats["llm_calls_saved"] == 9
+    assert stats["inflight"] == 0
+
+
+def test_threads_share_result_and_get_independent_copies():
+    flight = SingleFlight(enabled=True)
+    calls = []
+    release = threading.Event()
+
+    def slow():
+        calls.append(1)
+        release.wait(2)
+        return {"parameters": {"days": 30}}
+
+    results = []
+
+    def worker():
+        results.append(flight.do("k", slow)[0])
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1 and len(results) == 5
+    results[0]["parameters"]["days"] = 99
+    assert all(r["parameters"]["days"] == 30 for r in results[1:])
+    assert flight.stats()["coalesced_local"] == 4
+
+
+class _FakeRedis:
+    """Lock held by "another process"; its result lands in the cache later."""
+
+    def __init__(self):
+        self.store = {}
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def exists(self, key):
+        return int(key in self.store)
+
+    def eval(self, _script, _n, key, token):
+        if self.store.get(key) == token:
+            del self.store[key]
+
+
+def test_remote_lock_holder_result_is_reused():
+    redis = _FakeRedis()
+    redis.store["k:inflight"] = "other-process"
+    flight = SingleFlight(enabled=True, redis_client=redis, lock_ttl_ms=1000, poll_ms=5)
+    polls = []
+
+    def lookup():
+        polls.append(1)
+        return {"action": "shared"} if len(polls) >= 3 else None
+
+    result, how = flight.do("k", lambda: {"action": "own_call"}, lookup)
+    assert (result, how) == ({"action": "shared"}, "remote")
+    assert flight.stats()["leader_calls"] == 0
+
+    # Lock released without a cached result → call the LLM ourselves
+    del redis.store["k:inflight"]
+    result, how = flight.do("k", lambda: {"action": "own_call"}, lambda: None)
+    assert (result, how) == ({"action": "own_call"}, None)
+    assert "k:inflight" not in redis.store
+
+
+def test_cancelled_async_leader_does_not_fail_waiters():
+    flight = SingleFlight(enabled=True)
+    calls = []
+
+    async def fn():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"action": "x"}
+
+    async def scenario():
+        leader = asyncio.ensure_future(flight.do_async("k", fn))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(flight.do_async("k", fn))
+        await asyncio.sleep(0.01)
+        leader.cancel()  # client of the leading request disconnected
+        result, how = await waiter
+        assert leader.cancelled()
+        return result, how
+
+    result, how = asyncio.run(scenario())
+    assert (result, how) == ({"action": "x"}, "local")
+    assert calls == [1]
+    assert flight.stats()["inflight"] == 0
+
+
+def test_interrupted_sync_leader_hands_lead_to_waiter():
+    flight = SingleFlight(enabled=True)
+    started = threading.Event()
+    out = {}
+
+    def leader_fn():
+        started.set()
+        time.sleep(0.05)
+        raise KeyboardInterrupt
+
+    def waiter():
+        out["result"] = flight.do("k", lambda: {"action": "y"})
+
+    def leader():
+        try:
+            flight.do("k", leader_fn)
+        except KeyboardInterrupt:
+            out["leader"] = "interrupted"
+
+    t_leader = threading.Thread(target=leader)
+    t_leader.start()
+    started.wait(1)
+    t_waiter = threading.Thread(target=waiter)
+    t_waiter.start()
+    t_leader.join(1)
+    t_waiter.join(1)
+
+    assert out == {"leader": "interrupted", "result": ({"action": "y"}, None)}
+    assert flight.stats()["inflight"] == 0
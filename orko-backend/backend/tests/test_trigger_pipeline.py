@@ -0,0 +1,109 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.api.deps.auth import require_trigger_role
+from backend.app.api.deps.parser import get_parser
+from backend.app.main import app
+from backend.app.schemas.auth import CurrentUser
+from backend.app.services.parser.intent_mapper import IntentMapper
+from backend.app.services.parsing.parser_engine import ParserEngine
+from backend.app.services.rate_limit.trigger_rate_limiter import TriggerRateLimiter
+from backend.app.services.workflow.trigger_queue import TriggerQueue
+
+
+class _CountingResponses:
+    def __init__(self, output):
+        self.output = output
+        self.calls = 0
+
+    async def create(self, **_kwargs):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return SimpleNamespace(output_text=json.dumps(self.output))
+
+
+@pytest.fixture
+def trigger_env(monkeypatch):
+    engine = ParserEngine()
+    engine._cache.enabled = False
+    engine._fastpath.mode = "off"
+    monkeypatch.setattr(engine, "_record", lambda *args: None)
+
+    enqueued = []
+    monkeypatch.setattr(IntentMapper, "_record_telemetry", lambda self, *args: None)
+    monkeypatch.setattr(TriggerRateLimiter, "__init__", lambda self: None)
+    monkeypatch.setattr(TriggerRateLimiter, "check_and_increment", lambda self, **kw: None)
+    monkeypatch.setattr(TriggerQueue, "enqueue_trigger", staticmethod(lambda p: enqueued.append(p) or "job-1"))
+
+    app.dependency_overrides[get_parser] = lambda: engine
+    app.dependency_overrides[require_trigger_role] = lambda: CurrentUser(id="u-1", role="operator")
+    try:
+        yield engine, enqueued
+    finally:
+        app.dependency_overrides.pop(get_parser, None)
+        app.dependency_overrides.pop(require_trigger_role, None)
+
+
+def test_unmapped_action_requires_review_without_enqueue(client, trigger_env):
+    engine, enqueued = trigger_env
+    responses = _CountingResponses(
+        {
+            "domain": "finance",
+            "action": "list_overdue_invoices",
+            "parameters": {"overdue_days": 30},
+            "context": {"confidence": 0.92},
+        }
+    )
+    engine._ai_parser._async_client = SimpleNamespace(responses=responses)
+
+    res = client.post("/api/trigger", json={"raw_command": "List overdue invoices for 30 days"})
+
+    assert res.status_code == 200, res.text
+    assert responses.calls == 1
+    body = res.json()
+    # No intent_to_workflow entry → nothing to run, nothing queued
+    assert body["status"] == "requires_review"
+    assert "list_overdue_invoices" in body["message"]
+    assert body["parsed"]["parameters"] == {"overdue_days": 30}
+    assert enqueued == []
+
+
+def test_empty_action_is_not_queued(client, trigger_env):
+    engine, enqueued = trigger_env
+    engine._ai_parser._async_client = SimpleNamespace(
+        responses=_CountingResponses({"domain": "general", "action": "", "context": {"confidence": 0.9}})
+    )
+
+    res = client.post("/api/trigger", json={"raw_command": "hmm"})
+
+    assert res.status_code == 200, res.text
+    assert res.json()["status"] == "requires_review"
+    assert enqueued == []
+
+
+def test_mapped_intent_uses_workflow_config_and_slot_filling(client, trigger_env):
+    engine, enqueued = trigger_env
+    responses = _CountingResponses(
+        {
+            "domain": "finance",
+            "action": "create_daily_pnl_report",
+            "parameters": {"desk": "Black Sea"},
+            "context": {"confidence": 0.9},
+        }
+    )
+    engine._ai_parser._async_client = SimpleNamespace(responses=responses)
+
+    res = client.post(
+        "/api/trigger",
+        json={"raw_command": "Create daily PnL for Black Sea", "context": {"data": {"date": "2025-01-02"}}},
+    )
+
+    assert res.status_code == 200, res.text
+    assert responses.calls == 1
+    body = res.json()
+    assert body["workflow_name"] == "daily_pnl_report_v1"
+    assert body["missing_parameters"] == []
+    assert enqueued[0]["parameters"] == {"date": "2025-01-02", "desk": "Black Sea", "format": "xlsx"}
@@ -0,0 +1,75 @@
+import fakeredis
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.services.rate_limit.trigger_rate_limiter import (
+    GCRA_LUA,
+    RateLimitDecision,
+    RateLimitExceeded,
+    TriggerRateLimiter,
+)
+from backend.tests.e2e.rate_limit_benchmark import SimulatedGcraScript, wall_clock_ms
+
+
+def test_retry_after_header_rounds_up_to_whole_seconds():
+    denied = RateLimitDecision(allowed=False, limit=5, remaining=0, retry_after_ms=11_001, limited_by="user")
+    assert denied.retry_after_header == 12
+    assert RateLimitExceeded("x", denied).retry_after_seconds == 12
+
+    almost = RateLimitDecision(allowed=False, limit=5, remaining=0, retry_after_ms=3, limited_by="org")
+    assert almost.retry_after_header == 1
+
+    # Legacy callers without a decision still get the full window.
+    assert RateLimitExceeded("x").retry_after_seconds == settings.RATE_LIMIT_WINDOW_SECONDS
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_PER_MINUTE", 3)
+    monkeypatch.setattr(settings, "RATE_LIMIT_WINDOW_SECONDS", 60)
+    return TriggerRateLimiter(client=fakeredis.FakeRedis())
+
+
+def test_gcra_counts_down_and_denies_without_consuming(limiter):
+    remaining = [limiter.check_and_increment("u1", "o1").remaining for _ in range(3)]
+    assert remaining == [2, 1, 0]
+
+    with pytest.raises(RateLimitExceeded) as exc:
+        limiter.check_and_increment("u1", "o1")
+    decision = exc.value.decision
+    assert decision.limited_by == "user"
+    # Next slot opens one emission interval (60s / 3) after the first request.
+    assert 0 < decision.retry_after_ms <= 20_000
+    assert exc.value.retry_after_seconds <= 20
+
+    # The denied call did not advance the org bucket: another user in the
+    # same org is limited by the org only after the org's own 3 requests.
+    with pytest.raises(RateLimitExceeded) as exc:
+        limiter.check_and_increment("u2", "o1")
+    assert exc.value.decision.limited_by == "org"
+
+
+def test_user_and_org_are_checked_together(limiter):
+    for _ in range(3):
+        limiter.check_and_increment("u1", "o1")
+
+    # Same user, fresh org: the user bucket still denies, and the fresh
+    # org bucket is not charged for the rejected request.
+    with pytest.raises(RateLimitExceeded):
+        limiter.check_and_increment("u1", "o2")
+    assert limiter.check("u3", "o2").remaining == 2
+
+
+def test_benchmark_port_follows_the_lua_script():
+    lua = fakeredis.FakeRedis().register_script(GCRA_LUA)
+    port = SimulatedGcraScript(wall_clock_ms)
+    args = [1, 20_000, 60_000, 20_000, 60_000]  # 3 per minute for both keys
+
+    calls = [(["u1", "o1"], 1)] * 4 + [(["u2", "o1"], 1), (["u3", "o2"], 3), (["u3", "o2"], 1), (["u4", "o3"], 2)]
+    for keys, want in calls:
+        expected = [int(v) for v in lua(keys=keys, args=[want] + args[1:])]
+        got = port(keys, [want] + args[1:])
+        # granted, remaining and limiting key match exactly; retry-after up
+        # to the clock drift between the two calls
+        assert got[:2] + got[3:] == expected[:2] + expected[3:], (keys, want)
+        assert abs(got[2] - expected[2]) <= 50
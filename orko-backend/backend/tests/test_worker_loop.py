@@ -0,0 +1,78 @@
+import asyncio
+import threading
+
+import pytest
+
+from backend.app.services.telemetry.telemetry_collector import TelemetryCollector
+from backend.app.services.workflow import trigger_queue
+from backend.app.services.workflow.orchestrator import Orchestrator
+from backend.app.services.workflow.worker_loop import WorkerLoop, shutdown_worker_loop
+
+
+@pytest.fixture
+def loop():
+    worker_loop = WorkerLoop(concurrency=2)
+    yield worker_loop
+    worker_loop.stop(timeout=1)
+
+
+def test_runs_coroutines_on_one_persistent_loop(loop):
+    async def which_loop():
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    first = loop.run(which_loop())
+    second = loop.run(which_loop())
+    assert first == second
+    assert first[1] == "orko-workflow-loop"
+
+
+def test_concurrency_is_capped(loop):
+    async def io():
+        await asyncio.sleep(0.02)
+        return 1
+
+    futures = [loop.submit(io()) for _ in range(6)]
+    assert sum(f.result(timeout=5) for f in futures) == 6
+
+    stats = loop.stats()
+    assert stats["max_in_flight"] == 2
+    assert stats["completed"] == 6
+    assert stats["in_flight"] == 0
+
+
+def test_timeout_cancels_the_run(loop):
+    cancelled = threading.Event()
+
+    async def stuck():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        loop.run(stuck(), timeout=0.05)
+    assert cancelled.wait(2)
+
+
+def test_celery_task_awaits_the_orchestrator(monkeypatch):
+    steps_seen = []
+
+    async def fake_run(self, workflow_steps, context=None, **kwargs):
+        await asyncio.sleep(0)
+        steps_seen.append(kwargs["workflow_name"])
+        return {"success": True, "context": context}
+
+    monkeypatch.setattr(Orchestrator, "run", fake_run)
+    monkeypatch.setattr(TelemetryCollector, "record_workflow", staticmethod(lambda **kw: None))
+
+    try:
+        out = trigger_queue.run_workflow_task.apply(
+            args=[{"workflow_name": "daily_pnl_report_v1", "parameters": {"desk": "Black Sea"}}]
+        ).get()
+    finally:
+        shutdown_worker_loop(timeout=1)
+
+    assert out["status"] == "success"
+    assert out["result"] == {"success": True, "context": {"desk": "Black Sea"}}
+    assert steps_seen == ["daily_pnl_report_v1"]
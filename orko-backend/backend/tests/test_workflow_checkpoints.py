@@ -0,0 +1,99 @@
+import asyncio
+
+import fakeredis
+
+from backend.app.services.workflow.checkpoints import (
+    Checkpoint,
+    MemoryCheckpointStore,
+    RedisCheckpointStore,
+    StepCheckpointer,
+    checkpoint_stats,
+)
+from backend.app.services.workflow.dag import compile_flow, run_plan
+from backend.app.services.workflow.orchestrator import Orchestrator
+
+PLAN = compile_flow({"name": "report", "steps": [
+    {"action": "fetch"}, {"action": "draft"}, {"action": "send"}]})
+
+
+class _Actions(dict):
+    def __init__(self, fail_send=False):
+        self.calls = []
+        self.keys = []
+        self.fail_send = fail_send
+        super().__init__(fetch=self._step("fetch"), draft=self._step("draft"), send=self.send)
+
+    def _step(self, name):
+        def step(context):
+            self.calls.append(name)
+            return {"from": name}
+        return step
+
+    def send(self, context, idempotency_key=None):
+        self.calls.append("send")
+        self.keys.append(idempotency_key)
+        if self.fail_send:
+            raise RuntimeError("smtp down")
+        return "sent"
+
+
+def test_retry_resumes_at_first_incomplete_step():
+    store = MemoryCheckpointStore()
+    before = checkpoint_stats()
+
+    first = _Actions(fail_send=True)
+    report = asyncio.run(run_plan(PLAN, {}, first.__getitem__, checkpoints=StepCheckpointer("audit-1", store)))
+    assert report.failed_step == "send"
+    assert first.calls == ["fetch", "draft", "send"]
+
+    retry = _Actions()
+    context = {}
+    report = asyncio.run(run_plan(PLAN, context, retry.__getitem__, checkpoints=StepCheckpointer("audit-1", store)))
+
+    assert report.failed_step is None
+    assert retry.calls == ["send"]
+    assert report.as_dict()["restored_steps"] == ["fetch", "draft"]
+    assert context["step_results"]["draft"] == {"from": "draft"}
+    # Same key on every attempt of the run, different per run
+    assert first.keys == retry.keys
+    other = StepCheckpointer("audit-2", store).idempotency_key(2, "send")
+    assert other != retry.keys[0]
+
+    after = checkpoint_stats()
+    assert after["steps_restored"] - before["steps_restored"] == 2
+    assert after["runs_resumed"] - before["runs_resumed"] == 1
+
+
+def test_unserializable_results_are_rerun_not_restored():
+    store = MemoryCheckpointStore()
+    actions = _Actions(fail_send=True)
+    actions["draft"] = lambda context: {"handle": object()}
+
+    asyncio.run(run_plan(PLAN, {}, actions.__getitem__, checkpoints=StepCheckpointer("audit-3", store)))
+
+    assert sorted(store.load("audit-3")) == [0]
+
+
+def test_orchestrator_drops_checkpoints_after_success(orchestrator_sinks):
+    store = MemoryCheckpointStore()
+
+    failed = asyncio.run(Orchestrator().run(
+        PLAN, context={}, actions=_Actions(fail_send=True), checkpoints=StepCheckpointer("a-9", store)))
+    assert failed["success"] is False
+    assert len(store.load("a-9")) == 2
+
+    ok = asyncio.run(Orchestrator().run(
+        PLAN, context={}, actions=_Actions(), checkpoints=StepCheckpointer("a-9", store)))
+    assert ok["success"] is True
+    assert store.load("a-9") == {}
+
+
+def test_redis_store_round_trip():
+    client = fakeredis.FakeRedis()
+    store = RedisCheckpointStore(client=client, ttl_seconds=60)
+
+    store.save("a-1", Checkpoint(1, "draft", {"pages": 3}, 12.5))
+    assert store.load("a-1") == {1: Checkpoint(1, "draft", {"pages": 3}, 12.5)}
+    assert 0 < client.ttl("wf:ckpt:a-1") <= 60
+    store.clear("a-1")
+    assert store.load("a-1") == {}
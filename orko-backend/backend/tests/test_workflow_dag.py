@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from backend.app.services.workflow.dag import FlowValidationError, compile_flow, load_flow, run_plan
+from backend.app.services.workflow.orchestrator import Orchestrator
+
+
+def _sleeper(ms, log=None, name=None):
+    async def step(context):
+        if log is not None:
+            log.append(("start", name))
+        await asyncio.sleep(ms / 1000)
+        if log is not None:
+            log.append(("end", name))
+        return name
+
+    return step
+
+
+def test_legacy_step_lists_compile_to_a_chain():
+    plan = compile_flow({"name": "f", "steps": [{"action": "a"}, {"action": "b"}, {"action": "c"}]})
+    assert [(s.id, s.depends_on) for s in plan.steps] == [("a", ()), ("b", ("a",)), ("c", ("b",))]
+
+
+@pytest.mark.parametrize(
+    "steps, message",
+    [
+        ([{"action": "a", "depends_on": ["b"]}, {"action": "b", "depends_on": ["a"]}], "cycle"),
+        ([{"action": "a", "depends_on": ["missing"]}], "unknown step"),
+        ([{"action": "a"}, {"action": "a", "depends_on": []}], "duplicate"),
+        ([{"action": "a", "depends_on": [], "timeout_ms": 0}], "timeout_ms"),
+    ],
+)
+def test_invalid_flows_are_rejected(steps, message):
+    with pytest.raises(FlowValidationError, match=message):
+        compile_flow({"name": "bad", "steps": steps})
+
+
+def test_shipped_flows_compile():
+    plan = load_flow("log_file_notify")
+    assert [s.id for s in plan.steps if not s.depends_on] == ["log_message", "write_file"]
+    assert plan.dependents["write_file"] == ("notify_user",)
+    for name in ("contract_draft", "daily_update"):
+        assert load_flow(name).steps[-1].id == "notify_user"
+
+
+def test_independent_steps_run_concurrently_and_critical_path_is_reported():
+    plan = load_flow("log_file_notify")
+    actions = {"log_message": _sleeper(20, name="log"), "write_file": _sleeper(60, name="file"),
+               "notify_user": _sleeper(10, name="notify")}
+    context = {}
+
+    report = asyncio.run(run_plan(plan, context, actions.__getitem__))
+
+    assert report.failed_step is None
+    assert report.total_ms < 20 + 60 + 10  # roots overlapped
+    assert report.critical_path() == ["write_file", "notify_user"]
+    assert context["step_results"] == {"log_message": "log", "write_file": "file", "notify_user": "notify"}
+    assert report.steps["notify_user"].start_ms >= report.steps["write_file"].end_ms
+
+
+def test_flow_concurrency_limit_serializes_roots():
+    plan = compile_flow({"name": "f", "max_concurrency": 1, "steps": [
+        {"action": "a", "depends_on": []}, {"action": "b", "depends_on": []}]})
+    log = []
+    actions = {"a": _sleeper(10, log, "a"), "b": _sleeper(10, log, "b")}
+
+    report = asyncio.run(run_plan(plan, {}, actions.__getitem__))
+
+    assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+    assert report.steps["b"].wait_ms > 5
+
+
+def test_step_timeout_cancels_siblings_and_skips_dependents():
+    plan = compile_flow({"name": "f", "steps": [
+        {"action": "slow", "depends_on": [], "timeout_ms": 20},
+        {"action": "long", "depends_on": []},
+        {"action": "after", "depends_on": ["slow", "long"]},
+    ]})
+    actions = {"slow": _sleeper(1000), "long": _sleeper(1000), "after": _sleeper(1)}
+
+    report = asyncio.run(run_plan(plan, {}, actions.__getitem__))
+
+    assert report.failed_step == "slow"
+    assert {sid: r.status for sid, r in report.steps.items()} == {
+        "slow": "timeout", "long": "cancelled", "after": "skipped"}
+    assert report.total_ms < 500
+
+
+def test_orchestrator_runs_plans_and_routes_step_failures_to_dlq(orchestrator_sinks):
+
+    def boom(context):
+        raise RuntimeError("disk full")
+
+    plan = load_flow("log_file_notify")
+    actions = {"log_message": _sleeper(1), "write_file": boom, "notify_user": _sleeper(1)}
+    result = asyncio.run(Orchestrator().run(plan, context={}, actions=actions))
+
+    assert result["success"] is False
+    assert result["steps"]["failed_step"] == "write_file"
+    assert "disk full" in orchestrator_sinks.dlq[0]["error_message"]
+    assert orchestrator_sinks.steps[0]["report"]["steps"][2]["status"] == "skipped"